@@ -0,0 +1,23 @@
+-- Migration 018: Add shared rate limit bucket state
+-- Lets every API worker draw from the same AI provider quota.
+-- Rows are updated under pg_advisory_xact_lock(hashtext(limiter_key)).
+
+-- ============================================================================
+-- RATE LIMIT BUCKETS TABLE
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+    limiter_key VARCHAR(100) NOT NULL,                  -- e.g. ai-provider:claude
+    bucket VARCHAR(50) NOT NULL,                        -- requests_per_minute, requests_per_hour, tokens_per_minute
+    level DOUBLE PRECISION NOT NULL,                    -- Tokens currently available (negative = debt)
+    updated_at DOUBLE PRECISION NOT NULL,               -- Database epoch seconds of last refill
+
+    PRIMARY KEY (limiter_key, bucket)
+);
+
+-- ============================================================================
+-- COMMENTS
+-- ============================================================================
+
+COMMENT ON TABLE rate_limit_buckets IS 'Token bucket levels shared across workers for AI provider rate limiting';
+COMMENT ON COLUMN rate_limit_buckets.level IS 'Available capacity after last refill; refilled lazily on access';
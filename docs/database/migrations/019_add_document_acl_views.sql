@@ -0,0 +1,58 @@
+-- Migration 019: Add document_acl_views read model
+-- Compact projection of document ownership and sharing used by authorization
+-- checks, so permission checks read one indexed row instead of replaying the
+-- Document event stream (including DocumentConverted payloads).
+-- See: docs/decisions/021-user-group-authentication-authorization.md
+
+-- ============================================================================
+-- CREATE DOCUMENT_ACL_VIEWS TABLE
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS document_acl_views (
+    document_id UUID PRIMARY KEY,
+    owner_kerberos_id VARCHAR(255) NOT NULL,
+    visibility VARCHAR(20) NOT NULL DEFAULT 'private',
+    shared_with_groups TEXT[] NOT NULL DEFAULT '{}',
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    CONSTRAINT check_acl_visibility
+        CHECK (visibility IN ('private', 'group', 'organization', 'public'))
+);
+
+-- ============================================================================
+-- BACKFILL FROM EVENT STORE
+-- ============================================================================
+
+-- Owner comes from DocumentUploaded; groups are those shared after the most
+-- recent DocumentMadePrivate, matching Document aggregate replay semantics.
+WITH last_private AS (
+    SELECT aggregate_id, MAX(sequence) AS sequence
+    FROM events
+    WHERE event_type = 'DocumentMadePrivate'
+    GROUP BY aggregate_id
+),
+shares AS (
+    SELECT e.aggregate_id, array_agg(DISTINCT e.payload->>'group') AS groups
+    FROM events e
+    LEFT JOIN last_private p ON p.aggregate_id = e.aggregate_id
+    WHERE e.event_type = 'DocumentSharedWithGroup'
+      AND e.sequence > COALESCE(p.sequence, 0)
+    GROUP BY e.aggregate_id
+)
+INSERT INTO document_acl_views (document_id, owner_kerberos_id, visibility, shared_with_groups, updated_at)
+SELECT u.aggregate_id,
+       COALESCE(u.payload->>'owner_kerberos_id', ''),
+       CASE WHEN s.groups IS NULL THEN 'private' ELSE 'group' END,
+       COALESCE(s.groups, '{}'),
+       NOW()
+FROM events u
+LEFT JOIN shares s ON s.aggregate_id = u.aggregate_id
+WHERE u.event_type = 'DocumentUploaded'
+ON CONFLICT (document_id) DO NOTHING;
+
+-- ============================================================================
+-- COMMENTS
+-- ============================================================================
+
+COMMENT ON TABLE document_acl_views IS 'Authorization read model: document owner, visibility and shared groups (maintained by DocumentAclProjection)';
+COMMENT ON COLUMN document_acl_views.shared_with_groups IS 'Groups the document is shared with; non-empty only when visibility is group';
@@ -0,0 +1,123 @@
+-- Migration 020: Keyset pagination indexes and per-status counters
+-- Listings page by (created_at, id) / (timestamp, id) cursors instead of OFFSET,
+-- and status counts are read from counter tables instead of COUNT(*) scans.
+-- The counters are kept exact by row triggers on the projection tables, so
+-- every projection write path updates them in the same transaction.
+
+-- ============================================================================
+-- KEYSET INDEXES
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_document_views_created_id
+    ON document_views(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_document_views_status_created_id
+    ON document_views(status, created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_audit_log_timestamp_id
+    ON audit_log_views(timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_audit_log_document_timestamp_id
+    ON audit_log_views(document_id, timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_audit_log_user_timestamp_id
+    ON audit_log_views(user_id, timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_audit_log_event_type_timestamp_id
+    ON audit_log_views(event_type, timestamp DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_feedback_document_created_id
+    ON feedback_views(document_id, created_at, id);
+
+-- ============================================================================
+-- STATUS COUNTER TABLES
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS document_status_counts (
+    status VARCHAR(50) PRIMARY KEY,
+    count BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS feedback_status_counts (
+    document_id UUID NOT NULL,
+    status VARCHAR(50) NOT NULL,
+    count BIGINT NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (document_id, status)
+);
+
+-- ============================================================================
+-- COUNTER TRIGGERS
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION maintain_document_status_counts()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE document_status_counts SET count = count - 1 WHERE status = OLD.status;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO document_status_counts (status, count) VALUES (NEW.status, 1)
+        ON CONFLICT (status) DO UPDATE SET count = document_status_counts.count + 1;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS document_views_status_counts ON document_views;
+CREATE TRIGGER document_views_status_counts
+    AFTER INSERT OR DELETE ON document_views
+    FOR EACH ROW
+    EXECUTE FUNCTION maintain_document_status_counts();
+
+DROP TRIGGER IF EXISTS document_views_status_counts_update ON document_views;
+CREATE TRIGGER document_views_status_counts_update
+    AFTER UPDATE OF status ON document_views
+    FOR EACH ROW
+    WHEN (OLD.status IS DISTINCT FROM NEW.status)
+    EXECUTE FUNCTION maintain_document_status_counts();
+
+CREATE OR REPLACE FUNCTION maintain_feedback_status_counts()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE feedback_status_counts SET count = count - 1
+        WHERE document_id = OLD.document_id AND status = OLD.status;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO feedback_status_counts (document_id, status, count)
+        VALUES (NEW.document_id, NEW.status, 1)
+        ON CONFLICT (document_id, status) DO UPDATE SET count = feedback_status_counts.count + 1;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS feedback_views_status_counts ON feedback_views;
+CREATE TRIGGER feedback_views_status_counts
+    AFTER INSERT OR DELETE ON feedback_views
+    FOR EACH ROW
+    EXECUTE FUNCTION maintain_feedback_status_counts();
+
+DROP TRIGGER IF EXISTS feedback_views_status_counts_update ON feedback_views;
+CREATE TRIGGER feedback_views_status_counts_update
+    AFTER UPDATE OF status, document_id ON feedback_views
+    FOR EACH ROW
+    WHEN (OLD.status IS DISTINCT FROM NEW.status OR OLD.document_id IS DISTINCT FROM NEW.document_id)
+    EXECUTE FUNCTION maintain_feedback_status_counts();
+
+-- ============================================================================
+-- BACKFILL
+-- ============================================================================
+
+TRUNCATE document_status_counts;
+INSERT INTO document_status_counts (status, count)
+SELECT status, COUNT(*) FROM document_views GROUP BY status;
+
+TRUNCATE feedback_status_counts;
+INSERT INTO feedback_status_counts (document_id, status, count)
+SELECT document_id, status, COUNT(*) FROM feedback_views GROUP BY document_id, status;
+
+-- ============================================================================
+-- COMMENTS
+-- ============================================================================
+
+COMMENT ON TABLE document_status_counts IS 'Number of document_views rows per status, maintained by trigger';
+COMMENT ON TABLE feedback_status_counts IS 'Number of feedback_views rows per document and status, maintained by trigger';
+COMMENT ON INDEX idx_document_views_created_id IS 'Keyset pagination for document listings';
@@ -0,0 +1,101 @@
+-- Migration 021: Normalised semantic IR storage
+-- One row per definition, formula, table and cross-reference instead of a
+-- single IR blob, so the API can return selected fields a page at a time and
+-- search definitions across documents through indexes.
+-- Section bodies and raw markdown are not stored: sections keep their line
+-- ranges and bodies are sliced from document_views.markdown_content on demand.
+-- The older generic semantic_ir table is left in place.
+
+-- ============================================================================
+-- CREATE SEMANTIC_IR_DOCUMENTS TABLE
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS semantic_ir_documents (
+    document_id UUID PRIMARY KEY,
+    title VARCHAR(500) NOT NULL,
+    original_format VARCHAR(50) NOT NULL,
+    sections JSONB NOT NULL DEFAULT '[]',
+    metadata JSONB NOT NULL DEFAULT '{}',
+    validation_issues JSONB NOT NULL DEFAULT '[]',
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    CONSTRAINT semantic_ir_documents_document_fk FOREIGN KEY (document_id)
+        REFERENCES document_views(id) ON DELETE CASCADE
+);
+
+-- ============================================================================
+-- CREATE ELEMENT TABLES
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS semantic_ir_definitions (
+    document_id UUID NOT NULL REFERENCES semantic_ir_documents(document_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    id VARCHAR(100) NOT NULL,
+    term VARCHAR(500) NOT NULL,
+    aliases_lower TEXT[] NOT NULL DEFAULT '{}',
+    section_id VARCHAR(100) NOT NULL,
+    data JSONB NOT NULL,
+
+    PRIMARY KEY (document_id, position)
+);
+
+CREATE TABLE IF NOT EXISTS semantic_ir_formulae (
+    document_id UUID NOT NULL REFERENCES semantic_ir_documents(document_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    id VARCHAR(100) NOT NULL,
+    name VARCHAR(500),
+    section_id VARCHAR(100) NOT NULL,
+    data JSONB NOT NULL,
+
+    PRIMARY KEY (document_id, position)
+);
+
+CREATE TABLE IF NOT EXISTS semantic_ir_tables (
+    document_id UUID NOT NULL REFERENCES semantic_ir_documents(document_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    id VARCHAR(100) NOT NULL,
+    title VARCHAR(500),
+    section_id VARCHAR(100) NOT NULL,
+    data JSONB NOT NULL,
+
+    PRIMARY KEY (document_id, position)
+);
+
+CREATE TABLE IF NOT EXISTS semantic_ir_cross_references (
+    document_id UUID NOT NULL REFERENCES semantic_ir_documents(document_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    id VARCHAR(100) NOT NULL,
+    source_id VARCHAR(100) NOT NULL,
+    target_id VARCHAR(100) NOT NULL,
+    resolved BOOLEAN NOT NULL DEFAULT FALSE,
+    data JSONB NOT NULL,
+
+    PRIMARY KEY (document_id, position)
+);
+
+-- ============================================================================
+-- INDEXES
+-- ============================================================================
+
+-- text_pattern_ops serves LIKE 'prefix%' under any collation
+CREATE INDEX IF NOT EXISTS idx_semantic_ir_definitions_term
+    ON semantic_ir_definitions (lower(term) text_pattern_ops);
+CREATE INDEX IF NOT EXISTS idx_semantic_ir_definitions_aliases
+    ON semantic_ir_definitions USING GIN (aliases_lower);
+CREATE INDEX IF NOT EXISTS idx_semantic_ir_formulae_name
+    ON semantic_ir_formulae (lower(name) text_pattern_ops)
+    WHERE name IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_semantic_ir_cross_references_target
+    ON semantic_ir_cross_references (document_id, target_id);
+
+-- ============================================================================
+-- COMMENTS
+-- ============================================================================
+
+COMMENT ON TABLE semantic_ir_documents IS 'Semantic IR header and section skeletons per document';
+COMMENT ON TABLE semantic_ir_definitions IS 'Term definitions extracted into semantic IR, one row per definition';
+COMMENT ON TABLE semantic_ir_formulae IS 'Formula references extracted into semantic IR, one row per formula';
+COMMENT ON TABLE semantic_ir_tables IS 'Tables extracted into semantic IR, one row per table';
+COMMENT ON TABLE semantic_ir_cross_references IS 'Internal references extracted into semantic IR';
+COMMENT ON COLUMN semantic_ir_documents.sections IS 'Section metadata and line ranges without bodies';
+COMMENT ON COLUMN semantic_ir_definitions.data IS 'Full TermDefinition as serialised by TermDefinition.to_dict';
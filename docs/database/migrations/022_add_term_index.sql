@@ -0,0 +1,45 @@
+-- Migration 022: Cross-document term index
+-- One row per defined term, alias and formula variable of every document's
+-- semantic IR, maintained by TermIndexProjection on DocumentConverted and
+-- SemanticIRCurated. Lets the API find which documents define or use a term
+-- without loading any IR, with prefix and fuzzy (trigram) matching.
+
+-- pg_trgm provides similarity(), the % operator and gin_trgm_ops
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- ============================================================================
+-- CREATE TERM_INDEX_ENTRIES TABLE
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS term_index_entries (
+    document_id UUID NOT NULL,
+    term VARCHAR(500) NOT NULL,
+    term_lower VARCHAR(500) NOT NULL,
+    kind VARCHAR(20) NOT NULL,
+    source_id VARCHAR(100) NOT NULL,
+    section_id VARCHAR(100),
+
+    PRIMARY KEY (document_id, term_lower, kind, source_id),
+    CONSTRAINT term_index_entries_document_fk FOREIGN KEY (document_id)
+        REFERENCES document_views(id) ON DELETE CASCADE,
+    CONSTRAINT term_index_entries_kind_check CHECK (kind IN ('definition', 'alias', 'variable'))
+);
+
+-- ============================================================================
+-- INDEXES
+-- ============================================================================
+
+-- Trigram GIN index serves both the fuzzy % match and LIKE 'prefix%'
+CREATE INDEX IF NOT EXISTS idx_term_index_entries_trgm
+    ON term_index_entries USING GIN (term_lower gin_trgm_ops);
+-- B-tree for exact and short-prefix lookups, where trigrams are unselective
+CREATE INDEX IF NOT EXISTS idx_term_index_entries_term
+    ON term_index_entries (term_lower text_pattern_ops);
+
+-- ============================================================================
+-- COMMENTS
+-- ============================================================================
+
+COMMENT ON TABLE term_index_entries IS 'Inverted index from defined terms, aliases and formula variables to documents';
+COMMENT ON COLUMN term_index_entries.kind IS 'definition, alias (of the definition in source_id) or variable (of the formula in source_id)';
+COMMENT ON COLUMN term_index_entries.source_id IS 'Definition or formula ID within the document semantic IR';
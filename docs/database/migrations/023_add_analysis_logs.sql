@@ -0,0 +1,56 @@
+-- Migration 023: Persistent analysis logs
+-- AnalysisLogStore keeps only a bounded ring of recent entries per document in
+-- memory; PostgresAnalysisLogWriter persists every entry here in batches so
+-- logs survive restarts and can be read from any worker.
+-- Only the latest run per document is kept: starting a new run deletes the
+-- entries of the previous one.
+
+-- ============================================================================
+-- CREATE ANALYSIS_LOGS TABLE
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS analysis_logs (
+    document_id UUID PRIMARY KEY,
+    run_id UUID NOT NULL,
+    started_at TIMESTAMPTZ NOT NULL,
+    completed_at TIMESTAMPTZ,
+    status VARCHAR(50) NOT NULL,
+    last_sequence INTEGER NOT NULL DEFAULT 0,
+    dropped_entries INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- ============================================================================
+-- CREATE ANALYSIS_LOG_ENTRIES TABLE
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS analysis_log_entries (
+    run_id UUID NOT NULL,
+    sequence INTEGER NOT NULL,
+    document_id UUID NOT NULL,
+    id UUID NOT NULL,
+    timestamp TIMESTAMPTZ NOT NULL,
+    level VARCHAR(20) NOT NULL,
+    stage VARCHAR(100) NOT NULL,
+    message TEXT NOT NULL,
+    details JSONB,
+
+    PRIMARY KEY (run_id, sequence)
+);
+
+-- ============================================================================
+-- INDEXES
+-- ============================================================================
+
+-- Deleting the previous run's entries when a new run starts
+CREATE INDEX IF NOT EXISTS idx_analysis_log_entries_document
+    ON analysis_log_entries (document_id);
+
+-- ============================================================================
+-- COMMENTS
+-- ============================================================================
+
+COMMENT ON TABLE analysis_logs IS 'Latest analysis log run per document';
+COMMENT ON TABLE analysis_log_entries IS 'Entries of each analysis log run, numbered by sequence from 1';
+COMMENT ON COLUMN analysis_logs.last_sequence IS 'Sequence of the newest entry written for the run';
+COMMENT ON COLUMN analysis_logs.dropped_entries IS 'Entries the writing worker dropped from its in-memory ring (all are persisted)';
@@ -0,0 +1,91 @@
+-- Migration 024: Event blobs and a sequence-partitioned events table
+-- DocumentConverted events carried the full markdown and sections inline in
+-- events.payload, so every aggregate load and projection page read and decoded
+-- whole documents. PostgresEventStore now writes payload fields larger than
+-- event_blobs.BLOB_THRESHOLD_BYTES to event_blobs, keyed by the SHA-256 of their
+-- JSON encoding, and keeps {"$blob": <digest>} in the payload.
+--
+-- The events table is also replaced by one range-partitioned on sequence, so
+-- vacuum and index maintenance run per partition and reads of recent events
+-- (projection catch-up, health checks) touch only recent partitions. This migration only creates the new table;
+-- scripts/migrate_partition_events.py copies existing rows into it and swaps
+-- it in, and externalizes content of events written before this migration:
+--
+--   python scripts/migrate_partition_events.py externalize
+--   python scripts/migrate_partition_events.py partition
+--   python scripts/migrate_partition_events.py ensure-partitions   # run daily
+--
+-- A partitioned table cannot enforce UNIQUE (aggregate_id, event_version)
+-- across partitions; PostgresEventStore.append serializes appends per
+-- aggregate with a transaction-scoped advisory lock instead.
+
+-- ============================================================================
+-- CREATE EVENT_BLOBS TABLE
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS event_blobs (
+    digest CHAR(64) PRIMARY KEY,
+    content TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- ============================================================================
+-- CREATE PARTITIONED EVENTS TABLE
+-- ============================================================================
+
+-- Same columns and defaults as events; sequence keeps drawing from events_sequence_seq
+CREATE TABLE IF NOT EXISTS events_partitioned (
+    LIKE events INCLUDING DEFAULTS,
+    PRIMARY KEY (sequence)
+) PARTITION BY RANGE (sequence);
+
+-- Aggregate loads: WHERE aggregate_id = $1 AND event_version > $2 ORDER BY event_version
+CREATE INDEX IF NOT EXISTS idx_events_partitioned_aggregate_version
+    ON events_partitioned (aggregate_id, event_version);
+CREATE INDEX IF NOT EXISTS idx_events_partitioned_id ON events_partitioned (id);
+CREATE INDEX IF NOT EXISTS idx_events_partitioned_event_type ON events_partitioned (event_type);
+CREATE INDEX IF NOT EXISTS idx_events_partitioned_created_at ON events_partitioned (created_at);
+
+-- ============================================================================
+-- PARTITION MAINTENANCE
+-- ============================================================================
+
+-- Create the partitions covering every sequence up to p_ahead partitions past
+-- the current one. Partitions are named events_p<n> and hold sequences
+-- [n * p_partition_size + 1, (n + 1) * p_partition_size]. Returns the number
+-- of partitions created.
+CREATE OR REPLACE FUNCTION ensure_events_partitions(
+    p_table TEXT DEFAULT 'events',
+    p_partition_size BIGINT DEFAULT 1000000,
+    p_ahead INTEGER DEFAULT 4
+)
+RETURNS INTEGER AS $$
+DECLARE
+    v_last BIGINT;
+    v_partition BIGINT;
+    v_name TEXT;
+    v_created INTEGER := 0;
+BEGIN
+    v_last := (SELECT last_value FROM events_sequence_seq);
+    FOR v_partition IN 0 .. (v_last / p_partition_size) + p_ahead LOOP
+        v_name := 'events_p' || lpad(v_partition::TEXT, 6, '0');
+        IF to_regclass(v_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%s) TO (%s)',
+                v_name, p_table, v_partition * p_partition_size + 1, (v_partition + 1) * p_partition_size + 1
+            );
+            v_created := v_created + 1;
+        END IF;
+    END LOOP;
+    RETURN v_created;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- COMMENTS
+-- ============================================================================
+
+COMMENT ON TABLE event_blobs IS 'Large event payload fields, content-addressed by the SHA-256 of their JSON encoding';
+COMMENT ON COLUMN event_blobs.content IS 'JSON encoding of the payload field value';
+COMMENT ON TABLE events_partitioned IS 'Events partitioned by sequence range; replaces events after migrate_partition_events.py partition';
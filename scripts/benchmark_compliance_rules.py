@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Compare single-scan and per-rule compliance checking as rule sets grow.
+
+Generates rule sets of "Must include ..." requirements over a synthetic
+vocabulary and a document drawn from the same vocabulary, then times
+``ComplianceChecker.identify_issues`` (one keyword scan for all rules)
+against calling ``check_requirement`` for each rule in turn.
+
+Usage:
+  python scripts/benchmark_compliance_rules.py
+  python scripts/benchmark_compliance_rules.py --rules 10 100 1000 10000 --words 20000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.domain.services.compliance_checker import ComplianceChecker
+from src.domain.value_objects import RequirementType
+
+
+def generate_rules(rng: random.Random, rule_count: int) -> tuple:
+    vocabulary = [f"term{i}x" for i in range(rule_count * 2)]
+    rules = [
+        {"rule": "Must include " + " ".join(rng.sample(vocabulary, 4)), "type": RequirementType.MUST}
+        for _ in range(rule_count)
+    ]
+    return vocabulary, rules
+
+
+def timed(func, repeat: int) -> tuple:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rules", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--words", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rules':>6} {'index (ms)':>11} {'indexed (ms)':>13} {'naive (ms)':>11} {'speedup':>8}  issues")
+
+    for rule_count in args.rules:
+        rng = random.Random(rule_count)
+        vocabulary, rules = generate_rules(rng, rule_count)
+        document = " ".join(rng.choice(vocabulary) for _ in range(args.words))
+
+        checker = ComplianceChecker()
+        start = time.perf_counter()
+        checker.get_index(rules)
+        index_elapsed = time.perf_counter() - start
+
+        indexed_elapsed, indexed = timed(lambda: checker.identify_issues(document, rules), args.repeat)
+        naive_elapsed, naive = timed(
+            lambda: [
+                rule["rule"] for rule in rules
+                if not checker.check_requirement(document, rule["rule"], rule["type"]).is_compliant
+            ],
+            args.repeat,
+        )
+        if [issue["rule"] for issue in indexed] != naive:
+            sys.exit(f"{rule_count} rules: indexed and naive results differ")
+
+        print(
+            f"{rule_count:>6} {index_elapsed * 1000:>11.1f} {indexed_elapsed * 1000:>13.1f} "
+            f"{naive_elapsed * 1000:>11.1f} {naive_elapsed / indexed_elapsed:>7.1f}x  {len(naive)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Build and query a large semantic IR.
+
+Generates a DocumentIR with thousands of definitions, formulae and tables,
+then times lookups through the indexed ``find_*`` methods against the
+linear scans they replaced, plus the IR consumers that call them in loops
+(IRValidator and TestCaseGenerator) and ``to_llm_format``.
+
+Usage:
+  python scripts/benchmark_document_ir.py
+  python scripts/benchmark_document_ir.py --definitions 20000 --formulae 2000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.domain.testing.test_generator import TestCaseGenerator
+from src.domain.value_objects.semantic_ir import (
+    DocumentIR,
+    FormulaReference,
+    IRSection,
+    SectionType,
+    TableData,
+    TermDefinition,
+)
+from src.infrastructure.semantic.ir_validator import IRValidator
+
+
+def build_ir(definition_count: int, formula_count: int, table_count: int) -> DocumentIR:
+    rng = random.Random(42)
+    sections = [
+        IRSection(
+            id=f"sec-{n}",
+            title=f"Section {n}",
+            content=f"Body of section {n}. " * 20,
+            level=1,
+            section_type=SectionType.DEFINITION,
+        )
+        for n in range(max(1, definition_count // 50))
+    ]
+    definitions = [
+        TermDefinition(
+            id=f"def-{n}",
+            term=f"Term{n}",
+            definition=f"Meaning of term {n}",
+            section_id=sections[n % len(sections)].id,
+            aliases=[f"T{n}"],
+        )
+        for n in range(definition_count)
+    ]
+    formulae = [
+        FormulaReference(
+            id=f"formula-{n}",
+            latex=f"F{n} = x + y",
+            section_id=sections[n % len(sections)].id,
+            name=f"Formula{n}",
+            variables=[f"Term{rng.randrange(definition_count)}" for _ in range(4)],
+        )
+        for n in range(formula_count)
+    ]
+    tables = [
+        TableData(id=f"table-{n}", headers=["a", "b"], rows=[["1", "2"]], section_id=sections[0].id)
+        for n in range(table_count)
+    ]
+    markdown = "\n".join(section.content for section in sections)
+    return DocumentIR(
+        document_id="benchmark",
+        title="Benchmark",
+        original_format="markdown",
+        sections=sections,
+        definitions=definitions,
+        formulae=formulae,
+        tables=tables,
+        cross_references=[],
+        metadata={},
+        raw_markdown=markdown,
+    )
+
+
+def linear_find_definition(ir: DocumentIR, term: str):
+    for definition in ir.definitions:
+        if definition.matches(term):
+            return definition
+    return None
+
+
+def timed(label: str, fn) -> float:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34}{elapsed * 1000:>10.1f} ms")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark DocumentIR lookups")
+    parser.add_argument("--definitions", type=int, default=5000)
+    parser.add_argument("--formulae", type=int, default=1000)
+    parser.add_argument("--tables", type=int, default=500)
+    parser.add_argument("--lookups", type=int, default=5000)
+    parser.add_argument("--linear-sample", type=int, default=200, help="Lookups timed with the old linear scan")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    ir = None
+
+    def build():
+        nonlocal ir
+        ir = build_ir(args.definitions, args.formulae, args.tables)
+
+    print(f"definitions={args.definitions} formulae={args.formulae} "
+          f"tables={args.tables} lookups={args.lookups}")
+    timed("build IR", build)
+    terms = [f"term{rng.randrange(args.definitions)}" for _ in range(args.lookups)]
+    formula_ids = [f"formula-{rng.randrange(args.formulae)}" for _ in range(args.lookups)]
+
+    timed("find_definition (first, builds)", lambda: ir.find_definition(terms[0]))
+    indexed = timed("find_definition x lookups", lambda: [ir.find_definition(t) for t in terms])
+    sample = terms[:args.linear_sample]
+    linear = timed(f"linear scan x {len(sample)}", lambda: [linear_find_definition(ir, t) for t in sample])
+    timed("find_formula x lookups", lambda: [ir.find_formula(f) for f in formula_ids])
+    timed("find_table x lookups", lambda: [ir.find_table(f"table-{n % args.tables}") for n in range(args.lookups)])
+    timed("IRValidator.validate", lambda: IRValidator().validate(ir))
+    timed("TestCaseGenerator (all formulae)", lambda: TestCaseGenerator().generate_from_document(ir))
+    timed("to_llm_format", ir.to_llm_format)
+    speedup = (linear / len(sample)) / (indexed / len(terms))
+    print(f"{'per-lookup speed-up':<34}{speedup:>10.0f} x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Compare full and incremental semantic IR builds for an edited document.
+
+Generates a specification-style markdown document (numbered sections with
+definitions, formulae, tables and cross-references), builds its IR, then
+edits a growing percentage of sections and times ``IRBuilder.build``
+against ``IncrementalIRBuilder.rebuild`` seeded with the previous IR.
+
+Usage:
+  python scripts/benchmark_incremental_ir.py
+  python scripts/benchmark_incremental_ir.py --sections 2000 --percent 0 1 5 25 100
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.infrastructure.converters.base import (
+    ConversionResult,
+    DocumentFormat,
+    DocumentMetadata,
+    DocumentSection,
+)
+from src.infrastructure.semantic import IRBuilder, IncrementalIRBuilder
+
+
+def section_body(n: int, revision: int) -> list:
+    edit = f" (revision {revision})" if revision else ""
+    lines = [
+        f'"Term {n}" means the value computed for instrument group {n}{edit}, '
+        f"measured at the close of each trading day.",
+        "",
+        f"Order Window {n}: the interval in which orders for group {n} are accepted{edit}.",
+        "",
+        f"See Section {max(1, n - 1)}.1 for the previous group and Table {max(1, n // 4)} for limits.",
+        "",
+        "$$",
+        f"Score{n} = Term{n} \\times \\alpha + \\beta_{{{n}}}",
+        "$$",
+        "",
+    ]
+    if n % 4 == 0:
+        lines += [
+            f"Table {n // 4}: Limits for group {n}",
+            "| Field | Limit | Unit |",
+            "|-------|-------|------|",
+            f"| size | {n * 10} | lots |",
+            f"| price | {n}.5 | EUR |",
+            "",
+        ]
+    return lines
+
+
+def generate_document(section_count: int, revisions: dict) -> ConversionResult:
+    lines = ["# Trading Specification", "", "Preamble text for the specification.", ""]
+    sections = []
+    for n in range(1, section_count + 1):
+        start = len(lines) + 1
+        title = f"{n}.1 Group {n} Rules"
+        body = section_body(n, revisions.get(n, 0))
+        lines.append(f"## {title}")
+        lines.extend(body)
+        sections.append(
+            DocumentSection(
+                id=f"section-{n + 1}",
+                title=title,
+                content="\n".join(body).strip(),
+                level=2,
+                start_line=start,
+                end_line=len(lines),
+            )
+        )
+    sections.insert(
+        0,
+        DocumentSection(
+            id="section-1",
+            title="Trading Specification",
+            content="Preamble text for the specification.",
+            level=1,
+            start_line=1,
+            end_line=4,
+        ),
+    )
+    return ConversionResult(
+        success=True,
+        markdown_content="\n".join(lines),
+        sections=sections,
+        metadata=DocumentMetadata(title="Trading Specification", original_format=DocumentFormat.MARKDOWN),
+    )
+
+
+def timed(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sections", type=int, default=1000)
+    parser.add_argument("--percent", type=float, nargs="+", default=[0, 1, 5, 10, 25, 50, 100])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    original = generate_document(args.sections, {})
+    previous = IRBuilder().build(original, "benchmark")
+    print(
+        f"Document: {args.sections} sections, {len(previous.definitions)} definitions, "
+        f"{len(previous.formulae)} formulae, {len(previous.tables)} tables, "
+        f"{len(previous.cross_references)} cross-references"
+    )
+    print(f"{'changed':>8} {'full (ms)':>10} {'incremental (ms)':>17} {'speedup':>8}  diff")
+
+    for percent in args.percent:
+        changed = rng.sample(range(1, args.sections + 1), round(args.sections * percent / 100))
+        edited = generate_document(args.sections, {n: 1 for n in changed})
+
+        full = timed(lambda: IRBuilder().build(edited, "benchmark"), args.repeat)
+        builder = IncrementalIRBuilder()
+        incremental = timed(lambda: builder.rebuild(edited, "benchmark", previous), args.repeat)
+        _, diff = builder.rebuild(edited, "benchmark", previous)
+
+        print(
+            f"{percent:>7.0f}% {full * 1000:>10.1f} {incremental * 1000:>17.1f} "
+            f"{full / incremental:>7.1f}x  {diff.summary()}"
+        )
+
+
+if __name__ == "__main__":
+    main()
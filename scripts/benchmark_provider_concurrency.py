@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark for the AI providers against a local mock server.
+
+Starts an in-process mock of the Anthropic Messages and OpenAI Chat
+Completions APIs that streams its answer over a fixed latency, then fires
+many concurrent ``analyze_document_stream`` calls through the real
+provider classes. Reports wall time, latency and time-to-first-issue
+percentiles, thread count and how many TCP connections the pooled HTTP
+client opened.
+
+Usage:
+  python scripts/benchmark_provider_concurrency.py --requests 200 --latency 0.5
+  python scripts/benchmark_provider_concurrency.py --provider openai --max-connections 10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+ANALYSIS_JSON = json.dumps({
+    "issues": [
+        {
+            "rule_id": f"RULE-{n}",
+            "severity": "medium",
+            "title": f"Mock issue {n}",
+            "description": "Parameter lacks a documented range. " * 4,
+            "location": f"Section {n}",
+            "original_text": "The threshold is configurable.",
+            "confidence": 0.8,
+        }
+        for n in range(1, 6)
+    ],
+    "suggestions": [],
+    "summary": "mock analysis",
+}, indent=2)
+CHUNK_SIZE = 40
+
+
+def sse(event: dict, name: str | None = None) -> str:
+    prefix = f"event: {name}\n" if name else ""
+    return f"{prefix}data: {json.dumps(event)}\n\n"
+
+
+async def stream_chunks(latency: float):
+    chunks = [ANALYSIS_JSON[i:i + CHUNK_SIZE] for i in range(0, len(ANALYSIS_JSON), CHUNK_SIZE)]
+    await asyncio.sleep(latency / 2)
+    for chunk in chunks:
+        yield chunk
+        await asyncio.sleep(latency / 2 / len(chunks))
+
+
+async def anthropic_events(latency: float):
+    message = {
+        "id": "msg_mock", "type": "message", "role": "assistant", "model": "claude-sonnet-4-5",
+        "content": [], "stop_reason": None, "stop_sequence": None,
+        "usage": {"input_tokens": 100, "output_tokens": 1},
+    }
+    yield sse({"type": "message_start", "message": message}, "message_start")
+    yield sse({"type": "content_block_start", "index": 0,
+               "content_block": {"type": "text", "text": ""}}, "content_block_start")
+    async for chunk in stream_chunks(latency):
+        yield sse({"type": "content_block_delta", "index": 0,
+                   "delta": {"type": "text_delta", "text": chunk}}, "content_block_delta")
+    yield sse({"type": "content_block_stop", "index": 0}, "content_block_stop")
+    yield sse({"type": "message_delta", "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+               "usage": {"output_tokens": 200}}, "message_delta")
+    yield sse({"type": "message_stop"}, "message_stop")
+
+
+async def openai_events(latency: float):
+    base = {"id": "chatcmpl-mock", "object": "chat.completion.chunk", "created": int(time.time()), "model": "gpt-5"}
+    async for chunk in stream_chunks(latency):
+        yield sse({**base, "choices": [{"index": 0, "delta": {"content": chunk}, "finish_reason": None}]})
+    yield sse({**base, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]})
+    yield sse({**base, "choices": [],
+               "usage": {"prompt_tokens": 100, "completion_tokens": 200, "total_tokens": 300}})
+    yield "data: [DONE]\n\n"
+
+
+def create_mock_app(latency: float) -> tuple[FastAPI, set]:
+    app = FastAPI()
+    peers: set = set()
+
+    @app.post("/v1/messages")
+    async def anthropic_messages(request: Request):
+        peers.add(request.client)
+        if (await request.json()).get("stream"):
+            return StreamingResponse(anthropic_events(latency), media_type="text/event-stream")
+        await asyncio.sleep(latency)
+        return {
+            "id": "msg_mock",
+            "type": "message",
+            "role": "assistant",
+            "model": "claude-sonnet-4-5",
+            "content": [{"type": "text", "text": ANALYSIS_JSON}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": 100, "output_tokens": 20},
+        }
+
+    @app.post("/v1/chat/completions")
+    async def openai_chat(request: Request):
+        peers.add(request.client)
+        if (await request.json()).get("stream"):
+            return StreamingResponse(openai_events(latency), media_type="text/event-stream")
+        await asyncio.sleep(latency)
+        return {
+            "id": "chatcmpl-mock",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": "gpt-5",
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": ANALYSIS_JSON},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 100, "completion_tokens": 20, "total_tokens": 120},
+        }
+
+    return app, peers
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def run_benchmark(args: argparse.Namespace) -> None:
+    port = free_port()
+    base = f"http://127.0.0.1:{port}"
+    os.environ["AI_INTEGRATIONS_ANTHROPIC_BASE_URL"] = base
+    os.environ["AI_INTEGRATIONS_ANTHROPIC_API_KEY"] = "mock-key"
+    os.environ["AI_INTEGRATIONS_OPENAI_BASE_URL"] = f"{base}/v1"
+    os.environ["AI_INTEGRATIONS_OPENAI_API_KEY"] = "mock-key"
+    os.environ["AI_HTTP_MAX_CONNECTIONS"] = str(args.max_connections)
+    os.environ["AI_HTTP_MAX_KEEPALIVE_CONNECTIONS"] = str(args.max_connections)
+
+    app, peers = create_mock_app(args.latency)
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    from src.infrastructure.ai.http_pool import close_http_clients
+    from src.infrastructure.ai.rate_limiter import RateLimiter, RateLimitConfig
+
+    if args.provider == "claude":
+        from src.infrastructure.ai.claude_provider import ClaudeProvider as Provider
+    else:
+        from src.infrastructure.ai.openai_provider import OpenAIProvider as Provider
+
+    limiter = RateLimiter(RateLimitConfig(
+        requests_per_minute=1_000_000,
+        requests_per_hour=1_000_000,
+        tokens_per_minute=1_000_000_000,
+        concurrent_requests=args.requests,
+    ))
+    provider = Provider(rate_limiter=limiter)
+    latencies: list[float] = []
+    first_issue: list[float] = []
+    peak_threads = threading.active_count()
+
+    async def one_call() -> None:
+        nonlocal peak_threads
+        start = time.perf_counter()
+        seen: list[float] = []
+
+        def on_issue(issue) -> None:
+            if not seen:
+                seen.append(time.perf_counter() - start)
+
+        result = await provider.analyze_document_stream("# Mock document\n" * 50, [], on_issue=on_issue)
+        latencies.append(time.perf_counter() - start)
+        first_issue.extend(seen)
+        peak_threads = max(peak_threads, threading.active_count())
+        if not result.success:
+            raise RuntimeError(result.errors)
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(one_call() for _ in range(args.requests)))
+    wall = time.perf_counter() - wall_start
+
+    latencies.sort()
+    first_issue.sort()
+    print(f"provider:           {args.provider}")
+    print(f"requests:           {args.requests}")
+    print(f"mock latency:       {args.latency * 1000:.0f} ms")
+    print(f"max connections:    {args.max_connections}")
+    print(f"wall time:          {wall:.2f} s ({args.requests / wall:.1f} req/s)")
+    print(f"latency p50/p95:    {statistics.median(latencies) * 1000:.0f} / "
+          f"{latencies[int(len(latencies) * 0.95) - 1] * 1000:.0f} ms")
+    if first_issue:
+        print(f"first issue p50:    {statistics.median(first_issue) * 1000:.0f} ms")
+    print(f"peak threads:       {peak_threads}")
+    print(f"tcp connections:    {len(peers)}")
+
+    await close_http_clients()
+    server.should_exit = True
+    await server_task
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark AI provider concurrency against a mock server")
+    parser.add_argument("--provider", choices=["claude", "openai"], default="claude")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.5, help="Mock response latency in seconds")
+    parser.add_argument("--max-connections", type=int, default=100)
+    asyncio.run(run_benchmark(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Migrate the event store to event blobs and a sequence-partitioned events table.
+
+Run after applying docs/database/migrations/024_add_event_blobs_and_partitioned_events.sql.
+
+Commands:
+  externalize        Move large content fields of existing events to event_blobs
+  partition          Copy events into events_partitioned and swap it in as events
+  ensure-partitions  Create upcoming partitions (run daily once partitioned)
+
+Usage:
+  python scripts/migrate_partition_events.py externalize --dry-run
+  python scripts/migrate_partition_events.py externalize --batch-size 500
+  python scripts/migrate_partition_events.py partition --partition-size 1000000
+  python scripts/migrate_partition_events.py ensure-partitions
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+import asyncpg
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.infrastructure.persistence.event_blobs import EXTERNALIZED_FIELDS, externalize  # noqa: E402
+
+
+async def externalize_events(conn: asyncpg.Connection, batch_size: int, dry_run: bool) -> None:
+    """Rewrite payloads of existing events with blob references, one batch per transaction."""
+    event_types = list(EXTERNALIZED_FIELDS)
+    last_sequence = 0
+    rewritten = 0
+    moved_bytes = 0
+    while True:
+        rows = await conn.fetch(
+            """
+            SELECT sequence, event_type, payload
+            FROM events
+            WHERE sequence > $1 AND event_type = ANY($2::text[])
+            ORDER BY sequence
+            LIMIT $3
+            """,
+            last_sequence,
+            event_types,
+            batch_size,
+        )
+        if not rows:
+            break
+        async with conn.transaction():
+            for row in rows:
+                payload = json.loads(row["payload"]) if isinstance(row["payload"], str) else row["payload"]
+                payload, blobs = externalize(row["event_type"], payload)
+                if not blobs:
+                    continue
+                rewritten += 1
+                moved_bytes += sum(len(encoded) for encoded in blobs.values())
+                if dry_run:
+                    continue
+                await conn.executemany(
+                    """
+                    INSERT INTO event_blobs (digest, content, size_bytes)
+                    VALUES ($1, $2, $3)
+                    ON CONFLICT (digest) DO NOTHING
+                    """,
+                    [(digest, encoded, len(encoded)) for digest, encoded in blobs.items()],
+                )
+                await conn.execute(
+                    "UPDATE events SET payload = $2 WHERE sequence = $1",
+                    row["sequence"],
+                    json.dumps(payload),
+                )
+        last_sequence = rows[-1]["sequence"]
+        print(f"  ... up to sequence {last_sequence}: {rewritten} payloads")
+
+    verb = "Would rewrite" if dry_run else "✓ Rewrote"
+    print(f"{verb} {rewritten} payloads, moving {moved_bytes / 1024 / 1024:.1f} MiB to event_blobs")
+
+
+async def is_partitioned(conn: asyncpg.Connection, table: str) -> bool:
+    return await conn.fetchval("SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass($1)", table) or False
+
+
+async def copy_events(conn: asyncpg.Connection, batch_size: int) -> int:
+    """Copy events not yet in events_partitioned, in sequence order; returns rows copied."""
+    last_copied = await conn.fetchval("SELECT COALESCE(MAX(sequence), 0) FROM events_partitioned")
+    last_sequence = await conn.fetchval("SELECT COALESCE(MAX(sequence), 0) FROM events")
+    copied = 0
+    while last_copied < last_sequence:
+        upper = last_copied + batch_size
+        result = await conn.execute(
+            """
+            INSERT INTO events_partitioned
+            SELECT * FROM events WHERE sequence > $1 AND sequence <= $2
+            """,
+            last_copied,
+            upper,
+        )
+        copied += int(result.split()[-1])
+        last_copied = upper
+    return copied
+
+
+async def partition_events(
+    conn: asyncpg.Connection, batch_size: int, partition_size: int, ahead: int, dry_run: bool
+) -> None:
+    """Copy events into events_partitioned while writes continue, then swap under a lock."""
+    if await is_partitioned(conn, "events"):
+        print("✓ events is already partitioned")
+        return
+    if await conn.fetchval("SELECT to_regclass('events_partitioned')") is None:
+        raise RuntimeError("events_partitioned does not exist; apply migration 024 first")
+
+    if dry_run:
+        count = await conn.fetchval("SELECT COUNT(*) FROM events")
+        last_sequence = await conn.fetchval("SELECT COALESCE(MAX(sequence), 0) FROM events")
+        partitions = last_sequence // partition_size + 1 + ahead
+        print(f"Would copy {count} events into {partitions} partitions of {partition_size} sequences")
+        return
+
+    created = await conn.fetchval(
+        "SELECT ensure_events_partitions('events_partitioned', $1, $2)", partition_size, ahead
+    )
+    print(f"✓ Created {created} partitions")
+
+    # Bulk of the copy runs while the application keeps appending
+    copied = await copy_events(conn, batch_size)
+    print(f"✓ Copied {copied} events")
+
+    async with conn.transaction():
+        # Blocks appends, not reads, until the swap commits
+        await conn.execute("LOCK TABLE events IN EXCLUSIVE MODE")
+        await conn.fetchval(
+            "SELECT ensure_events_partitions('events_partitioned', $1, $2)", partition_size, ahead
+        )
+        tail = await copy_events(conn, batch_size)
+        old_count = await conn.fetchval("SELECT COUNT(*) FROM events")
+        new_count = await conn.fetchval("SELECT COUNT(*) FROM events_partitioned")
+        if old_count != new_count:
+            raise RuntimeError(f"Row counts differ after copy: events={old_count}, events_partitioned={new_count}")
+        await conn.execute("ALTER TABLE events RENAME TO events_unpartitioned")
+        await conn.execute("ALTER TABLE events_partitioned RENAME TO events")
+        # Dropping the old table must not drop the sequence the new one draws from
+        await conn.execute("ALTER SEQUENCE events_sequence_seq OWNED BY events.sequence")
+    print(f"✓ Copied {tail} events written during the copy and swapped in the partitioned table")
+    print("  The previous table is kept as events_unpartitioned; drop it once verified:")
+    print("  DROP TABLE events_unpartitioned;")
+
+
+async def ensure_partitions(conn: asyncpg.Connection, partition_size: int, ahead: int) -> None:
+    if not await is_partitioned(conn, "events"):
+        raise RuntimeError("events is not partitioned yet; run the partition command first")
+    created = await conn.fetchval("SELECT ensure_events_partitions('events', $1, $2)", partition_size, ahead)
+    print(f"✓ Created {created} partitions")
+
+
+async def migrate(args: argparse.Namespace) -> int:
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        print("ERROR: DATABASE_URL environment variable not set")
+        return 1
+
+    print("Connecting to database...")
+    conn = await asyncpg.connect(database_url)
+
+    try:
+        if args.command == "externalize":
+            await externalize_events(conn, args.batch_size, args.dry_run)
+        elif args.command == "partition":
+            await partition_events(conn, args.batch_size, args.partition_size, args.ahead, args.dry_run)
+        else:
+            await ensure_partitions(conn, args.partition_size, args.ahead)
+        print("\n✅ Migration completed successfully!")
+        return 0
+
+    except Exception as e:
+        print(f"\n❌ Migration failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    finally:
+        await conn.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=("externalize", "partition", "ensure-partitions"))
+    parser.add_argument("--batch-size", type=int, default=1000, help="Events per batch")
+    parser.add_argument("--partition-size", type=int, default=1_000_000, help="Sequences per partition")
+    parser.add_argument("--ahead", type=int, default=4, help="Empty partitions to keep ahead of the sequence")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would change without writing")
+    return asyncio.run(migrate(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -147,6 +147,26 @@ class Settings(BaseSettings):
         description="Maximum retries for AI requests"
     )
 
+    # ========================================================================
+    # Health Checks
+    # ========================================================================
+    HEALTH_REFRESH_INTERVAL: float = Field(
+        default=10.0,
+        gt=0,
+        description="Seconds between background dependency checks served by the readiness probe"
+    )
+
+    HEALTH_CHECK_TIMEOUT: float = Field(
+        default=2.0,
+        gt=0,
+        description="Seconds a single dependency check may take before it counts as unhealthy"
+    )
+
+    PREWARM_ON_STARTUP: bool = Field(
+        default=True,
+        description="Import document converters and configured AI providers in the background once ready"
+    )
+
     # ========================================================================
     # Logging Configuration
     # ========================================================================
@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import time
 from typing import Optional, Callable
 
 import asyncpg
@@ -11,12 +13,29 @@ from src.infrastructure.persistence.snapshot_store import InMemorySnapshotStore
 from src.infrastructure.repositories.document_repository import DocumentRepository
 from src.infrastructure.repositories.feedback_repository import FeedbackSessionRepository
 from src.infrastructure.repositories.policy_repository import PolicyRepositoryRepository
-from src.infrastructure.queries.document_queries import DocumentQueries
+from src.infrastructure.queries.document_queries import DocumentDetailCache, DocumentQueries
 from src.infrastructure.queries.feedback_queries import FeedbackQueries
 from src.infrastructure.queries.policy_queries import PolicyQueries
 from src.infrastructure.queries.audit_queries import AuditQueries
+from src.infrastructure.queries.document_acl_queries import DocumentAclCache, DocumentAclQueries
+from src.infrastructure.semantic.ir_store import (
+    SemanticIRStore,
+    InMemorySemanticIRStore,
+    PostgresSemanticIRStore,
+)
+from src.infrastructure.semantic.converted_ir import ConvertedIR
+from src.infrastructure.semantic.lineage_graph_cache import LineageGraphCache
+from src.infrastructure.semantic.term_index import TermIndex, InMemoryTermIndex, PostgresTermIndex
 from src.infrastructure.converters.converter_factory import ConverterFactory
+from src.infrastructure.ai import token_budget
+from src.infrastructure.ai.chat import DocumentChatService
+from src.infrastructure.ai.analysis.analysis_log import AnalysisLogStore
+from src.infrastructure.ai.analysis.analysis_log_writer import PostgresAnalysisLogWriter
+from src.infrastructure.ai.analysis.progress_broadcaster import ProgressBroadcaster
+from src.infrastructure.ai.analysis.progress_relay import PostgresProgressRelay
 from src.infrastructure.projections.document_projector import DocumentProjection
+from src.infrastructure.projections.document_acl_projector import DocumentAclProjection
+from src.infrastructure.projections.term_index_projector import TermIndexProjection
 from src.infrastructure.projections.policy_projector import PolicyProjection
 from src.infrastructure.projections.failure_tracking import ProjectionFailureTracker
 from src.application.services.event_publisher import InMemoryEventPublisher, ProjectionEventPublisher
@@ -29,11 +48,14 @@ from src.application.commands.document_handlers import (
 )
 from src.application.commands.analysis_handlers import (
     StartAnalysisHandler,
+    StartBatchAnalysisHandler,
     CancelAnalysisHandler,
 )
 from src.application.commands.feedback_handlers import (
     AcceptChangeHandler,
     RejectChangeHandler,
+    AcceptChangesHandler,
+    RejectChangesHandler,
     ModifyChangeHandler,
 )
 from src.application.commands.policy_handlers import (
@@ -50,6 +72,7 @@ from src.application.queries.feedback_queries import (
     GetFeedbackByDocumentHandler,
     GetFeedbackByIdHandler,
     CountFeedbackByDocumentHandler,
+    GetFeedbackStatusCountsHandler,
 )
 from src.application.queries.policy_queries import (
     GetPolicyRepositoryByIdHandler,
@@ -61,6 +84,8 @@ from src.application.queries.audit_queries import (
     GetAuditLogByDocumentHandler,
 )
 from .config import get_settings, Settings
+from .health_monitor import HealthMonitor
+from .middleware.compression import CompressedVariantCache
 
 
 class Container:
@@ -74,6 +99,18 @@ class Container:
         self._event_publisher: Optional[InMemoryEventPublisher] = None
         self._failure_tracker: Optional[ProjectionFailureTracker] = None
         self._converter_factory: Optional[ConverterFactory] = None
+        self._provider_factory = None
+        self._document_acl_cache = DocumentAclCache()
+        self._document_detail_cache = DocumentDetailCache()
+        self._content_variant_cache = CompressedVariantCache()
+        self._semantic_ir_store: Optional[SemanticIRStore] = None
+        self._lineage_graph_cache: Optional[LineageGraphCache] = None
+        self._term_index: Optional[TermIndex] = None
+        self._chat_service: Optional[DocumentChatService] = None
+        self._analysis_log_writer: Optional[PostgresAnalysisLogWriter] = None
+        self._progress_relay: Optional[PostgresProgressRelay] = None
+        self._health_monitor: Optional[HealthMonitor] = None
+        self._prewarm_task: Optional[asyncio.Task] = None
 
     @classmethod
     async def get_instance(cls) -> "Container":
@@ -91,16 +128,62 @@ class Container:
                 max_size=self._settings.DB_POOL_MAX_SIZE,
             )
             self._register_projections()
+            await self._start_analysis_log_writer()
+            await self._start_progress_relay()
+            await self.health_monitor.start()
+        if self._settings.PREWARM_ON_STARTUP:
+            self._prewarm_task = asyncio.create_task(self.prewarm())
+
+    async def prewarm(self) -> None:
+        """
+        Import the document converters and configured AI providers ahead of use,
+        and load the tokenizer used for prompt budgets.
+
+        Those modules load lazily to keep startup fast; loading them here, in a
+        worker thread once the app is ready, spares the first upload or analysis
+        the import cost. Token counts are estimated until the tokenizer loads.
+        """
+        started = time.perf_counter()
+        try:
+            converters = await asyncio.to_thread(self.converter_factory.preload)
+            providers = await asyncio.to_thread(self.provider_factory.preload)
+            encodings = await asyncio.to_thread(token_budget.preload)
+        except Exception as e:
+            logger.warning(f"Pre-warming failed; modules will load on first use: {e}")
+            return
+        logger.info(
+            f"Pre-warmed {len(converters)} converters, {len(providers)} AI providers and "
+            f"{len(encodings)} tokenizers in {time.perf_counter() - started:.2f}s"
+        )
+
+    async def _start_analysis_log_writer(self) -> None:
+        """Persist analysis logs in the background and read other workers' logs."""
+        self._analysis_log_writer = PostgresAnalysisLogWriter(self._pool)
+        AnalysisLogStore.get_instance().attach(sink=self._analysis_log_writer, reader=self._analysis_log_writer)
+        await self._analysis_log_writer.start()
+
+    async def _start_progress_relay(self) -> None:
+        """Share analysis progress with the other workers."""
+        broadcaster = ProgressBroadcaster.get_instance()
+        self._progress_relay = PostgresProgressRelay(self._pool, broadcaster)
+        broadcaster.attach(self._progress_relay)
+        await self._progress_relay.start()
 
     def _register_projections(self) -> None:
         if self._pool:
             logger.info("Registering projections and event handlers with event publisher")
 
             # Register projections
-            document_projection = DocumentProjection(self._pool)
+            document_projection = DocumentProjection(self._pool, detail_cache=self._document_detail_cache)
             self.event_publisher.register_projection(document_projection)
-            policy_projection = PolicyProjection(self._pool)
+            policy_projection = PolicyProjection(self._pool, detail_cache=self._document_detail_cache)
             self.event_publisher.register_projection(policy_projection)
+            document_acl_projection = DocumentAclProjection(self._pool, cache=self._document_acl_cache)
+            self.event_publisher.register_projection(document_acl_projection)
+            # Shared so a first conversion's IR is built and saved once for both consumers
+            converted_ir = ConvertedIR(self.semantic_ir_store)
+            term_index_projection = TermIndexProjection(self.term_index, self.semantic_ir_store, converted_ir)
+            self.event_publisher.register_projection(term_index_projection)
 
             # Register event handlers
             db_connection = PostgresConnection(self._pool)
@@ -109,6 +192,8 @@ class Container:
                 event_publisher=self.event_publisher,
                 db_connection=db_connection,
                 enabled=True,
+                ir_store=self.semantic_ir_store,
+                converted_ir=converted_ir,
             )
 
             # Subscribe to DocumentConverted events
@@ -121,6 +206,18 @@ class Container:
             )
 
     async def close(self) -> None:
+        if self._prewarm_task and not self._prewarm_task.done():
+            self._prewarm_task.cancel()
+        if self._health_monitor:
+            await self._health_monitor.stop()
+        if self._progress_relay:
+            ProgressBroadcaster.get_instance().attach(None)
+            await self._progress_relay.stop()
+            self._progress_relay = None
+        if self._analysis_log_writer:
+            AnalysisLogStore.get_instance().attach(sink=None, reader=None)
+            await self._analysis_log_writer.stop()
+            self._analysis_log_writer = None
         if self._pool:
             await self._pool.close()
             self._pool = None
@@ -129,6 +226,17 @@ class Container:
     def pool(self) -> Optional[asyncpg.Pool]:
         return self._pool
 
+    @property
+    def health_monitor(self) -> HealthMonitor:
+        if self._health_monitor is None:
+            settings = get_settings()
+            self._health_monitor = HealthMonitor(
+                lambda: self._pool,
+                refresh_interval=settings.HEALTH_REFRESH_INTERVAL,
+                check_timeout=settings.HEALTH_CHECK_TIMEOUT,
+            )
+        return self._health_monitor
+
     @property
     def event_store(self) -> PostgresEventStore:
         if self._event_store is None and self._pool:
@@ -169,6 +277,16 @@ class Container:
             self._converter_factory = ConverterFactory()
         return self._converter_factory
 
+    @property
+    def provider_factory(self):
+        """Shared AI provider factory so rate limits apply across requests."""
+        from src.infrastructure.ai.provider_factory import ProviderFactory
+        from src.infrastructure.ai.rate_limiter import PostgresRateLimitStore
+        if self._provider_factory is None:
+            store = PostgresRateLimitStore(self._pool) if self._pool else None
+            self._provider_factory = ProviderFactory(rate_limit_store=store)
+        return self._provider_factory
+
     @property
     def document_repository(self) -> DocumentRepository:
         return DocumentRepository(self.event_store, self.snapshot_store)
@@ -189,7 +307,7 @@ class Container:
     @property
     def document_queries(self) -> Optional[DocumentQueries]:
         if self._pool:
-            return DocumentQueries(self._pool)
+            return DocumentQueries(self._pool, cache=self._document_detail_cache)
         return None
 
     @property
@@ -204,6 +322,46 @@ class Container:
             return PolicyQueries(self._pool)
         return None
 
+    @property
+    def document_acl_queries(self) -> Optional[DocumentAclQueries]:
+        if self._pool:
+            return DocumentAclQueries(self._pool, cache=self._document_acl_cache)
+        return None
+
+    @property
+    def content_variant_cache(self) -> CompressedVariantCache:
+        return self._content_variant_cache
+
+    @property
+    def semantic_ir_store(self) -> SemanticIRStore:
+        if self._semantic_ir_store is None:
+            if self._pool:
+                self._semantic_ir_store = PostgresSemanticIRStore(self._pool)
+            else:
+                self._semantic_ir_store = InMemorySemanticIRStore()
+        return self._semantic_ir_store
+
+    @property
+    def lineage_graph_cache(self) -> LineageGraphCache:
+        if self._lineage_graph_cache is None:
+            self._lineage_graph_cache = LineageGraphCache(self.semantic_ir_store)
+        return self._lineage_graph_cache
+
+    @property
+    def chat_service(self) -> DocumentChatService:
+        if self._chat_service is None:
+            self._chat_service = DocumentChatService(self.semantic_ir_store)
+        return self._chat_service
+
+    @property
+    def term_index(self) -> TermIndex:
+        if self._term_index is None:
+            if self._pool:
+                self._term_index = PostgresTermIndex(self._pool)
+            else:
+                self._term_index = InMemoryTermIndex()
+        return self._term_index
+
     @property
     def audit_queries(self) -> Optional[AuditQueries]:
         if self._pool:
@@ -250,12 +408,20 @@ async def get_delete_document_handler() -> DeleteDocumentHandler:
 
 async def get_start_analysis_handler() -> StartAnalysisHandler:
     container = await get_container()
-    from src.infrastructure.ai.provider_factory import ProviderFactory
     return StartAnalysisHandler(
         document_repository=container.document_repository,
         policy_repository=container.policy_repository,
         event_publisher=container.event_publisher,
-        provider_factory=ProviderFactory(),
+        provider_factory=container.provider_factory,
+    )
+
+
+async def get_start_batch_analysis_handler() -> StartBatchAnalysisHandler:
+    container = await get_container()
+    return StartBatchAnalysisHandler(
+        document_repository=container.document_repository,
+        policy_repository=container.policy_repository,
+        analysis_handler=await get_start_analysis_handler(),
     )
 
 
@@ -283,6 +449,22 @@ async def get_reject_change_handler() -> RejectChangeHandler:
     )
 
 
+async def get_accept_changes_handler() -> AcceptChangesHandler:
+    container = await get_container()
+    return AcceptChangesHandler(
+        feedback_repository=container.feedback_repository,
+        event_publisher=container.event_publisher,
+    )
+
+
+async def get_reject_changes_handler() -> RejectChangesHandler:
+    container = await get_container()
+    return RejectChangesHandler(
+        feedback_repository=container.feedback_repository,
+        event_publisher=container.event_publisher,
+    )
+
+
 async def get_modify_change_handler() -> ModifyChangeHandler:
     container = await get_container()
     return ModifyChangeHandler(
@@ -346,6 +528,11 @@ async def get_count_feedback_handler() -> CountFeedbackByDocumentHandler:
     return CountFeedbackByDocumentHandler(feedback_queries=container.feedback_queries)
 
 
+async def get_feedback_status_counts_handler() -> GetFeedbackStatusCountsHandler:
+    container = await get_container()
+    return GetFeedbackStatusCountsHandler(feedback_queries=container.feedback_queries)
+
+
 async def get_policy_repository_handler() -> GetPolicyRepositoryByIdHandler:
     container = await get_container()
     return GetPolicyRepositoryByIdHandler(policy_queries=container.policy_queries)
@@ -389,6 +576,42 @@ async def get_document_repository():
     return container.document_repository
 
 
+async def get_document_acl_queries():
+    """Get DocumentAclQueries (cached ownership/sharing lookups) for dependency injection."""
+    container = await get_container()
+    return container.document_acl_queries
+
+
+async def get_content_variant_cache():
+    """Get CompressedVariantCache (encoded document content per revision) for dependency injection."""
+    container = await get_container()
+    return container.content_variant_cache
+
+
+async def get_semantic_ir_store():
+    """Get SemanticIRStore (normalised semantic IR tables) for dependency injection."""
+    container = await get_container()
+    return container.semantic_ir_store
+
+
+async def get_lineage_graph_cache():
+    """Get LineageGraphCache (per-document term and formula dependency graphs) for dependency injection."""
+    container = await get_container()
+    return container.lineage_graph_cache
+
+
+async def get_document_chat_service():
+    """Get DocumentChatService (retrieval index and cached chat context per document) for dependency injection."""
+    container = await get_container()
+    return container.chat_service
+
+
+async def get_term_index():
+    """Get TermIndex (cross-document term, alias and variable index) for dependency injection."""
+    container = await get_container()
+    return container.term_index
+
+
 # ============================================================================
 # Authentication Dependencies (Phase 13)
 # ============================================================================
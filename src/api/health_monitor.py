@@ -0,0 +1,198 @@
+"""
+Background dependency checks for the readiness and health endpoints.
+
+Probes read the results of the last refresh instead of querying the
+database themselves, so a probe never waits on I/O or takes a pool
+connection. A background task refreshes the results every
+``HEALTH_REFRESH_INTERVAL`` seconds, each check bounded by
+``HEALTH_CHECK_TIMEOUT``.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+HEALTHY = "healthy"
+DEGRADED = "degraded"
+UNHEALTHY = "unhealthy"
+
+# Results older than this many refresh intervals are treated as unhealthy
+STALE_AFTER_INTERVALS = 3
+
+
+@dataclass
+class CheckResult:
+    status: str
+    message: str
+    details: Dict[str, Any] = field(default_factory=dict)
+    checked_at: datetime = field(default_factory=datetime.utcnow)
+    duration_ms: float = 0.0
+
+
+class HealthMonitor:
+    """Caches the health of the database and event store, refreshed in the background."""
+
+    def __init__(
+        self,
+        pool_provider: Callable[[], Optional[asyncpg.Pool]],
+        refresh_interval: float = 10.0,
+        check_timeout: float = 2.0,
+    ):
+        self._pool_provider = pool_provider
+        self._refresh_interval = refresh_interval
+        self._check_timeout = check_timeout
+        self._results: Dict[str, CheckResult] = {}
+        self._refreshed_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+
+    @property
+    def refresh_interval(self) -> float:
+        return self._refresh_interval
+
+    async def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        await self.refresh()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Started health monitor (refresh every {self._refresh_interval}s)")
+
+    async def stop(self) -> None:
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while self._running:
+            await asyncio.sleep(self._refresh_interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Health refresh failed: {e}", exc_info=True)
+
+    async def refresh(self) -> None:
+        """Run every check once and replace the cached results."""
+        database, event_store = await asyncio.gather(
+            self._timed(self._check_database),
+            self._timed(self._check_event_store),
+        )
+        self._results = {"database": database, "event_store": event_store}
+        self._refreshed_at = time.monotonic()
+
+    async def _timed(self, check: Callable[[asyncpg.Pool], Any]) -> CheckResult:
+        pool = self._pool_provider()
+        if pool is None:
+            return CheckResult(status=UNHEALTHY, message="Database pool not initialized")
+        started = time.monotonic()
+        try:
+            result = await asyncio.wait_for(check(pool), self._check_timeout)
+        except asyncio.TimeoutError:
+            result = CheckResult(status=UNHEALTHY, message=f"Check timed out after {self._check_timeout}s")
+        except Exception as e:
+            logger.error(f"Health check {check.__name__} failed: {e}")
+            result = CheckResult(status=UNHEALTHY, message=f"Check failed: {type(e).__name__}")
+        result.duration_ms = round((time.monotonic() - started) * 1000, 1)
+        return result
+
+    async def _check_database(self, pool: asyncpg.Pool) -> CheckResult:
+        async with pool.acquire() as conn:
+            await conn.fetchval("SELECT 1")
+        return CheckResult(status=HEALTHY, message="Database operational", details={"connected": True})
+
+    async def _check_event_store(self, pool: asyncpg.Pool) -> CheckResult:
+        async with pool.acquire() as conn:
+            # Planner estimate and index lookup: constant time however large the table.
+            # Once partitioned, events itself holds no rows; the estimate sums its partitions.
+            row = await conn.fetchrow(
+                """
+                SELECT (SELECT CASE WHEN bool_and(reltuples < 0) THEN -1
+                                    ELSE SUM(GREATEST(reltuples, 0)) END::BIGINT
+                        FROM pg_class
+                        WHERE relkind = 'r'
+                          AND (oid = 'events'::regclass
+                               OR oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = 'events'::regclass))
+                       ) AS estimated_events,
+                       (SELECT MAX(sequence) FROM events) AS last_sequence
+                """
+            )
+        estimated = row["estimated_events"]
+        return CheckResult(
+            status=HEALTHY,
+            message="Event store operational",
+            details={
+                # reltuples is -1 until the table is first analysed
+                "estimated_events": estimated if estimated is not None and estimated >= 0 else None,
+                "last_sequence": row["last_sequence"] or 0,
+            },
+        )
+
+    def pool_status(self) -> CheckResult:
+        """Current pool utilisation, read from the pool without I/O."""
+        pool = self._pool_provider()
+        if pool is None:
+            return CheckResult(status=UNHEALTHY, message="Database pool not initialized")
+        size = pool.get_size()
+        idle = pool.get_idle_size()
+        max_size = pool.get_max_size()
+        active = size - idle
+        utilization = (active / max_size) * 100 if max_size > 0 else 0
+        if utilization > 90:
+            status, message = DEGRADED, "Connection pool nearly exhausted"
+        elif utilization > 70:
+            status, message = DEGRADED, "High connection pool utilization"
+        else:
+            status, message = HEALTHY, "Connection pool available"
+        return CheckResult(
+            status=status,
+            message=message,
+            details={
+                "pool_size": size,
+                "active_connections": active,
+                "idle_connections": idle,
+                "utilization_percent": round(utilization, 1),
+            },
+        )
+
+    def snapshot(self) -> Dict[str, CheckResult]:
+        """The cached check results plus live pool status, without any I/O."""
+        if self._refreshed_at is None:
+            results = {"database": CheckResult(status=UNHEALTHY, message="Health not checked yet")}
+        elif time.monotonic() - self._refreshed_at > self._refresh_interval * STALE_AFTER_INTERVALS:
+            results = {
+                name: replace(result, status=UNHEALTHY, message=f"Last check is stale ({result.message})")
+                for name, result in self._results.items()
+            }
+        else:
+            results = dict(self._results)
+        database = results.get("database")
+        if database is not None and self._pool_provider() is not None:
+            pool = self.pool_status()
+            degraded = database.status == HEALTHY and pool.status != HEALTHY
+            results["database"] = replace(
+                database,
+                status=pool.status if degraded else database.status,
+                message=pool.message if degraded else database.message,
+                details={**database.details, **pool.details},
+            )
+        return results
+
+    @staticmethod
+    def overall_status(results: Dict[str, CheckResult]) -> str:
+        statuses = {result.status for result in results.values()}
+        if UNHEALTHY in statuses:
+            return UNHEALTHY
+        if DEGRADED in statuses:
+            return DEGRADED
+        return HEALTHY
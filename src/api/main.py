@@ -74,6 +74,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     yield
     await container.close()
 
+    from src.infrastructure.ai.http_pool import close_http_clients
+    await close_http_clients()
+
 
 def create_app() -> FastAPI:
     # Get validated settings first
@@ -126,6 +129,10 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # gzip/brotli for JSON and markdown responses; streamed bodies pass through
+    from .middleware.compression import CompressionMiddleware
+    app.add_middleware(CompressionMiddleware)
+
     # Add correlation ID tracking for request tracing
     from .middleware.correlation import CorrelationIDMiddleware
     app.add_middleware(CorrelationIDMiddleware)
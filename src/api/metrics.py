@@ -167,7 +167,7 @@ ai_request_duration_seconds = Histogram(
 ai_tokens_used_total = Counter(
     'ai_tokens_used_total',
     'Total number of AI tokens consumed',
-    ['provider', 'token_type']  # prompt, completion
+    ['provider', 'token_type']  # prompt, completion, cached (prompt tokens read from the provider cache)
 )
 
 
@@ -0,0 +1,206 @@
+"""
+Response compression with gzip, and brotli when the ``brotli`` package is installed.
+
+CompressionMiddleware compresses complete JSON, markdown and other text
+responses on the fly. Streaming responses (exports, downloads, server-sent
+events) pass through untouched. Routes serving content that is immutable
+for a document revision encode it once through CompressedVariantCache and
+set Content-Encoding themselves, which the middleware leaves alone.
+"""
+import asyncio
+import gzip
+import logging
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+    logger.debug("brotli not installed - responses are compressed with gzip only")
+
+# Preferred first; the first listed wins when the client weights them equally
+SUPPORTED_ENCODINGS: Tuple[str, ...] = ("br", "gzip") if BROTLI_AVAILABLE else ("gzip",)
+
+# Below this the headers outweigh the savings
+MIN_COMPRESS_BYTES = 1024
+
+# Bodies at least this large are compressed off the event loop
+OFFLOAD_COMPRESS_BYTES = 256 * 1024
+
+# On-the-fly levels favour latency; cached variants are compressed once per revision
+FAST_LEVELS = {"br": 4, "gzip": 6}
+BEST_LEVELS = {"br": 9, "gzip": 9}
+
+COMPRESSIBLE_TYPES = ("application/json", "application/javascript", "image/svg+xml")
+
+VARIANT_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """The supported content coding the client weights highest, or None for identity."""
+    if not accept_encoding:
+        return None
+    weights = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        weight = 1.0
+        params = params.strip().replace(" ", "")
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[coding.strip().lower()] = weight
+    best, best_weight = None, 0.0
+    for coding in SUPPORTED_ENCODINGS:
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    if not content_type:
+        return False
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type == "text/event-stream":
+        return False
+    return media_type.startswith("text/") or media_type.endswith("+json") or media_type in COMPRESSIBLE_TYPES
+
+
+def compress(body: bytes, encoding: str, best: bool = False) -> bytes:
+    level = (BEST_LEVELS if best else FAST_LEVELS)[encoding]
+    if encoding == "br":
+        return brotli.compress(body, quality=level)
+    # mtime=0 keeps the output, and so cached variants, byte-for-byte stable
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+async def compress_async(body: bytes, encoding: str, best: bool = False) -> bytes:
+    if len(body) >= OFFLOAD_COMPRESS_BYTES:
+        return await asyncio.to_thread(compress, body, encoding, best)
+    return compress(body, encoding, best)
+
+
+class CompressedVariantCache:
+    """
+    LRU of response bodies per content coding, bounded by total size.
+
+    Keys must change whenever the content does, e.g. by including the
+    document revision, so entries never need invalidating.
+    """
+
+    def __init__(self, max_bytes: int = VARIANT_CACHE_BYTES, min_size: int = MIN_COMPRESS_BYTES):
+        self._max_bytes = max_bytes
+        self._min_size = min_size
+        self._bodies: "OrderedDict[Tuple[Hashable, Optional[str]], bytes]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    async def get_or_encode(
+        self, key: Hashable, encoding: Optional[str], render: Callable[[], bytes]
+    ) -> Tuple[bytes, Optional[str]]:
+        """
+        The body for ``key`` in ``encoding``, rendering and compressing it on a miss.
+
+        Returns:
+            The body and the coding actually applied, which is None when the
+            client accepts no supported coding or the body is too small to gain
+        """
+        cached = self._get(key, encoding)
+        if cached is not None:
+            self.hits += 1
+            return cached, encoding
+        self.misses += 1
+
+        body = self._get(key, None)
+        if body is None:
+            body = render()
+            self._put(key, None, body)
+        if encoding is None or len(body) < self._min_size:
+            return body, None
+
+        encoded = await compress_async(body, encoding, best=True)
+        self._put(key, encoding, encoded)
+        return encoded, encoding
+
+    def _get(self, key: Hashable, encoding: Optional[str]) -> Optional[bytes]:
+        body = self._bodies.get((key, encoding))
+        if body is not None:
+            self._bodies.move_to_end((key, encoding))
+        return body
+
+    def _put(self, key: Hashable, encoding: Optional[str], body: bytes) -> None:
+        if (key, encoding) in self._bodies or len(body) > self._max_bytes:
+            return
+        self._bodies[(key, encoding)] = body
+        self._bytes += len(body)
+        while self._bytes > self._max_bytes:
+            _, evicted = self._bodies.popitem(last=False)
+            self._bytes -= len(evicted)
+
+    def __len__(self) -> int:
+        return len(self._bodies)
+
+
+class CompressionMiddleware:
+    """Compress complete text responses with the client's preferred supported coding."""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = MIN_COMPRESS_BYTES):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        decided = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, decided
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if decided or message["type"] != "http.response.body":
+                if not decided:
+                    decided = True
+                    await send(start)
+                await send(message)
+                return
+
+            decided = True
+            headers = MutableHeaders(raw=start["headers"])
+            body = message.get("body", b"")
+            compressible = "content-encoding" not in headers and is_compressible(headers.get("content-type"))
+            if compressible:
+                headers.add_vary_header("Accept-Encoding")
+            # A body spread over several messages is a stream; leave it as sent
+            if not compressible or message.get("more_body", False) or len(body) < self.minimum_size:
+                await send(start)
+                await send(message)
+                return
+
+            compressed = await compress_async(body, encoding)
+            if len(compressed) < len(body):
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(compressed))
+                body = compressed
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
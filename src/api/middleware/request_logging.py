@@ -32,6 +32,8 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     # Paths to skip logging (to reduce noise)
     SKIP_PATHS = {
         "/health",
+        "/api/v1/health/live",
+        "/api/v1/health/ready",
         "/metrics",
         "/favicon.ico",
     }
@@ -1,24 +1,35 @@
+import json
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 
 from src.api.schemas.analysis import (
     AnalysisSessionResponse,
+    BatchAnalysisResponse,
     StartAnalysisRequest,
+    StartBatchAnalysisRequest,
 )
 from src.api.dependencies import (
     get_start_analysis_handler,
+    get_start_batch_analysis_handler,
     get_cancel_analysis_handler,
     get_document_by_id_handler,
     get_container,
 )
-from src.domain.commands import StartAnalysis, CancelAnalysis
+from src.domain.commands import StartAnalysis, StartBatchAnalysis, CancelAnalysis
 from src.domain.exceptions.document_exceptions import DocumentNotFound, InvalidDocumentState
+from src.domain.exceptions.document_group_exceptions import DocumentGroupNotFound, InvalidGroupOperation
+from src.application.services.batch_analysis import BatchAnalysisRegistry
 from src.application.queries.document_queries import GetDocumentById
+from src.infrastructure.ai.analysis.progress_broadcaster import ProgressBroadcaster
 
 router = APIRouter()
 
+# Seconds between keep-alive comments on an idle progress stream
+PROGRESS_HEARTBEAT_SECONDS = 15.0
+
 
 @router.post("/documents/{document_id}/reset", status_code=status.HTTP_200_OK)
 async def reset_document_for_retry(
@@ -26,7 +37,7 @@ async def reset_document_for_retry(
 ):
     container = await get_container()
     
-    document = await container.document_repository.get(document_id)
+    document = await container.document_repository.get(document_id, include_content=False)
     if document is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -137,6 +148,83 @@ async def get_analysis_status(
     )
 
 
+@router.post(
+    "/analysis/batches",
+    response_model=BatchAnalysisResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def start_batch_analysis(
+    request: StartBatchAnalysisRequest,
+    handler=Depends(get_start_batch_analysis_handler),
+):
+    """
+    Analyse many documents in the background.
+
+    Targets the listed ``document_ids``, else the members of ``group_id``,
+    else the documents assigned to ``policy_repository_id``. Poll
+    ``GET /analysis/batches/{batch_id}`` for progress, throughput and ETA.
+    """
+    command = StartBatchAnalysis(
+        document_ids=tuple(request.document_ids),
+        group_id=request.group_id,
+        policy_repository_id=request.policy_repository_id,
+        ai_model=request.model_provider or "claude",
+        initiated_by="anonymous",
+        max_concurrency=request.max_concurrency,
+        token_budget=request.token_budget,
+    )
+    try:
+        report = await handler.handle(command)
+    except DocumentGroupNotFound as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except InvalidGroupOperation as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return BatchAnalysisResponse(**report.to_dict())
+
+
+@router.get("/analysis/batches/{batch_id}", response_model=BatchAnalysisResponse)
+async def get_batch_analysis(batch_id: UUID):
+    report = BatchAnalysisRegistry.get_instance().get(batch_id)
+    if report is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Batch analysis {batch_id} not found",
+        )
+    return BatchAnalysisResponse(**report.to_dict())
+
+
+@router.get("/documents/{document_id}/analysis/progress/stream")
+async def stream_analysis_progress(request: Request, document_id: UUID):
+    """
+    Stream an analysis's progress as server-sent ``progress`` events.
+
+    Starts with the latest progress of a running analysis, if any, and ends
+    after the update that completes, fails or cancels it. A client that
+    falls behind receives only the newest state.
+    """
+    broadcaster = ProgressBroadcaster.get_instance()
+
+    async def events():
+        subscription = broadcaster.subscribe(document_id)
+        try:
+            while not await request.is_disconnected():
+                progress = await subscription.next(PROGRESS_HEARTBEAT_SECONDS)
+                if progress is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: progress\ndata: {json.dumps(progress.to_dict())}\n\n"
+                if progress.is_finished:
+                    return
+        finally:
+            broadcaster.unsubscribe(subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.delete("/documents/{document_id}/analysis", status_code=status.HTTP_204_NO_CONTENT)
 async def cancel_analysis(
     document_id: UUID,
@@ -1,16 +1,22 @@
+import json
 from uuid import UUID
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Header, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional
 from datetime import datetime
 
-from src.infrastructure.ai.analysis.analysis_log import AnalysisLogStore
+from src.infrastructure.ai.analysis.analysis_log import AnalysisLog, AnalysisLogStore, LogEntry
 
 router = APIRouter()
 
+# Seconds between keep-alive comments on an idle event stream
+STREAM_HEARTBEAT_SECONDS = 15.0
+
 
 class LogEntryResponse(BaseModel):
     id: str
+    sequence: int = 0
     timestamp: str
     level: str
     stage: str
@@ -23,14 +29,43 @@ class AnalysisLogResponse(BaseModel):
     started_at: str
     completed_at: Optional[str] = None
     status: str
+    last_sequence: int = 0
+    dropped_entries: int = 0
     entries: List[LogEntryResponse]
 
 
+def _log_response(log: AnalysisLog, entries: List[LogEntry]) -> AnalysisLogResponse:
+    return AnalysisLogResponse(
+        document_id=str(log.document_id),
+        started_at=log.started_at.isoformat(),
+        completed_at=log.completed_at.isoformat() if log.completed_at else None,
+        status=log.status,
+        last_sequence=log.last_sequence,
+        dropped_entries=log.dropped_entries,
+        entries=[LogEntryResponse(**e.to_dict()) for e in entries],
+    )
+
+
 @router.get("/documents/{document_id}/analysis-logs", response_model=AnalysisLogResponse)
-async def get_analysis_logs(document_id: UUID):
+async def get_analysis_logs(
+    document_id: UUID,
+    after: int = Query(0, ge=0, description="Only return entries with a greater sequence"),
+    wait: float = Query(0, ge=0, le=60, description="Seconds to wait for new entries (long poll)"),
+):
+    """
+    Get a document's analysis log.
+
+    Pass the ``last_sequence`` of the previous response as ``after`` to
+    receive only newer entries, and ``wait`` to hold the request open until
+    one arrives or the analysis completes.
+    """
     store = AnalysisLogStore.get_instance()
-    log = store.get_log(document_id)
-    
+    if wait:
+        log, entries = await store.wait_for_entries(document_id, after, wait)
+    else:
+        log = await store.load_log(document_id, after=after)
+        entries = log.entries_after(after) if log else []
+
     if log is None:
         return AnalysisLogResponse(
             document_id=str(document_id),
@@ -39,21 +74,44 @@ async def get_analysis_logs(document_id: UUID):
             status="not_started",
             entries=[],
         )
-    
-    return AnalysisLogResponse(
-        document_id=str(log.document_id),
-        started_at=log.started_at.isoformat(),
-        completed_at=log.completed_at.isoformat() if log.completed_at else None,
-        status=log.status,
-        entries=[
-            LogEntryResponse(
-                id=str(e.id),
-                timestamp=e.timestamp.isoformat(),
-                level=e.level.value,
-                stage=e.stage,
-                message=e.message,
-                details=e.details,
-            )
-            for e in log.entries
-        ],
+
+    return _log_response(log, entries)
+
+
+@router.get("/documents/{document_id}/analysis-logs/stream")
+async def stream_analysis_logs(
+    request: Request,
+    document_id: UUID,
+    after: int = Query(0, ge=0, description="Only stream entries with a greater sequence"),
+    last_event_id: Optional[str] = Header(None),
+):
+    """
+    Stream a document's analysis log entries as server-sent events.
+
+    Each entry is sent as an ``entry`` event whose ``id`` is its sequence,
+    so a reconnecting EventSource resumes where it left off. A ``complete``
+    event carrying the final status ends the stream.
+    """
+    store = AnalysisLogStore.get_instance()
+    if last_event_id and last_event_id.isdigit():
+        after = int(last_event_id)
+
+    async def events():
+        sequence = after
+        while not await request.is_disconnected():
+            log, entries = await store.wait_for_entries(document_id, sequence, STREAM_HEARTBEAT_SECONDS)
+            for entry in entries:
+                sequence = entry.sequence
+                yield f"id: {sequence}\nevent: entry\ndata: {json.dumps(entry.to_dict(), default=str)}\n\n"
+            if log is not None and log.is_complete and sequence >= log.last_sequence:
+                summary = {"status": log.status, "completed_at": log.completed_at.isoformat()}
+                yield f"event: complete\ndata: {json.dumps(summary)}\n\n"
+                return
+            if not entries:
+                yield ": keep-alive\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
@@ -12,6 +12,7 @@ from src.api.dependencies import (
 from src.application.queries.document_queries import GetDocumentById
 from src.application.queries.audit_queries import GetRecentAuditLogs, GetAuditLogByDocument
 from src.application.queries.base import PaginationParams
+from src.infrastructure.queries.pagination import next_cursor
 
 router = APIRouter()
 
@@ -21,12 +22,14 @@ async def get_global_audit_trail(
     event_type: Optional[str] = None,
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page; takes precedence over page"),
     handler=Depends(get_audit_trail_handler),
 ):
     """Get global audit trail with optional filtering."""
     pagination = PaginationParams(
         limit=per_page,
         offset=(page - 1) * per_page,
+        cursor=cursor,
     )
     
     query = GetRecentAuditLogs(
@@ -51,6 +54,7 @@ async def get_global_audit_trail(
         total=len(entries),
         page=page,
         per_page=per_page,
+        next_cursor=next_cursor(entries, per_page, sort_attr="timestamp"),
     )
 
 
@@ -59,6 +63,7 @@ async def get_document_audit_trail(
     document_id: UUID,
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page; takes precedence over page"),
     document_handler=Depends(get_document_by_id_handler),
     audit_handler=Depends(get_document_audit_handler),
 ):
@@ -75,6 +80,7 @@ async def get_document_audit_trail(
     pagination = PaginationParams(
         limit=per_page,
         offset=(page - 1) * per_page,
+        cursor=cursor,
     )
 
     query = GetAuditLogByDocument(
@@ -99,4 +105,5 @@ async def get_document_audit_trail(
         total=len(entries),
         page=page,
         per_page=per_page,
+        next_cursor=next_cursor(entries, per_page, sort_attr="timestamp"),
     )
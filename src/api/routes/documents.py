@@ -1,22 +1,25 @@
-from typing import Optional
+from typing import Callable, List, Optional
 from uuid import UUID
 from io import BytesIO
 import logging
 
-from fastapi import APIRouter, Depends, UploadFile, File, Form, Query, HTTPException, status
+from fastapi import APIRouter, Depends, UploadFile, File, Form, Query, HTTPException, Request, status
 from fastapi.responses import StreamingResponse, Response
+from pydantic import BaseModel
 
 from src.api.schemas.documents import (
     DocumentResponse,
     DocumentDetailResponse,
     DocumentListResponse,
     DocumentContentResponse,
+    DocumentContentWindowResponse,
     DocumentUpdateRequest,
     ExportDocumentRequest,
     AssignPolicyRepositoryRequest,
     ShareDocumentRequest,
     ShareDocumentResponse,
     MakePrivateResponse,
+    SectionResponse,
 )
 from src.api.dependencies import (
     get_upload_document_handler,
@@ -29,14 +32,34 @@ from src.api.dependencies import (
     get_container,
     get_authorization_service,
     get_document_repository,
+    get_document_acl_queries,
+    get_content_variant_cache,
+    get_semantic_ir_store,
+    get_lineage_graph_cache,
+    get_term_index,
     get_current_user,
 )
 from src.domain.aggregates.user import User
+from src.domain.value_objects.document_access import DocumentAccess
+from src.domain.value_objects.permission import Permission
+from src.domain.value_objects.user_role import UserRole
 from src.api.config import get_settings
+from src.api.middleware.compression import negotiate_encoding
 from src.api.utils.validation import validate_upload_file
 from src.domain.commands import UploadDocument, ExportDocument, DeleteDocument
 from src.application.queries.document_queries import GetDocumentById, ListDocuments
 from src.application.queries.base import PaginationParams
+from src.infrastructure.queries.pagination import next_cursor
+from src.infrastructure.queries.content_window import (
+    CHARS,
+    SECTIONS,
+    char_window,
+    decode_window_cursor,
+    next_window_cursor,
+    section_window,
+    window_limit,
+)
+from src.infrastructure.semantic.ir_store import validate_include
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -57,6 +80,76 @@ def mime_type_to_document_format(mime_type: str) -> "DocumentFormat":
     return mime_map.get(mime_type, DocumentFormat.UNKNOWN)
 
 
+async def load_document_access(document_id: UUID, acl_queries, doc_repo) -> DocumentAccess:
+    """Load the ownership and sharing state needed for an authorization check.
+    
+    Reads the cached document_acl_views row; only documents missing from the
+    read model (not yet projected) fall back to rehydrating the aggregate.
+    """
+    access = await acl_queries.get_access(document_id) if acl_queries else None
+    if access is not None:
+        return access
+    
+    doc_aggregate = await doc_repo.get(document_id, include_content=False)
+    if doc_aggregate is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Document with ID {document_id} not found",
+        )
+    return DocumentAccess.from_document(doc_aggregate)
+
+
+def document_etag(document) -> str:
+    # Weak: the identity, gzip and br variants of a URL share it (RFC 9110 8.8.3)
+    return f'W/"{document.revision}"'
+
+
+def validator_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": "private, no-cache", "Vary": "Accept-Encoding"}
+
+
+def conditional_response(request: Request, etag: str) -> Optional[Response]:
+    """Return a 304 when the client already has ``etag``, else None."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # Weak comparison (RFC 9110 13.1.2)
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in tags or etag.removeprefix("W/") in tags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validator_headers(etag))
+    return None
+
+
+async def encoded_response(
+    request: Request, variant_cache, key: tuple, render: Callable[[], BaseModel], etag: str
+) -> Response:
+    """JSON for ``render()``, encoded once per key in the client's preferred coding.
+
+    ``key`` must include the document revision: cached variants are never invalidated.
+    """
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    body, applied = await variant_cache.get_or_encode(
+        key, encoding, lambda: render().model_dump_json().encode()
+    )
+    headers = validator_headers(etag)
+    if applied:
+        headers["Content-Encoding"] = applied
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def section_responses(sections) -> Optional[List[SectionResponse]]:
+    if not sections:
+        return None
+    return [
+        SectionResponse(
+            title=s.get("title", ""),
+            content=s.get("content", ""),
+            level=s.get("level", 1),
+        )
+        for s in sections
+        if isinstance(s, dict)
+    ]
+
+
 @router.post("/documents", response_model=DocumentResponse, status_code=status.HTTP_201_CREATED)
 async def upload_document(
     file: UploadFile = File(...),
@@ -165,6 +258,8 @@ async def upload_document(
 async def list_documents(
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page; takes precedence over page"),
+    estimate_total: bool = Query(False, description="Use the planner's row estimate for an unfiltered total"),
     status_filter: Optional[str] = Query(None, alias="status"),
     policy_repository_id: Optional[UUID] = None,
     list_handler=Depends(get_list_documents_handler),
@@ -172,7 +267,7 @@ async def list_documents(
 ):
     from src.application.queries.document_queries import ListDocuments, CountDocuments
 
-    pagination = PaginationParams(limit=per_page, offset=(page - 1) * per_page)
+    pagination = PaginationParams(limit=per_page, offset=(page - 1) * per_page, cursor=cursor)
     query = ListDocuments(
         status=status_filter,
         policy_repository_id=policy_repository_id,
@@ -181,6 +276,7 @@ async def list_documents(
     count_query = CountDocuments(
         status=status_filter,
         policy_repository_id=policy_repository_id,
+        estimate=estimate_total,
     )
 
     documents = await list_handler.handle(query)
@@ -204,16 +300,20 @@ async def list_documents(
         total=total,
         page=page,
         per_page=per_page,
+        next_cursor=next_cursor(documents, per_page),
     )
 
 
 @router.get("/documents/{document_id}", response_model=DocumentDetailResponse)
 async def get_document(
     document_id: UUID,
+    request: Request,
     current_user: User = Depends(get_current_user),
     handler=Depends(get_document_by_id_handler),
     auth_service=Depends(get_authorization_service),
     doc_repo=Depends(get_document_repository),
+    acl_queries=Depends(get_document_acl_queries),
+    variant_cache=Depends(get_content_variant_cache),
 ):
     query = GetDocumentById(document_id=document_id)
     document = await handler.handle(query)
@@ -224,16 +324,11 @@ async def get_document(
             detail=f"Document with ID {document_id} not found",
         )
     
-    # Load document aggregate for authorization check
-    doc_aggregate = await doc_repo.get(document_id)
-    if doc_aggregate is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Document with ID {document_id} not found",
-        )
+    # Authorize from the ACL read model (falls back to the aggregate)
+    doc_access = await load_document_access(document_id, acl_queries, doc_repo)
     
     # Check authorization
-    if not auth_service.can_view_document(current_user, doc_aggregate):
+    if not auth_service.can_view_document(current_user, doc_access):
         logger.warning(
             f"User {current_user.kerberos_id} denied access to document {document_id}"
         )
@@ -242,33 +337,28 @@ async def get_document(
             detail="You do not have permission to view this document",
         )
 
-    sections = None
-    if document.sections:
-        from src.api.schemas.documents import SectionResponse
-        sections = [
-            SectionResponse(
-                title=s.get("title", ""),
-                content=s.get("content", ""),
-                level=s.get("level", 1),
-            )
-            for s in document.sections
-            if isinstance(s, dict)
-        ]
+    etag = document_etag(document)
+    not_modified = conditional_response(request, etag)
+    if not_modified is not None:
+        return not_modified
 
-    return DocumentDetailResponse(
-        id=document.id,
-        title=document.title,
-        description=document.description,
-        status=document.status,
-        version=document.version,
-        original_format=document.original_format,
-        markdown_content=document.markdown_content,
-        sections=sections,
-        metadata=document.metadata,
-        compliance_status=document.compliance_status,
-        created_at=document.created_at,
-        updated_at=document.updated_at,
-    )
+    def render() -> DocumentDetailResponse:
+        return DocumentDetailResponse(
+            id=document.id,
+            title=document.title,
+            description=document.description,
+            status=document.status,
+            version=document.version,
+            original_format=document.original_format,
+            markdown_content=document.markdown_content,
+            sections=section_responses(document.sections),
+            metadata=document.metadata,
+            compliance_status=document.compliance_status,
+            created_at=document.created_at,
+            updated_at=document.updated_at,
+        )
+
+    return await encoded_response(request, variant_cache, ("detail", document.id, document.revision), render, etag)
 
 
 @router.patch("/documents/{document_id}", response_model=DocumentResponse)
@@ -279,6 +369,7 @@ async def update_document(
     handler=Depends(get_document_by_id_handler),
     auth_service=Depends(get_authorization_service),
     doc_repo=Depends(get_document_repository),
+    acl_queries=Depends(get_document_acl_queries),
 ):
     query = GetDocumentById(document_id=document_id)
     document = await handler.handle(query)
@@ -289,16 +380,11 @@ async def update_document(
             detail=f"Document with ID {document_id} not found",
         )
     
-    # Load document aggregate for authorization check
-    doc_aggregate = await doc_repo.get(document_id)
-    if doc_aggregate is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Document with ID {document_id} not found",
-        )
+    # Authorize from the ACL read model (falls back to the aggregate)
+    doc_access = await load_document_access(document_id, acl_queries, doc_repo)
     
     # Check authorization
-    if not auth_service.can_edit_document(current_user, doc_aggregate):
+    if not auth_service.can_edit_document(current_user, doc_access):
         logger.warning(
             f"User {current_user.kerberos_id} denied edit access to document {document_id}"
         )
@@ -327,17 +413,13 @@ async def delete_document(
     handler=Depends(get_delete_document_handler),
     auth_service=Depends(get_authorization_service),
     doc_repo=Depends(get_document_repository),
+    acl_queries=Depends(get_document_acl_queries),
 ):
-    # Load document aggregate for authorization check
-    doc_aggregate = await doc_repo.get(document_id)
-    if doc_aggregate is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Document with ID {document_id} not found",
-        )
+    # Authorize from the ACL read model (falls back to the aggregate)
+    doc_access = await load_document_access(document_id, acl_queries, doc_repo)
     
     # Check authorization
-    if not auth_service.can_delete_document(current_user, doc_aggregate):
+    if not auth_service.can_delete_document(current_user, doc_access):
         logger.warning(
             f"User {current_user.kerberos_id} denied delete access to document {document_id}"
         )
@@ -379,7 +461,7 @@ async def share_document(
         HTTPException 400: Invalid group names
     """
     # Load document aggregate
-    doc_aggregate = await doc_repo.get(document_id)
+    doc_aggregate = await doc_repo.get(document_id, include_content=False)
     if doc_aggregate is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -417,8 +499,12 @@ async def share_document(
     for group in request.groups:
         doc_aggregate.share_with_group(group, current_user.kerberos_id)
     
-    # Save the aggregate (which publishes events)
+    # Save the aggregate and publish its events (updates document_acl_views)
+    events = list(doc_aggregate.pending_events)
     await doc_repo.save(doc_aggregate)
+    if events:
+        container = await get_container()
+        await container.event_publisher.publish_all(events)
     
     logger.info(
         f"User {current_user.kerberos_id} shared document {document_id} "
@@ -457,7 +543,7 @@ async def make_document_private(
         HTTPException 403: User cannot modify sharing for this document
     """
     # Load document aggregate
-    doc_aggregate = await doc_repo.get(document_id)
+    doc_aggregate = await doc_repo.get(document_id, include_content=False)
     if doc_aggregate is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -477,8 +563,12 @@ async def make_document_private(
     # Make document private
     doc_aggregate.make_private(current_user.kerberos_id)
     
-    # Save the aggregate (which publishes events)
+    # Save the aggregate and publish its events (updates document_acl_views)
+    events = list(doc_aggregate.pending_events)
     await doc_repo.save(doc_aggregate)
+    if events:
+        container = await get_container()
+        await container.event_publisher.publish_all(events)
     
     logger.info(
         f"User {current_user.kerberos_id} made document {document_id} private"
@@ -494,21 +584,19 @@ async def make_document_private(
 @router.get("/documents/{document_id}/content", response_model=DocumentContentResponse)
 async def get_document_content(
     document_id: UUID,
+    request: Request,
     format: str = Query("markdown", pattern="^(markdown|original)$"),
     current_user: User = Depends(get_current_user),
     handler=Depends(get_document_by_id_handler),
     auth_service=Depends(get_authorization_service),
     doc_repo=Depends(get_document_repository),
+    acl_queries=Depends(get_document_acl_queries),
+    variant_cache=Depends(get_content_variant_cache),
 ):
-    # Check authorization first
-    doc_aggregate = await doc_repo.get(document_id)
-    if doc_aggregate is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Document with ID {document_id} not found",
-        )
+    # Authorize from the ACL read model (falls back to the aggregate)
+    doc_access = await load_document_access(document_id, acl_queries, doc_repo)
     
-    if not auth_service.can_view_document(current_user, doc_aggregate):
+    if not auth_service.can_view_document(current_user, doc_access):
         logger.warning(
             f"User {current_user.kerberos_id} denied access to content of document {document_id}"
         )
@@ -526,25 +614,94 @@ async def get_document_content(
             detail=f"Document with ID {document_id} not found",
         )
 
-    sections = None
-    if document.sections:
-        from src.api.schemas.documents import SectionResponse
-        sections = [
-            SectionResponse(
-                title=s.get("title", ""),
-                content=s.get("content", ""),
-                level=s.get("level", 1),
+    etag = document_etag(document)
+    not_modified = conditional_response(request, etag)
+    if not_modified is not None:
+        return not_modified
+
+    def render() -> DocumentContentResponse:
+        return DocumentContentResponse(
+            document_id=document.id,
+            format=format,
+            content=document.markdown_content or "",
+            sections=section_responses(document.sections),
+        )
+
+    key = ("content", document.id, document.revision, format)
+    return await encoded_response(request, variant_cache, key, render, etag)
+
+
+@router.get("/documents/{document_id}/content/window", response_model=DocumentContentWindowResponse)
+async def get_document_content_window(
+    document_id: UUID,
+    request: Request,
+    unit: str = Query(SECTIONS, pattern=f"^({SECTIONS}|{CHARS})$"),
+    start: int = Query(0, ge=0, description="First section index or character offset"),
+    limit: Optional[int] = Query(None, ge=1, description="Sections or characters per window; capped per unit"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous window; takes precedence over unit and start"),
+    current_user: User = Depends(get_current_user),
+    handler=Depends(get_document_by_id_handler),
+    auth_service=Depends(get_authorization_service),
+    doc_repo=Depends(get_document_repository),
+    acl_queries=Depends(get_document_acl_queries),
+    variant_cache=Depends(get_content_variant_cache),
+):
+    """Serve a viewport of a document: a range of sections or of markdown characters."""
+    # Authorize from the ACL read model (falls back to the aggregate)
+    doc_access = await load_document_access(document_id, acl_queries, doc_repo)
+
+    if not auth_service.can_view_document(current_user, doc_access):
+        logger.warning(
+            f"User {current_user.kerberos_id} denied access to content of document {document_id}"
+        )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to view this document",
+        )
+
+    document = await handler.handle(GetDocumentById(document_id=document_id))
+
+    if document is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Document with ID {document_id} not found",
+        )
+
+    if cursor:
+        revision, unit, start = decode_window_cursor(cursor)
+        if revision != document.revision:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Document changed since the cursor was issued; start again without a cursor",
             )
-            for s in document.sections
-            if isinstance(s, dict)
-        ]
-
-    return DocumentContentResponse(
-        document_id=document.id,
-        format=format,
-        content=document.markdown_content or "",
-        sections=sections,
-    )
+    limit = window_limit(unit, limit)
+
+    etag = document_etag(document)
+    not_modified = conditional_response(request, etag)
+    if not_modified is not None:
+        return not_modified
+
+    def render() -> DocumentContentWindowResponse:
+        if unit == SECTIONS:
+            window = section_window(document.sections, start, limit)
+            sections, content = section_responses(window.items) or [], None
+        else:
+            window = char_window(document.markdown_content, start, limit)
+            sections, content = None, window.items
+        return DocumentContentWindowResponse(
+            document_id=document.id,
+            revision=document.revision,
+            unit=unit,
+            start=window.start,
+            end=window.end,
+            total=window.total,
+            sections=sections,
+            content=content,
+            next_cursor=next_window_cursor(window, document.revision),
+        )
+
+    key = ("window", document.id, document.revision, unit, start, limit)
+    return await encoded_response(request, variant_cache, key, render, etag)
 
 
 @router.post("/documents/{document_id}/export")
@@ -555,16 +712,12 @@ async def export_document(
     handler=Depends(get_export_document_handler),
     auth_service=Depends(get_authorization_service),
     doc_repo=Depends(get_document_repository),
+    acl_queries=Depends(get_document_acl_queries),
 ):
-    # Check authorization first
-    doc_aggregate = await doc_repo.get(document_id)
-    if doc_aggregate is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Document with ID {document_id} not found",
-        )
+    # Authorize from the ACL read model (falls back to the aggregate)
+    doc_access = await load_document_access(document_id, acl_queries, doc_repo)
     
-    if not auth_service.can_view_document(current_user, doc_aggregate):
+    if not auth_service.can_view_document(current_user, doc_access):
         logger.warning(
             f"User {current_user.kerberos_id} denied export access to document {document_id}"
         )
@@ -591,17 +744,13 @@ async def download_original_document(
     handler=Depends(get_document_by_id_handler),
     auth_service=Depends(get_authorization_service),
     doc_repo=Depends(get_document_repository),
+    acl_queries=Depends(get_document_acl_queries),
 ):
     """Download the original uploaded document file."""
-    # Check authorization first
-    doc_aggregate = await doc_repo.get(document_id)
-    if doc_aggregate is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Document with ID {document_id} not found",
-        )
+    # Authorize from the ACL read model (falls back to the aggregate)
+    doc_access = await load_document_access(document_id, acl_queries, doc_repo)
     
-    if not auth_service.can_view_document(current_user, doc_aggregate):
+    if not auth_service.can_view_document(current_user, doc_access):
         logger.warning(
             f"User {current_user.kerberos_id} denied download access to document {document_id}"
         )
@@ -723,24 +872,195 @@ async def remove_policy_repository(
     return None
 
 
+def _build_semantic_ir(document, document_id: UUID):
+    """Run rule-based IR extraction over a converted document's markdown."""
+    from src.infrastructure.semantic import IRBuilder
+    from src.infrastructure.converters.base import (
+        ConversionResult,
+        DocumentSection,
+        DocumentMetadata,
+        DocumentFormat,
+    )
+
+    sections = []
+    if document.sections:
+        for s in document.sections:
+            if isinstance(s, dict):
+                sections.append(
+                    DocumentSection(
+                        id=s.get("id", ""),
+                        title=s.get("title", ""),
+                        content=s.get("content", ""),
+                        level=s.get("level", 1),
+                        start_line=s.get("start_line"),
+                        end_line=s.get("end_line"),
+                    )
+                )
+
+    metadata_dict = document.metadata or {}
+    metadata = DocumentMetadata(
+        title=document.title,
+        author=metadata_dict.get("author"),
+        created_date=metadata_dict.get("created_date"),
+        modified_date=metadata_dict.get("modified_date"),
+        page_count=metadata_dict.get("page_count", 0),
+        word_count=metadata_dict.get("word_count", 0),
+        original_format=mime_type_to_document_format(document.original_format) if document.original_format else DocumentFormat.UNKNOWN,
+    )
+
+    conversion_result = ConversionResult(
+        success=True,
+        markdown_content=document.markdown_content,
+        sections=sections,
+        metadata=metadata,
+    )
+
+    return IRBuilder().build(conversion_result, str(document_id))
+
+
+async def _load_or_build_semantic_ir(document, document_id: UUID, ir_store):
+    """Read the stored IR, building and storing it on first request."""
+    markdown = document.markdown_content
+    ir = await ir_store.load(str(document_id), markdown_loader=lambda: markdown)
+    if ir is None:
+        ir = _build_semantic_ir(document, document_id)
+        await ir_store.save(ir)
+    return ir
+
+
+def _parse_include(include: Optional[str]) -> list:
+    fields = [name.strip() for name in include.split(",") if name.strip()] if include else []
+    try:
+        return validate_include(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/semantic-ir/definitions")
+async def search_semantic_ir_definitions(
+    term: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    current_user: User = Depends(get_current_user),
+    auth_service=Depends(get_authorization_service),
+    ir_store=Depends(get_semantic_ir_store),
+):
+    """
+    Search term definitions across all documents the user can view.
+
+    Matches terms starting with ``term`` or having it as an alias; exact
+    matches are listed first.
+
+    Args:
+        term: Term prefix or alias (case-insensitive)
+        limit: Maximum number of results
+        offset: Number of results to skip
+
+    Returns:
+        Matching definitions with their document
+    """
+    if not auth_service.has_permission(current_user, Permission.VIEW):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to view documents",
+        )
+
+    viewer = None if current_user.has_role(UserRole.ADMIN) else (
+        current_user.kerberos_id, set(current_user.groups)
+    )
+    hits = await ir_store.search_definitions(term, viewer=viewer, limit=limit, offset=offset)
+
+    return {
+        "term": term,
+        "results": [
+            {
+                "document_id": hit.document_id,
+                "document_title": hit.document_title,
+                "definition": hit.definition.to_dict(),
+            }
+            for hit in hits
+        ],
+        "limit": limit,
+        "offset": offset,
+    }
+
+
+@router.get("/semantic-ir/terms")
+async def search_term_index(
+    q: str = Query(..., min_length=2, max_length=200, description="Term, alias or formula variable"),
+    fuzzy: bool = Query(True, description="Also return similarly spelled terms"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    current_user: User = Depends(get_current_user),
+    auth_service=Depends(get_authorization_service),
+    term_index=Depends(get_term_index),
+):
+    """
+    Find the documents that define or use a term.
+
+    Searches defined terms, aliases and formula variables across all
+    documents the user can view. Exact matches rank first, then prefix
+    matches, then (with ``fuzzy``) similarly spelled terms.
+
+    Args:
+        q: Term to look up (case-insensitive)
+        fuzzy: Include trigram-similar terms
+        limit: Maximum number of results
+        offset: Number of results to skip
+
+    Returns:
+        Ranked index entries with their document
+    """
+    if not auth_service.has_permission(current_user, Permission.VIEW):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to view documents",
+        )
+
+    viewer = None if current_user.has_role(UserRole.ADMIN) else (
+        current_user.kerberos_id, set(current_user.groups)
+    )
+    hits = await term_index.search(q, viewer=viewer, fuzzy=fuzzy, limit=limit, offset=offset)
+
+    return {
+        "query": q,
+        "results": [hit.to_dict() for hit in hits],
+        "limit": limit,
+        "offset": offset,
+    }
+
+
 @router.get("/documents/{document_id}/semantic-ir")
 async def get_document_semantic_ir(
     document_id: UUID,
     format: str = Query("json", pattern="^(json|llm-text)$"),
+    include: Optional[str] = Query(None, description="Comma-separated IR fields, e.g. 'definitions,formulae'"),
+    term: Optional[str] = Query(None, max_length=200, description="Filter definitions and formulae by term prefix"),
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
     handler=Depends(get_document_by_id_handler),
+    ir_store=Depends(get_semantic_ir_store),
 ):
     """
     Retrieve the semantic intermediate representation (IR) for a document.
 
+    With ``include`` only the listed fields are returned, each paged by
+    ``limit``/``offset`` with unpaged counts under ``totals``. Without it
+    the full IR is returned.
+
     Args:
         document_id: UUID of the document
         format: Output format - 'json' for structured data or 'llm-text' for LLM-optimized text
+        include: IR fields to return (sections, definitions, formulae, tables,
+            cross_references, validation_issues)
+        term: Term prefix narrowing definitions and formulae
+        limit: Page size for each included field
+        offset: Page offset for each included field
 
     Returns:
         Semantic IR in requested format
     """
-    from src.infrastructure.semantic import IRBuilder
-    from src.infrastructure.converters.converter_factory import ConverterFactory
+    fields = _parse_include(include)
 
     query = GetDocumentById(document_id=document_id)
     document = await handler.handle(query)
@@ -757,54 +1077,15 @@ async def get_document_semantic_ir(
             detail="Document has not been converted yet",
         )
 
-    # Rebuild IR from document data
     try:
-        container = await get_container()
-
-        # Get conversion result from document
-        from src.infrastructure.converters.base import (
-            ConversionResult,
-            DocumentSection,
-            DocumentMetadata,
-            DocumentFormat,
-        )
-
-        sections = []
-        if document.sections:
-            for s in document.sections:
-                if isinstance(s, dict):
-                    sections.append(
-                        DocumentSection(
-                            id=s.get("id", ""),
-                            title=s.get("title", ""),
-                            content=s.get("content", ""),
-                            level=s.get("level", 1),
-                            start_line=s.get("start_line"),
-                            end_line=s.get("end_line"),
-                        )
-                    )
+        if fields and format == "json":
+            result = await ir_store.fetch(str(document_id), fields, term=term, limit=limit, offset=offset)
+            if result is None:
+                await ir_store.save(_build_semantic_ir(document, document_id))
+                result = await ir_store.fetch(str(document_id), fields, term=term, limit=limit, offset=offset)
+            return result
 
-        metadata_dict = document.metadata or {}
-        metadata = DocumentMetadata(
-            title=document.title,
-            author=metadata_dict.get("author"),
-            created_date=metadata_dict.get("created_date"),
-            modified_date=metadata_dict.get("modified_date"),
-            page_count=metadata_dict.get("page_count", 0),
-            word_count=metadata_dict.get("word_count", 0),
-            original_format=mime_type_to_document_format(document.original_format) if document.original_format else DocumentFormat.UNKNOWN,
-        )
-
-        conversion_result = ConversionResult(
-            success=True,
-            markdown_content=document.markdown_content,
-            sections=sections,
-            metadata=metadata,
-        )
-
-        # Build IR
-        ir_builder = IRBuilder()
-        ir = ir_builder.build(conversion_result, str(document_id))
+        ir = await _load_or_build_semantic_ir(document, document_id, ir_store)
 
         if format == "llm-text":
             return Response(
@@ -822,11 +1103,84 @@ async def get_document_semantic_ir(
         )
 
 
+@router.get("/documents/{document_id}/semantic-ir/lineage")
+async def get_term_lineage(
+    document_id: UUID,
+    term: str = Query(..., min_length=1, max_length=200, description="Term, alias, formula name or ID"),
+    handler=Depends(get_document_by_id_handler),
+    ir_store=Depends(get_semantic_ir_store),
+    lineage_graphs=Depends(get_lineage_graph_cache),
+):
+    """
+    Report what a term depends on and what depends on it.
+
+    ``upstream`` lists every definition and formula the term is derived
+    from, directly or transitively; ``downstream`` lists everything that
+    would be affected if it changed. Both are in dependency-first order.
+
+    Args:
+        document_id: UUID of the document
+        term: Defined term, alias, formula name or node ID (case-insensitive)
+
+    Returns:
+        The resolved node with its direct and transitive dependencies and dependents
+    """
+    query = GetDocumentById(document_id=document_id)
+    document = await handler.handle(query)
+
+    if document is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Document with ID {document_id} not found",
+        )
+
+    if not document.markdown_content:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Document has not been converted yet",
+        )
+
+    try:
+        graph = await lineage_graphs.get(
+            str(document_id), lambda: _load_or_build_semantic_ir(document, document_id, ir_store)
+        )
+    except Exception as e:
+        logger.exception(f"Error building lineage graph: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to build lineage graph: {str(e)}",
+        )
+
+    node_id = graph.resolve(term)
+    if node_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Term '{term}' is not defined in document {document_id}",
+        )
+
+    def describe(ids):
+        return [{"id": i, "name": graph.node(i).name, "kind": graph.node(i).kind} for i in ids]
+
+    node = graph.node(node_id)
+    return {
+        "document_id": str(document_id),
+        "id": node.id,
+        "name": node.name,
+        "kind": node.kind,
+        "in_cycle": graph.in_cycle(node_id),
+        "dependencies": describe(graph.dependencies(node_id)),
+        "dependents": describe(graph.dependents(node_id)),
+        "upstream": describe(graph.upstream(node_id)),
+        "downstream": describe(graph.downstream(node_id)),
+    }
+
+
 @router.get("/documents/{document_id}/semantic-ir/download")
 async def download_semantic_ir(
     document_id: UUID,
     format: str = Query("json", pattern="^(json|llm-text|markdown)$"),
     handler=Depends(get_document_by_id_handler),
+    ir_store=Depends(get_semantic_ir_store),
 ):
     """
     Download the semantic intermediate representation as a file.
@@ -838,7 +1192,6 @@ async def download_semantic_ir(
     Returns:
         Downloadable file with semantic IR
     """
-    from src.infrastructure.semantic import IRBuilder
     import json
 
     query = GetDocumentById(document_id=document_id)
@@ -856,65 +1209,22 @@ async def download_semantic_ir(
             detail="Document has not been converted yet",
         )
 
-    # Rebuild IR from document data
     try:
-        from src.infrastructure.converters.base import (
-            ConversionResult,
-            DocumentSection,
-            DocumentMetadata,
-            DocumentFormat,
-        )
-
-        sections = []
-        if document.sections:
-            for s in document.sections:
-                if isinstance(s, dict):
-                    sections.append(
-                        DocumentSection(
-                            id=s.get("id", ""),
-                            title=s.get("title", ""),
-                            content=s.get("content", ""),
-                            level=s.get("level", 1),
-                            start_line=s.get("start_line"),
-                            end_line=s.get("end_line"),
-                        )
-                    )
-
-        metadata_dict = document.metadata or {}
-        metadata = DocumentMetadata(
-            title=document.title,
-            author=metadata_dict.get("author"),
-            created_date=metadata_dict.get("created_date"),
-            modified_date=metadata_dict.get("modified_date"),
-            page_count=metadata_dict.get("page_count", 0),
-            word_count=metadata_dict.get("word_count", 0),
-            original_format=mime_type_to_document_format(document.original_format) if document.original_format else DocumentFormat.UNKNOWN,
-        )
-
-        conversion_result = ConversionResult(
-            success=True,
-            markdown_content=document.markdown_content,
-            sections=sections,
-            metadata=metadata,
-        )
-
-        # Build IR
-        ir_builder = IRBuilder()
-        ir = ir_builder.build(conversion_result, str(document_id))
-
         # Determine content and filename
         filename = f"{document.title or 'document'}_semantic_ir"
 
         if format == "json":
-            content = json.dumps(ir.to_dict(), indent=2)
+            ir = await _load_or_build_semantic_ir(document, document_id, ir_store)
+            content = json.dumps(ir.to_dict(), indent=2, default=str)
             media_type = "application/json"
             filename += ".json"
         elif format == "llm-text":
+            ir = await _load_or_build_semantic_ir(document, document_id, ir_store)
             content = ir.to_llm_format()
             media_type = "text/plain"
             filename += ".txt"
         else:  # markdown
-            content = ir.raw_markdown
+            content = document.markdown_content
             media_type = "text/markdown"
             filename += ".md"
 
@@ -7,22 +7,29 @@ from src.api.schemas.feedback import (
     FeedbackItemResponse,
     FeedbackListResponse,
     RejectFeedbackRequest,
+    BulkAcceptFeedbackRequest,
+    BulkRejectFeedbackRequest,
+    BulkFeedbackDecisionResponse,
 )
 from src.api.dependencies import (
     get_accept_change_handler,
     get_reject_change_handler,
+    get_accept_changes_handler,
+    get_reject_changes_handler,
     get_feedback_by_document_handler,
     get_feedback_by_id_handler,
-    get_count_feedback_handler,
+    get_feedback_status_counts_handler,
     get_document_by_id_handler,
 )
-from src.domain.commands import AcceptChange, RejectChange
+from src.domain.commands import AcceptChange, RejectChange, AcceptChanges, RejectChanges
 from src.application.queries.document_queries import GetDocumentById
 from src.application.queries.feedback_queries import (
     GetFeedbackByDocument,
     GetFeedbackById,
-    CountFeedbackByDocument,
+    GetFeedbackStatusCounts,
 )
+from src.application.queries.base import PaginationParams
+from src.infrastructure.queries.pagination import next_cursor
 
 router = APIRouter()
 
@@ -31,9 +38,11 @@ router = APIRouter()
 async def get_document_feedback(
     document_id: UUID,
     status_filter: Optional[str] = Query(None, alias="status"),
+    per_page: Optional[int] = Query(None, ge=1, le=500, description="Page size; all items when omitted"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     document_handler=Depends(get_document_by_id_handler),
     feedback_handler=Depends(get_feedback_by_document_handler),
-    count_handler=Depends(get_count_feedback_handler),
+    counts_handler=Depends(get_feedback_status_counts_handler),
 ):
     query = GetDocumentById(document_id=document_id)
     document = await document_handler.handle(query)
@@ -44,19 +53,17 @@ async def get_document_feedback(
             detail=f"Document with ID {document_id} not found",
         )
 
+    pagination = PaginationParams(limit=per_page or 100, cursor=cursor) if per_page or cursor else None
     feedback_query = GetFeedbackByDocument(
         document_id=document_id,
         status=status_filter,
+        pagination=pagination,
     )
     feedback_items = await feedback_handler.handle(feedback_query)
 
-    pending_query = CountFeedbackByDocument(document_id=document_id, status="pending")
-    accepted_query = CountFeedbackByDocument(document_id=document_id, status="accepted")
-    rejected_query = CountFeedbackByDocument(document_id=document_id, status="rejected")
-
-    pending_count = await count_handler.handle(pending_query)
-    accepted_count = await count_handler.handle(accepted_query)
-    rejected_count = await count_handler.handle(rejected_query)
+    # One read of the per-status counters instead of a COUNT(*) per status
+    counts = await counts_handler.handle(GetFeedbackStatusCounts(document_id=document_id))
+    total = counts.get(status_filter, 0) if status_filter else sum(counts.values())
 
     return FeedbackListResponse(
         items=[
@@ -78,10 +85,52 @@ async def get_document_feedback(
             )
             for item in feedback_items
         ],
-        total=len(feedback_items),
-        pending_count=pending_count,
-        accepted_count=accepted_count,
-        rejected_count=rejected_count,
+        total=total,
+        pending_count=counts.get("pending", 0),
+        accepted_count=counts.get("accepted", 0),
+        rejected_count=counts.get("rejected", 0),
+        next_cursor=next_cursor(feedback_items, pagination.limit if pagination else None),
+    )
+
+
+@router.post("/documents/{document_id}/feedback/accept", response_model=BulkFeedbackDecisionResponse)
+async def accept_feedback_bulk(
+    document_id: UUID,
+    request: BulkAcceptFeedbackRequest,
+    accept_handler=Depends(get_accept_changes_handler),
+):
+    """Accept several feedback items at once; all are accepted or, if any is not pending, none."""
+    accepted = await accept_handler.handle(AcceptChanges(
+        document_id=document_id,
+        feedback_ids=tuple(request.feedback_ids),
+        accepted_by="anonymous",
+    ))
+    return BulkFeedbackDecisionResponse(
+        document_id=document_id,
+        status="accepted",
+        feedback_ids=accepted,
+        count=len(accepted),
+    )
+
+
+@router.post("/documents/{document_id}/feedback/reject", response_model=BulkFeedbackDecisionResponse)
+async def reject_feedback_bulk(
+    document_id: UUID,
+    request: BulkRejectFeedbackRequest,
+    reject_handler=Depends(get_reject_changes_handler),
+):
+    """Reject several feedback items with one reason; all are rejected or, if any is not pending, none."""
+    rejected = await reject_handler.handle(RejectChanges(
+        document_id=document_id,
+        feedback_ids=tuple(request.feedback_ids),
+        rejected_by="anonymous",
+        reason=request.reason,
+    ))
+    return BulkFeedbackDecisionResponse(
+        document_id=document_id,
+        status="rejected",
+        feedback_ids=rejected,
+        count=len(rejected),
     )
 
 
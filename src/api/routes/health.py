@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse
 from typing import Optional, Dict, Any
 from pydantic import BaseModel
 import logging
 
 from src.api.dependencies import Container
+from src.api.health_monitor import UNHEALTHY
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -32,139 +34,68 @@ class HealthResponse(BaseModel):
     dependencies: Dict[str, DependencyStatus]
 
 
-@router.get("/health", response_model=HealthResponse)
-async def health_check(
-    container: Container = Depends(Container.get_instance)
-) -> HealthResponse:
+@router.get("/health/live")
+async def liveness_check() -> Dict[str, str]:
     """
-    Comprehensive health check endpoint with dependency status.
-
-    Checks:
-    - Database connectivity and pool status
-    - Event store accessibility
-    - Overall application health
+    Liveness probe: the process is up and serving requests.
 
-    Returns:
-        HealthResponse: Application health status with dependency details
+    Touches no dependency, so a slow or unavailable database never gets
+    a healthy process restarted.
     """
-    dependencies = {}
-    overall_healthy = True
-    degraded = False
+    return {"status": "alive"}
 
-    # Check database
-    try:
-        pool = container.pool
 
-        if not pool:
-            dependencies["database"] = DependencyStatus(
-                status="unhealthy",
-                message="Database pool not initialized"
-            )
-            overall_healthy = False
-        else:
-            # Get pool metrics
-            pool_size = pool.get_size()
-            pool_min_size = pool.get_min_size()
-            pool_max_size = pool.get_max_size()
-            pool_idle_size = pool.get_idle_size()
-            active_connections = pool_size - pool_idle_size
-
-            # Test connectivity
-            try:
-                async with pool.acquire() as conn:
-                    await conn.fetchval("SELECT 1")
-                    db_connected = True
-            except Exception as e:
-                logger.error(f"Database connectivity test failed: {e}")
-                db_connected = False
-
-            # Determine status
-            utilization = (active_connections / pool_max_size) * 100 if pool_max_size > 0 else 0
-
-            if not db_connected:
-                status = "unhealthy"
-                message = "Database connection failed"
-                overall_healthy = False
-            elif utilization > 90:
-                status = "degraded"
-                message = "Connection pool nearly exhausted"
-                degraded = True
-            elif utilization > 70:
-                status = "degraded"
-                message = "High connection pool utilization"
-                degraded = True
-            else:
-                status = "healthy"
-                message = "Database operational"
-
-            dependencies["database"] = DependencyStatus(
-                status=status,
-                message=message,
+def _health_response(container: Container) -> HealthResponse:
+    monitor = container.health_monitor
+    results = monitor.snapshot()
+    return HealthResponse(
+        status=monitor.overall_status(results),
+        version="1.0.0",
+        dependencies={
+            name: DependencyStatus(
+                status=result.status,
+                message=result.message,
                 details={
-                    "connected": db_connected,
-                    "pool_size": pool_size,
-                    "active_connections": active_connections,
-                    "idle_connections": pool_idle_size,
-                    "utilization_percent": round(utilization, 1),
-                }
+                    **result.details,
+                    "checked_at": result.checked_at.isoformat(),
+                    "duration_ms": result.duration_ms,
+                },
             )
+            for name, result in results.items()
+        },
+    )
 
-    except Exception as e:
-        logger.error(f"Database health check failed: {e}", exc_info=True)
-        dependencies["database"] = DependencyStatus(
-            status="unhealthy",
-            message=f"Health check error: {str(e)}"
-        )
-        overall_healthy = False
 
-    # Check event store
-    try:
-        event_store = container.event_store
-        if event_store:
-            # Try to query event store
-            try:
-                # Simple query to verify event store is accessible
-                async with container.pool.acquire() as conn:
-                    count = await conn.fetchval("SELECT COUNT(*) FROM events")
-                dependencies["event_store"] = DependencyStatus(
-                    status="healthy",
-                    message="Event store operational",
-                    details={"total_events": count}
-                )
-            except Exception as e:
-                logger.error(f"Event store check failed: {e}")
-                dependencies["event_store"] = DependencyStatus(
-                    status="unhealthy",
-                    message="Event store query failed"
-                )
-                overall_healthy = False
-        else:
-            dependencies["event_store"] = DependencyStatus(
-                status="unhealthy",
-                message="Event store not initialized"
-            )
-            overall_healthy = False
-    except Exception as e:
-        logger.error(f"Event store health check failed: {e}", exc_info=True)
-        dependencies["event_store"] = DependencyStatus(
-            status="unhealthy",
-            message=f"Health check error: {str(e)}"
-        )
-        overall_healthy = False
+@router.get("/health/ready", response_model=HealthResponse)
+async def readiness_check(
+    container: Container = Depends(Container.get_instance)
+) -> JSONResponse:
+    """
+    Readiness probe: dependencies are reachable.
 
-    # Determine overall status
-    if not overall_healthy:
-        overall_status = "unhealthy"
-    elif degraded:
-        overall_status = "degraded"
-    else:
-        overall_status = "healthy"
+    Served from the results of the last background check, so the probe
+    itself does no I/O. Responds 503 while any dependency is unhealthy.
+    """
+    response = _health_response(container)
+    status_code = 503 if response.status == UNHEALTHY else 200
+    return JSONResponse(status_code=status_code, content=response.model_dump())
 
-    return HealthResponse(
-        status=overall_status,
-        version="1.0.0",
-        dependencies=dependencies
-    )
+
+@router.get("/health", response_model=HealthResponse)
+async def health_check(
+    container: Container = Depends(Container.get_instance)
+) -> HealthResponse:
+    """
+    Health check endpoint with dependency status.
+
+    Reports the database (connectivity and pool utilisation) and the event
+    store (estimated size and last sequence) as of the last background
+    check, refreshed every ``HEALTH_REFRESH_INTERVAL`` seconds.
+
+    Returns:
+        HealthResponse: Application health status with dependency details
+    """
+    return _health_response(container)
 
 
 @router.get("/health/database")
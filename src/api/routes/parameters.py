@@ -4,8 +4,6 @@ import os
 from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from google import genai
-from google.genai import types
 
 from src.api.schemas.parameters import Parameter, ParametersResponse
 from src.api.dependencies import get_document_by_id_handler
@@ -54,6 +52,9 @@ Document to analyze:
 
 
 def get_gemini_client():
+    # The Gemini SDK is slow to import, so it is loaded on the first request
+    from src.infrastructure.ai.gemini_provider import get_gemini_client as get_shared_gemini_client
+
     api_key = os.environ.get("AI_INTEGRATIONS_GEMINI_API_KEY")
     base_url = os.environ.get("AI_INTEGRATIONS_GEMINI_BASE_URL")
     
@@ -63,13 +64,7 @@ def get_gemini_client():
             detail="AI service is not configured"
         )
     
-    return genai.Client(
-        api_key=api_key,
-        http_options={
-            'api_version': '',
-            'base_url': base_url
-        }
-    )
+    return get_shared_gemini_client(api_key, base_url)
 
 
 @router.get("/documents/{document_id}/parameters", response_model=ParametersResponse)
@@ -93,25 +88,25 @@ async def get_document_parameters(
             total=0,
         )
 
+    from google.genai import types
+
     prompt = PARAMETER_EXTRACTION_PROMPT + document.markdown_content
 
     try:
         client = get_gemini_client()
         
         response = await asyncio.wait_for(
-            asyncio.to_thread(
-                lambda: client.models.generate_content(
-                    model="gemini-2.5-flash",
-                    contents=[
-                        types.Content(
-                            role="user",
-                            parts=[types.Part(text=prompt)]
-                        )
-                    ],
-                    config=types.GenerateContentConfig(
-                        response_mime_type="application/json",
-                        temperature=0.3,
+            client.aio.models.generate_content(
+                model="gemini-2.5-flash",
+                contents=[
+                    types.Content(
+                        role="user",
+                        parts=[types.Part(text=prompt)]
                     )
+                ],
+                config=types.GenerateContentConfig(
+                    response_mime_type="application/json",
+                    temperature=0.3,
                 )
             ),
             timeout=60,
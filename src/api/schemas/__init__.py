@@ -14,12 +14,17 @@ from .documents import (
 )
 from .analysis import (
     AnalysisSessionResponse,
+    BatchAnalysisResponse,
     StartAnalysisRequest,
+    StartBatchAnalysisRequest,
 )
 from .feedback import (
     FeedbackItemResponse,
     FeedbackListResponse,
     RejectFeedbackRequest,
+    BulkAcceptFeedbackRequest,
+    BulkRejectFeedbackRequest,
+    BulkFeedbackDecisionResponse,
 )
 from .policies import (
     PolicyRepositoryResponse,
@@ -49,10 +54,15 @@ __all__ = [
     "DocumentUpdateRequest",
     "ExportDocumentRequest",
     "AnalysisSessionResponse",
+    "BatchAnalysisResponse",
+    "StartBatchAnalysisRequest",
     "StartAnalysisRequest",
     "FeedbackItemResponse",
     "FeedbackListResponse",
     "RejectFeedbackRequest",
+    "BulkAcceptFeedbackRequest",
+    "BulkRejectFeedbackRequest",
+    "BulkFeedbackDecisionResponse",
     "PolicyRepositoryResponse",
     "PolicyRepositoryListResponse",
     "PolicyRepositoryCreate",
@@ -38,3 +38,39 @@ class AnalysisSessionResponse(BaseModel):
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     error_message: Optional[str] = None
+
+
+class StartBatchAnalysisRequest(BaseModel):
+    document_ids: List[UUID] = Field(default_factory=list)
+    group_id: Optional[UUID] = None
+    policy_repository_id: Optional[UUID] = None
+    model_provider: Optional[str] = Field(
+        None, pattern="^(gemini|openai|anthropic|claude)$"
+    )
+    max_concurrency: int = Field(4, ge=1, le=32)
+    token_budget: Optional[int] = Field(None, ge=1)
+
+
+class BatchDocumentStatus(BaseModel):
+    document_id: UUID
+    status: str
+    reason: Optional[str] = None
+
+
+class BatchAnalysisResponse(BaseModel):
+    batch_id: UUID
+    total: int
+    pending: int
+    running: int
+    completed: int
+    failed: int
+    skipped: int
+    max_concurrency: int
+    token_budget: Optional[int] = None
+    tokens_reserved: int = 0
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    elapsed_seconds: float = 0.0
+    throughput_per_minute: float = 0.0
+    eta_seconds: Optional[float] = None
+    documents: List[BatchDocumentStatus] = Field(default_factory=list)
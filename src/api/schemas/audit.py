@@ -21,3 +21,4 @@ class AuditTrailResponse(BaseModel):
     total: int
     page: Optional[int] = None
     per_page: Optional[int] = None
+    next_cursor: Optional[str] = None
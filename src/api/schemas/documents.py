@@ -66,11 +66,25 @@ class DocumentContentResponse(BaseModel):
     sections: Optional[List[SectionResponse]] = None
 
 
+class DocumentContentWindowResponse(BaseModel):
+    """A range of sections or markdown characters; ``end`` is exclusive."""
+    document_id: UUID
+    revision: str
+    unit: str
+    start: int
+    end: int
+    total: int
+    sections: Optional[List[SectionResponse]] = None
+    content: Optional[str] = None
+    next_cursor: Optional[str] = None
+
+
 class DocumentListResponse(BaseModel):
     documents: List[DocumentResponse]
     total: int
     page: int = 1
     per_page: int = 20
+    next_cursor: Optional[str] = None
 
 
 class ShareDocumentRequest(BaseModel):
@@ -2,13 +2,33 @@ from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class RejectFeedbackRequest(BaseModel):
     reason: Optional[str] = None
 
 
+# Upper bound on decisions applied in one request
+MAX_BULK_FEEDBACK_ITEMS = 500
+
+
+class BulkAcceptFeedbackRequest(BaseModel):
+    feedback_ids: List[UUID] = Field(..., min_length=1, max_length=MAX_BULK_FEEDBACK_ITEMS)
+
+
+class BulkRejectFeedbackRequest(BaseModel):
+    feedback_ids: List[UUID] = Field(..., min_length=1, max_length=MAX_BULK_FEEDBACK_ITEMS)
+    reason: Optional[str] = None
+
+
+class BulkFeedbackDecisionResponse(BaseModel):
+    document_id: UUID
+    status: str
+    feedback_ids: List[UUID]
+    count: int
+
+
 class FeedbackItemResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     
@@ -34,3 +54,4 @@ class FeedbackListResponse(BaseModel):
     pending_count: int
     accepted_count: int
     rejected_count: int
+    next_cursor: Optional[str] = None
@@ -1,17 +1,38 @@
+import asyncio
 import logging
-from uuid import UUID
+from collections import deque
+from typing import Dict, List, Optional
+from uuid import UUID, uuid4
 
 from .base import CommandHandler
-from src.domain.commands import StartAnalysis, CancelAnalysis
+from src.domain.commands import StartAnalysis, StartBatchAnalysis, CancelAnalysis
 from src.domain.aggregates.document import Document
-from src.domain.exceptions.document_exceptions import DocumentNotFound
+from src.domain.aggregates.document_group import DocumentGroup
+from src.domain.aggregates.policy_repository import PolicyRepository
+from src.domain.exceptions.analysis_exceptions import AnalysisInProgress
+from src.domain.exceptions.document_exceptions import DocumentNotFound, InvalidDocumentState
+from src.domain.exceptions.document_group_exceptions import DocumentGroupNotFound, InvalidGroupOperation
 from src.domain.exceptions.policy_exceptions import PolicyRepositoryNotFound
+from src.infrastructure.repositories.base import Repository
 from src.infrastructure.repositories.document_repository import DocumentRepository
 from src.infrastructure.repositories.policy_repository import PolicyRepositoryRepository
 from src.infrastructure.ai.provider_factory import ProviderFactory
 from src.infrastructure.ai.analysis.engine import AnalysisEngine
+from src.infrastructure.ai.analysis.result_aggregator import AggregatedResult
+from src.infrastructure.ai.analysis.progress_broadcaster import ProgressBroadcaster
 from src.infrastructure.ai.base import PolicyRule, AnalysisOptions
 from src.application.services.event_publisher import EventPublisher
+from src.application.services.batch_analysis import (
+    COMPLETED,
+    FAILED,
+    RESPONSE_TOKEN_ALLOWANCE,
+    RUNNING,
+    SKIPPED,
+    BatchAnalysisRegistry,
+    BatchAnalysisReport,
+    CompiledPolicy,
+    estimate_document_tokens,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +45,22 @@ except ImportError:
     logger.debug("Metrics not available - running outside API context")
 
 
+def policy_rules_from_repository(policy_repo: PolicyRepository) -> list[PolicyRule]:
+    """Compile a repository's policies into the rules passed to the analysis engine."""
+    return [
+        PolicyRule(
+            id=str(p.get("policy_id", "")),
+            name=p.get("policy_name", ""),
+            description=p.get("policy_content", ""),
+            requirement_type=p.get("requirement_type", "SHOULD"),
+            category=p.get("category", "general"),
+            validation_criteria=p.get("validation_criteria", ""),
+            examples=p.get("examples", []),
+        )
+        for p in (policy.to_dict() for policy in policy_repo.policies)
+    ]
+
+
 class StartAnalysisHandler(CommandHandler[StartAnalysis, UUID]):
     def __init__(
         self,
@@ -31,11 +68,13 @@ class StartAnalysisHandler(CommandHandler[StartAnalysis, UUID]):
         policy_repository: PolicyRepositoryRepository,
         event_publisher: EventPublisher,
         provider_factory: ProviderFactory | None = None,
+        progress_broadcaster: ProgressBroadcaster | None = None,
     ):
         self._documents = document_repository
         self._policies = policy_repository
         self._publisher = event_publisher
         self._provider_factory = provider_factory or ProviderFactory()
+        self._progress = progress_broadcaster or ProgressBroadcaster.get_instance()
 
     async def handle(self, command: StartAnalysis) -> UUID:
         document = await self._documents.get(command.document_id)
@@ -46,10 +85,35 @@ class StartAnalysisHandler(CommandHandler[StartAnalysis, UUID]):
         if policy_repo is None:
             raise PolicyRepositoryNotFound(repository_id=command.policy_repository_id)
 
-        document.start_analysis(
+        await self.run(
+            document,
             policy_repository_id=command.policy_repository_id,
+            policy_rules=policy_rules_from_repository(policy_repo),
             ai_model=command.ai_model,
-            initiated_by=command.initiated_by
+            initiated_by=command.initiated_by,
+        )
+
+        return command.document_id
+
+    async def run(
+        self,
+        document: Document,
+        policy_repository_id: UUID,
+        policy_rules: list[PolicyRule],
+        ai_model: str,
+        initiated_by: str,
+    ) -> AggregatedResult | None:
+        """
+        Analyse a loaded document against already compiled policy rules.
+
+        Records the start, completion or failure on the document and
+        publishes the events. Returns the engine's result, or None if the
+        analysis raised.
+        """
+        document.start_analysis(
+            policy_repository_id=policy_repository_id,
+            ai_model=ai_model,
+            initiated_by=initiated_by
         )
 
         events = list(document.pending_events)
@@ -59,27 +123,14 @@ class StartAnalysisHandler(CommandHandler[StartAnalysis, UUID]):
             await self._publisher.publish_all(events)
 
         try:
-            policy_rules = [
-                PolicyRule(
-                    id=str(p.get("policy_id", "")),
-                    name=p.get("policy_name", ""),
-                    description=p.get("policy_content", ""),
-                    requirement_type=p.get("requirement_type", "SHOULD"),
-                    category=p.get("category", "general"),
-                    validation_criteria=p.get("validation_criteria", ""),
-                    examples=p.get("examples", []),
-                )
-                for p in policy_repo.policies
-            ]
-
             from src.infrastructure.ai.base import ProviderType
             
             provider_type = ProviderType.CLAUDE
-            if command.ai_model:
+            if ai_model:
                 try:
-                    provider_type = ProviderType(command.ai_model)
+                    provider_type = ProviderType(ai_model)
                 except ValueError:
-                    provider_type = ProviderType.CLAUDE
+                    logger.warning(f"Unknown AI provider '{ai_model}', routing from {provider_type.value}")
             
             engine = AnalysisEngine(
                 provider_factory=self._provider_factory,
@@ -91,13 +142,14 @@ class StartAnalysisHandler(CommandHandler[StartAnalysis, UUID]):
                 max_issues=50,
             )
             
-            logger.info(f"Starting AI analysis for document {command.document_id} with provider {provider_type.value}")
+            logger.info(f"Starting AI analysis for document {document.id} with provider {provider_type.value}")
             result = await engine.analyze(
-                document_id=command.document_id,
+                document_id=document.id,
                 document_content=document.markdown_content,
                 policy_rules=policy_rules,
                 options=options,
                 provider_type=provider_type,
+                progress_callback=self._progress.publish,
             )
             logger.info(f"Analysis completed: success={result.success}, issues={result.total_issues}")
 
@@ -119,7 +171,7 @@ class StartAnalysisHandler(CommandHandler[StartAnalysis, UUID]):
             else:
                 error_msg = "; ".join(result.errors) if result.errors else "Unknown analysis error"
                 document.fail_analysis(reason=error_msg)
-                logger.error(f"Analysis failed for document {command.document_id}: {error_msg}")
+                logger.error(f"Analysis failed for document {document.id}: {error_msg}")
 
                 # Track failed analysis
                 if METRICS_AVAILABLE:
@@ -131,8 +183,10 @@ class StartAnalysisHandler(CommandHandler[StartAnalysis, UUID]):
             if completion_events:
                 await self._publisher.publish_all(completion_events)
 
+            return result
+
         except Exception as e:
-            logger.exception(f"Analysis error for document {command.document_id}: {e}")
+            logger.exception(f"Analysis error for document {document.id}: {e}")
             try:
                 document.fail_analysis(reason=str(e))
                 failure_events = list(document.pending_events)
@@ -142,7 +196,143 @@ class StartAnalysisHandler(CommandHandler[StartAnalysis, UUID]):
             except Exception as save_error:
                 logger.exception(f"Failed to save failure state: {save_error}")
 
-        return command.document_id
+        return None
+
+
+class StartBatchAnalysisHandler(CommandHandler[StartBatchAnalysis, BatchAnalysisReport]):
+    """Schedules a batch of analyses in the background and returns its report straight away.
+
+    At most ``max_concurrency`` documents are analysed at once. Each
+    document's tokens are estimated before it starts and reserved against
+    ``token_budget``; documents that no longer fit are skipped. Policy
+    repositories are loaded and compiled once per batch, however many
+    documents use them.
+    """
+
+    def __init__(
+        self,
+        document_repository: DocumentRepository,
+        policy_repository: PolicyRepositoryRepository,
+        analysis_handler: StartAnalysisHandler,
+        group_repository: Optional[Repository[DocumentGroup]] = None,
+        registry: Optional[BatchAnalysisRegistry] = None,
+    ):
+        self._documents = document_repository
+        self._policies = policy_repository
+        self._analysis = analysis_handler
+        self._groups = group_repository
+        self._registry = registry or BatchAnalysisRegistry.get_instance()
+
+    async def handle(self, command: StartBatchAnalysis) -> BatchAnalysisReport:
+        if command.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        document_ids = await self._resolve_documents(command)
+        report = BatchAnalysisReport(
+            batch_id=uuid4(),
+            document_ids=document_ids,
+            max_concurrency=command.max_concurrency,
+            token_budget=command.token_budget,
+        )
+        self._registry.add(report)
+        report.task = asyncio.create_task(self._run(command, report))
+        logger.info(
+            f"Scheduled batch analysis {report.batch_id} of {report.total} documents "
+            f"(concurrency {command.max_concurrency}, token budget {command.token_budget})"
+        )
+        return report
+
+    async def _resolve_documents(self, command: StartBatchAnalysis) -> List[UUID]:
+        if command.document_ids:
+            document_ids = list(command.document_ids)
+        elif command.group_id is not None:
+            if self._groups is None:
+                raise InvalidGroupOperation("Document groups are not persisted; pass document_ids instead")
+            group = await self._groups.get(command.group_id)
+            if group is None:
+                raise DocumentGroupNotFound(command.group_id)
+            document_ids = group.member_document_ids
+        elif command.policy_repository_id is not None:
+            policy_repo = await self._policies.get(command.policy_repository_id)
+            if policy_repo is None:
+                raise PolicyRepositoryNotFound(repository_id=command.policy_repository_id)
+            document_ids = sorted(policy_repo.assigned_documents, key=str)
+        else:
+            raise ValueError("Batch analysis needs document_ids, a group_id or a policy_repository_id")
+        return list(dict.fromkeys(document_ids))
+
+    async def _run(self, command: StartBatchAnalysis, report: BatchAnalysisReport) -> None:
+        queue = deque(report.document_ids)
+        compiled: Dict[UUID, asyncio.Task] = {}
+
+        async def worker() -> None:
+            while queue:
+                document_id = queue.popleft()
+                try:
+                    await self._analyze_one(command, report, document_id, compiled)
+                except Exception as e:
+                    logger.exception(f"Batch {report.batch_id}: analysis of {document_id} failed: {e}")
+                    report.mark(document_id, FAILED, str(e))
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(min(command.max_concurrency, len(queue)))))
+        finally:
+            report.finish()
+            logger.info(
+                f"Batch analysis {report.batch_id} finished: {report.count(COMPLETED)} completed, "
+                f"{report.count(FAILED)} failed, {report.count(SKIPPED)} skipped"
+            )
+
+    async def _compile_policy(self, repository_id: UUID) -> Optional[CompiledPolicy]:
+        policy_repo = await self._policies.get(repository_id)
+        if policy_repo is None:
+            return None
+        return CompiledPolicy.compile(repository_id, policy_rules_from_repository(policy_repo))
+
+    async def _analyze_one(
+        self,
+        command: StartBatchAnalysis,
+        report: BatchAnalysisReport,
+        document_id: UUID,
+        compiled: Dict[UUID, asyncio.Task],
+    ) -> None:
+        document = await self._documents.get(document_id)
+        if document is None:
+            report.mark(document_id, SKIPPED, "document not found")
+            return
+        repository_id = command.policy_repository_id or document.policy_repository_id
+        if repository_id is None:
+            report.mark(document_id, SKIPPED, "no policy repository")
+            return
+        # One load per repository, shared by concurrent workers
+        if repository_id not in compiled:
+            compiled[repository_id] = asyncio.ensure_future(self._compile_policy(repository_id))
+        policy = await compiled[repository_id]
+        if policy is None:
+            report.mark(document_id, SKIPPED, f"policy repository {repository_id} not found")
+            return
+
+        tokens = estimate_document_tokens(document.markdown_content) + policy.prompt_tokens + RESPONSE_TOKEN_ALLOWANCE
+        if not report.try_reserve(tokens):
+            report.mark(document_id, SKIPPED, "token budget exhausted")
+            return
+
+        report.mark(document_id, RUNNING)
+        try:
+            result = await self._analysis.run(
+                document,
+                policy_repository_id=repository_id,
+                policy_rules=policy.rules,
+                ai_model=command.ai_model,
+                initiated_by=command.initiated_by,
+            )
+        except (AnalysisInProgress, InvalidDocumentState) as e:
+            report.tokens_reserved -= tokens
+            report.mark(document_id, SKIPPED, str(e))
+            return
+        if result is not None and result.success:
+            report.mark(document_id, COMPLETED)
+        else:
+            report.mark(document_id, FAILED, "; ".join(result.errors) if result and result.errors else "analysis failed")
 
 
 class CancelAnalysisHandler(CommandHandler[CancelAnalysis, bool]):
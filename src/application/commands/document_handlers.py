@@ -128,7 +128,7 @@ class ExportDocumentHandler(CommandHandler[ExportDocument, str]):
         self._publisher = event_publisher
 
     async def handle(self, command: ExportDocument) -> str:
-        document = await self._documents.get(command.document_id)
+        document = await self._documents.get(command.document_id, include_content=False)
         if document is None:
             raise DocumentNotFound(document_id=command.document_id)
 
@@ -156,7 +156,7 @@ class DeleteDocumentHandler(CommandHandler[DeleteDocument, bool]):
         self._publisher = event_publisher
 
     async def handle(self, command: DeleteDocument) -> bool:
-        document = await self._documents.get(command.document_id)
+        document = await self._documents.get(command.document_id, include_content=False)
         if document is None:
             raise DocumentNotFound(document_id=command.document_id)
 
@@ -184,7 +184,7 @@ class CurateSemanticIRHandler(CommandHandler[CurateSemanticIR, bool]):
         logger.info(f"Handling CurateSemanticIR command for document {command.document_id}")
 
         # Load document
-        document = await self._documents.get(command.document_id)
+        document = await self._documents.get(command.document_id, include_content=False)
         if document is None:
             raise DocumentNotFound(document_id=command.document_id)
 
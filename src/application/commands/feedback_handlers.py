@@ -1,7 +1,8 @@
+from typing import List
 from uuid import UUID
 
 from .base import CommandHandler
-from src.domain.commands import AcceptChange, RejectChange, ModifyChange
+from src.domain.commands import AcceptChange, RejectChange, AcceptChanges, RejectChanges, ModifyChange
 from src.domain.aggregates.feedback_session import FeedbackSession
 from src.domain.exceptions.feedback_exceptions import FeedbackSessionNotFound
 from src.infrastructure.repositories.feedback_repository import FeedbackSessionRepository
@@ -69,6 +70,67 @@ class RejectChangeHandler(CommandHandler[RejectChange, bool]):
         return True
 
 
+class AcceptChangesHandler(CommandHandler[AcceptChanges, List[UUID]]):
+    """Accepts many changes with one session load, save and publish."""
+
+    def __init__(
+        self,
+        feedback_repository: FeedbackSessionRepository,
+        event_publisher: EventPublisher
+    ):
+        self._feedback = feedback_repository
+        self._publisher = event_publisher
+
+    async def handle(self, command: AcceptChanges) -> List[UUID]:
+        session = await self._feedback.get(command.document_id)
+        if session is None:
+            raise FeedbackSessionNotFound(session_id=command.document_id)
+
+        accepted = session.accept_changes(
+            feedback_ids=command.feedback_ids,
+            accepted_by=command.accepted_by,
+        )
+
+        events = list(session.pending_events)
+        await self._feedback.save(session)
+
+        if events:
+            await self._publisher.publish_all(events)
+
+        return accepted
+
+
+class RejectChangesHandler(CommandHandler[RejectChanges, List[UUID]]):
+    """Rejects many changes with one session load, save and publish."""
+
+    def __init__(
+        self,
+        feedback_repository: FeedbackSessionRepository,
+        event_publisher: EventPublisher
+    ):
+        self._feedback = feedback_repository
+        self._publisher = event_publisher
+
+    async def handle(self, command: RejectChanges) -> List[UUID]:
+        session = await self._feedback.get(command.document_id)
+        if session is None:
+            raise FeedbackSessionNotFound(session_id=command.document_id)
+
+        rejected = session.reject_changes(
+            feedback_ids=command.feedback_ids,
+            rejected_by=command.rejected_by,
+            rejection_reason=command.reason,
+        )
+
+        events = list(session.pending_events)
+        await self._feedback.save(session)
+
+        if events:
+            await self._publisher.publish_all(events)
+
+        return rejected
+
+
 class ModifyChangeHandler(CommandHandler[ModifyChange, bool]):
     def __init__(
         self,
@@ -93,7 +93,7 @@ class AssignDocumentToPolicyHandler(CommandHandler[AssignDocumentToPolicy, bool]
         if repo is None:
             raise PolicyRepositoryNotFound(repository_id=command.repository_id)
         
-        document = await self._document_repo.get(command.document_id)
+        document = await self._document_repo.get(command.document_id, include_content=False)
         if document is None:
             raise DocumentNotFound(document_id=command.document_id)
         
@@ -2,14 +2,14 @@
 
 import logging
 from typing import Optional
-import json
 from uuid import UUID
 
 from src.domain.events.document_events import DocumentConverted
 from src.domain.events.base import DomainEvent
 from src.infrastructure.repositories.document_repository import DocumentRepository
 from src.infrastructure.semantic.ai_curator import SemanticIRCurator
-from src.infrastructure.semantic import IRBuilder
+from src.infrastructure.semantic.converted_ir import ConvertedIR
+from src.infrastructure.semantic.ir_store import SemanticIRStore, PostgresSemanticIRStore
 from src.application.services.event_publisher import EventPublisher
 from src.infrastructure.persistence.postgres_connection import PostgresConnection
 from src.infrastructure.ai.analysis.analysis_log import AnalysisLogStore, LogLevel
@@ -22,10 +22,12 @@ class SemanticCurationEventHandler:
     Event handler that triggers AI curation when a document is converted.
 
     This implements the async background curation pattern (Option 2):
-    1. Document is uploaded and converted with rule-based extraction
+    1. Document is uploaded and converted
     2. DocumentConverted event is emitted
-    3. This handler triggers AI curation in the background
-    4. Enhanced semantic IR is saved back to the database
+    3. This handler loads the stored semantic IR, building and saving the
+       rule-based IR from the event on first conversion
+    4. AI curation runs in the background
+    5. Enhanced semantic IR is saved back to the database
     """
 
     def __init__(
@@ -35,6 +37,8 @@ class SemanticCurationEventHandler:
         db_connection: PostgresConnection,
         ai_curator: Optional[SemanticIRCurator] = None,
         enabled: bool = True,
+        ir_store: Optional[SemanticIRStore] = None,
+        converted_ir: Optional[ConvertedIR] = None,
     ):
         """
         Initialize the curation event handler.
@@ -42,15 +46,32 @@ class SemanticCurationEventHandler:
         Args:
             document_repository: Repository for loading/saving documents
             event_publisher: Event publisher for emitting curation events
-            db_connection: Database connection for direct semantic_ir table updates
+            db_connection: Database connection backing the default IR store
             ai_curator: AI curator (defaults to new instance)
             enabled: Whether curation is enabled (allows disabling for testing)
+            ir_store: Semantic IR store (defaults to Postgres on db_connection)
+            converted_ir: Shared load-or-build step for converted documents
+                (defaults to one over ``ir_store``)
         """
         self._documents = document_repository
         self._publisher = event_publisher
         self._db = db_connection
         self._curator = ai_curator or SemanticIRCurator()
         self._enabled = enabled
+        self._ir_store = ir_store
+        self._converted_ir = converted_ir
+
+    @property
+    def ir_store(self) -> SemanticIRStore:
+        if self._ir_store is None:
+            self._ir_store = PostgresSemanticIRStore(self._db.pool)
+        return self._ir_store
+
+    @property
+    def converted_ir(self) -> ConvertedIR:
+        if self._converted_ir is None:
+            self._converted_ir = ConvertedIR(self.ir_store)
+        return self._converted_ir
 
     async def handle(self, event: DomainEvent) -> None:
         """Handle DocumentConverted events."""
@@ -71,25 +92,10 @@ class SemanticCurationEventHandler:
         analysis_log.info("semantic_curation", "Starting AI-powered semantic IR curation")
 
         try:
-            # Get semantic IR from database
-            analysis_log.info("semantic_curation", "Retrieving semantic IR from database")
-            async with self._db.pool.acquire() as conn:
-                row = await conn.fetchrow(
-                    "SELECT semantic_ir FROM semantic_ir WHERE document_id = $1",
-                    event.aggregate_id
-                )
-
-            if not row or not row['semantic_ir']:
-                analysis_log.warning("semantic_curation", "No semantic IR found, skipping curation")
-                logger.warning(f"No semantic IR found for document {event.aggregate_id}, skipping curation")
-                return
-
-            # Deserialize semantic IR
-            analysis_log.info("semantic_curation", "Deserializing semantic IR")
-            from src.domain.value_objects.semantic_ir import DocumentIR
-            semantic_ir_data = json.loads(row['semantic_ir'])
-            semantic_ir = DocumentIR.from_dict(semantic_ir_data)
+            # Stored semantic IR, or the rule-based IR built from this conversion and saved
+            analysis_log.info("semantic_curation", "Loading rule-based semantic IR")
             markdown = event.markdown_content
+            semantic_ir = await self.converted_ir.load_or_build(event)
 
             # Run AI curation
             logger.info(f"Starting AI curation for document {event.aggregate_id}")
@@ -107,7 +113,8 @@ class SemanticCurationEventHandler:
             enhanced_ir = await self._curator.curate(
                 ir=semantic_ir,
                 markdown=markdown,
-                provider_type="claude"
+                provider_type="claude",
+                analysis_log=analysis_log,
             )
 
             new_def_count = len(enhanced_ir.definitions)
@@ -131,20 +138,10 @@ class SemanticCurationEventHandler:
 
             # Save enhanced IR back to database
             analysis_log.info("semantic_curation", "Saving enhanced semantic IR to database")
-            serialized_ir = enhanced_ir.to_dict()
-            async with self._db.pool.acquire() as conn:
-                await conn.execute(
-                    """
-                    UPDATE semantic_ir
-                    SET semantic_ir = $1, updated_at = NOW()
-                    WHERE document_id = $2
-                    """,
-                    json.dumps(serialized_ir),
-                    event.aggregate_id
-                )
+            await self.ir_store.save(enhanced_ir)
 
             # Load document and emit success event
-            document = await self._documents.get(event.aggregate_id)
+            document = await self._documents.get(event.aggregate_id, include_content=False)
             if document:
                 document.complete_ir_curation(
                     definitions_added=definitions_added,
@@ -176,7 +173,7 @@ class SemanticCurationEventHandler:
 
             # Try to emit failure event
             try:
-                document = await self._documents.get(event.aggregate_id)
+                document = await self._documents.get(event.aggregate_id, include_content=False)
                 if document:
                     document.fail_ir_curation(error_message=str(e))
                     events = list(document.pending_events)
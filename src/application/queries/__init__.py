@@ -19,10 +19,12 @@ from .feedback_queries import (
     GetFeedbackByDocument,
     GetPendingFeedback,
     CountFeedbackByDocument,
+    GetFeedbackStatusCounts,
     GetFeedbackByIdHandler,
     GetFeedbackByDocumentHandler,
     GetPendingFeedbackHandler,
     CountFeedbackByDocumentHandler,
+    GetFeedbackStatusCountsHandler,
 )
 
 from .policy_queries import (
@@ -64,10 +66,12 @@ __all__ = [
     "GetFeedbackByDocument",
     "GetPendingFeedback",
     "CountFeedbackByDocument",
+    "GetFeedbackStatusCounts",
     "GetFeedbackByIdHandler",
     "GetFeedbackByDocumentHandler",
     "GetPendingFeedbackHandler",
     "CountFeedbackByDocumentHandler",
+    "GetFeedbackStatusCountsHandler",
     "GetPolicyRepositoryById",
     "ListPolicyRepositories",
     "GetPoliciesByRepository",
@@ -62,7 +62,8 @@ class GetAuditLogByDocumentHandler(QueryHandler[GetAuditLogByDocument, List[Audi
         return await self._queries.get_by_document(
             document_id=query.document_id,
             limit=query.pagination.limit,
-            offset=query.pagination.offset
+            offset=query.pagination.offset,
+            cursor=query.pagination.cursor
         )
 
 
@@ -74,7 +75,8 @@ class GetAuditLogByUserHandler(QueryHandler[GetAuditLogByUser, List[AuditLogView
         return await self._queries.get_by_user(
             user_id=query.user_id,
             limit=query.pagination.limit,
-            offset=query.pagination.offset
+            offset=query.pagination.offset,
+            cursor=query.pagination.cursor
         )
 
 
@@ -86,7 +88,8 @@ class GetRecentAuditLogsHandler(QueryHandler[GetRecentAuditLogs, List[AuditLogVi
         return await self._queries.get_recent(
             limit=query.pagination.limit,
             offset=query.pagination.offset,
-            event_type=query.event_type
+            event_type=query.event_type,
+            cursor=query.pagination.cursor
         )
 
 
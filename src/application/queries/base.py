@@ -10,6 +10,7 @@ TResult = TypeVar('TResult')
 class PaginationParams:
     limit: int = 50
     offset: int = 0
+    cursor: Optional[str] = None
 
 
 class QueryHandler(ABC, Generic[TQuery, TResult]):
@@ -29,6 +29,7 @@ class ListDocuments:
 class CountDocuments:
     status: Optional[str] = None
     policy_repository_id: Optional[UUID] = None
+    estimate: bool = False
 
 
 class GetDocumentByIdHandler(QueryHandler[GetDocumentById, Optional[DocumentDetailView]]):
@@ -48,7 +49,8 @@ class ListDocumentsHandler(QueryHandler[ListDocuments, List[DocumentView]]):
             status=query.status,
             policy_repository_id=query.policy_repository_id,
             limit=query.pagination.limit,
-            offset=query.pagination.offset
+            offset=query.pagination.offset,
+            cursor=query.pagination.cursor
         )
 
 
@@ -59,5 +61,6 @@ class CountDocumentsHandler(QueryHandler[CountDocuments, int]):
     async def handle(self, query: CountDocuments) -> int:
         return await self._queries.count(
             status=query.status,
-            policy_repository_id=query.policy_repository_id
+            policy_repository_id=query.policy_repository_id,
+            estimate=query.estimate
         )
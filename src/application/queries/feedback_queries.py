@@ -1,8 +1,8 @@
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Dict, Optional, List
 from uuid import UUID
 
-from .base import QueryHandler
+from .base import QueryHandler, PaginationParams
 from src.infrastructure.queries.feedback_queries import (
     FeedbackQueries,
     FeedbackView,
@@ -18,6 +18,7 @@ class GetFeedbackById:
 class GetFeedbackByDocument:
     document_id: UUID
     status: Optional[str] = None
+    pagination: Optional[PaginationParams] = None
 
 
 @dataclass(frozen=True)
@@ -31,6 +32,11 @@ class CountFeedbackByDocument:
     status: Optional[str] = None
 
 
+@dataclass(frozen=True)
+class GetFeedbackStatusCounts:
+    document_id: UUID
+
+
 class GetFeedbackByIdHandler(QueryHandler[GetFeedbackById, Optional[FeedbackView]]):
     def __init__(self, feedback_queries: FeedbackQueries):
         self._queries = feedback_queries
@@ -44,9 +50,16 @@ class GetFeedbackByDocumentHandler(QueryHandler[GetFeedbackByDocument, List[Feed
         self._queries = feedback_queries
 
     async def handle(self, query: GetFeedbackByDocument) -> List[FeedbackView]:
+        if query.pagination is None:
+            return await self._queries.get_by_document(
+                document_id=query.document_id,
+                status=query.status
+            )
         return await self._queries.get_by_document(
             document_id=query.document_id,
-            status=query.status
+            status=query.status,
+            limit=query.pagination.limit,
+            cursor=query.pagination.cursor
         )
 
 
@@ -67,3 +80,11 @@ class CountFeedbackByDocumentHandler(QueryHandler[CountFeedbackByDocument, int])
             document_id=query.document_id,
             status=query.status
         )
+
+
+class GetFeedbackStatusCountsHandler(QueryHandler[GetFeedbackStatusCounts, Dict[str, int]]):
+    def __init__(self, feedback_queries: FeedbackQueries):
+        self._queries = feedback_queries
+
+    async def handle(self, query: GetFeedbackStatusCounts) -> Dict[str, int]:
+        return await self._queries.count_by_status(query.document_id)
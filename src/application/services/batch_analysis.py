@@ -0,0 +1,187 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from src.infrastructure.ai.base import PolicyRule
+from src.infrastructure.ai.prompts.base import format_policy_rules
+from src.infrastructure.ai.token_budget import DOCUMENT_TOKEN_BUDGET, get_token_counter, pack_content
+
+# Reserved per document for the model's response
+RESPONSE_TOKEN_ALLOWANCE = 8192
+
+# Finished batch reports kept for status queries
+DEFAULT_MAX_REPORTS = 100
+
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+
+def estimate_tokens(text: str) -> int:
+    # Same counter the providers use for rate limiting; cached per document version
+    return get_token_counter().count(text)
+
+
+def estimate_document_tokens(content: str) -> int:
+    """Tokens of ``content`` once packed into the analysis prompt's document budget."""
+    return pack_content(content, DOCUMENT_TOKEN_BUDGET).tokens
+
+
+@dataclass(frozen=True)
+class CompiledPolicy:
+    """A policy repository's rules, compiled once and shared by every document of a batch."""
+
+    repository_id: UUID
+    rules: List[PolicyRule]
+    prompt_tokens: int
+
+    @classmethod
+    def compile(cls, repository_id: UUID, rules: List[PolicyRule]) -> "CompiledPolicy":
+        # Rendering here also warms the prompt template's rule cache for the providers
+        rules_text = format_policy_rules([
+            {
+                "name": r.name,
+                "requirement_type": r.requirement_type,
+                "description": r.description,
+                "validation_criteria": r.validation_criteria,
+            }
+            for r in rules
+        ])
+        return cls(repository_id=repository_id, rules=rules, prompt_tokens=estimate_tokens(rules_text))
+
+
+@dataclass
+class BatchAnalysisReport:
+    """Progress of a batch analysis, updated by its workers as documents finish."""
+
+    batch_id: UUID
+    document_ids: List[UUID]
+    max_concurrency: int
+    token_budget: Optional[int] = None
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+    statuses: Dict[UUID, str] = field(default_factory=dict)
+    reasons: Dict[UUID, str] = field(default_factory=dict)
+    tokens_reserved: int = 0
+    task: Optional[asyncio.Task] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        for document_id in self.document_ids:
+            self.statuses.setdefault(document_id, PENDING)
+        self._started = time.monotonic()
+        self._finished: Optional[float] = None
+
+    @property
+    def total(self) -> int:
+        return len(self.document_ids)
+
+    def count(self, status: str) -> int:
+        return sum(1 for s in self.statuses.values() if s == status)
+
+    def mark(self, document_id: UUID, status: str, reason: str | None = None) -> None:
+        self.statuses[document_id] = status
+        if reason:
+            self.reasons[document_id] = reason
+
+    def try_reserve(self, tokens: int) -> bool:
+        """Reserve ``tokens`` of the budget; False if that would exceed it."""
+        if self.token_budget is not None and self.tokens_reserved + tokens > self.token_budget:
+            return False
+        self.tokens_reserved += tokens
+        return True
+
+    def finish(self) -> None:
+        self.finished_at = datetime.utcnow()
+        self._finished = time.monotonic()
+
+    @property
+    def is_finished(self) -> bool:
+        return self.finished_at is not None
+
+    def elapsed_seconds(self) -> float:
+        return (self._finished or time.monotonic()) - self._started
+
+    def throughput_per_minute(self) -> float:
+        """Documents analysed (completed or failed) per minute so far."""
+        elapsed = self.elapsed_seconds()
+        processed = self.count(COMPLETED) + self.count(FAILED)
+        return processed * 60 / elapsed if elapsed > 0 else 0.0
+
+    def eta_seconds(self) -> Optional[float]:
+        """Estimated seconds until every document has been processed; None until one has."""
+        if self.is_finished:
+            return 0.0
+        throughput = self.throughput_per_minute()
+        if throughput <= 0:
+            return None
+        remaining = self.count(PENDING) + self.count(RUNNING)
+        return remaining * 60 / throughput
+
+    async def wait(self) -> None:
+        if self.task is not None:
+            await asyncio.shield(self.task)
+
+    def to_dict(self) -> dict:
+        eta = self.eta_seconds()
+        return {
+            "batch_id": str(self.batch_id),
+            "total": self.total,
+            "pending": self.count(PENDING),
+            "running": self.count(RUNNING),
+            "completed": self.count(COMPLETED),
+            "failed": self.count(FAILED),
+            "skipped": self.count(SKIPPED),
+            "max_concurrency": self.max_concurrency,
+            "token_budget": self.token_budget,
+            "tokens_reserved": self.tokens_reserved,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "elapsed_seconds": round(self.elapsed_seconds(), 1),
+            "throughput_per_minute": round(self.throughput_per_minute(), 2),
+            "eta_seconds": round(eta, 1) if eta is not None else None,
+            "documents": [
+                {
+                    "document_id": str(document_id),
+                    "status": self.statuses[document_id],
+                    "reason": self.reasons.get(document_id),
+                }
+                for document_id in self.document_ids
+            ],
+        }
+
+
+class BatchAnalysisRegistry:
+    """Process-wide record of batch analyses, keeping the most recent ``max_reports``."""
+
+    _instance: "BatchAnalysisRegistry | None" = None
+
+    def __init__(self, max_reports: int = DEFAULT_MAX_REPORTS):
+        self._reports: "OrderedDict[UUID, BatchAnalysisReport]" = OrderedDict()
+        self._max_reports = max_reports
+
+    @classmethod
+    def get_instance(cls) -> "BatchAnalysisRegistry":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def add(self, report: BatchAnalysisReport) -> None:
+        self._reports[report.batch_id] = report
+        # Drop the oldest finished reports; running batches are always kept
+        for batch_id in list(self._reports):
+            if len(self._reports) <= self._max_reports:
+                break
+            if self._reports[batch_id].is_finished:
+                del self._reports[batch_id]
+
+    def get(self, batch_id: UUID) -> Optional[BatchAnalysisReport]:
+        return self._reports.get(batch_id)
+
+    def all(self) -> List[BatchAnalysisReport]:
+        return list(self._reports.values())
@@ -63,6 +63,10 @@ class Document(Aggregate):
     def status(self) -> DocumentStatus:
         return self._status
 
+    @property
+    def policy_repository_id(self) -> Optional[UUID]:
+        return self._policy_repository_id
+
     @property
     def compliance_score(self) -> Optional[float]:
         return self._compliance_score
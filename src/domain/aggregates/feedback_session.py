@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 
 from .base import Aggregate
@@ -21,7 +21,8 @@ class FeedbackSession(Aggregate):
     def __init__(self, session_id: UUID):
         super().__init__(session_id)
         self._document_id: Optional[UUID] = None
-        self._feedback_items: List[FeedbackItem] = []
+        # Keyed by feedback_id; dicts keep insertion order, so items stay in generation order
+        self._feedback_items: Dict[UUID, FeedbackItem] = {}
 
     @property
     def document_id(self) -> Optional[UUID]:
@@ -29,12 +30,15 @@ class FeedbackSession(Aggregate):
 
     @property
     def feedback_items(self) -> List[FeedbackItem]:
-        """Return copy of feedback items list (items themselves are immutable)."""
-        return self._feedback_items.copy()
+        """Return feedback items as a new list (items themselves are immutable)."""
+        return list(self._feedback_items.values())
+
+    def get_feedback(self, feedback_id: UUID) -> Optional[FeedbackItem]:
+        return self._feedback_items.get(feedback_id)
 
     def _init_state(self) -> None:
         self._document_id = None
-        self._feedback_items = []
+        self._feedback_items = {}
 
     @classmethod
     def create_for_document(
@@ -51,23 +55,9 @@ class FeedbackSession(Aggregate):
         )
         return session
 
-    def _find_feedback(self, feedback_id: UUID) -> Optional[FeedbackItem]:
-        """Find feedback item by ID."""
-        for item in self._feedback_items:
-            if item.feedback_id == feedback_id:
-                return item
-        return None
-
-    def _find_feedback_index(self, feedback_id: UUID) -> int:
-        """Find index of feedback item by ID. Returns -1 if not found."""
-        for i, item in enumerate(self._feedback_items):
-            if item.feedback_id == feedback_id:
-                return i
-        return -1
-
     def _validate_feedback_pending(self, feedback_id: UUID) -> None:
         """Validate that feedback exists and is in PENDING status."""
-        feedback = self._find_feedback(feedback_id)
+        feedback = self._feedback_items.get(feedback_id)
         if feedback is None:
             raise FeedbackNotFound(feedback_id=feedback_id)
         if feedback.status != FeedbackStatus.PENDING:
@@ -129,6 +119,65 @@ class FeedbackSession(Aggregate):
             )
         )
 
+    def accept_changes(
+        self,
+        feedback_ids: Iterable[UUID],
+        accepted_by: str,
+    ) -> List[UUID]:
+        """
+        Accept several pending changes at once.
+
+        Every item is validated before any is accepted, so either all of
+        them are accepted or none is. Duplicate ids are accepted once.
+
+        Returns:
+            The accepted feedback ids, in request order
+        """
+        accepted = self._validate_all_pending(feedback_ids)
+        for feedback_id in accepted:
+            self._apply_event(
+                ChangeAccepted(
+                    aggregate_id=self._id,
+                    feedback_id=feedback_id,
+                    accepted_by=accepted_by,
+                    applied_change="",
+                )
+            )
+        return accepted
+
+    def reject_changes(
+        self,
+        feedback_ids: Iterable[UUID],
+        rejected_by: str,
+        rejection_reason: str,
+    ) -> List[UUID]:
+        """
+        Reject several pending changes at once, with the same reason.
+
+        Every item is validated before any is rejected, so either all of
+        them are rejected or none is. Duplicate ids are rejected once.
+
+        Returns:
+            The rejected feedback ids, in request order
+        """
+        rejected = self._validate_all_pending(feedback_ids)
+        for feedback_id in rejected:
+            self._apply_event(
+                ChangeRejected(
+                    aggregate_id=self._id,
+                    feedback_id=feedback_id,
+                    rejected_by=rejected_by,
+                    rejection_reason=rejection_reason,
+                )
+            )
+        return rejected
+
+    def _validate_all_pending(self, feedback_ids: Iterable[UUID]) -> List[UUID]:
+        unique_ids = list(dict.fromkeys(feedback_ids))
+        for feedback_id in unique_ids:
+            self._validate_feedback_pending(feedback_id)
+        return unique_ids
+
     def modify_change(
         self,
         feedback_id: UUID,
@@ -151,14 +200,14 @@ class FeedbackSession(Aggregate):
         """
         Apply event to aggregate state using immutable value objects.
 
-        Creates new lists instead of mutating existing ones to maintain DDD principles.
+        Decisions replace the item under its id with a new FeedbackItem
+        rather than mutating it, at constant cost per event.
         """
         if isinstance(event, FeedbackSessionCreated):
             self._document_id = event.document_id
 
         elif isinstance(event, FeedbackGenerated):
-            # Create new FeedbackItem and append to list
-            new_item = FeedbackItem.create_pending(
+            self._feedback_items[event.feedback_id] = FeedbackItem.create_pending(
                 feedback_id=event.feedback_id,
                 issue_description=event.issue_description,
                 suggested_change=event.suggested_change,
@@ -166,40 +215,18 @@ class FeedbackSession(Aggregate):
                 policy_reference=event.policy_reference,
                 section_reference=event.section_reference,
             )
-            self._feedback_items.append(new_item)
 
         elif isinstance(event, ChangeAccepted):
-            # Find item and replace with accepted version (immutable update)
-            idx = self._find_feedback_index(event.feedback_id)
-            if idx >= 0:
-                old_item = self._feedback_items[idx]
-                accepted_item = old_item.accept(event.applied_change)
-                # Create new list with updated item
-                self._feedback_items = [
-                    accepted_item if i == idx else item
-                    for i, item in enumerate(self._feedback_items)
-                ]
+            item = self._feedback_items.get(event.feedback_id)
+            if item is not None:
+                self._feedback_items[event.feedback_id] = item.accept(event.applied_change)
 
         elif isinstance(event, ChangeRejected):
-            # Find item and replace with rejected version (immutable update)
-            idx = self._find_feedback_index(event.feedback_id)
-            if idx >= 0:
-                old_item = self._feedback_items[idx]
-                rejected_item = old_item.reject(event.rejection_reason)
-                # Create new list with updated item
-                self._feedback_items = [
-                    rejected_item if i == idx else item
-                    for i, item in enumerate(self._feedback_items)
-                ]
+            item = self._feedback_items.get(event.feedback_id)
+            if item is not None:
+                self._feedback_items[event.feedback_id] = item.reject(event.rejection_reason)
 
         elif isinstance(event, ChangeModified):
-            # Find item and replace with modified version (immutable update)
-            idx = self._find_feedback_index(event.feedback_id)
-            if idx >= 0:
-                old_item = self._feedback_items[idx]
-                modified_item = old_item.modify(event.modified_change)
-                # Create new list with updated item
-                self._feedback_items = [
-                    modified_item if i == idx else item
-                    for i, item in enumerate(self._feedback_items)
-                ]
+            item = self._feedback_items.get(event.feedback_id)
+            if item is not None:
+                self._feedback_items[event.feedback_id] = item.modify(event.modified_change)
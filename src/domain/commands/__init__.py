@@ -7,11 +7,14 @@ from .document_commands import (
 )
 from .analysis_commands import (
     StartAnalysis,
+    StartBatchAnalysis,
     CancelAnalysis,
 )
 from .feedback_commands import (
     AcceptChange,
     RejectChange,
+    AcceptChanges,
+    RejectChanges,
     ModifyChange,
 )
 from .policy_commands import (
@@ -27,9 +30,12 @@ __all__ = [
     "DeleteDocument",
     "CurateSemanticIR",
     "StartAnalysis",
+    "StartBatchAnalysis",
     "CancelAnalysis",
     "AcceptChange",
     "RejectChange",
+    "AcceptChanges",
+    "RejectChanges",
     "ModifyChange",
     "CreatePolicyRepository",
     "AddPolicy",
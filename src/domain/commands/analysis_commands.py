@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from typing import Optional, Tuple
 from uuid import UUID
 
 from .base import Command
@@ -17,3 +18,21 @@ class CancelAnalysis(Command):
     document_id: UUID = field(default=None)
     cancelled_by: str = ""
     reason: str = ""
+
+
+@dataclass(frozen=True)
+class StartBatchAnalysis(Command):
+    """Analyse many documents: the listed ones, a group's members, or a policy repository's documents.
+
+    ``document_ids`` takes precedence over ``group_id``, which takes
+    precedence over the documents assigned to ``policy_repository_id``.
+    Each document is analysed against ``policy_repository_id`` if given,
+    else against its own policy repository.
+    """
+    document_ids: Tuple[UUID, ...] = ()
+    group_id: Optional[UUID] = None
+    policy_repository_id: Optional[UUID] = None
+    initiated_by: str = ""
+    ai_model: str = "claude"
+    max_concurrency: int = 4
+    token_budget: Optional[int] = None
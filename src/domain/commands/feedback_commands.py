@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from typing import Tuple
 from uuid import UUID
 
 from .base import Command
@@ -19,6 +20,21 @@ class RejectChange(Command):
     reason: str = ""
 
 
+@dataclass(frozen=True)
+class AcceptChanges(Command):
+    document_id: UUID = field(default=None)
+    feedback_ids: Tuple[UUID, ...] = ()
+    accepted_by: str = ""
+
+
+@dataclass(frozen=True)
+class RejectChanges(Command):
+    document_id: UUID = field(default=None)
+    feedback_ids: Tuple[UUID, ...] = ()
+    rejected_by: str = ""
+    reason: str = ""
+
+
 @dataclass(frozen=True)
 class ModifyChange(Command):
     document_id: UUID = field(default=None)
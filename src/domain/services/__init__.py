@@ -1,10 +1,15 @@
 from .document_conversion_service import DocumentConversionService
 from .compliance_checker import ComplianceChecker, ComplianceResult
+from .keyword_index import KeywordIndex
+from .lineage_graph import LineageGraph, LineageNode
 from .version_calculator import VersionCalculator
 
 __all__ = [
     "DocumentConversionService",
     "ComplianceChecker",
     "ComplianceResult",
+    "KeywordIndex",
+    "LineageGraph",
+    "LineageNode",
     "VersionCalculator",
 ]
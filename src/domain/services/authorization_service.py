@@ -1,9 +1,10 @@
 """Authorization service for policy-based access control."""
 
-from typing import Set
+from typing import Set, Union
 
 from src.domain.aggregates.document import Document
 from src.domain.aggregates.user import User
+from src.domain.value_objects.document_access import DocumentAccess
 from src.domain.value_objects.permission import Permission
 from src.domain.value_objects.user_role import UserRole
 
@@ -39,6 +40,11 @@ ROLE_PERMISSIONS: dict[UserRole, Set[Permission]] = {
 }
 
 
+# Document checks need only ownership and sharing state, so they accept
+# either the aggregate or the DocumentAccess read model.
+DocumentLike = Union[Document, DocumentAccess]
+
+
 class AuthorizationService:
     """Service for checking user permissions and document access.
     
@@ -50,6 +56,9 @@ class AuthorizationService:
     - Document owners have special privileges (view, edit, share, delete)
     - Group members can view shared documents
     - Permission checks combine role-based and document-level rules
+    
+    Document checks accept a DocumentAccess from the document_acl_views
+    read model as well as the Document aggregate.
     """
     
     def get_user_permissions(self, user: User) -> Set[Permission]:
@@ -90,7 +99,7 @@ class AuthorizationService:
         user_permissions = self.get_user_permissions(user)
         return permission in user_permissions
     
-    def can_view_document(self, user: User, document: Document) -> bool:
+    def can_view_document(self, user: User, document: DocumentLike) -> bool:
         """Check if user can view a document.
         
         Rules:
@@ -99,7 +108,7 @@ class AuthorizationService:
         
         Args:
             user: User aggregate
-            document: Document aggregate
+            document: Document aggregate or DocumentAccess view
             
         Returns:
             True if user can view the document
@@ -115,7 +124,7 @@ class AuthorizationService:
         # Check document-level access
         return document.can_view(user.kerberos_id, user.groups)
     
-    def can_edit_document(self, user: User, document: Document) -> bool:
+    def can_edit_document(self, user: User, document: DocumentLike) -> bool:
         """Check if user can edit a document.
         
         Rules:
@@ -124,7 +133,7 @@ class AuthorizationService:
         
         Args:
             user: User aggregate
-            document: Document aggregate
+            document: Document aggregate or DocumentAccess view
             
         Returns:
             True if user can edit the document
@@ -140,7 +149,7 @@ class AuthorizationService:
         # Only owner can edit (non-admins)
         return document.owner_kerberos_id == user.kerberos_id
     
-    def can_share_document(self, user: User, document: Document) -> bool:
+    def can_share_document(self, user: User, document: DocumentLike) -> bool:
         """Check if user can share a document.
         
         Rules:
@@ -151,7 +160,7 @@ class AuthorizationService:
         
         Args:
             user: User aggregate
-            document: Document aggregate
+            document: Document aggregate or DocumentAccess view
             
         Returns:
             True if user can share the document
@@ -167,7 +176,7 @@ class AuthorizationService:
         # Only owner can share (non-admins)
         return document.owner_kerberos_id == user.kerberos_id
     
-    def can_delete_document(self, user: User, document: Document) -> bool:
+    def can_delete_document(self, user: User, document: DocumentLike) -> bool:
         """Check if user can delete a document.
         
         Rules:
@@ -176,7 +185,7 @@ class AuthorizationService:
         
         Args:
             user: User aggregate
-            document: Document aggregate
+            document: Document aggregate or DocumentAccess view
             
         Returns:
             True if user can delete the document
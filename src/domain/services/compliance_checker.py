@@ -1,7 +1,9 @@
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Set, Tuple
 
 from src.domain.value_objects import RequirementType
+from .keyword_index import KeywordIndex
 
 
 @dataclass
@@ -13,6 +15,17 @@ class ComplianceResult:
 
 
 class ComplianceChecker:
+    """Cheap keyword pre-screen of a document against policy rules.
+
+    Keyword indexes are cached per distinct rule set, so repeated checks
+    against the same policy repository reuse a single automaton and scan
+    each document once regardless of the number of rules.
+    """
+
+    def __init__(self, max_cached_indexes: int = 32):
+        self._max_cached_indexes = max_cached_indexes
+        self._indexes: "OrderedDict[Tuple[str, ...], KeywordIndex]" = OrderedDict()
+
     def check_requirement(
         self,
         document_content: str,
@@ -20,8 +33,18 @@ class ComplianceChecker:
         requirement_type: RequirementType,
     ) -> ComplianceResult:
         keywords = self._extract_keywords(policy_rule)
-        matches = sum(1 for kw in keywords if kw.lower() in document_content.lower())
-        
+        content = document_content.lower()
+        found = {kw for kw in set(keywords) if kw in content}
+        return self._score(keywords, found, requirement_type)
+
+    def _score(
+        self,
+        keywords: List[str],
+        found: Set[str],
+        requirement_type: RequirementType,
+    ) -> ComplianceResult:
+        matches = sum(1 for kw in keywords if kw in found)
+
         confidence = min(1.0, matches / max(1, len(keywords)))
         threshold = self._get_threshold_for_requirement_type(requirement_type)
         is_compliant = confidence >= threshold
@@ -47,15 +70,18 @@ class ComplianceChecker:
         document_content: str,
         policy_rules: List[Dict[str, Any]],
     ) -> List[Dict[str, Any]]:
+        index = self.get_index(policy_rules)
+        found = index.find_all(document_content)
+
         issues = []
         for rule in policy_rules:
             req_type = rule.get("type", RequirementType.SHOULD)
             if isinstance(req_type, str):
                 req_type = RequirementType(req_type.upper())
-            result = self.check_requirement(
-                document_content=document_content,
-                policy_rule=rule["rule"],
-                requirement_type=req_type,
+            result = self._score(
+                self._extract_keywords(rule["rule"]),
+                found,
+                req_type,
             )
             if not result.is_compliant:
                 issues.append({
@@ -67,6 +93,21 @@ class ComplianceChecker:
                 })
         return issues
 
+    def get_index(self, policy_rules: List[Dict[str, Any]]) -> KeywordIndex:
+        """Return the cached keyword index for a rule set, building it once."""
+        key = tuple(rule["rule"] for rule in policy_rules)
+        index = self._indexes.get(key)
+        if index is not None:
+            self._indexes.move_to_end(key)
+            return index
+
+        keywords = {kw for rule_text in key for kw in self._extract_keywords(rule_text)}
+        index = KeywordIndex(keywords)
+        self._indexes[key] = index
+        if len(self._indexes) > self._max_cached_indexes:
+            self._indexes.popitem(last=False)
+        return index
+
     def _get_severity(self, requirement_type: RequirementType) -> str:
         if requirement_type == RequirementType.MUST:
             return "HIGH"
@@ -0,0 +1,82 @@
+"""Multi-pattern keyword index for single-pass policy pre-screening."""
+
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Set
+
+
+class KeywordIndex:
+    """Aho-Corasick automaton over a fixed set of lowercase keywords.
+
+    The automaton is built once and can then report every keyword that
+    occurs as a substring of a document in a single pass over the text,
+    independent of how many keywords are indexed. Matching is
+    case-insensitive and uses the same substring semantics as
+    ``keyword in document.lower()``.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[Set[str]] = [set()]
+        self._keywords: FrozenSet[str] = frozenset(
+            kw.lower() for kw in keywords if kw
+        )
+
+        for keyword in self._keywords:
+            self._insert(keyword)
+        self._build_failure_links()
+
+    @property
+    def keywords(self) -> FrozenSet[str]:
+        return self._keywords
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    def _insert(self, keyword: str) -> None:
+        state = 0
+        for ch in keyword:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append(set())
+                self._goto[state][ch] = next_state
+            state = next_state
+        self._outputs[state].add(keyword)
+
+    def _build_failure_links(self) -> None:
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._outputs[child] |= self._outputs[self._fail[child]]
+
+    def find_all(self, text: str) -> Set[str]:
+        """Return the set of indexed keywords occurring in ``text``."""
+        if not self._keywords:
+            return set()
+
+        goto = self._goto
+        fail = self._fail
+        visited: Set[int] = set()
+        state = 0
+        for ch in text.lower():
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if state:
+                visited.add(state)
+
+        found: Set[str] = set()
+        outputs = self._outputs
+        for state in visited:
+            found |= outputs[state]
+        return found
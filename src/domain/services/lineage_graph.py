@@ -0,0 +1,294 @@
+"""Term and formula dependency graph with precomputed transitive closure."""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from src.domain.value_objects.semantic_ir import DocumentIR
+
+DEFINITION = "definition"
+FORMULA = "formula"
+
+
+@dataclass(frozen=True)
+class LineageNode:
+    """A definition or formula in the lineage graph."""
+
+    id: str
+    name: str
+    kind: str
+
+
+class LineageGraph:
+    """Dependency graph over a document's definitions and formulae.
+
+    An edge ``a -> b`` means ``a`` depends on ``b``. On construction the
+    graph is condensed into strongly connected components with an iterative
+    Tarjan pass, and the components are laid out in topological order
+    (dependencies first). Transitive upstream and downstream sets are then
+    computed for every component in one pass each over the condensation and
+    stored as bitsets, so closure queries do not walk the graph.
+
+    Nodes are numbered by topological position, so every list returned by
+    the query methods is in dependency-first order; members of a cycle are
+    adjacent.
+    """
+
+    def __init__(
+        self,
+        nodes: Sequence[LineageNode],
+        edges: Iterable[Tuple[str, str]],
+        names: Optional[Mapping[str, str]] = None,
+    ):
+        """
+        Args:
+            nodes: Graph nodes; later nodes reusing an id are ignored
+            edges: ``(dependent_id, dependency_id)`` pairs; pairs naming
+                unknown nodes are ignored
+            names: Lowercase name or alias to node id, used by ``resolve``
+        """
+        unique: Dict[str, LineageNode] = {}
+        for node in nodes:
+            unique.setdefault(node.id, node)
+        listed = list(unique.values())
+        position = {node.id: i for i, node in enumerate(listed)}
+
+        successors: List[List[int]] = [[] for _ in listed]
+        for source, target in edges:
+            if source in position and target in position:
+                successors[position[source]].append(position[target])
+
+        components = self._strongly_connected_components(successors)
+
+        # Renumber nodes by topological position
+        order = [i for component in components for i in component]
+        rank = [0] * len(order)
+        for new, old in enumerate(order):
+            rank[old] = new
+        self._nodes: List[LineageNode] = [listed[old] for old in order]
+        self._index: Dict[str, int] = {node.id: i for i, node in enumerate(self._nodes)}
+        self._names: Dict[str, str] = dict(names or {})
+
+        self._successors: List[List[int]] = [
+            sorted({rank[t] for t in successors[old]}) for old in order
+        ]
+        predecessors: List[List[int]] = [[] for _ in order]
+        for source, targets in enumerate(self._successors):
+            for target in targets:
+                predecessors[target].append(source)
+        self._predecessors = predecessors
+
+        self._component: List[int] = [0] * len(order)
+        self._spans: List[range] = []
+        self._members: List[int] = []
+        cyclic = 0
+        start = 0
+        for c, component in enumerate(components):
+            end = start + len(component)
+            mask = ((1 << end) - 1) ^ ((1 << start) - 1)
+            self._spans.append(range(start, end))
+            self._members.append(mask)
+            for i in range(start, end):
+                self._component[i] = c
+            if len(component) > 1 or start in self._successors[start]:
+                cyclic |= mask
+            start = end
+        self._cyclic = cyclic
+        self._cyclic_by_kind: Dict[str, int] = {}
+
+        self._upstream = self._closure(self._successors, range(len(components)))
+        self._downstream = self._closure(self._predecessors, range(len(components) - 1, -1, -1))
+
+    @classmethod
+    def from_ir(cls, ir: "DocumentIR") -> "LineageGraph":
+        """
+        Build the graph for a document IR.
+
+        Definitions depend on the definitions named in their lineage
+        ``input_terms`` (matched by term or alias); formulae depend on the
+        formulae and definitions listed in ``dependencies``.
+
+        Args:
+            ir: Document IR
+
+        Returns:
+            LineageGraph over the IR's definitions and formulae
+        """
+        nodes = [LineageNode(d.id, d.term, DEFINITION) for d in ir.definitions]
+        nodes += [LineageNode(f.id, f.name or f.id, FORMULA) for f in ir.formulae]
+
+        names: Dict[str, str] = {}
+        for definition in ir.definitions:
+            for term in definition.get_all_terms():
+                names.setdefault(term.lower().strip(), definition.id)
+        terms = dict(names)
+        for formula in ir.formulae:
+            if formula.name:
+                names.setdefault(formula.name.lower().strip(), formula.id)
+
+        edges: List[Tuple[str, str]] = []
+        for definition in ir.definitions:
+            if definition.lineage:
+                for dependency in definition.lineage.input_terms:
+                    target = terms.get(dependency.name.lower().strip())
+                    if target:
+                        edges.append((definition.id, target))
+        for formula in ir.formulae:
+            edges.extend((formula.id, dependency) for dependency in formula.dependencies)
+
+        return cls(nodes, edges, names)
+
+    @staticmethod
+    def _strongly_connected_components(successors: List[List[int]]) -> List[List[int]]:
+        """Tarjan's algorithm without recursion; components come out dependencies first."""
+        count = len(successors)
+        index = [-1] * count
+        lowlink = [0] * count
+        on_stack = [False] * count
+        stack: List[int] = []
+        components: List[List[int]] = []
+        counter = 0
+
+        for root in range(count):
+            if index[root] != -1:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, child = work[-1]
+                if child == 0:
+                    index[node] = lowlink[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                edges = successors[node]
+                while child < len(edges):
+                    target = edges[child]
+                    child += 1
+                    if index[target] == -1:
+                        work[-1] = (node, child)
+                        work.append((target, 0))
+                        break
+                    if on_stack[target]:
+                        lowlink[node] = min(lowlink[node], index[target])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(sorted(component))
+        return components
+
+    def _closure(self, adjacency: List[List[int]], components: Iterable[int]) -> List[int]:
+        """Reachable-node bitset per component, visiting components after everything they reach."""
+        reach = [0] * len(self._members)
+        for c in components:
+            mask = self._members[c] & self._cyclic
+            for i in self._spans[c]:
+                for j in adjacency[i]:
+                    d = self._component[j]
+                    if d != c:
+                        mask |= self._members[d] | reach[d]
+            reach[c] = mask
+        return reach
+
+    def _ids(self, mask: int) -> List[str]:
+        bits = bin(mask)[:1:-1]
+        ids = []
+        i = bits.find("1")
+        while i != -1:
+            ids.append(self._nodes[i].id)
+            i = bits.find("1", i + 1)
+        return ids
+
+    def _cyclic_of_kind(self, kind: str) -> int:
+        mask = self._cyclic_by_kind.get(kind)
+        if mask is None:
+            mask = 0
+            for c, members in enumerate(self._members):
+                if members & self._cyclic and any(self._nodes[i].kind == kind for i in self._spans[c]):
+                    mask |= members
+            self._cyclic_by_kind[kind] = mask
+        return mask
+
+    def _position(self, node_id: str) -> int:
+        try:
+            return self._index[node_id]
+        except KeyError:
+            raise KeyError(f"Unknown lineage node: {node_id}") from None
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._index
+
+    def node(self, node_id: str) -> LineageNode:
+        """Return the node with the given ID."""
+        return self._nodes[self._position(node_id)]
+
+    def resolve(self, name: str) -> Optional[str]:
+        """
+        Find a node by ID, or by term, alias or formula name.
+
+        Args:
+            name: Node ID or name (case-insensitive)
+
+        Returns:
+            Node ID if found, None otherwise
+        """
+        if name in self._index:
+            return name
+        return self._names.get(name.lower().strip())
+
+    def topological_order(self) -> List[str]:
+        """All node IDs, dependencies before the nodes that depend on them."""
+        return [node.id for node in self._nodes]
+
+    def dependencies(self, node_id: str) -> List[str]:
+        """Nodes that ``node_id`` depends on directly."""
+        return [self._nodes[i].id for i in self._successors[self._position(node_id)]]
+
+    def dependents(self, node_id: str) -> List[str]:
+        """Nodes that depend directly on ``node_id``."""
+        return [self._nodes[i].id for i in self._predecessors[self._position(node_id)]]
+
+    def upstream(self, node_id: str) -> List[str]:
+        """Every node that ``node_id`` depends on, directly or transitively."""
+        i = self._position(node_id)
+        return self._ids(self._upstream[self._component[i]] & ~(1 << i))
+
+    def downstream(self, node_id: str) -> List[str]:
+        """Every node that depends on ``node_id``, i.e. what is affected if it changes."""
+        i = self._position(node_id)
+        return self._ids(self._downstream[self._component[i]] & ~(1 << i))
+
+    def cycles(self) -> List[List[str]]:
+        """Node IDs of each dependency cycle, including self-dependencies."""
+        return [self._ids(members) for members in self._members if members & self._cyclic]
+
+    def in_cycle(self, node_id: str) -> bool:
+        """Whether ``node_id`` is part of a dependency cycle."""
+        return bool(self._cyclic >> self._position(node_id) & 1)
+
+    def reaches_cycle(self, node_id: str, kind: Optional[str] = None) -> bool:
+        """
+        Whether ``node_id`` is in, or depends on, a dependency cycle.
+
+        Args:
+            node_id: Node to check
+            kind: Only consider cycles containing nodes of this kind
+
+        Returns:
+            True if a matching cycle is reachable
+        """
+        cyclic = self._cyclic if kind is None else self._cyclic_of_kind(kind)
+        return bool(self._upstream[self._component[self._position(node_id)]] & cyclic)
+
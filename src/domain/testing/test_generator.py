@@ -96,7 +96,8 @@ class TestCaseGenerator:
         
         formulas = document_ir.formulae
         if formulas_to_test:
-            formulas = [f for f in formulas if f.id in formulas_to_test]
+            wanted = set(formulas_to_test)
+            formulas = [f for f in formulas if f.id in wanted]
         
         for formula in formulas:
             results[formula.id] = self.generate_from_formula(formula, document_ir)
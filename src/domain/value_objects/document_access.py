@@ -0,0 +1,52 @@
+"""Document access control snapshot."""
+
+from dataclasses import dataclass, field
+from typing import FrozenSet
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class DocumentAccess:
+    """The ownership and sharing state of a document, without its content.
+    
+    Carries exactly what authorization checks need, so permission checks
+    can be answered from the ``document_acl_views`` read model instead of
+    rehydrating the Document aggregate. Mirrors ``Document.can_view``.
+    """
+    
+    document_id: UUID
+    owner_kerberos_id: str
+    visibility: str = "private"
+    shared_with_groups: FrozenSet[str] = field(default_factory=frozenset)
+    
+    @classmethod
+    def from_document(cls, document) -> "DocumentAccess":
+        """Build from a Document aggregate."""
+        return cls(
+            document_id=document.id,
+            owner_kerberos_id=document.owner_kerberos_id,
+            visibility=document.visibility,
+            shared_with_groups=frozenset(document.shared_with_groups),
+        )
+    
+    def can_view(self, user_kerberos_id: str, user_groups: set) -> bool:
+        """Check if a user can view the document.
+        
+        Args:
+            user_kerberos_id: User's Kerberos ID
+            user_groups: Set of groups the user belongs to
+            
+        Returns:
+            True if user can view the document
+        """
+        if self.owner_kerberos_id == user_kerberos_id:
+            return True
+        
+        if self.visibility == "private":
+            return False
+        elif self.visibility == "group":
+            return bool(self.shared_with_groups & set(user_groups))
+        elif self.visibility in ("organization", "public"):
+            return True
+        
+        return False
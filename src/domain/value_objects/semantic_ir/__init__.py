@@ -8,6 +8,7 @@ from .formula_reference import FormulaReference
 from .table_data import TableData
 from .cross_reference import CrossReference
 from .validation_issue import ValidationIssue, ValidationSeverity, ValidationType
+from .lazy_content import LazyText
 from .document_ir import DocumentIR
 
 __all__ = [
@@ -24,5 +25,6 @@ __all__ = [
     'ValidationIssue',
     'ValidationSeverity',
     'ValidationType',
+    'LazyText',
     'DocumentIR',
 ]
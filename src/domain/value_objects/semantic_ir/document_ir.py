@@ -1,19 +1,93 @@
 """Document Intermediate Representation value object."""
 
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Any, Optional, Set
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Iterable, List, Dict, Any, Optional, Set, SupportsIndex, Tuple
 
 from .ir_section import IRSection
+from .lazy_content import ContentLoader, LazyField, LazyText, line_slice
 from .term_definition import TermDefinition
 from .formula_reference import FormulaReference
 from .table_data import TableData
 from .cross_reference import CrossReference
 from .validation_issue import ValidationIssue
 
+if TYPE_CHECKING:
+    from src.domain.services.lineage_graph import LineageGraph
+
+# List fields that the lookup indexes are built from
+_INDEXED_FIELDS = frozenset({"sections", "definitions", "formulae", "tables"})
+
+
+class _TrackedList(list):
+    """List that counts in-place mutations so derived indexes can detect staleness."""
+
+    version = 0
+
+    def _changed(self) -> None:
+        self.version += 1
+
+    def append(self, item: Any) -> None:
+        super().append(item)
+        self._changed()
+
+    def extend(self, items: Iterable[Any]) -> None:
+        super().extend(items)
+        self._changed()
+
+    def insert(self, index: SupportsIndex, item: Any) -> None:
+        super().insert(index, item)
+        self._changed()
+
+    def pop(self, index: SupportsIndex = -1) -> Any:
+        item = super().pop(index)
+        self._changed()
+        return item
+
+    def remove(self, item: Any) -> None:
+        super().remove(item)
+        self._changed()
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def sort(self, *, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> None:
+        super().sort(key=key, reverse=reverse)
+        self._changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._changed()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, items: Iterable[Any]) -> "_TrackedList":
+        super().__iadd__(items)
+        self._changed()
+        return self
+
+    def __imul__(self, count: SupportsIndex) -> "_TrackedList":
+        super().__imul__(count)
+        self._changed()
+        return self
+
 
 @dataclass
 class DocumentIR:
-    """Semantic Intermediate Representation for document analysis."""
+    """Semantic Intermediate Representation for document analysis.
+
+    Lookups by id, name and alias go through dictionaries that are built on
+    first use and rebuilt after the underlying list is mutated or replaced.
+    ``raw_markdown`` may be passed as None with a ``markdown_loader``, in
+    which case the markdown is fetched on first access.
+    """
 
     document_id: str
     title: str
@@ -24,11 +98,15 @@ class DocumentIR:
     tables: List[TableData]
     cross_references: List[CrossReference]
     metadata: Dict[str, Any]
-    raw_markdown: str
+    raw_markdown: Optional[str] = LazyField("markdown_loader")
     validation_issues: List[ValidationIssue] = field(default_factory=list)
+    markdown_loader: Optional[ContentLoader] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate document IR data."""
+        self._indexes: Dict[str, Tuple[Tuple[_TrackedList, ...], Tuple[int, ...], Any]] = {}
+        for name in _INDEXED_FIELDS:
+            self._tracked(name)
         if not self.document_id:
             raise ValueError("Document ID cannot be empty")
         if not self.title:
@@ -36,52 +114,147 @@ class DocumentIR:
         if not self.original_format:
             raise ValueError("Original format cannot be empty")
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, include_content: bool = True) -> Dict[str, Any]:
         """
         Serialize to JSON-compatible dictionary.
 
+        Args:
+            include_content: Include ``raw_markdown`` and section bodies
+
         Returns:
             Dictionary representation of the DocumentIR
         """
-        return {
+        data = {
             "document_id": self.document_id,
             "title": self.title,
             "original_format": self.original_format,
-            "sections": [asdict(s) for s in self.sections],
+            "sections": [s.to_dict(include_content) for s in self.sections],
             "definitions": [d.to_dict() for d in self.definitions],
             "formulae": [asdict(f) for f in self.formulae],
             "tables": [asdict(t) for t in self.tables],
             "cross_references": [asdict(c) for c in self.cross_references],
             "metadata": self.metadata,
-            "raw_markdown": self.raw_markdown,
             "validation_issues": [asdict(v) for v in self.validation_issues],
         }
+        # Only read when wanted: reading raw_markdown runs the lazy loader
+        if include_content:
+            data["raw_markdown"] = self.raw_markdown
+        return data
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "DocumentIR":
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        markdown_loader: Optional[ContentLoader] = None,
+        section_loader: Optional[Callable[[str], str]] = None,
+    ) -> "DocumentIR":
         """
         Deserialize from JSON-compatible dictionary.
 
+        Content left out by ``to_dict(include_content=False)`` is loaded on
+        demand: the markdown through ``markdown_loader`` and each section
+        body through ``section_loader(section_id)``, or else by slicing the
+        section's lines out of the markdown.
+
         Args:
             data: Dictionary representation
+            markdown_loader: Loader for ``raw_markdown`` when absent from ``data``
+            section_loader: Loader for section bodies absent from ``data``
 
         Returns:
             DocumentIR instance
         """
+        markdown = data.get("raw_markdown")
+        lazy_markdown = LazyText(markdown_loader) if markdown is None and markdown_loader else None
+
+        def section_from_dict(section: Dict[str, Any]) -> IRSection:
+            if "content" in section:
+                return IRSection.from_dict(section)
+            if section_loader is not None:
+                return IRSection.from_dict(section, content_loader=partial(section_loader, section["id"]))
+            source = lazy_markdown.get if lazy_markdown else (lambda: markdown or "")
+
+            def sliced() -> str:
+                return line_slice(source(), section.get("start_line"), section.get("end_line"))
+            return IRSection.from_dict(section, content_loader=sliced)
+
         return cls(
             document_id=data["document_id"],
             title=data["title"],
             original_format=data["original_format"],
-            sections=[IRSection.from_dict(s) for s in data.get("sections", [])],
+            sections=[section_from_dict(s) for s in data.get("sections", [])],
             definitions=[TermDefinition.from_dict(d) for d in data.get("definitions", [])],
             formulae=[FormulaReference.from_dict(f) for f in data.get("formulae", [])],
             tables=[TableData.from_dict(t) for t in data.get("tables", [])],
             cross_references=[CrossReference.from_dict(c) for c in data.get("cross_references", [])],
             metadata=data.get("metadata", {}),
-            raw_markdown=data.get("raw_markdown", ""),
+            raw_markdown=None if lazy_markdown else (markdown or ""),
             validation_issues=[ValidationIssue.from_dict(v) for v in data.get("validation_issues", [])],
+            markdown_loader=lazy_markdown.get if lazy_markdown else None,
         )
 
+    @property
+    def is_content_loaded(self) -> bool:
+        """Whether ``raw_markdown`` is held in memory."""
+        return self._raw_markdown is not None
+
+    def _tracked(self, name: str) -> _TrackedList:
+        """Return list field ``name``, wrapping it first if it was assigned a plain list."""
+        items = getattr(self, name)
+        if not isinstance(items, _TrackedList):
+            items = _TrackedList(items)
+            setattr(self, name, items)
+        return items
+
+    def _index(self, name: str, sources: Tuple[str, ...], build: Callable[..., Any]) -> Any:
+        """
+        Return the cached index ``name`` over the list fields ``sources``.
+
+        The index is rebuilt, by calling ``build`` with those lists, once
+        any of them has been mutated or replaced.
+        """
+        lists = tuple(self._tracked(source) for source in sources)
+        versions = tuple(items.version for items in lists)
+        cached = self._indexes.get(name)
+        if cached is not None and cached[1] == versions and all(a is b for a, b in zip(cached[0], lists)):
+            return cached[2]
+        index = build(*lists)
+        self._indexes[name] = (lists, versions, index)
+        return index
+
+    def lineage_graph(self) -> "LineageGraph":
+        """
+        Get the dependency graph over definitions and formulae.
+
+        The graph is built on first use and rebuilt after either list changes.
+
+        Returns:
+            LineageGraph for this IR
+        """
+        from src.domain.services.lineage_graph import LineageGraph
+
+        return self._index(
+            "lineage_graph", ("definitions", "formulae"), lambda definitions, formulae: LineageGraph.from_ir(self)
+        )
+
+    @staticmethod
+    def _first_by(items: List[Any], key: Callable[[Any], Optional[str]]) -> Dict[str, Any]:
+        # setdefault keeps the first match, as the linear scans did
+        index: Dict[str, Any] = {}
+        for item in items:
+            value = key(item)
+            if value:
+                index.setdefault(value, item)
+        return index
+
+    @staticmethod
+    def _build_term_index(definitions: List[TermDefinition]) -> Dict[str, TermDefinition]:
+        index: Dict[str, TermDefinition] = {}
+        for definition in definitions:
+            for term in definition.get_all_terms():
+                index.setdefault(term.lower(), definition)
+        return index
+
     def get_all_defined_terms(self) -> List[str]:
         """
         Get all terms defined in the document.
@@ -101,7 +274,7 @@ class DocumentIR:
         Returns:
             Set of all term names and aliases (lowercase)
         """
-        return {term.lower() for term in self.get_all_defined_terms()}
+        return set(self._index("terms", ("definitions",), self._build_term_index))
 
     def find_definition(self, term: str) -> Optional[TermDefinition]:
         """
@@ -113,10 +286,8 @@ class DocumentIR:
         Returns:
             TermDefinition if found, None otherwise
         """
-        for definition in self.definitions:
-            if definition.matches(term):
-                return definition
-        return None
+        terms = self._index("terms", ("definitions",), self._build_term_index)
+        return terms.get(term.lower().strip())
 
     def find_formula(self, formula_id: str) -> Optional[FormulaReference]:
         """
@@ -128,10 +299,8 @@ class DocumentIR:
         Returns:
             FormulaReference if found, None otherwise
         """
-        for formula in self.formulae:
-            if formula.id == formula_id:
-                return formula
-        return None
+        formulae = self._index("formula_ids", ("formulae",), partial(self._first_by, key=lambda f: f.id))
+        return formulae.get(formula_id)
 
     def find_formula_by_name(self, name: str) -> Optional[FormulaReference]:
         """
@@ -143,11 +312,11 @@ class DocumentIR:
         Returns:
             FormulaReference if found, None otherwise
         """
-        name_lower = name.lower()
-        for formula in self.formulae:
-            if formula.name and formula.name.lower() == name_lower:
-                return formula
-        return None
+        formulae = self._index(
+            "formula_names", ("formulae",),
+            partial(self._first_by, key=lambda f: f.name.lower() if f.name else None),
+        )
+        return formulae.get(name.lower())
 
     def find_table(self, table_id: str) -> Optional[TableData]:
         """
@@ -159,10 +328,8 @@ class DocumentIR:
         Returns:
             TableData if found, None otherwise
         """
-        for table in self.tables:
-            if table.id == table_id:
-                return table
-        return None
+        tables = self._index("table_ids", ("tables",), partial(self._first_by, key=lambda t: t.id))
+        return tables.get(table_id)
 
     def find_section(self, section_id: str) -> Optional[IRSection]:
         """
@@ -174,10 +341,8 @@ class DocumentIR:
         Returns:
             IRSection if found, None otherwise
         """
-        for section in self.sections:
-            if section.id == section_id:
-                return section
-        return None
+        sections = self._index("section_ids", ("sections",), partial(self._first_by, key=lambda s: s.id))
+        return sections.get(section_id)
 
     def get_error_issues(self) -> List[ValidationIssue]:
         """Get all error-level validation issues."""
@@ -285,3 +450,4 @@ class DocumentIR:
             "total_terms": len(self.get_all_defined_terms()),
             "markdown_length": len(self.raw_markdown),
         }
+
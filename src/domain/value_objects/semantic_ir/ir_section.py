@@ -1,23 +1,29 @@
 """Enhanced section with semantic classification."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 
+from .lazy_content import ContentLoader, LazyField
 from .section_type import SectionType
 
 
 @dataclass(frozen=True)
 class IRSection:
-    """Enhanced document section with semantic classification."""
+    """Enhanced document section with semantic classification.
+
+    ``content`` may be passed as None together with a ``content_loader``;
+    the body is then fetched on first access instead of held in memory.
+    """
 
     id: str
     title: str
-    content: str
+    content: Optional[str] = LazyField("content_loader")
     level: int
     section_type: SectionType
     parent_id: Optional[str] = None
     start_line: Optional[int] = None
     end_line: Optional[int] = None
+    content_loader: Optional[ContentLoader] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate section data."""
@@ -41,13 +47,45 @@ class IRSection:
             return False
         return self.start_line <= line_number <= self.end_line
 
+    @property
+    def is_content_loaded(self) -> bool:
+        """Whether the section body is held in memory."""
+        return self._content is not None
+
+    def to_dict(self, include_content: bool = True) -> Dict[str, Any]:
+        """
+        Serialize to dictionary.
+
+        Args:
+            include_content: Include the section body
+
+        Returns:
+            Dictionary representation of the IRSection
+        """
+        data = {
+            "id": self.id,
+            "title": self.title,
+            "level": self.level,
+            "section_type": self.section_type,
+            "parent_id": self.parent_id,
+            "start_line": self.start_line,
+            "end_line": self.end_line,
+        }
+        # Only read when wanted: reading content runs the lazy loader
+        if include_content:
+            data["content"] = self.content
+        return data
+
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "IRSection":
+    def from_dict(
+        cls, data: Dict[str, Any], content_loader: Optional[ContentLoader] = None
+    ) -> "IRSection":
         """
         Deserialize from dictionary.
 
         Args:
             data: Dictionary representation
+            content_loader: Loader for the body when ``data`` has no content
 
         Returns:
             IRSection instance
@@ -62,10 +100,12 @@ class IRSection:
         return cls(
             id=data["id"],
             title=data["title"],
-            content=data["content"],
+            content=data.get("content") if content_loader else data["content"],
             level=data["level"],
             section_type=section_type,
             parent_id=data.get("parent_id"),
             start_line=data.get("start_line"),
             end_line=data.get("end_line"),
+            content_loader=content_loader,
         )
+
@@ -0,0 +1,76 @@
+"""On-demand loading of document text for semantic IR."""
+
+from typing import Any, Callable, Optional
+
+ContentLoader = Callable[[], str]
+
+
+class LazyField:
+    """Dataclass field whose text may be supplied as None and loaded on read.
+
+    Declared in the class body in place of a plain annotation default. The
+    value is kept in the private attribute ``_<name>``; when that is None
+    the instance's ``loader_field`` is called on first access and its result
+    kept. The field has no default, and assignment goes through
+    ``object.__setattr__`` so frozen dataclasses can use it too.
+    """
+
+    def __init__(self, loader_field: str):
+        self._loader_field = loader_field
+        self._attr = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attr = f"_{name}"
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> str:
+        if instance is None:
+            # Tells dataclasses the field has no default
+            raise AttributeError(self._attr[1:])
+        value = getattr(instance, self._attr)
+        if value is None:
+            loader = getattr(instance, self._loader_field)
+            value = (loader() or "") if loader else ""
+            object.__setattr__(instance, self._attr, value)
+        return value
+
+    def __set__(self, instance: Any, value: Optional[str]) -> None:
+        object.__setattr__(instance, self._attr, value)
+
+
+class LazyText:
+    """Text fetched by ``loader`` on first use and cached afterwards.
+
+    Lets an IR loaded without its markdown share one fetch between
+    ``DocumentIR.raw_markdown`` and the sections sliced out of it.
+    """
+
+    def __init__(self, loader: ContentLoader):
+        self._loader = loader
+        self._value: Optional[str] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._value is not None
+
+    def get(self) -> str:
+        if self._value is None:
+            self._value = self._loader() or ""
+        return self._value
+
+
+def line_slice(text: str, start_line: Optional[int], end_line: Optional[int]) -> str:
+    """
+    Return lines ``start_line``..``end_line`` (1-based, inclusive) of ``text``.
+
+    Args:
+        text: Full document text
+        start_line: First line, or None for the start of the text
+        end_line: Last line, or None for the end of the text
+
+    Returns:
+        The selected lines joined with newlines
+    """
+    lines = text.splitlines()
+    start = (start_line or 1) - 1
+    end = end_line if end_line is not None else len(lines)
+    return "\n".join(lines[start:end])
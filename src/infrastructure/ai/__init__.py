@@ -9,7 +9,14 @@ from .base import (
     IssueSeverity,
 )
 from .provider_factory import ProviderFactory
-from .rate_limiter import RateLimiter
+from .routing_provider import RoutingProvider, RoutingConfig, ProviderHealth
+from .rate_limiter import (
+    RateLimiter,
+    RateLimitConfig,
+    RateLimitStore,
+    InMemoryRateLimitStore,
+    PostgresRateLimitStore,
+)
 
 __all__ = [
     "AIProvider",
@@ -21,5 +28,12 @@ __all__ = [
     "Issue",
     "IssueSeverity",
     "ProviderFactory",
+    "RoutingProvider",
+    "RoutingConfig",
+    "ProviderHealth",
     "RateLimiter",
+    "RateLimitConfig",
+    "RateLimitStore",
+    "InMemoryRateLimitStore",
+    "PostgresRateLimitStore",
 ]
@@ -2,6 +2,7 @@ from .engine import AnalysisEngine
 from .policy_evaluator import PolicyEvaluator, ComplianceResult
 from .feedback_generator import FeedbackGenerator, FeedbackItem
 from .progress_tracker import ProgressTracker, AnalysisProgress, AnalysisStage
+from .progress_broadcaster import ProgressBroadcaster, ProgressSubscription
 from .result_aggregator import ResultAggregator, AggregatedResult
 
 __all__ = [
@@ -13,6 +14,8 @@ __all__ = [
     "ProgressTracker",
     "AnalysisProgress",
     "AnalysisStage",
+    "ProgressBroadcaster",
+    "ProgressSubscription",
     "ResultAggregator",
     "AggregatedResult",
 ]
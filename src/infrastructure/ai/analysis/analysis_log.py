@@ -1,9 +1,24 @@
+import asyncio
+import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List
+from typing import Deque, Dict, List, Optional, Protocol, Tuple
 from uuid import UUID, uuid4
 
+# Per-log ring bounds: oldest entries are dropped past either limit
+DEFAULT_MAX_ENTRIES_PER_LOG = 1000
+DEFAULT_MAX_CHARS_PER_LOG = 250_000
+
+# Store bounds: least recently used logs are dropped past max_logs, and logs
+# untouched for max_age_seconds are dropped on the next create
+DEFAULT_MAX_LOGS = 500
+DEFAULT_MAX_AGE_SECONDS = 3600.0
+
+# How often a waiter re-reads persisted logs written by another worker
+PERSISTED_POLL_INTERVAL_SECONDS = 1.0
+
 
 class LogLevel(Enum):
     DEBUG = "debug"
@@ -20,10 +35,16 @@ class LogEntry:
     stage: str
     message: str
     details: Dict | None = None
+    sequence: int = 0
+
+    def size(self) -> int:
+        """Approximate size in characters, used for the per-log budget."""
+        return len(self.message) + (len(str(self.details)) if self.details else 0)
 
     def to_dict(self) -> dict:
         return {
             "id": str(self.id),
+            "sequence": self.sequence,
             "timestamp": self.timestamp.isoformat(),
             "level": self.level.value,
             "stage": self.stage,
@@ -32,13 +53,44 @@ class LogEntry:
         }
 
 
+class AnalysisLogSink(Protocol):
+    """Receives log changes as they happen, e.g. to persist them."""
+
+    def entry_added(self, log: "AnalysisLog", entry: LogEntry) -> None: ...
+
+    def log_changed(self, log: "AnalysisLog") -> None: ...
+
+
 @dataclass
 class AnalysisLog:
+    """Log of one analysis run, holding the most recent entries in a bounded ring.
+
+    Entries are numbered by ``sequence`` from 1; readers pass the last
+    sequence they saw to ``entries_after`` or ``wait_for_entries`` to get
+    only newer entries. Entries pushed out of the ring are counted in
+    ``dropped_entries``.
+    """
+
     document_id: UUID
     started_at: datetime
-    entries: List[LogEntry] = field(default_factory=list)
+    entries: Deque[LogEntry] = field(default_factory=deque)
     completed_at: datetime | None = None
     status: str = "in_progress"
+    run_id: UUID = field(default_factory=uuid4)
+    last_sequence: int = 0
+    dropped_entries: int = 0
+    max_entries: int = DEFAULT_MAX_ENTRIES_PER_LOG
+    max_chars: int = DEFAULT_MAX_CHARS_PER_LOG
+    sink: Optional[AnalysisLogSink] = field(default=None, repr=False, compare=False)
+    # Set when a newer run of the same document takes this log's place
+    replaced: bool = field(default=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.entries = deque(self.entries)
+        self.last_sequence = max([self.last_sequence] + [e.sequence for e in self.entries])
+        self.touched_at = time.monotonic()
+        self._chars = sum(e.size() for e in self.entries)
+        self._changed: Optional[asyncio.Event] = None
 
     def add_entry(
         self,
@@ -47,6 +99,7 @@ class AnalysisLog:
         message: str,
         details: Dict | None = None,
     ) -> None:
+        self.last_sequence += 1
         entry = LogEntry(
             id=uuid4(),
             timestamp=datetime.utcnow(),
@@ -54,8 +107,18 @@ class AnalysisLog:
             stage=stage,
             message=message,
             details=details,
+            sequence=self.last_sequence,
         )
         self.entries.append(entry)
+        self._chars += entry.size()
+        while len(self.entries) > 1 and (
+            len(self.entries) > self.max_entries or self._chars > self.max_chars
+        ):
+            self._chars -= self.entries.popleft().size()
+            self.dropped_entries += 1
+        if self.sink is not None:
+            self.sink.entry_added(self, entry)
+        self._notify()
 
     def info(self, stage: str, message: str, details: Dict | None = None) -> None:
         self.add_entry(LogLevel.INFO, stage, message, details)
@@ -72,22 +135,91 @@ class AnalysisLog:
     def complete(self, status: str = "completed") -> None:
         self.completed_at = datetime.utcnow()
         self.status = status
+        if self.sink is not None:
+            self.sink.log_changed(self)
+        self._notify()
 
-    def to_dict(self) -> dict:
+    @property
+    def is_complete(self) -> bool:
+        return self.completed_at is not None
+
+    def entries_after(self, sequence: int = 0) -> List[LogEntry]:
+        """Entries with a sequence greater than ``sequence``, oldest first."""
+        if sequence <= 0:
+            return list(self.entries)
+        # Sequences are contiguous in the ring, so the start index is arithmetic
+        first = self.entries[0].sequence if self.entries else self.last_sequence + 1
+        return list(self.entries)[max(0, sequence - first + 1):]
+
+    async def wait_for_entries(self, sequence: int, timeout: float) -> List[LogEntry]:
+        """
+        Entries after ``sequence``, waiting up to ``timeout`` seconds for one to arrive.
+
+        Returns immediately, possibly with no entries, once the log is complete.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            entries = self.entries_after(sequence)
+            remaining = deadline - time.monotonic()
+            if entries or self.is_complete or remaining <= 0:
+                return entries
+            if self._changed is None:
+                self._changed = asyncio.Event()
+            try:
+                await asyncio.wait_for(self._changed.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+
+    def _notify(self) -> None:
+        self.touched_at = time.monotonic()
+        if self._changed is not None:
+            self._changed.set()
+            self._changed = None
+
+    def to_dict(self, after: int = 0) -> dict:
         return {
             "document_id": str(self.document_id),
             "started_at": self.started_at.isoformat(),
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "status": self.status,
-            "entries": [e.to_dict() for e in self.entries],
+            "last_sequence": self.last_sequence,
+            "dropped_entries": self.dropped_entries,
+            "entries": [e.to_dict() for e in self.entries_after(after)],
         }
 
 
+class AnalysisLogReader(Protocol):
+    """Reads logs persisted by any worker."""
+
+    async def load(self, document_id: UUID, after: int = 0, limit: int = 1000) -> Optional[AnalysisLog]: ...
+
+
 class AnalysisLogStore:
+    """Process-wide registry of analysis logs with bounded memory.
+
+    Holds at most ``max_logs`` logs, evicting the least recently used, and
+    drops logs untouched for ``max_age_seconds``. With a ``sink`` attached
+    every change is also handed to it (see ``PostgresAnalysisLogWriter``), and with a
+    ``reader`` the async read methods fall back to persisted logs, so logs
+    survive restarts and are visible from every worker.
+    """
+
     _instance: "AnalysisLogStore | None" = None
-    
-    def __init__(self):
-        self._logs: Dict[UUID, AnalysisLog] = {}
+
+    def __init__(
+        self,
+        max_logs: int = DEFAULT_MAX_LOGS,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+        max_entries_per_log: int = DEFAULT_MAX_ENTRIES_PER_LOG,
+        max_chars_per_log: int = DEFAULT_MAX_CHARS_PER_LOG,
+    ):
+        self._logs: "OrderedDict[UUID, AnalysisLog]" = OrderedDict()
+        self._max_logs = max_logs
+        self._max_age_seconds = max_age_seconds
+        self._max_entries_per_log = max_entries_per_log
+        self._max_chars_per_log = max_chars_per_log
+        self._sink: Optional[AnalysisLogSink] = None
+        self._reader: Optional[AnalysisLogReader] = None
 
     @classmethod
     def get_instance(cls) -> "AnalysisLogStore":
@@ -95,25 +227,87 @@ class AnalysisLogStore:
             cls._instance = cls()
         return cls._instance
 
+    def attach(self, sink: Optional[AnalysisLogSink] = None, reader: Optional[AnalysisLogReader] = None) -> None:
+        """Persist changes through ``sink`` and read unknown logs through ``reader``."""
+        self._sink = sink
+        self._reader = reader
+        for log in self._logs.values():
+            log.sink = sink
+
     def create_log(self, document_id: UUID) -> AnalysisLog:
+        self._evict_expired()
         log = AnalysisLog(
             document_id=document_id,
             started_at=datetime.utcnow(),
+            max_entries=self._max_entries_per_log,
+            max_chars=self._max_chars_per_log,
+            sink=self._sink,
         )
+        previous = self._logs.get(document_id)
+        if previous is not None:
+            previous.replaced = True
         self._logs[document_id] = log
+        self._logs.move_to_end(document_id)
+        while len(self._logs) > self._max_logs:
+            self._logs.popitem(last=False)
+        if self._sink is not None:
+            self._sink.log_changed(log)
         return log
 
     def get_log(self, document_id: UUID) -> AnalysisLog | None:
-        return self._logs.get(document_id)
+        log = self._logs.get(document_id)
+        if log is not None:
+            self._logs.move_to_end(document_id)
+        return log
 
     def get_or_create_log(self, document_id: UUID) -> AnalysisLog:
-        if document_id not in self._logs:
+        log = self.get_log(document_id)
+        if log is None:
             return self.create_log(document_id)
-        return self._logs[document_id]
+        return log
 
     def clear_log(self, document_id: UUID) -> None:
-        if document_id in self._logs:
-            del self._logs[document_id]
+        self._logs.pop(document_id, None)
 
     def get_all_logs(self) -> List[AnalysisLog]:
         return list(self._logs.values())
+
+    def __len__(self) -> int:
+        return len(self._logs)
+
+    def _evict_expired(self) -> None:
+        cutoff = time.monotonic() - self._max_age_seconds
+        for document_id in [d for d, log in self._logs.items() if log.touched_at < cutoff]:
+            del self._logs[document_id]
+
+    async def load_log(self, document_id: UUID, after: int = 0) -> Optional[AnalysisLog]:
+        """The log held by this worker, else the persisted one (entries after ``after`` only)."""
+        log = self.get_log(document_id)
+        if log is None and self._reader is not None:
+            log = await self._reader.load(document_id, after=after)
+        return log
+
+    async def wait_for_entries(
+        self, document_id: UUID, after: int, timeout: float
+    ) -> Tuple[Optional[AnalysisLog], List[LogEntry]]:
+        """
+        Wait up to ``timeout`` seconds for entries after ``after``.
+
+        Logs held by this worker are awaited directly; logs being written by
+        another worker are re-read from persistence every
+        ``PERSISTED_POLL_INTERVAL_SECONDS``.
+
+        Returns:
+            The log (None if unknown) and its entries after ``after``
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            log = self.get_log(document_id)
+            if log is not None:
+                return log, await log.wait_for_entries(after, max(0.0, deadline - time.monotonic()))
+            log = await self.load_log(document_id, after=after)
+            entries = log.entries_after(after) if log else []
+            remaining = deadline - time.monotonic()
+            if entries or (log and log.is_complete) or remaining <= 0:
+                return log, entries
+            await asyncio.sleep(min(PERSISTED_POLL_INTERVAL_SECONDS, remaining))
@@ -0,0 +1,219 @@
+import asyncio
+import json
+import logging
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import asyncpg
+
+from .analysis_log import AnalysisLog, LogEntry, LogLevel
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresAnalysisLogWriter:
+    """Persists analysis logs to ``analysis_logs``/``analysis_log_entries`` in batches.
+
+    Attached to ``AnalysisLogStore`` as its sink, it only queues changes, so
+    logging never waits on the database. A background task writes the queue
+    every ``flush_interval`` seconds, or as soon as ``batch_size`` entries
+    are waiting, in one transaction per batch. If the database falls behind,
+    the oldest queued entries beyond ``max_pending`` are dropped and counted
+    in ``dropped``.
+
+    It is also the store's reader: logs written by any worker are loaded
+    from the same tables.
+    """
+
+    def __init__(
+        self,
+        pool: asyncpg.Pool,
+        flush_interval: float = 0.5,
+        batch_size: int = 500,
+        max_pending: int = 10000,
+    ):
+        self._pool = pool
+        self._flush_interval = flush_interval
+        self._batch_size = batch_size
+        self._entries: Deque[Tuple[AnalysisLog, LogEntry]] = deque(maxlen=max_pending)
+        self._headers: Dict[UUID, AnalysisLog] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+        self.dropped = 0
+
+    # Sink -------------------------------------------------------------
+
+    def entry_added(self, log: AnalysisLog, entry: LogEntry) -> None:
+        if len(self._entries) == self._entries.maxlen:
+            self.dropped += 1
+        self._entries.append((log, entry))
+        if len(self._entries) >= self._batch_size:
+            self._wakeup.set()
+
+    def log_changed(self, log: AnalysisLog) -> None:
+        self._headers[log.document_id] = log
+
+    @property
+    def pending(self) -> int:
+        return len(self._entries) + len(self._headers)
+
+    # Background flushing ----------------------------------------------
+
+    async def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._run())
+        logger.info("Started analysis log writer")
+
+    async def stop(self) -> None:
+        """Stop the background task after writing everything still queued."""
+        if not self._running:
+            return
+        self._running = False
+        self._wakeup.set()
+        if self._task:
+            await self._task
+        while self.pending:
+            await self.flush()
+        logger.info("Stopped analysis log writer")
+
+    async def _run(self) -> None:
+        while self._running:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Failed to persist analysis logs: {e}", exc_info=True)
+
+    async def flush(self) -> int:
+        """
+        Write queued changes.
+
+        Returns:
+            Number of entries written
+        """
+        if not self._entries and not self._headers:
+            return 0
+
+        entries: List[Tuple[AnalysisLog, LogEntry]] = []
+        while self._entries and len(entries) < self._batch_size:
+            entries.append(self._entries.popleft())
+        # Entries and headers of a run that a newer run replaced are stale
+        entries = [(log, entry) for log, entry in entries if not log.replaced]
+        headers = {d: log for d, log in self._headers.items() if not log.replaced}
+        self._headers.clear()
+        for log, _ in entries:
+            headers.setdefault(log.document_id, log)
+        current = [(log.document_id, log.run_id) for log in headers.values()]
+        rows = [
+            (log.run_id, entry.sequence, log.document_id, entry.id, entry.timestamp,
+             entry.level.value, entry.stage, entry.message,
+             json.dumps(entry.details, default=str) if entry.details is not None else None)
+            for log, entry in entries
+        ]
+
+        try:
+            async with self._pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.executemany(
+                        """
+                        INSERT INTO analysis_logs
+                        (document_id, run_id, started_at, completed_at, status,
+                         last_sequence, dropped_entries, updated_at)
+                        VALUES ($1, $2, $3, $4, $5, $6, $7, NOW())
+                        ON CONFLICT (document_id) DO UPDATE SET
+                            run_id = EXCLUDED.run_id,
+                            started_at = EXCLUDED.started_at,
+                            completed_at = EXCLUDED.completed_at,
+                            status = EXCLUDED.status,
+                            last_sequence = EXCLUDED.last_sequence,
+                            dropped_entries = EXCLUDED.dropped_entries,
+                            updated_at = NOW()
+                        """,
+                        [
+                            (log.document_id, log.run_id, log.started_at, log.completed_at,
+                             log.status, log.last_sequence, log.dropped_entries)
+                            for log in headers.values()
+                        ],
+                    )
+                    await conn.executemany(
+                        "DELETE FROM analysis_log_entries WHERE document_id = $1 AND run_id <> $2",
+                        current,
+                    )
+                    await conn.executemany(
+                        """
+                        INSERT INTO analysis_log_entries
+                        (run_id, sequence, document_id, id, timestamp, level, stage, message, details)
+                        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+                        ON CONFLICT (run_id, sequence) DO NOTHING
+                        """,
+                        rows,
+                    )
+        except Exception:
+            # Put the batch back so the next flush retries it
+            self._entries.extendleft(reversed(entries))
+            for document_id, log in headers.items():
+                self._headers.setdefault(document_id, log)
+            raise
+
+        if self._entries:
+            self._wakeup.set()
+        return len(rows)
+
+    # Reader -----------------------------------------------------------
+
+    async def load(self, document_id: UUID, after: int = 0, limit: int = 1000) -> Optional[AnalysisLog]:
+        """Load the latest persisted run of a document's log, with entries after ``after``."""
+        async with self._pool.acquire() as conn:
+            header = await conn.fetchrow(
+                """
+                SELECT run_id, started_at, completed_at, status, last_sequence, dropped_entries
+                FROM analysis_logs
+                WHERE document_id = $1
+                """,
+                document_id,
+            )
+            if header is None:
+                return None
+            rows = await conn.fetch(
+                """
+                SELECT id, sequence, timestamp, level, stage, message, details
+                FROM analysis_log_entries
+                WHERE run_id = $1 AND sequence > $2
+                ORDER BY sequence
+                LIMIT $3
+                """,
+                header["run_id"],
+                after,
+                limit,
+            )
+
+        entries = [
+            LogEntry(
+                id=row["id"],
+                timestamp=row["timestamp"],
+                level=LogLevel(row["level"]),
+                stage=row["stage"],
+                message=row["message"],
+                details=json.loads(row["details"]) if row["details"] else None,
+                sequence=row["sequence"],
+            )
+            for row in rows
+        ]
+        return AnalysisLog(
+            document_id=document_id,
+            started_at=header["started_at"],
+            entries=deque(entries),
+            completed_at=header["completed_at"],
+            status=header["status"],
+            run_id=header["run_id"],
+            last_sequence=header["last_sequence"],
+            dropped_entries=header["dropped_entries"],
+        )
@@ -1,6 +1,7 @@
+import time
 from uuid import UUID
 
-from ..base import AIProvider, AnalysisOptions, PolicyRule
+from ..base import AIProvider, AnalysisOptions, Issue, PolicyRule
 from ..provider_factory import ProviderFactory, ProviderType
 from .progress_tracker import ProgressTracker, AnalysisStage, ProgressCallback
 from .policy_evaluator import PolicyEvaluator
@@ -31,7 +32,7 @@ class AnalysisEngine:
         options = options or AnalysisOptions()
         provider_type = provider_type or self._default_provider
         
-        provider = self._provider_factory.get_provider(provider_type)
+        provider = self._provider_factory.get_routing_provider(provider_type)
         
         tracker = ProgressTracker(document_id=document_id, total_steps=4)
         if progress_callback:
@@ -66,10 +67,22 @@ class AnalysisEngine:
             log.info("analysis", "Sending document to AI for analysis", {
                 "content_preview": processed_content[:200] + "..." if len(processed_content) > 200 else processed_content,
             })
-            analysis_result = await provider.analyze_document(
+            analysis_started = time.monotonic()
+
+            def on_issue(issue: Issue) -> None:
+                log.info("analysis", f"Issue found: {issue.title}", {
+                    "severity": issue.severity.value,
+                    "rule_id": issue.rule_id,
+                    "location": issue.location,
+                    "elapsed_ms": int((time.monotonic() - analysis_started) * 1000),
+                })
+                tracker.report_issue(issue.to_dict())
+
+            analysis_result = await provider.analyze_document_stream(
                 content=processed_content,
                 policy_rules=policy_rules,
                 options=options,
+                on_issue=on_issue,
             )
             log.info("analysis", "AI analysis complete", {
                 "issues_found": len(analysis_result.issues) if analysis_result.issues else 0,
@@ -81,13 +94,6 @@ class AnalysisEngine:
                     "truncated": len(analysis_result.raw_response) > 4000,
                     "total_length": len(analysis_result.raw_response),
                 })
-            if analysis_result.issues:
-                for i, issue in enumerate(analysis_result.issues[:5]):
-                    log.debug("analysis", f"Issue {i+1}: {issue.title if hasattr(issue, 'title') else str(issue)[:100]}", {
-                        "severity": issue.severity.value if hasattr(issue, 'severity') else "unknown",
-                    })
-                if len(analysis_result.issues) > 5:
-                    log.debug("analysis", f"... and {len(analysis_result.issues) - 5} more issues")
             tracker.complete_step("Document analysis complete")
             
             policy_evaluation = None
@@ -0,0 +1,117 @@
+import asyncio
+from collections import OrderedDict
+from typing import Dict, Optional, Protocol, Set
+from uuid import UUID
+
+from .progress_tracker import AnalysisProgress
+
+# Latest progress is remembered for this many documents, least recently updated dropped first
+DEFAULT_MAX_DOCUMENTS = 1000
+
+
+class ProgressRelay(Protocol):
+    """Carries published progress to other workers."""
+
+    def send(self, progress: AnalysisProgress) -> None: ...
+
+
+class ProgressSubscription:
+    """A subscriber's mailbox holding only the newest undelivered progress.
+
+    ``offer`` never blocks: an update that arrives before the previous one
+    was read replaces it (counted in ``coalesced``), so a slow reader skips
+    to the latest state instead of holding up the tracker.
+    """
+
+    def __init__(self, document_id: UUID):
+        self.document_id = document_id
+        self.coalesced = 0
+        self._latest: Optional[AnalysisProgress] = None
+        self._ready = asyncio.Event()
+
+    def offer(self, progress: AnalysisProgress) -> None:
+        if self._latest is not None:
+            self.coalesced += 1
+        self._latest = progress
+        self._ready.set()
+
+    async def next(self, timeout: float) -> Optional[AnalysisProgress]:
+        """The newest progress, waiting up to ``timeout`` seconds; None if nothing arrived."""
+        if self._latest is None:
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        progress, self._latest = self._latest, None
+        self._ready.clear()
+        return progress
+
+
+class ProgressBroadcaster:
+    """Process-wide pub/sub channel for ``AnalysisProgress`` keyed by document.
+
+    ``publish`` is a ``ProgressCallback``: pass it to ``ProgressTracker`` or
+    ``AnalysisEngine.analyze``. Updates go to this worker's subscribers and,
+    with a relay attached (see ``PostgresProgressRelay``), to every other
+    worker, whose relay hands them to ``deliver``.
+    """
+
+    _instance: "ProgressBroadcaster | None" = None
+
+    def __init__(self, max_documents: int = DEFAULT_MAX_DOCUMENTS):
+        self._subscribers: Dict[UUID, Set[ProgressSubscription]] = {}
+        self._latest: "OrderedDict[UUID, AnalysisProgress]" = OrderedDict()
+        self._max_documents = max_documents
+        self._relay: Optional[ProgressRelay] = None
+
+    @classmethod
+    def get_instance(cls) -> "ProgressBroadcaster":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def attach(self, relay: Optional[ProgressRelay]) -> None:
+        self._relay = relay
+
+    def publish(self, progress: AnalysisProgress) -> None:
+        self.deliver(progress)
+        if self._relay is not None:
+            self._relay.send(progress)
+
+    def deliver(self, progress: AnalysisProgress) -> None:
+        """Hand progress to this worker's subscribers only."""
+        document_id = progress.document_id
+        self._latest[document_id] = progress
+        self._latest.move_to_end(document_id)
+        while len(self._latest) > self._max_documents:
+            self._latest.popitem(last=False)
+        for subscription in self._subscribers.get(document_id, ()):
+            subscription.offer(progress)
+
+    def latest(self, document_id: UUID) -> Optional[AnalysisProgress]:
+        return self._latest.get(document_id)
+
+    def subscribe(self, document_id: UUID) -> ProgressSubscription:
+        """
+        Subscribe to a document's progress.
+
+        If an analysis of the document is running, its latest progress is
+        waiting in the subscription straight away.
+        """
+        subscription = ProgressSubscription(document_id)
+        self._subscribers.setdefault(document_id, set()).add(subscription)
+        latest = self._latest.get(document_id)
+        if latest is not None and not latest.is_finished:
+            subscription.offer(latest)
+        return subscription
+
+    def unsubscribe(self, subscription: ProgressSubscription) -> None:
+        subscriptions = self._subscribers.get(subscription.document_id)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscribers[subscription.document_id]
+
+    def subscriber_count(self, document_id: UUID) -> int:
+        return len(self._subscribers.get(document_id, ()))
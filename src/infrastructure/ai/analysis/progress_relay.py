@@ -0,0 +1,149 @@
+import asyncio
+import json
+import logging
+from typing import Dict, Optional
+from uuid import UUID, uuid4
+
+import asyncpg
+
+from .progress_broadcaster import ProgressBroadcaster
+from .progress_tracker import AnalysisProgress
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_CHANNEL = "analysis_progress"
+
+# NOTIFY payloads must stay under 8000 bytes
+MAX_PAYLOAD_BYTES = 7900
+
+
+class PostgresProgressRelay:
+    """Shares analysis progress between workers through Postgres LISTEN/NOTIFY.
+
+    Attached to ``ProgressBroadcaster``, ``send`` only records the newest
+    progress per document; a background task sends what is waiting at most
+    once every ``flush_interval`` seconds, so a burst of updates becomes one
+    notification. A dedicated connection listens on the channel and hands
+    progress published by other workers to ``broadcaster.deliver``.
+    """
+
+    def __init__(
+        self,
+        pool: asyncpg.Pool,
+        broadcaster: ProgressBroadcaster,
+        channel: str = PROGRESS_CHANNEL,
+        flush_interval: float = 0.1,
+    ):
+        self._pool = pool
+        self._broadcaster = broadcaster
+        self._channel = channel
+        self._flush_interval = flush_interval
+        self._origin = uuid4().hex
+        self._pending: Dict[UUID, AnalysisProgress] = {}
+        self._wakeup = asyncio.Event()
+        self._listener: Optional[asyncpg.Connection] = None
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+
+    def send(self, progress: AnalysisProgress) -> None:
+        self._pending[progress.document_id] = progress
+        self._wakeup.set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    async def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        await self._listen()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Started progress relay on channel {self._channel}")
+
+    async def stop(self) -> None:
+        """Stop listening after sending everything still waiting."""
+        if not self._running:
+            return
+        self._running = False
+        self._wakeup.set()
+        if self._task:
+            await self._task
+        if self._pending:
+            await self.flush()
+        await self._unlisten()
+        logger.info("Stopped progress relay")
+
+    async def _listen(self) -> None:
+        self._listener = await self._pool.acquire()
+        await self._listener.add_listener(self._channel, self._on_notification)
+
+    async def _unlisten(self) -> None:
+        if self._listener is None:
+            return
+        listener, self._listener = self._listener, None
+        try:
+            if not listener.is_closed():
+                await listener.remove_listener(self._channel, self._on_notification)
+        finally:
+            await self._pool.release(listener)
+
+    async def _run(self) -> None:
+        while self._running:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            try:
+                if self._listener is None or self._listener.is_closed():
+                    # The listening connection was lost; a new one misses nothing already sent
+                    await self._unlisten()
+                    await self._listen()
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Failed to relay analysis progress: {e}", exc_info=True)
+            await asyncio.sleep(self._flush_interval)
+
+    async def flush(self) -> int:
+        """
+        Notify other workers of the waiting progress.
+
+        Returns:
+            Number of notifications sent
+        """
+        if not self._pending:
+            return 0
+        batch, self._pending = self._pending, {}
+        try:
+            async with self._pool.acquire() as conn:
+                await conn.executemany(
+                    "SELECT pg_notify($1, $2)",
+                    [(self._channel, self._encode(progress)) for progress in batch.values()],
+                )
+        except Exception:
+            # Keep anything newer that arrived meanwhile
+            for document_id, progress in batch.items():
+                self._pending.setdefault(document_id, progress)
+            self._wakeup.set()
+            raise
+        return len(batch)
+
+    def _encode(self, progress: AnalysisProgress) -> str:
+        data = progress.to_dict()
+        payload = json.dumps({"origin": self._origin, "progress": data}, default=str)
+        if len(payload.encode()) > MAX_PAYLOAD_BYTES:
+            # Drop the bulky optional parts; subscribers still get stage and counts
+            data["latest_issue"] = None
+            data["errors"] = [e[:200] for e in data["errors"][-3:]]
+            data["warnings"] = [w[:200] for w in data["warnings"][-3:]]
+            payload = json.dumps({"origin": self._origin, "progress": data}, default=str)
+        return payload
+
+    def _on_notification(self, connection, pid: int, channel: str, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+            if message.get("origin") == self._origin:
+                return
+            progress = AnalysisProgress.from_dict(message["progress"])
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring malformed progress notification: {e}")
+            return
+        self._broadcaster.deliver(progress)
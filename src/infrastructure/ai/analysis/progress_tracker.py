@@ -31,6 +31,8 @@ class AnalysisProgress:
     estimated_completion: datetime | None = None
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
+    issues_found: int = 0
+    latest_issue: dict | None = None
 
     def to_dict(self) -> dict:
         return {
@@ -46,8 +48,34 @@ class AnalysisProgress:
             "estimated_completion": self.estimated_completion.isoformat() if self.estimated_completion else None,
             "errors": self.errors,
             "warnings": self.warnings,
+            "issues_found": self.issues_found,
+            "latest_issue": self.latest_issue,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "AnalysisProgress":
+        estimated = data.get("estimated_completion")
+        return cls(
+            analysis_id=UUID(data["analysis_id"]),
+            document_id=UUID(data["document_id"]),
+            stage=AnalysisStage(data["stage"]),
+            progress_percent=data["progress_percent"],
+            current_step=data["current_step"],
+            total_steps=data["total_steps"],
+            completed_steps=data["completed_steps"],
+            started_at=datetime.fromisoformat(data["started_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+            estimated_completion=datetime.fromisoformat(estimated) if estimated else None,
+            errors=list(data.get("errors", [])),
+            warnings=list(data.get("warnings", [])),
+            issues_found=data.get("issues_found", 0),
+            latest_issue=data.get("latest_issue"),
+        )
+
+    @property
+    def is_finished(self) -> bool:
+        return self.stage in (AnalysisStage.COMPLETED, AnalysisStage.FAILED, AnalysisStage.CANCELLED)
+
 
 ProgressCallback = Callable[[AnalysisProgress], None]
 
@@ -67,6 +95,8 @@ class ProgressTracker:
         self._warnings: list[str] = []
         self._callbacks: list[ProgressCallback] = []
         self._cancelled = False
+        self._issues_found = 0
+        self._latest_issue: dict | None = None
 
     @property
     def analysis_id(self) -> UUID:
@@ -108,6 +138,8 @@ class ProgressTracker:
             estimated_completion=estimated_completion,
             errors=self._errors.copy(),
             warnings=self._warnings.copy(),
+            issues_found=self._issues_found,
+            latest_issue=self._latest_issue,
         )
 
     def start_stage(self, stage: AnalysisStage, step_description: str) -> None:
@@ -129,6 +161,15 @@ class ProgressTracker:
         self._updated_at = datetime.utcnow()
         self._notify_callbacks()
 
+    def report_issue(self, issue: dict) -> None:
+        if self._cancelled:
+            raise AnalysisCancelledException("Analysis was cancelled")
+        
+        self._issues_found += 1
+        self._latest_issue = issue
+        self._updated_at = datetime.utcnow()
+        self._notify_callbacks()
+
     def add_error(self, error: str) -> None:
         self._errors.append(error)
         self._updated_at = datetime.utcnow()
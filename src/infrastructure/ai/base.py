@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Callable
 from uuid import UUID, uuid4
 
 
@@ -168,6 +168,7 @@ class AnalysisResult:
     token_count: int = 0
     errors: list[str] = field(default_factory=list)
     raw_response: str = ""
+    cached_tokens: int = 0
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -178,6 +179,7 @@ class AnalysisResult:
             "processing_time_ms": self.processing_time_ms,
             "model_used": self.model_used,
             "token_count": self.token_count,
+            "cached_tokens": self.cached_tokens,
             "errors": self.errors,
         }
 
@@ -194,6 +196,9 @@ class AnalysisResult:
         return [i for i in self.issues if i.severity in (IssueSeverity.CRITICAL, IssueSeverity.HIGH)]
 
 
+IssueCallback = Callable[[Issue], None]
+
+
 class AIProvider(ABC):
     
     @property
@@ -220,6 +225,25 @@ class AIProvider(ABC):
     ) -> AnalysisResult:
         pass
 
+    async def analyze_document_stream(
+        self,
+        content: str,
+        policy_rules: list[PolicyRule],
+        options: AnalysisOptions | None = None,
+        on_issue: IssueCallback | None = None,
+    ) -> AnalysisResult:
+        """Analyze ``content``, calling ``on_issue`` for each issue as it is found.
+
+        Providers that can stream completions override this to report issues
+        while the response is still being generated; the default reports
+        them once the full result is available.
+        """
+        result = await self.analyze_document(content, policy_rules, options)
+        if on_issue:
+            for issue in result.issues:
+                on_issue(issue)
+        return result
+
     @abstractmethod
     async def generate_suggestion(
         self,
@@ -229,6 +253,11 @@ class AIProvider(ABC):
     ) -> Suggestion:
         pass
 
+    @abstractmethod
+    async def generate_text(self, prompt: str, max_tokens: int = 2048) -> str:
+        """Complete a free-form ``prompt`` for callers that bring their own prompt and parsing."""
+        pass
+
     @abstractmethod
     async def is_available(self) -> bool:
         pass
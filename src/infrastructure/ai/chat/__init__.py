@@ -0,0 +1,16 @@
+from .context import ChatContext, ChatContextCache, ProviderContextCache, build_context
+from .retrieval import BM25Index, Chunk, build_chunks, tokenize
+from .service import ChatReply, DocumentChatService
+
+__all__ = [
+    "BM25Index",
+    "Chunk",
+    "ChatContext",
+    "ChatContextCache",
+    "ChatReply",
+    "DocumentChatService",
+    "ProviderContextCache",
+    "build_chunks",
+    "build_context",
+    "tokenize",
+]
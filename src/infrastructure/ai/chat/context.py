@@ -0,0 +1,204 @@
+"""
+Per-document chat context, shared by every conversation about the same version.
+
+A ChatContext holds the retrieval index and the stable part of the prompt:
+the system instructions, the document outline and its defined terms. Both
+are built once per (document revision, semantic IR version) and kept in an
+in-process LRU. ProviderContextCache additionally stores the stable prompt
+as Gemini cached content, so turns from any user send only the retrieved
+excerpts, recent history and question.
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+from ..token_budget import content_digest, fit_content, get_token_counter
+from .retrieval import BM25Index, build_chunks
+
+logger = logging.getLogger(__name__)
+
+CHAT_SYSTEM_PROMPT = """You are an expert trading algorithm documentation analyst. You are helping a user understand and improve their trading algorithm documentation.
+
+You have access to the document content and can answer questions about:
+- The trading strategy described in the document
+- Risk management approaches
+- Compliance considerations
+- Suggestions for improving the documentation
+- Technical implementation details
+
+Be helpful, accurate, and concise in your responses. If you're unsure about something, say so.
+Reference specific parts of the document when relevant."""
+
+RETRIEVAL_NOTE = (
+    "Each question arrives with the excerpts of the document most relevant to it. "
+    "Answer from those excerpts and the outline above; if they do not cover the "
+    "question, say which part of the document would need to be consulted."
+)
+
+OUTLINE_TOKEN_BUDGET = 2_000
+
+# Gemini rejects cached content below these sizes; smaller contexts rely on implicit prefix caching
+MIN_CACHED_CONTENT_TOKENS = {"gemini-2.5-flash": 1024, "gemini-2.5-pro": 4096}
+DEFAULT_MIN_CACHED_CONTENT_TOKENS = 4096
+
+CACHED_CONTENT_TTL_SECONDS = 3600
+
+# Entries are recreated this long before they expire, so no turn races the expiry
+CACHED_CONTENT_REFRESH_SECONDS = 60
+
+# After a failed create (e.g. a gateway without the caches API), stop trying for a while
+CACHED_CONTENT_RETRY_SECONDS = 600
+
+
+@dataclass(frozen=True)
+class ChatContext:
+    index: BM25Index
+    system_instruction: str
+    tokens: int
+
+    @property
+    def cache_key(self) -> str:
+        return content_digest(self.system_instruction)
+
+
+def build_context(document: Any, definitions: Sequence[Dict[str, Any]], model: Optional[str] = None) -> ChatContext:
+    outline = "\n".join(
+        f"{'  ' * max(0, section.get('level', 1) - 1)}- {section.get('title') or 'Untitled section'}"
+        for section in document.sections or []
+        if isinstance(section, dict)
+    )
+    terms = ", ".join(sorted({d.get("term", "") for d in definitions if d.get("term")}, key=str.lower))
+    overview = f"""Document Title: {document.title or 'Untitled'}
+Document Status: {document.status or 'Unknown'}
+
+Document Outline:
+{outline or 'No sections available'}
+
+Defined Terms: {terms or 'None extracted'}"""
+    system_instruction = "\n\n".join(
+        (CHAT_SYSTEM_PROMPT, fit_content(overview, OUTLINE_TOKEN_BUDGET, model), RETRIEVAL_NOTE)
+    )
+    index = BM25Index(build_chunks(document.sections, document.markdown_content, definitions, model))
+    return ChatContext(index, system_instruction, get_token_counter(model).count(system_instruction))
+
+
+class ChatContextCache:
+    """LRU of ChatContext per document, rebuilt when the document or its IR changes."""
+
+    def __init__(self, max_entries: int = 64):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Hashable, ChatContext]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    async def get(
+        self, document_id: str, version: Hashable, build: Callable[[], Awaitable[ChatContext]]
+    ) -> ChatContext:
+        entry = self._entries.get(document_id)
+        if entry is not None and entry[0] == version:
+            self._entries.move_to_end(document_id)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        context = await build()
+        self._entries[document_id] = (version, context)
+        self._entries.move_to_end(document_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return context
+
+    def invalidate(self, document_id: str) -> None:
+        self._entries.pop(document_id, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ProviderContextCache:
+    """
+    Gemini cached-content names per (model, context), shared across users.
+
+    Concurrent turns for the same context wait for a single create. The
+    provider expires entries after ``ttl_seconds``; they are only dropped
+    locally when evicted.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = CACHED_CONTENT_TTL_SECONDS,
+        max_entries: int = 256,
+        retry_seconds: float = CACHED_CONTENT_RETRY_SECONDS,
+    ):
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._retry_seconds = retry_seconds
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[str, float]]" = OrderedDict()
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._disabled_until = 0.0
+        self.hits = 0
+        self.creates = 0
+
+    async def get_or_create(self, client: Any, model: str, context: ChatContext) -> Optional[str]:
+        """The cached-content name for ``context``, or None to send the prompt inline."""
+        minimum = MIN_CACHED_CONTENT_TOKENS.get(model, DEFAULT_MIN_CACHED_CONTENT_TOKENS)
+        if context.tokens < minimum:
+            return None
+        key = (model, context.cache_key)
+        name = self._lookup(key)
+        if name is not None:
+            return name
+        if time.monotonic() < self._disabled_until:
+            return None
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                name = self._lookup(key)
+                if name is not None:
+                    return name
+                return await self._create(client, model, key, context)
+        finally:
+            self._locks.pop(key, None)
+
+    def forget(self, model: str, context: ChatContext) -> None:
+        self._entries.pop((model, context.cache_key), None)
+
+    def _lookup(self, key: Tuple[str, str]) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None or entry[1] - CACHED_CONTENT_REFRESH_SECONDS <= time.monotonic():
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    async def _create(self, client: Any, model: str, key: Tuple[str, str], context: ChatContext) -> Optional[str]:
+        from google.genai import types
+
+        try:
+            cached = await client.aio.caches.create(
+                model=model,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=context.system_instruction,
+                    display_name=f"chat-{context.cache_key[:16]}",
+                    ttl=f"{self._ttl_seconds}s",
+                ),
+            )
+        except Exception as e:
+            self._disabled_until = time.monotonic() + self._retry_seconds
+            logger.warning(
+                f"Could not create cached chat context; sending it inline for {self._retry_seconds:.0f}s: {e}"
+            )
+            return None
+
+        self.creates += 1
+        self._entries[key] = (cached.name, time.monotonic() + self._ttl_seconds)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return cached.name
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,133 @@
+"""
+Lexical retrieval over a document's sections and definitions.
+
+Chat turns are answered from the few chunks most relevant to the question
+instead of the whole document. Chunks are sections (split along paragraph
+boundaries when larger than ``CHUNK_TOKEN_BUDGET``) and semantic IR term
+definitions, ranked with Okapi BM25. Earlier user turns add their terms at
+a decaying weight, so follow-up questions ("and its lookback window?")
+still retrieve the sections the conversation is about.
+"""
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..token_budget import split_content
+
+SECTION = "section"
+DEFINITION = "definition"
+
+CHUNK_TOKEN_BUDGET = 400
+
+# BM25 term-frequency saturation and length normalisation
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# Weight of terms from the most recent earlier user turn; halves per turn back
+CONTEXT_WEIGHT = 0.5
+CONTEXT_TURNS = 3
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by can do does for from has have how i if in into is it its "
+    "me my not of on or so than that the their then there these this to was we what when "
+    "where which who why will with would you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN.findall(text.lower()) if t not in STOPWORDS and (len(t) > 1 or t.isdigit())]
+
+
+@dataclass(frozen=True)
+class Chunk:
+    id: str
+    kind: str
+    title: str
+    text: str
+
+    def render(self) -> str:
+        heading = f"Definition: {self.title}" if self.kind == DEFINITION else self.title or "Excerpt"
+        return f"### {heading}\n{self.text}"
+
+
+def build_chunks(
+    sections: Optional[Sequence[Any]],
+    markdown: Optional[str],
+    definitions: Iterable[Dict[str, Any]] = (),
+    model: Optional[str] = None,
+) -> List[Chunk]:
+    """
+    Chunks for a document: its sections, or its markdown when it has no
+    sections, followed by its term definitions.
+    """
+    chunks: List[Chunk] = []
+    parts = [s for s in sections or [] if isinstance(s, dict)]
+    if not parts and markdown:
+        parts = [{"title": "", "content": markdown}]
+    for index, section in enumerate(parts):
+        title = section.get("title", "")
+        for piece, text in enumerate(split_content(section.get("content", ""), CHUNK_TOKEN_BUDGET, model)):
+            chunks.append(Chunk(f"s{index}.{piece}", SECTION, title, text))
+    for definition in definitions:
+        aliases = definition.get("aliases") or []
+        term = definition.get("term", "")
+        title = f"{term} ({', '.join(aliases)})" if aliases else term
+        chunks.append(Chunk(f"d:{definition.get('id') or term}", DEFINITION, title, definition.get("definition", "")))
+    return chunks
+
+
+class BM25Index:
+    """Okapi BM25 over a fixed set of chunks; titles count as chunk text."""
+
+    def __init__(self, chunks: Sequence[Chunk], k1: float = BM25_K1, b: float = BM25_B):
+        self.chunks = list(chunks)
+        self._k1 = k1
+        self._b = b
+        self._postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self._lengths: List[int] = []
+        for position, chunk in enumerate(self.chunks):
+            counts = Counter(tokenize(chunk.title) + tokenize(chunk.text))
+            self._lengths.append(sum(counts.values()))
+            for term, frequency in counts.items():
+                self._postings[term].append((position, frequency))
+        self._average_length = (sum(self._lengths) / len(self._lengths)) if self._lengths else 0.0
+        total = len(self.chunks)
+        self._idf = {
+            term: math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self._postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def search(self, query: str, k: int = 6, context: Sequence[str] = ()) -> List[Tuple[Chunk, float]]:
+        """
+        The ``k`` best chunks for ``query``, highest score first.
+
+        ``context`` holds earlier user turns, most recent first; their terms
+        count at ``CONTEXT_WEIGHT``, halving for each turn further back.
+        """
+        weights: Dict[str, float] = {}
+        for term in tokenize(query):
+            weights[term] = 1.0
+        for turn, text in enumerate(context[:CONTEXT_TURNS]):
+            weight = CONTEXT_WEIGHT / (2 ** turn)
+            for term in tokenize(text):
+                weights[term] = max(weights.get(term, 0.0), weight)
+
+        scores: Dict[int, float] = defaultdict(float)
+        for term, weight in weights.items():
+            idf = self._idf.get(term)
+            if idf is None:
+                continue
+            for position, frequency in self._postings[term]:
+                norm = 1 - self._b + self._b * self._lengths[position] / (self._average_length or 1)
+                scores[position] += weight * idf * frequency * (self._k1 + 1) / (frequency + self._k1 * norm)
+
+        best = heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [(self.chunks[position], score) for position, score in best]
@@ -0,0 +1,177 @@
+"""
+Document chat with retrieval and provider-side context caching.
+
+Each turn sends the cached document context (see ``context``), the recent
+conversation that fits ``HISTORY_TOKEN_BUDGET`` and the top-k excerpts for
+the question that fit ``RETRIEVAL_TOKEN_BUDGET``. Prompt size therefore
+stays flat as documents and conversations grow; older turns still steer
+retrieval through their terms.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..token_budget import get_token_counter
+from ..usage import record_token_usage
+from .context import ChatContext, ChatContextCache, ProviderContextCache, build_context
+from .retrieval import Chunk
+
+logger = logging.getLogger(__name__)
+
+CHAT_MODEL = "gemini-2.5-flash"
+CHAT_TEMPERATURE = 0.7
+
+TOP_K = 6
+RETRIEVAL_TOKEN_BUDGET = 3_000
+HISTORY_TOKEN_BUDGET = 2_000
+
+# Definitions indexed per document; the IR store pages them
+MAX_INDEXED_DEFINITIONS = 1_000
+
+# (role, content) with role "user" or "assistant", oldest first
+ChatTurn = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class ChatReply:
+    text: str
+    sources: Tuple[str, ...] = ()
+    cached_context: bool = False
+
+
+class DocumentChatService:
+    def __init__(
+        self,
+        ir_store: Any = None,
+        context_cache: Optional[ChatContextCache] = None,
+        provider_cache: Optional[ProviderContextCache] = None,
+        model: str = CHAT_MODEL,
+        top_k: int = TOP_K,
+    ):
+        self._ir_store = ir_store
+        self._context_cache = context_cache if context_cache is not None else ChatContextCache()
+        self._provider_cache = provider_cache if provider_cache is not None else ProviderContextCache()
+        self._model = model
+        self._top_k = top_k
+
+    async def reply(self, client: Any, document: Any, message: str, history: Sequence[ChatTurn] = ()) -> ChatReply:
+        from google.genai import types
+
+        context = await self.context_for(document)
+        chunks = self.retrieve(context, message, history)
+        contents = [
+            types.Content(role="user" if role == "user" else "model", parts=[types.Part(text=text)])
+            for role, text in self.recent_history(history)
+        ]
+        contents.append(types.Content(role="user", parts=[types.Part(text=self.render_turn(message, chunks))]))
+
+        cache_name = await self._provider_cache.get_or_create(client, self._model, context)
+        try:
+            response = await self._generate(client, contents, context, cache_name)
+        except Exception as e:
+            if cache_name is None:
+                raise
+            # The cached content may have been deleted or expired early
+            logger.warning(f"Chat with cached context {cache_name} failed, retrying inline: {e}")
+            self._provider_cache.forget(self._model, context)
+            cache_name = None
+            response = await self._generate(client, contents, context, None)
+
+        return ChatReply(
+            text=response.text or "",
+            sources=tuple(dict.fromkeys(chunk.title for chunk in chunks if chunk.title)),
+            cached_context=cache_name is not None,
+        )
+
+    async def context_for(self, document: Any) -> ChatContext:
+        document_id = str(document.id)
+        ir_version = await self._ir_version(document_id)
+
+        async def build() -> ChatContext:
+            definitions = await self._definitions(document_id)
+            return await asyncio.to_thread(build_context, document, definitions, self._model)
+
+        return await self._context_cache.get(document_id, (document.revision, ir_version), build)
+
+    def retrieve(self, context: ChatContext, message: str, history: Sequence[ChatTurn] = ()) -> List[Chunk]:
+        """Top-k chunks for ``message`` that fit the retrieval budget, best first."""
+        earlier = [text for role, text in reversed(history) if role == "user"]
+        chunks = [chunk for chunk, _ in context.index.search(message, self._top_k, earlier)]
+        if not chunks:
+            # Nothing matched ("summarise this"): start from the beginning
+            chunks = context.index.chunks[:self._top_k]
+        counter = get_token_counter(self._model)
+        selected, used = [], 0
+        for chunk in chunks:
+            tokens = counter.count(chunk.render())
+            if selected and used + tokens > RETRIEVAL_TOKEN_BUDGET:
+                break
+            selected.append(chunk)
+            used += tokens
+        return selected
+
+    def recent_history(self, history: Sequence[ChatTurn]) -> List[ChatTurn]:
+        """The most recent turns that fit the history budget, oldest first."""
+        counter = get_token_counter(self._model)
+        kept: List[ChatTurn] = []
+        used = 0
+        for role, text in reversed(history):
+            used += counter.count(text)
+            if used > HISTORY_TOKEN_BUDGET:
+                break
+            kept.append((role, text))
+        kept.reverse()
+        # Gemini conversations open with a user turn
+        while kept and kept[0][0] != "user":
+            kept.pop(0)
+        return kept
+
+    @staticmethod
+    def render_turn(message: str, chunks: Sequence[Chunk]) -> str:
+        excerpts = "\n\n".join(chunk.render() for chunk in chunks) or "No matching excerpts."
+        return f"""Relevant excerpts from the document:
+
+{excerpts}
+
+User Question: {message}"""
+
+    async def _generate(self, client: Any, contents: list, context: ChatContext, cache_name: Optional[str]) -> Any:
+        from google.genai import types
+
+        if cache_name:
+            config = types.GenerateContentConfig(temperature=CHAT_TEMPERATURE, cached_content=cache_name)
+        else:
+            # Same leading system instruction every turn, so implicit caching can still reuse it
+            config = types.GenerateContentConfig(
+                temperature=CHAT_TEMPERATURE, system_instruction=context.system_instruction
+            )
+        response = await client.aio.models.generate_content(model=self._model, contents=contents, config=config)
+        usage = response.usage_metadata
+        if usage:
+            record_token_usage(
+                "gemini",
+                usage.prompt_token_count or 0,
+                usage.candidates_token_count or 0,
+                usage.cached_content_token_count or 0,
+            )
+        return response
+
+    async def _ir_version(self, document_id: str) -> Optional[str]:
+        if self._ir_store is None:
+            return None
+        try:
+            return await self._ir_store.version(document_id)
+        except Exception as e:
+            logger.warning(f"Could not read semantic IR version for {document_id}: {e}")
+            return None
+
+    async def _definitions(self, document_id: str) -> List[Dict[str, Any]]:
+        if self._ir_store is None:
+            return []
+        try:
+            fetched = await self._ir_store.fetch(document_id, ["definitions"], limit=MAX_INDEXED_DEFINITIONS)
+        except Exception as e:
+            logger.warning(f"Chat index for {document_id} built without definitions: {e}")
+            return []
+        return (fetched or {}).get("definitions", [])
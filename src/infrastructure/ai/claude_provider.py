@@ -1,13 +1,13 @@
 import asyncio
-import json
+import inspect
 import logging
 import os
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
-import litellm
+from anthropic import DEFAULT_CONNECTION_LIMITS, AsyncAnthropic, DefaultAsyncHttpxClient, Timeout
 
 logger = logging.getLogger(__name__)
 
@@ -18,17 +18,36 @@ from .base import (
     AnalysisOptions,
     AnalysisResult,
     Issue,
+    IssueCallback,
     IssueSeverity,
     PolicyRule,
     ProviderType,
     Suggestion,
 )
+from .http_pool import HttpPoolConfig, get_http_client
 from .rate_limiter import RateLimiter
-from .prompts.base import PromptContext
+from .streaming import StreamingJsonParser, parse_json_response
+from .token_budget import get_token_counter
+from .usage import record_token_usage
+from .prompts.base import PromptContext, PromptParts
 from .prompts.document_analysis import DocumentAnalysisPrompt
 from .prompts.suggestion_generation import SuggestionGenerationPrompt
 
 
+# Cache breakpoint: everything up to and including the marked block is reused
+EPHEMERAL_CACHE = {"type": "ephemeral"}
+
+
+def _anthropic_http_client(config: HttpPoolConfig, read_timeout: float) -> DefaultAsyncHttpxClient:
+    # The SDK validates that http_client comes from the httpx build it was
+    # compiled against, so limits and timeouts use its own types.
+    limits_type = type(DEFAULT_CONNECTION_LIMITS)
+    return DefaultAsyncHttpxClient(
+        limits=limits_type(**config.limit_kwargs()),
+        timeout=Timeout(read_timeout, connect=config.connect_timeout),
+    )
+
+
 class ClaudeProvider(AIProvider):
     
     AVAILABLE_MODELS = [
@@ -44,17 +63,18 @@ class ClaudeProvider(AIProvider):
         
         base_url = os.environ.get("AI_INTEGRATIONS_ANTHROPIC_BASE_URL")
         if base_url:
-            os.environ["ANTHROPIC_BASE_URL"] = base_url
             api_key = os.environ.get("AI_INTEGRATIONS_ANTHROPIC_API_KEY")
-            if api_key:
-                os.environ["ANTHROPIC_API_KEY"] = api_key
         else:
-            api_key = os.environ.get("ANTHROPIC_API_KEY")
-            if not api_key:
-                api_key = os.environ.get("AI_INTEGRATIONS_ANTHROPIC_API_KEY")
-                if api_key:
-                    os.environ["ANTHROPIC_API_KEY"] = api_key
+            api_key = os.environ.get("ANTHROPIC_API_KEY") or os.environ.get("AI_INTEGRATIONS_ANTHROPIC_API_KEY")
         
+        self._client = AsyncAnthropic(
+            api_key=api_key,
+            base_url=base_url or None,
+            max_retries=2,
+            http_client=get_http_client(
+                ProviderType.CLAUDE.value, self.REQUEST_TIMEOUT, client_factory=_anthropic_http_client
+            ),
+        )
         self._analysis_prompt = DocumentAnalysisPrompt()
         self._suggestion_prompt = SuggestionGenerationPrompt()
 
@@ -75,66 +95,73 @@ class ClaudeProvider(AIProvider):
         content: str,
         policy_rules: list[PolicyRule],
         options: AnalysisOptions | None = None,
+    ) -> AnalysisResult:
+        return await self.analyze_document_stream(content, policy_rules, options)
+
+    async def analyze_document_stream(
+        self,
+        content: str,
+        policy_rules: list[PolicyRule],
+        options: AnalysisOptions | None = None,
+        on_issue: IssueCallback | None = None,
     ) -> AnalysisResult:
         options = options or AnalysisOptions()
         model = self.validate_model(options.model_name)
         
         start_time = time.time()
+        context = PromptContext(
+            document_content=content,
+            policy_rules=[self._policy_rule_to_dict(r) for r in policy_rules],
+            max_issues=options.max_issues,
+            include_suggestions=options.include_suggestions,
+            section_focus=options.focus_sections,
+            extra_context=options.extra_context,
+            model_name=model,
+        )
+        prompt = self._analysis_prompt.render_parts(context)
+        estimated_tokens = get_token_counter(model).count_all(prompt.system, prompt.prefix, prompt.suffix)
         
+        # Only a completed acquire is released; a cancelled or failed one gave its slot back
+        acquired = False
         try:
             if self._rate_limiter:
-                await self._rate_limiter.acquire(estimated_tokens=len(content) // 4)
-            
-            context = PromptContext(
-                document_content=content,
-                policy_rules=[self._policy_rule_to_dict(r) for r in policy_rules],
-                max_issues=options.max_issues,
-                include_suggestions=options.include_suggestions,
-                section_focus=options.focus_sections,
-                extra_context=options.extra_context,
-            )
+                await self._rate_limiter.acquire(estimated_tokens=estimated_tokens)
+                acquired = True
             
-            user_prompt = self._analysis_prompt.render(context)
-            system_prompt = self._analysis_prompt.get_system_prompt()
+            parser = StreamingJsonParser(array_key="issues")
+            issues: list[Issue] = []
+
+            def handle_chunk(chunk: str) -> None:
+                for issue_data in parser.feed(chunk):
+                    parsed = self._parse_issues([issue_data])
+                    issues.extend(parsed)
+                    if on_issue:
+                        for issue in parsed:
+                            on_issue(issue)
             
-            message = await asyncio.wait_for(
-                asyncio.to_thread(
-                    self._call_messages_create,
-                    model,
-                    system_prompt,
-                    user_prompt,
-                    8192,
-                ),
+            message, headers = await asyncio.wait_for(
+                self._stream_message(model, prompt, 8192, handle_chunk),
                 timeout=self.REQUEST_TIMEOUT,
             )
             
             processing_time = int((time.time() - start_time) * 1000)
             
-            raw_response = ""
-            if message.choices and len(message.choices) > 0:
-                raw_response = message.choices[0].message.content or ""
-            
-            logger.info(f"Raw AI response length: {len(raw_response)}")
-            logger.debug(f"Raw AI response (first 2000 chars): {raw_response[:2000]}")
+            raw_response = parser.text
+            logger.debug(f"Streamed AI response length: {len(raw_response)}, issues: {len(issues)}")
             
             self._save_ai_response(raw_response, model, "document_analysis")
             
-            result_text = self._extract_json(raw_response)
-            logger.info(f"Extracted JSON length: {len(result_text)}")
-            logger.debug(f"Extracted JSON (first 2000 chars): {result_text[:2000]}")
-            
-            result_data = json.loads(result_text or "{}")
-            logger.info(f"Parsed issues count: {len(result_data.get('issues', []))}")
-            
-            issues = self._parse_issues(result_data.get("issues", []))
+            result_data = parser.result()
             suggestions = []
             
             if options.include_suggestions:
                 suggestions = self._parse_suggestions(result_data.get("suggestions", []), issues)
             
-            token_count = 0
-            if message.usage:
-                token_count = (message.usage.prompt_tokens or 0) + (message.usage.completion_tokens or 0)
+            token_count, cached_tokens = self._record_usage(message)
+            
+            if self._rate_limiter:
+                await self._rate_limiter.record_usage(estimated_tokens, token_count)
+                await self._rate_limiter.update_from_headers(headers)
             
             return AnalysisResult(
                 success=True,
@@ -145,6 +172,7 @@ class ClaudeProvider(AIProvider):
                 model_used=model,
                 token_count=token_count,
                 raw_response=raw_response,
+                cached_tokens=cached_tokens,
             )
             
         except asyncio.TimeoutError:
@@ -170,39 +198,73 @@ class ClaudeProvider(AIProvider):
                 errors=[str(e)],
             )
         finally:
-            if self._rate_limiter:
+            if acquired:
                 self._rate_limiter.release()
 
-    def _call_messages_create(
+    @staticmethod
+    def _cached_request(prompt: PromptParts) -> dict[str, Any]:
+        """System and messages with cache breakpoints after the system prompt and the prefix."""
+        content: list[dict[str, Any]] = []
+        if prompt.prefix:
+            content.append({"type": "text", "text": prompt.prefix, "cache_control": EPHEMERAL_CACHE})
+        if prompt.suffix:
+            content.append({"type": "text", "text": prompt.suffix})
+        request: dict[str, Any] = {"messages": [{"role": "user", "content": content}]}
+        if prompt.system:
+            request["system"] = [{"type": "text", "text": prompt.system, "cache_control": EPHEMERAL_CACHE}]
+        return request
+
+    def _record_usage(self, message) -> tuple[int, int]:
+        """Report the message's token usage; returns (total tokens, cached prompt tokens)."""
+        usage = message.usage
+        if not usage:
+            return 0, 0
+        cached_tokens = usage.cache_read_input_tokens or 0
+        # input_tokens excludes tokens read from or written to the cache
+        prompt_tokens = (usage.input_tokens or 0) + cached_tokens + (usage.cache_creation_input_tokens or 0)
+        completion_tokens = usage.output_tokens or 0
+        record_token_usage(self.provider_type.value, prompt_tokens, completion_tokens, cached_tokens)
+        return prompt_tokens + completion_tokens, cached_tokens
+
+    async def _stream_message(
         self,
         model: str,
-        system_prompt: str,
-        user_prompt: str,
+        prompt: PromptParts,
         max_tokens: int,
+        on_text: Callable[[str], None],
     ):
-        base_url = os.environ.get("AI_INTEGRATIONS_ANTHROPIC_BASE_URL")
-        if base_url:
-            os.environ["ANTHROPIC_BASE_URL"] = base_url
-            api_key = os.environ.get("AI_INTEGRATIONS_ANTHROPIC_API_KEY")
-            if api_key:
-                os.environ["ANTHROPIC_API_KEY"] = api_key
-        
-        litellm_model = f"anthropic/{model}"
-        
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt}
-        ]
-        
-        response = litellm.completion(
-            model=litellm_model,
-            messages=messages,
+        async with self._client.messages.stream(
+            model=model,
             max_tokens=max_tokens,
-            timeout=self.REQUEST_TIMEOUT,
-            num_retries=2,
+            **self._cached_request(prompt),
+        ) as stream:
+            async for text in stream.text_stream:
+                on_text(text)
+            message = await stream.get_final_message()
+            return message, stream.response.headers
+
+    async def _create_message(
+        self,
+        model: str,
+        prompt: PromptParts,
+        max_tokens: int,
+    ):
+        raw_response = await self._client.messages.with_raw_response.create(
+            model=model,
+            max_tokens=max_tokens,
+            **self._cached_request(prompt),
+        )
+        message = raw_response.parse()
+        # Newer SDK releases return an awaitable from parse() on async clients.
+        if inspect.isawaitable(message):
+            message = await message
+        return message, raw_response.headers
+
+    @staticmethod
+    def _message_text(message) -> str:
+        return "".join(
+            block.text for block in (message.content or []) if getattr(block, "type", None) == "text"
         )
-        
-        return response
 
     async def generate_suggestion(
         self,
@@ -210,36 +272,31 @@ class ClaudeProvider(AIProvider):
         document_context: str,
         policy_rule: PolicyRule,
     ) -> Suggestion:
+        context = PromptContext(
+            document_content=document_context,
+            policy_rules=[self._policy_rule_to_dict(policy_rule)],
+            issue_data=issue.to_dict(),
+            model_name=self.default_model,
+        )
+        prompt = self._suggestion_prompt.render_parts(context)
+        estimated_tokens = get_token_counter(self.default_model).count_all(
+            prompt.system, prompt.prefix, prompt.suffix
+        )
+        
         if self._rate_limiter:
-            await self._rate_limiter.acquire(estimated_tokens=1000)
+            await self._rate_limiter.acquire(estimated_tokens=estimated_tokens)
         
         try:
-            context = PromptContext(
-                document_content=document_context,
-                policy_rules=[self._policy_rule_to_dict(policy_rule)],
-                issue_data=issue.to_dict(),
-            )
-            
-            user_prompt = self._suggestion_prompt.render(context)
-            system_prompt = self._suggestion_prompt.get_system_prompt()
-            
-            message = await asyncio.wait_for(
-                asyncio.to_thread(
-                    self._call_messages_create,
-                    self.default_model,
-                    system_prompt,
-                    user_prompt,
-                    2048,
-                ),
+            message, headers = await asyncio.wait_for(
+                self._create_message(self.default_model, prompt, 2048),
                 timeout=self.REQUEST_TIMEOUT,
             )
+            self._record_usage(message)
             
-            result_text = ""
-            if message.choices and len(message.choices) > 0:
-                result_text = message.choices[0].message.content or ""
+            if self._rate_limiter:
+                await self._rate_limiter.update_from_headers(headers)
             
-            result_text = self._extract_json(result_text)
-            result_data = json.loads(result_text or "{}")
+            result_data = parse_json_response(self._message_text(message))
             
             return Suggestion.create(
                 issue_id=issue.id,
@@ -252,6 +309,28 @@ class ClaudeProvider(AIProvider):
             if self._rate_limiter:
                 self._rate_limiter.release()
 
+    async def generate_text(self, prompt: str, max_tokens: int = 2048) -> str:
+        estimated_tokens = get_token_counter(self.default_model).count(prompt)
+        if self._rate_limiter:
+            await self._rate_limiter.acquire(estimated_tokens=estimated_tokens)
+        
+        try:
+            message, headers = await asyncio.wait_for(
+                self._create_message(self.default_model, PromptParts(system="", prefix="", suffix=prompt), max_tokens),
+                timeout=self.REQUEST_TIMEOUT,
+            )
+            token_count, _ = self._record_usage(message)
+            
+            if self._rate_limiter:
+                await self._rate_limiter.record_usage(estimated_tokens, token_count)
+                await self._rate_limiter.update_from_headers(headers)
+            
+            return self._message_text(message)
+            
+        finally:
+            if self._rate_limiter:
+                self._rate_limiter.release()
+
     async def is_available(self) -> bool:
         try:
             api_key = os.environ.get("ANTHROPIC_API_KEY")
@@ -272,248 +351,6 @@ class ClaudeProvider(AIProvider):
         except Exception as e:
             logger.error(f"Failed to save AI response: {e}")
 
-    def _extract_json(self, text: str) -> str:
-        text = text.strip()
-        
-        # Log first 500 chars of raw response to understand format
-        logger.info(f"_extract_json: First 500 chars: {text[:500]}")
-        logger.info(f"_extract_json: Last 500 chars: {text[-500:]}")
-        
-        # Try to find JSON in code blocks first (most reliable)
-        import re
-        
-        # Look for ```json ... ``` blocks anywhere in the text
-        json_block_match = re.search(r'```json\s*([\s\S]*?)```', text)
-        if json_block_match:
-            json_text = json_block_match.group(1).strip()
-            logger.info(f"Found JSON in complete code block, length: {len(json_text)}")
-            try:
-                json.loads(json_text)
-                return json_text
-            except json.JSONDecodeError as e:
-                logger.info(f"JSON code block parse failed: {e}, trying repair")
-                repaired = self._repair_truncated_json(json_text)
-                try:
-                    json.loads(repaired)
-                    return repaired
-                except json.JSONDecodeError:
-                    pass
-        else:
-            # Check if response starts with ```json but is truncated (no closing ```)
-            if text.startswith('```json'):
-                logger.info("Response starts with ```json but no closing ``` - likely truncated")
-                json_text = text[7:].strip()  # Skip "```json"
-                logger.info(f"Attempting to repair truncated JSON, length: {len(json_text)}")
-                repaired = self._repair_truncated_json(json_text)
-                try:
-                    json.loads(repaired)
-                    logger.info(f"Successfully repaired truncated JSON, length: {len(repaired)}")
-                    return repaired
-                except json.JSONDecodeError as e:
-                    logger.info(f"Truncated JSON repair failed: {e}")
-            else:
-                logger.info("No ```json block found")
-        
-        # Look for ``` ... ``` blocks (without json marker)
-        code_block_match = re.search(r'```\s*([\s\S]*?)```', text)
-        if code_block_match:
-            block_text = code_block_match.group(1).strip()
-            logger.info(f"Found code block, starts with: {block_text[:100] if block_text else 'empty'}")
-            if block_text.startswith('{'):
-                logger.info(f"Found JSON in unmarked code block, length: {len(block_text)}")
-                try:
-                    json.loads(block_text)
-                    return block_text
-                except json.JSONDecodeError as e:
-                    logger.info(f"Unmarked code block JSON parse failed: {e}")
-                    repaired = self._repair_truncated_json(block_text)
-                    try:
-                        json.loads(repaired)
-                        return repaired
-                    except json.JSONDecodeError:
-                        pass
-        else:
-            logger.info("No code block found at all")
-        
-        # Fall back to finding JSON object directly in text
-        # Look for the LAST occurrence of {"issues" which is likely the complete JSON
-        issues_match = re.search(r'\{[^{}]*"issues"\s*:', text)
-        if issues_match:
-            start_idx = issues_match.start()
-            logger.info(f"Found 'issues' key at position {start_idx}")
-        else:
-            start_idx = text.find("{")
-            logger.info(f"No 'issues' key found, first brace at: {start_idx}")
-        
-        if start_idx == -1:
-            logger.warning("No JSON object found in response")
-            return "{}"
-        
-        # Extract balanced JSON from start_idx
-        brace_count = 0
-        end_idx = start_idx
-        in_string = False
-        escape_next = False
-        
-        for i, char in enumerate(text[start_idx:], start=start_idx):
-            if escape_next:
-                escape_next = False
-                continue
-            if char == "\\":
-                escape_next = True
-                continue
-            if char == '"' and not escape_next:
-                in_string = not in_string
-                continue
-            if in_string:
-                continue
-            if char == "{":
-                brace_count += 1
-            elif char == "}":
-                brace_count -= 1
-                if brace_count == 0:
-                    end_idx = i
-                    break
-        
-        if brace_count == 0 and end_idx > start_idx:
-            extracted = text[start_idx:end_idx + 1]
-            logger.debug(f"Extracted balanced JSON, length: {len(extracted)}")
-            return extracted
-        
-        # If braces not balanced, try to repair
-        json_text = text[start_idx:]
-        logger.debug(f"Braces unbalanced (count={brace_count}), attempting repair")
-        json_text = self._repair_truncated_json(json_text)
-        return json_text
-
-    def _repair_truncated_json(self, text: str) -> str:
-        if not text:
-            return "{}"
-        
-        try:
-            json.loads(text)
-            return text
-        except json.JSONDecodeError:
-            pass
-        
-        # Find the last complete object by looking for the last "}," or "}\n" pattern
-        # that represents a complete array element
-        last_complete_pos = -1
-        
-        # Track positions of complete objects in arrays
-        in_string = False
-        escape_next = False
-        brace_depth = 0
-        bracket_depth = 0
-        
-        for i, char in enumerate(text):
-            if escape_next:
-                escape_next = False
-                continue
-            if char == "\\":
-                escape_next = True
-                continue
-            if char == '"' and not escape_next:
-                in_string = not in_string
-                continue
-            if in_string:
-                continue
-            if char == "{":
-                brace_depth += 1
-            elif char == "}":
-                brace_depth -= 1
-                # Check if this closes an object inside an array (depth > 0)
-                if brace_depth >= 1 and bracket_depth >= 1:
-                    # Check if followed by comma or whitespace (complete object)
-                    if i + 1 < len(text):
-                        next_char = text[i + 1]
-                        if next_char in ',\n\r\t ':
-                            last_complete_pos = i + 1
-            elif char == "[":
-                bracket_depth += 1
-            elif char == "]":
-                bracket_depth -= 1
-        
-        # If we found a complete object, truncate there and close properly
-        if last_complete_pos > 0:
-            truncated = text[:last_complete_pos].rstrip().rstrip(',')
-            
-            # Count remaining open brackets/braces
-            in_string = False
-            escape_next = False
-            open_braces = 0
-            open_brackets = 0
-            
-            for char in truncated:
-                if escape_next:
-                    escape_next = False
-                    continue
-                if char == "\\":
-                    escape_next = True
-                    continue
-                if char == '"' and not escape_next:
-                    in_string = not in_string
-                    continue
-                if in_string:
-                    continue
-                if char == "{":
-                    open_braces += 1
-                elif char == "}":
-                    open_braces -= 1
-                elif char == "[":
-                    open_brackets += 1
-                elif char == "]":
-                    open_brackets -= 1
-            
-            # Close the remaining structures
-            repaired = truncated + "]" * open_brackets + "}" * open_braces
-            
-            try:
-                json.loads(repaired)
-                logger.info(f"Repaired JSON by truncating to last complete object at pos {last_complete_pos}")
-                return repaired
-            except json.JSONDecodeError as e:
-                logger.info(f"Truncation repair failed: {e}")
-        
-        # Fallback: simple bracket closing
-        in_string = False
-        escape_next = False
-        brace_count = 0
-        bracket_count = 0
-        
-        for char in text:
-            if escape_next:
-                escape_next = False
-                continue
-            if char == "\\":
-                escape_next = True
-                continue
-            if char == '"' and not escape_next:
-                in_string = not in_string
-                continue
-            if in_string:
-                continue
-            if char == "{":
-                brace_count += 1
-            elif char == "}":
-                brace_count -= 1
-            elif char == "[":
-                bracket_count += 1
-            elif char == "]":
-                bracket_count -= 1
-        
-        if in_string:
-            text = text + '"'
-        
-        text = text + "]" * bracket_count
-        text = text + "}" * brace_count
-        
-        try:
-            json.loads(text)
-            return text
-        except json.JSONDecodeError:
-            return "{}"
-
     def _policy_rule_to_dict(self, rule: PolicyRule) -> dict[str, Any]:
         return {
             "id": rule.id,
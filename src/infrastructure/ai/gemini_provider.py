@@ -17,12 +17,41 @@ from .base import (
     ProviderType,
     Suggestion,
 )
+from .http_pool import get_http_client
 from .rate_limiter import RateLimiter
-from .prompts.base import PromptContext
+from .token_budget import get_token_counter
+from .usage import record_token_usage
+from .prompts.base import PromptContext, PromptParts
 from .prompts.document_analysis import DocumentAnalysisPrompt
 from .prompts.suggestion_generation import SuggestionGenerationPrompt
 
 
+_gemini_clients: dict[tuple[str | None, str | None], tuple[Any, genai.Client]] = {}
+
+
+def get_gemini_client(api_key: str | None, base_url: str | None) -> genai.Client:
+    """Return a process-wide Gemini client backed by the pooled HTTP client.
+
+    The client is rebuilt whenever the pool hands out a new HTTP client,
+    e.g. after ``close_http_clients``, so it never holds a closed one.
+    """
+    key = (api_key, base_url)
+    http_client = get_http_client(ProviderType.GEMINI.value, GeminiProvider.REQUEST_TIMEOUT)
+    cached = _gemini_clients.get(key)
+    if cached is None or cached[0] is not http_client:
+        client = genai.Client(
+            api_key=api_key,
+            http_options=types.HttpOptions(
+                api_version='',
+                base_url=base_url,
+                httpx_async_client=http_client,
+            ),
+        )
+        cached = (http_client, client)
+        _gemini_clients[key] = cached
+    return cached[1]
+
+
 class GeminiProvider(AIProvider):
     
     AVAILABLE_MODELS = [
@@ -35,19 +64,16 @@ class GeminiProvider(AIProvider):
 
     def __init__(self, rate_limiter: RateLimiter | None = None):
         self._rate_limiter = rate_limiter
-        api_key = os.environ.get("AI_INTEGRATIONS_GEMINI_API_KEY")
-        base_url = os.environ.get("AI_INTEGRATIONS_GEMINI_BASE_URL")
-        
-        self._client = genai.Client(
-            api_key=api_key,
-            http_options={
-                'api_version': '',
-                'base_url': base_url
-            }
-        )
+        self._api_key = os.environ.get("AI_INTEGRATIONS_GEMINI_API_KEY")
+        self._base_url = os.environ.get("AI_INTEGRATIONS_GEMINI_BASE_URL")
         self._analysis_prompt = DocumentAnalysisPrompt()
         self._suggestion_prompt = SuggestionGenerationPrompt()
 
+    @property
+    def _client(self) -> genai.Client:
+        # Looked up per call: the provider outlives pooled clients closed at shutdown or in tests
+        return get_gemini_client(self._api_key, self._base_url)
+
     @property
     def provider_type(self) -> ProviderType:
         return ProviderType.GEMINI
@@ -70,37 +96,38 @@ class GeminiProvider(AIProvider):
         model = self.validate_model(options.model_name)
         
         start_time = time.time()
+        context = PromptContext(
+            document_content=content,
+            policy_rules=[self._policy_rule_to_dict(r) for r in policy_rules],
+            max_issues=options.max_issues,
+            include_suggestions=options.include_suggestions,
+            section_focus=options.focus_sections,
+            extra_context=options.extra_context,
+            model_name=model,
+        )
+        prompt = self._analysis_prompt.render_parts(context)
+        estimated_tokens = get_token_counter(model).count_all(prompt.system, prompt.prefix, prompt.suffix)
         
+        # Only a completed acquire is released; a cancelled or failed one gave its slot back
+        acquired = False
         try:
             if self._rate_limiter:
-                await self._rate_limiter.acquire(estimated_tokens=len(content) // 4)
-            
-            context = PromptContext(
-                document_content=content,
-                policy_rules=[self._policy_rule_to_dict(r) for r in policy_rules],
-                max_issues=options.max_issues,
-                include_suggestions=options.include_suggestions,
-                section_focus=options.focus_sections,
-                extra_context=options.extra_context,
-            )
-            
-            user_prompt = self._analysis_prompt.render(context)
-            system_prompt = self._analysis_prompt.get_system_prompt()
+                await self._rate_limiter.acquire(estimated_tokens=estimated_tokens)
+                acquired = True
             
             response = await asyncio.wait_for(
-                asyncio.to_thread(
-                    self._call_generate_content,
-                    model,
-                    system_prompt,
-                    user_prompt,
-                    options.temperature,
-                ),
+                self._call_generate_content(model, prompt, options.temperature),
                 timeout=self.REQUEST_TIMEOUT,
             )
             
             processing_time = int((time.time() - start_time) * 1000)
             
-            result_data = json.loads(response or "{}")
+            result_data = json.loads(response.text or "{}")
+            
+            token_count, cached_tokens = self._record_usage(response)
+            
+            if self._rate_limiter:
+                await self._rate_limiter.record_usage(estimated_tokens, token_count)
             
             issues = self._parse_issues(result_data.get("issues", []))
             suggestions = []
@@ -115,7 +142,8 @@ class GeminiProvider(AIProvider):
                 summary=result_data.get("summary", "Analysis completed"),
                 processing_time_ms=processing_time,
                 model_used=model,
-                token_count=result_data.get("token_count", 0),
+                token_count=token_count,
+                cached_tokens=cached_tokens,
             )
             
         except asyncio.TimeoutError:
@@ -141,31 +169,49 @@ class GeminiProvider(AIProvider):
                 errors=[str(e)],
             )
         finally:
-            if self._rate_limiter:
+            if acquired:
                 self._rate_limiter.release()
 
-    def _call_generate_content(
+    def _record_usage(self, response: types.GenerateContentResponse) -> tuple[int, int]:
+        """Report token usage; returns (total tokens, cached prompt tokens)."""
+        usage = response.usage_metadata
+        if not usage:
+            return 0, 0
+        cached_tokens = usage.cached_content_token_count or 0
+        record_token_usage(
+            self.provider_type.value,
+            usage.prompt_token_count or 0,
+            usage.candidates_token_count or 0,
+            cached_tokens,
+        )
+        return usage.total_token_count or 0, cached_tokens
+
+    async def _call_generate_content(
         self,
         model: str,
-        system_prompt: str,
-        user_prompt: str,
+        prompt: PromptParts,
         temperature: float,
-    ) -> str:
-        response = self._client.models.generate_content(
+        json_response: bool = True,
+        max_tokens: int | None = None,
+    ) -> types.GenerateContentResponse:
+        # The stable prefix leads the request so implicit caching can reuse it
+        parts = [types.Part(text=text) for text in (prompt.prefix, prompt.suffix) if text]
+        response = await self._client.aio.models.generate_content(
             model=model,
             contents=[
                 types.Content(
                     role="user",
-                    parts=[types.Part(text=user_prompt)]
+                    parts=parts
                 )
             ],
             config=types.GenerateContentConfig(
-                response_mime_type="application/json",
+                response_mime_type="application/json" if json_response else None,
                 temperature=temperature,
-                system_instruction=system_prompt,
+                system_instruction=prompt.system or None,
+                max_output_tokens=max_tokens,
             )
         )
-        return response.text or "{}"
+        return response
 
     async def generate_suggestion(
         self,
@@ -173,31 +219,28 @@ class GeminiProvider(AIProvider):
         document_context: str,
         policy_rule: PolicyRule,
     ) -> Suggestion:
+        context = PromptContext(
+            document_content=document_context,
+            policy_rules=[self._policy_rule_to_dict(policy_rule)],
+            issue_data=issue.to_dict(),
+            model_name=self.default_model,
+        )
+        prompt = self._suggestion_prompt.render_parts(context)
+        estimated_tokens = get_token_counter(self.default_model).count_all(
+            prompt.system, prompt.prefix, prompt.suffix
+        )
+        
         if self._rate_limiter:
-            await self._rate_limiter.acquire(estimated_tokens=1000)
+            await self._rate_limiter.acquire(estimated_tokens=estimated_tokens)
         
         try:
-            context = PromptContext(
-                document_content=document_context,
-                policy_rules=[self._policy_rule_to_dict(policy_rule)],
-                issue_data=issue.to_dict(),
-            )
-            
-            user_prompt = self._suggestion_prompt.render(context)
-            system_prompt = self._suggestion_prompt.get_system_prompt()
-            
             response = await asyncio.wait_for(
-                asyncio.to_thread(
-                    self._call_generate_content,
-                    self.default_model,
-                    system_prompt,
-                    user_prompt,
-                    0.3,
-                ),
+                self._call_generate_content(self.default_model, prompt, 0.3),
                 timeout=self.REQUEST_TIMEOUT,
             )
+            self._record_usage(response)
             
-            result_data = json.loads(response or "{}")
+            result_data = json.loads(response.text or "{}")
             
             return Suggestion.create(
                 issue_id=issue.id,
@@ -210,6 +253,33 @@ class GeminiProvider(AIProvider):
             if self._rate_limiter:
                 self._rate_limiter.release()
 
+    async def generate_text(self, prompt: str, max_tokens: int = 2048) -> str:
+        estimated_tokens = get_token_counter(self.default_model).count(prompt)
+        if self._rate_limiter:
+            await self._rate_limiter.acquire(estimated_tokens=estimated_tokens)
+        
+        try:
+            response = await asyncio.wait_for(
+                self._call_generate_content(
+                    self.default_model,
+                    PromptParts(system="", prefix="", suffix=prompt),
+                    0.3,
+                    json_response=False,
+                    max_tokens=max_tokens,
+                ),
+                timeout=self.REQUEST_TIMEOUT,
+            )
+            token_count, _ = self._record_usage(response)
+            
+            if self._rate_limiter:
+                await self._rate_limiter.record_usage(estimated_tokens, token_count)
+            
+            return response.text or ""
+            
+        finally:
+            if self._rate_limiter:
+                self._rate_limiter.release()
+
     async def is_available(self) -> bool:
         try:
             api_key = os.environ.get("AI_INTEGRATIONS_GEMINI_API_KEY")
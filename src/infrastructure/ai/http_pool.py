@@ -0,0 +1,89 @@
+"""Long-lived pooled HTTP clients shared by the AI providers.
+
+Each provider gets one ``httpx.AsyncClient`` for the lifetime of the
+process so TLS connections are kept alive and reused between calls
+instead of being re-established per request.
+"""
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class HttpPoolConfig:
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    connect_timeout: float = 10.0
+
+    @classmethod
+    def from_env(cls) -> "HttpPoolConfig":
+        defaults = cls()
+        return cls(
+            max_connections=int(os.environ.get("AI_HTTP_MAX_CONNECTIONS", defaults.max_connections)),
+            max_keepalive_connections=int(
+                os.environ.get("AI_HTTP_MAX_KEEPALIVE_CONNECTIONS", defaults.max_keepalive_connections)
+            ),
+            keepalive_expiry=float(os.environ.get("AI_HTTP_KEEPALIVE_EXPIRY", defaults.keepalive_expiry)),
+            connect_timeout=float(os.environ.get("AI_HTTP_CONNECT_TIMEOUT", defaults.connect_timeout)),
+        )
+
+    def limit_kwargs(self) -> dict[str, Any]:
+        return {
+            "max_connections": self.max_connections,
+            "max_keepalive_connections": self.max_keepalive_connections,
+            "keepalive_expiry": self.keepalive_expiry,
+        }
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(**self.limit_kwargs())
+
+
+ClientFactory = Callable[[HttpPoolConfig, float], Any]
+
+
+def _default_client_factory(config: HttpPoolConfig, read_timeout: float) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        limits=config.limits(),
+        timeout=httpx.Timeout(read_timeout, connect=config.connect_timeout),
+    )
+
+
+_clients: dict[str, Any] = {}
+
+
+def get_http_client(
+    name: str,
+    read_timeout: float,
+    config: HttpPoolConfig | None = None,
+    client_factory: ClientFactory | None = None,
+) -> Any:
+    """Return the shared client for ``name``, creating it on first use.
+
+    ``client_factory`` lets an SDK that ships its own httpx-compatible
+    client class build the pooled client with the same limits.
+    """
+    client = _clients.get(name)
+    if client is None or client.is_closed:
+        config = config or HttpPoolConfig.from_env()
+        client = (client_factory or _default_client_factory)(config, read_timeout)
+        _clients[name] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close every pooled client; called on application shutdown."""
+    clients = list(_clients.items())
+    _clients.clear()
+    for name, client in clients:
+        if client.is_closed:
+            continue
+        # One failing client (e.g. bound to a closed event loop) must not leave the rest open
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(f"Could not close pooled HTTP client {name}: {e}")
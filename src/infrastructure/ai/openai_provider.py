@@ -2,22 +2,27 @@ import asyncio
 import json
 import os
 import time
-from typing import Any
+from typing import Any, Callable
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 from .base import (
     AIProvider,
     AnalysisOptions,
     AnalysisResult,
     Issue,
+    IssueCallback,
     IssueSeverity,
     PolicyRule,
     ProviderType,
     Suggestion,
 )
+from .http_pool import get_http_client
 from .rate_limiter import RateLimiter
-from .prompts.base import PromptContext
+from .streaming import StreamingJsonParser
+from .token_budget import get_token_counter
+from .usage import record_token_usage
+from .prompts.base import PromptContext, PromptParts
 from .prompts.document_analysis import DocumentAnalysisPrompt
 from .prompts.suggestion_generation import SuggestionGenerationPrompt
 
@@ -40,9 +45,10 @@ class OpenAIProvider(AIProvider):
         api_key = os.environ.get("AI_INTEGRATIONS_OPENAI_API_KEY")
         base_url = os.environ.get("AI_INTEGRATIONS_OPENAI_BASE_URL")
         
-        self._client = OpenAI(
+        self._client = AsyncOpenAI(
             api_key=api_key,
-            base_url=base_url
+            base_url=base_url,
+            http_client=get_http_client(ProviderType.OPENAI.value, self.REQUEST_TIMEOUT),
         )
         self._analysis_prompt = DocumentAnalysisPrompt()
         self._suggestion_prompt = SuggestionGenerationPrompt()
@@ -64,53 +70,68 @@ class OpenAIProvider(AIProvider):
         content: str,
         policy_rules: list[PolicyRule],
         options: AnalysisOptions | None = None,
+    ) -> AnalysisResult:
+        return await self.analyze_document_stream(content, policy_rules, options)
+
+    async def analyze_document_stream(
+        self,
+        content: str,
+        policy_rules: list[PolicyRule],
+        options: AnalysisOptions | None = None,
+        on_issue: IssueCallback | None = None,
     ) -> AnalysisResult:
         options = options or AnalysisOptions()
         model = self.validate_model(options.model_name)
         
         start_time = time.time()
+        context = PromptContext(
+            document_content=content,
+            policy_rules=[self._policy_rule_to_dict(r) for r in policy_rules],
+            max_issues=options.max_issues,
+            include_suggestions=options.include_suggestions,
+            section_focus=options.focus_sections,
+            extra_context=options.extra_context,
+            model_name=model,
+        )
+        prompt = self._analysis_prompt.render_parts(context)
+        estimated_tokens = get_token_counter(model).count_all(prompt.system, prompt.prefix, prompt.suffix)
         
+        # Only a completed acquire is released; a cancelled or failed one gave its slot back
+        acquired = False
         try:
             if self._rate_limiter:
-                await self._rate_limiter.acquire(estimated_tokens=len(content) // 4)
+                await self._rate_limiter.acquire(estimated_tokens=estimated_tokens)
+                acquired = True
             
-            context = PromptContext(
-                document_content=content,
-                policy_rules=[self._policy_rule_to_dict(r) for r in policy_rules],
-                max_issues=options.max_issues,
-                include_suggestions=options.include_suggestions,
-                section_focus=options.focus_sections,
-                extra_context=options.extra_context,
-            )
-            
-            user_prompt = self._analysis_prompt.render(context)
-            system_prompt = self._analysis_prompt.get_system_prompt()
+            parser = StreamingJsonParser(array_key="issues")
+            issues: list[Issue] = []
+
+            def handle_chunk(chunk: str) -> None:
+                for issue_data in parser.feed(chunk):
+                    parsed = self._parse_issues([issue_data])
+                    issues.extend(parsed)
+                    if on_issue:
+                        for issue in parsed:
+                            on_issue(issue)
             
-            response = await asyncio.wait_for(
-                asyncio.to_thread(
-                    self._call_chat_completion,
-                    model,
-                    system_prompt,
-                    user_prompt,
-                    8192,
-                ),
+            usage, headers = await asyncio.wait_for(
+                self._stream_chat_completion(model, prompt, 8192, handle_chunk),
                 timeout=self.REQUEST_TIMEOUT,
             )
             
             processing_time = int((time.time() - start_time) * 1000)
             
-            result_text = response.choices[0].message.content or "{}"
-            result_data = json.loads(result_text)
-            
-            issues = self._parse_issues(result_data.get("issues", []))
+            result_data = parser.result()
             suggestions = []
             
             if options.include_suggestions:
                 suggestions = self._parse_suggestions(result_data.get("suggestions", []), issues)
             
-            token_count = 0
-            if response.usage:
-                token_count = response.usage.total_tokens
+            token_count, cached_tokens = self._record_usage(usage)
+            
+            if self._rate_limiter:
+                await self._rate_limiter.record_usage(estimated_tokens, token_count)
+                await self._rate_limiter.update_from_headers(headers)
             
             return AnalysisResult(
                 success=True,
@@ -120,6 +141,7 @@ class OpenAIProvider(AIProvider):
                 processing_time_ms=processing_time,
                 model_used=model,
                 token_count=token_count,
+                cached_tokens=cached_tokens,
             )
             
         except asyncio.TimeoutError:
@@ -145,25 +167,70 @@ class OpenAIProvider(AIProvider):
                 errors=[str(e)],
             )
         finally:
-            if self._rate_limiter:
+            if acquired:
                 self._rate_limiter.release()
 
-    def _call_chat_completion(
+    @staticmethod
+    def _cached_request(prompt: PromptParts) -> dict[str, Any]:
+        """Messages plus a cache key so requests sharing a prefix are routed to the same cache."""
+        messages = [{"role": "system", "content": prompt.system}] if prompt.system else []
+        messages.append({"role": "user", "content": prompt.user})
+        request: dict[str, Any] = {"messages": messages}
+        if prompt.cache_key:
+            request["prompt_cache_key"] = prompt.cache_key
+        return request
+
+    def _record_usage(self, usage) -> tuple[int, int]:
+        """Report token usage; returns (total tokens, cached prompt tokens)."""
+        if not usage:
+            return 0, 0
+        details = usage.prompt_tokens_details
+        cached_tokens = (details.cached_tokens or 0) if details else 0
+        record_token_usage(
+            self.provider_type.value, usage.prompt_tokens, usage.completion_tokens, cached_tokens
+        )
+        return usage.total_tokens, cached_tokens
+
+    async def _stream_chat_completion(
         self,
         model: str,
-        system_prompt: str,
-        user_prompt: str,
+        prompt: PromptParts,
         max_tokens: int,
+        on_text: Callable[[str], None],
     ):
-        return self._client.chat.completions.create(
+        stream = await self._client.chat.completions.create(
             model=model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
             response_format={"type": "json_object"},
             max_completion_tokens=max_tokens,
+            stream=True,
+            stream_options={"include_usage": True},
+            **self._cached_request(prompt),
         )
+        usage = None
+        async with stream:
+            async for chunk in stream:
+                if chunk.usage:
+                    usage = chunk.usage
+                if chunk.choices and chunk.choices[0].delta.content:
+                    on_text(chunk.choices[0].delta.content)
+        return usage, stream.response.headers
+
+    async def _call_chat_completion(
+        self,
+        model: str,
+        prompt: PromptParts,
+        max_tokens: int,
+        json_response: bool = True,
+    ):
+        request = self._cached_request(prompt)
+        if json_response:
+            request["response_format"] = {"type": "json_object"}
+        raw_response = await self._client.chat.completions.with_raw_response.create(
+            model=model,
+            max_completion_tokens=max_tokens,
+            **request,
+        )
+        return raw_response.parse(), raw_response.headers
 
     async def generate_suggestion(
         self,
@@ -171,29 +238,29 @@ class OpenAIProvider(AIProvider):
         document_context: str,
         policy_rule: PolicyRule,
     ) -> Suggestion:
+        context = PromptContext(
+            document_content=document_context,
+            policy_rules=[self._policy_rule_to_dict(policy_rule)],
+            issue_data=issue.to_dict(),
+            model_name=self.default_model,
+        )
+        prompt = self._suggestion_prompt.render_parts(context)
+        estimated_tokens = get_token_counter(self.default_model).count_all(
+            prompt.system, prompt.prefix, prompt.suffix
+        )
+        
         if self._rate_limiter:
-            await self._rate_limiter.acquire(estimated_tokens=1000)
+            await self._rate_limiter.acquire(estimated_tokens=estimated_tokens)
         
         try:
-            context = PromptContext(
-                document_content=document_context,
-                policy_rules=[self._policy_rule_to_dict(policy_rule)],
-                issue_data=issue.to_dict(),
-            )
-            
-            user_prompt = self._suggestion_prompt.render(context)
-            system_prompt = self._suggestion_prompt.get_system_prompt()
-            
-            response = await asyncio.wait_for(
-                asyncio.to_thread(
-                    self._call_chat_completion,
-                    self.default_model,
-                    system_prompt,
-                    user_prompt,
-                    2048,
-                ),
+            response, headers = await asyncio.wait_for(
+                self._call_chat_completion(self.default_model, prompt, 2048),
                 timeout=self.REQUEST_TIMEOUT,
             )
+            self._record_usage(response.usage)
+            
+            if self._rate_limiter:
+                await self._rate_limiter.update_from_headers(headers)
             
             result_text = response.choices[0].message.content or "{}"
             result_data = json.loads(result_text)
@@ -209,6 +276,33 @@ class OpenAIProvider(AIProvider):
             if self._rate_limiter:
                 self._rate_limiter.release()
 
+    async def generate_text(self, prompt: str, max_tokens: int = 2048) -> str:
+        estimated_tokens = get_token_counter(self.default_model).count(prompt)
+        if self._rate_limiter:
+            await self._rate_limiter.acquire(estimated_tokens=estimated_tokens)
+        
+        try:
+            response, headers = await asyncio.wait_for(
+                self._call_chat_completion(
+                    self.default_model,
+                    PromptParts(system="", prefix="", suffix=prompt),
+                    max_tokens,
+                    json_response=False,
+                ),
+                timeout=self.REQUEST_TIMEOUT,
+            )
+            token_count, _ = self._record_usage(response.usage)
+            
+            if self._rate_limiter:
+                await self._rate_limiter.record_usage(estimated_tokens, token_count)
+                await self._rate_limiter.update_from_headers(headers)
+            
+            return response.choices[0].message.content or ""
+            
+        finally:
+            if self._rate_limiter:
+                self._rate_limiter.release()
+
     async def is_available(self) -> bool:
         try:
             api_key = os.environ.get("AI_INTEGRATIONS_OPENAI_API_KEY")
@@ -1,4 +1,4 @@
-from .base import PromptTemplate, PromptContext
+from .base import PromptContext, PromptParts, PromptTemplate
 from .document_analysis import DocumentAnalysisPrompt
 from .policy_compliance import PolicyCompliancePrompt
 from .suggestion_generation import SuggestionGenerationPrompt
@@ -6,6 +6,7 @@ from .suggestion_generation import SuggestionGenerationPrompt
 __all__ = [
     "PromptTemplate",
     "PromptContext",
+    "PromptParts",
     "DocumentAnalysisPrompt",
     "PolicyCompliancePrompt",
     "SuggestionGenerationPrompt",
@@ -1,6 +1,16 @@
+import hashlib
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable
+
+from ..token_budget import DOCUMENT_TOKEN_BUDGET, fit_content
+
+RuleKey = tuple[tuple[Any, Any, Any, Any], ...]
+
+# Rendered prefixes kept for reuse, one per (template, rules, document) in flight
+PREFIX_MEMO_SIZE = 32
 
 
 @dataclass
@@ -12,6 +22,7 @@ class PromptContext:
     extra_context: str = ""
     max_issues: int = 50
     include_suggestions: bool = True
+    model_name: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -22,9 +33,72 @@ class PromptContext:
             "extra_context": self.extra_context,
             "max_issues": self.max_issues,
             "include_suggestions": self.include_suggestions,
+            "model_name": self.model_name,
         }
 
 
+@dataclass(frozen=True)
+class PromptParts:
+    """
+    A rendered prompt split for provider-side prompt caching.
+
+    ``system`` and ``prefix`` are identical for every call with the same
+    template, rules and document, so providers mark them cacheable and
+    only ``suffix`` (options, focus sections, issue details) varies.
+    ``cache_key`` identifies the shared prefix.
+    """
+    system: str
+    prefix: str
+    suffix: str
+    cache_key: str = ""
+
+    @property
+    def user(self) -> str:
+        return self.prefix + self.suffix
+
+
+class PrefixMemo:
+    """Bounded LRU of rendered prompt prefixes keyed by a hash of their inputs."""
+
+    def __init__(self, max_size: int = PREFIX_MEMO_SIZE):
+        self._max_size = max_size
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_render(self, key: str, render: Callable[[], str]) -> str:
+        prefix = self._entries.get(key)
+        if prefix is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return prefix
+        self.misses += 1
+        prefix = render()
+        self._entries[key] = prefix
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+        return prefix
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+prefix_memo = PrefixMemo()
+
+
+def prompt_cache_key(*parts: str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
 class PromptTemplate(ABC):
     
     @property
@@ -45,29 +119,74 @@ class PromptTemplate(ABC):
     def get_system_prompt(self) -> str:
         pass
 
+    def render_parts(self, context: PromptContext) -> PromptParts:
+        """
+        Render the prompt as a cacheable prefix and a per-call suffix.
+
+        Templates without a stable prefix send everything as the suffix.
+        """
+        return PromptParts(system=self.get_system_prompt(), prefix="", suffix=self.render(context))
+
+    def _cached_parts(
+        self,
+        prefix_inputs: tuple[str, ...],
+        render_prefix: Callable[[], str],
+        suffix: str,
+    ) -> PromptParts:
+        """Build parts whose prefix is rendered once per distinct ``prefix_inputs``."""
+        system = self.get_system_prompt()
+        key = prompt_cache_key(self.name, system, *prefix_inputs)
+        prefix = prefix_memo.get_or_render(key, render_prefix)
+        return PromptParts(system=system, prefix=prefix, suffix=suffix, cache_key=key)
+
     def _format_rules(self, rules: list[dict[str, Any]]) -> str:
-        if not rules:
-            return "No specific policy rules provided."
-        
-        formatted = []
-        for i, rule in enumerate(rules, 1):
-            rule_text = f"{i}. {rule.get('name', 'Unnamed Rule')}"
-            if rule.get('requirement_type'):
-                rule_text += f" [{rule['requirement_type']}]"
-            rule_text += f"\n   Description: {rule.get('description', 'No description')}"
-            if rule.get('validation_criteria'):
-                rule_text += f"\n   Criteria: {rule['validation_criteria']}"
-            formatted.append(rule_text)
-        
-        return "\n".join(formatted)
-
-    def _truncate_content(self, content: str, max_chars: int = 50000) -> str:
-        if len(content) <= max_chars:
-            return content
-        
-        half = max_chars // 2
-        return (
-            content[:half] +
-            "\n\n... [Content truncated for length] ...\n\n" +
-            content[-half:]
+        return format_policy_rules(rules)
+
+    def _fit_content(
+        self,
+        content: str,
+        max_tokens: int = DOCUMENT_TOKEN_BUDGET,
+        model: str | None = None,
+    ) -> str:
+        return fit_content(content, max_tokens, model)
+
+
+@lru_cache(maxsize=64)
+def format_rules(rules: RuleKey) -> str:
+    """
+    Render (name, requirement_type, description, validation_criteria) rules as prompt text.
+
+    Cached, so documents analysed against the same policy repository share
+    one rendering.
+    """
+    formatted = []
+    for i, (name, requirement_type, description, validation_criteria) in enumerate(rules, 1):
+        rule_text = f"{i}. {name}"
+        if requirement_type:
+            rule_text += f" [{requirement_type}]"
+        rule_text += f"\n   Description: {description}"
+        if validation_criteria:
+            rule_text += f"\n   Criteria: {validation_criteria}"
+        formatted.append(rule_text)
+
+    return "\n".join(formatted)
+
+
+def format_policy_rules(rules: list[dict[str, Any]]) -> str:
+    """Render policy rule dicts as the rules block shared by the analysis prompts."""
+    if not rules:
+        return "No specific policy rules provided."
+    key = tuple(
+        (
+            rule.get('name', 'Unnamed Rule'),
+            rule.get('requirement_type'),
+            rule.get('description', 'No description'),
+            rule.get('validation_criteria'),
         )
+        for rule in rules
+    )
+    try:
+        return format_rules(key)
+    except TypeError:
+        # Unhashable field values: format without the cache
+        return format_rules.__wrapped__(key)
@@ -1,4 +1,4 @@
-from .base import PromptTemplate, PromptContext
+from .base import PromptContext, PromptParts, PromptTemplate
 
 
 class DocumentAnalysisPrompt(PromptTemplate):
@@ -45,17 +45,20 @@ Always provide specific, actionable feedback with clear locations in the documen
 Prioritize issues by severity: critical issues (blocking implementation) first, then high, medium, low, and informational."""
 
     def render(self, context: PromptContext) -> str:
-        rules_text = self._format_rules(context.policy_rules)
-        content = self._truncate_content(context.document_content)
-        
-        section_focus_text = ""
-        if context.section_focus:
-            section_focus_text = f"\n\nFOCUS SECTIONS:\nPrioritize analysis of these sections: {', '.join(context.section_focus)}"
-        
-        extra_context_text = ""
-        if context.extra_context:
-            extra_context_text = f"\n\nADDITIONAL CONTEXT:\n{context.extra_context}"
+        return self.render_parts(context).user
 
+    def render_parts(self, context: PromptContext) -> PromptParts:
+        # Instructions, rules and document come first so repeat analyses of the
+        # same document against the same policy share a cacheable prefix.
+        rules_text = self._format_rules(context.policy_rules)
+        content = self._fit_content(context.document_content, model=context.model_name)
+        return self._cached_parts(
+            (rules_text, content),
+            lambda: self._render_prefix(rules_text, content),
+            self._render_suffix(context),
+        )
+
+    def _render_prefix(self, rules_text: str, content: str) -> str:
         return f"""Analyze the following trading algorithm documentation for quality, completeness, self-containment, and compliance issues.
 
 CRITICAL SELF-CONTAINMENT CHECK:
@@ -66,27 +69,6 @@ The document(s) must be FULLY SELF-CONTAINED. An independent person should be ab
 
 Flag as CRITICAL any issue that would prevent independent implementation or index calculation.
 
-POLICY RULES TO CHECK:
-{rules_text}
-{section_focus_text}
-{extra_context_text}
-
-DOCUMENT CONTENT:
----
-{content}
----
-
-ANALYSIS REQUIREMENTS:
-1. Identify up to {context.max_issues} issues, prioritized by severity
-2. For each issue, provide:
-   - A clear, specific title
-   - Detailed description of the problem
-   - Exact location in the document (section name or line reference)
-   - The original problematic text
-   - Issue category (see categories below)
-   - Confidence score (0.0-1.0) in your assessment
-{"3. For each issue, also provide a suggested fix with explanation" if context.include_suggestions else ""}
-
 ISSUE CATEGORIES (use these for categorization):
 - missing_reference: External document, appendix, or attachment referenced but not included
 - undefined_parameter: Parameter, threshold, or value mentioned but not defined
@@ -152,4 +134,37 @@ Respond with a JSON object in this exact format:
         "assessment_summary": "Summary of whether an independent person could fully implement this strategy"
     }},
     "summary": "Overall assessment of document quality, completeness, and self-containment"
-}}"""
+}}
+
+POLICY RULES TO CHECK:
+{rules_text}
+
+DOCUMENT CONTENT:
+---
+{content}
+---
+"""
+
+    def _render_suffix(self, context: PromptContext) -> str:
+        section_focus_text = ""
+        if context.section_focus:
+            section_focus_text = f"\n\nFOCUS SECTIONS:\nPrioritize analysis of these sections: {', '.join(context.section_focus)}"
+        
+        extra_context_text = ""
+        if context.extra_context:
+            extra_context_text = f"\n\nADDITIONAL CONTEXT:\n{context.extra_context}"
+
+        return f"""{section_focus_text}{extra_context_text}
+
+ANALYSIS REQUIREMENTS:
+1. Identify up to {context.max_issues} issues, prioritized by severity
+2. For each issue, provide:
+   - A clear, specific title
+   - Detailed description of the problem
+   - Exact location in the document (section name or line reference)
+   - The original problematic text
+   - Issue category (see categories above)
+   - Confidence score (0.0-1.0) in your assessment
+{"3. For each issue, also provide a suggested fix with explanation" if context.include_suggestions else ""}
+
+Respond with a JSON object in the format given above."""
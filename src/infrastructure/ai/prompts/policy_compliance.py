@@ -50,7 +50,7 @@ Be precise and cite specific sections of the document as evidence for your asses
 
     def render(self, context: PromptContext) -> str:
         rules_text = self._format_rules(context.policy_rules)
-        content = self._truncate_content(context.document_content)
+        content = self._fit_content(context.document_content, model=context.model_name)
         
         extra_context_text = ""
         if context.extra_context:
@@ -1,4 +1,5 @@
-from .base import PromptTemplate, PromptContext
+from ..token_budget import EXCERPT_TOKEN_BUDGET
+from .base import PromptContext, PromptParts, PromptTemplate
 
 
 class SuggestionGenerationPrompt(PromptTemplate):
@@ -29,11 +30,41 @@ Your role is to generate specific, actionable text corrections that:
 Always provide complete replacement text, not just suggestions for changes."""
 
     def render(self, context: PromptContext) -> str:
+        return self.render_parts(context).user
+
+    def render_parts(self, context: PromptContext) -> PromptParts:
         if not context.issue_data:
             raise ValueError("issue_data is required for suggestion generation")
-        
+        # Requirements and response format are the same for every issue, so
+        # they lead and the issue-specific details follow.
+        return self._cached_parts((), self._render_prefix, self._render_suffix(context))
+
+    def _render_prefix(self) -> str:
+        return """Generate a specific text correction to fix the issue described below in a trading algorithm document.
+
+SUGGESTION REQUIREMENTS:
+1. Provide complete replacement text that can be applied directly
+2. Ensure the suggestion fully addresses the issue
+3. Match the document's existing style and tone
+4. If compliance-related, use appropriate regulatory language
+5. Be specific and actionable - no placeholders or vague recommendations
+
+Respond with a JSON object in this exact format:
+{
+    "suggested_text": "The complete corrected text that should replace the original",
+    "explanation": "Detailed explanation of what was changed and why",
+    "changes_made": [
+        "Specific change 1",
+        "Specific change 2"
+    ],
+    "compliance_improvement": "How this change improves compliance (if applicable)",
+    "confidence": 0.85
+}
+"""
+
+    def _render_suffix(self, context: PromptContext) -> str:
         issue = context.issue_data
-        content = self._truncate_content(context.document_content, max_chars=10000)
+        content = self._fit_content(context.document_content, EXCERPT_TOKEN_BUDGET, context.model_name)
         
         rule_text = ""
         if context.policy_rules:
@@ -50,8 +81,7 @@ Examples: {', '.join(rule.get('examples', []))}"""
         if context.extra_context:
             extra_context_text = f"\n\nADDITIONAL CONTEXT:\n{context.extra_context}"
 
-        return f"""Generate a specific text correction to fix the following issue in a trading algorithm document.
-
+        return f"""
 ISSUE DETAILS:
 Title: {issue.get('title', 'Unknown')}
 Severity: {issue.get('severity', 'medium')}
@@ -64,23 +94,4 @@ Original Text: {issue.get('original_text', 'No text provided')}
 SURROUNDING DOCUMENT CONTEXT:
 ---
 {content}
----
-
-SUGGESTION REQUIREMENTS:
-1. Provide complete replacement text that can be applied directly
-2. Ensure the suggestion fully addresses the issue
-3. Match the document's existing style and tone
-4. If compliance-related, use appropriate regulatory language
-5. Be specific and actionable - no placeholders or vague recommendations
-
-Respond with a JSON object in this exact format:
-{{
-    "suggested_text": "The complete corrected text that should replace the original",
-    "explanation": "Detailed explanation of what was changed and why",
-    "changes_made": [
-        "Specific change 1",
-        "Specific change 2"
-    ],
-    "compliance_improvement": "How this change improves compliance (if applicable)",
-    "confidence": 0.85
-}}"""
+---"""
@@ -1,8 +1,10 @@
+import importlib
 import os
 from typing import TYPE_CHECKING
 
 from .base import AIProvider, ProviderType
-from .rate_limiter import RateLimiter, RateLimitConfig
+from .rate_limiter import RateLimiter, RateLimitConfig, RateLimitStore
+from .routing_provider import ProviderHealth, RoutingConfig, RoutingProvider
 
 if TYPE_CHECKING:
     from .gemini_provider import GeminiProvider
@@ -17,13 +19,28 @@ API_KEY_ENV_VARS = {
 
 PROVIDER_PRIORITY = [ProviderType.CLAUDE, ProviderType.GEMINI, ProviderType.OPENAI]
 
+# Provider modules pull in their SDKs, so they are imported on first use
+PROVIDER_REGISTRY: dict[ProviderType, tuple[str, str]] = {
+    ProviderType.GEMINI: (".gemini_provider", "GeminiProvider"),
+    ProviderType.OPENAI: (".openai_provider", "OpenAIProvider"),
+    ProviderType.CLAUDE: (".claude_provider", "ClaudeProvider"),
+}
+
 
 class ProviderFactory:
 
-    def __init__(self, rate_limit_config: RateLimitConfig | None = None):
+    def __init__(
+        self,
+        rate_limit_config: RateLimitConfig | None = None,
+        rate_limit_store: RateLimitStore | None = None,
+        routing_config: RoutingConfig | None = None,
+    ):
         self._rate_limit_config = rate_limit_config or RateLimitConfig()
+        self._rate_limit_store = rate_limit_store
+        self._routing_config = routing_config or RoutingConfig.from_env()
         self._instances: dict[ProviderType, AIProvider] = {}
         self._rate_limiters: dict[ProviderType, RateLimiter] = {}
+        self._health: dict[ProviderType, ProviderHealth] = {}
 
     def is_provider_configured(self, provider_type: ProviderType) -> bool:
         env_vars = API_KEY_ENV_VARS.get(provider_type, [])
@@ -54,23 +71,30 @@ class ProviderFactory:
 
     def get_rate_limiter(self, provider_type: ProviderType) -> RateLimiter:
         if provider_type not in self._rate_limiters:
-            self._rate_limiters[provider_type] = RateLimiter(self._rate_limit_config)
+            self._rate_limiters[provider_type] = RateLimiter(
+                self._rate_limit_config,
+                store=self._rate_limit_store,
+                key=f"ai-provider:{provider_type.value}",
+            )
         return self._rate_limiters[provider_type]
 
+    @staticmethod
+    def _provider_class(provider_type: ProviderType) -> type[AIProvider]:
+        if provider_type not in PROVIDER_REGISTRY:
+            raise ValueError(f"Unknown provider type: {provider_type}")
+        module_name, class_name = PROVIDER_REGISTRY[provider_type]
+        return getattr(importlib.import_module(module_name, __package__), class_name)
+
     def _create_provider(self, provider_type: ProviderType) -> AIProvider:
         rate_limiter = self.get_rate_limiter(provider_type)
-        
-        if provider_type == ProviderType.GEMINI:
-            from .gemini_provider import GeminiProvider
-            return GeminiProvider(rate_limiter=rate_limiter)
-        elif provider_type == ProviderType.OPENAI:
-            from .openai_provider import OpenAIProvider
-            return OpenAIProvider(rate_limiter=rate_limiter)
-        elif provider_type == ProviderType.CLAUDE:
-            from .claude_provider import ClaudeProvider
-            return ClaudeProvider(rate_limiter=rate_limiter)
-        else:
-            raise ValueError(f"Unknown provider type: {provider_type}")
+        return self._provider_class(provider_type)(rate_limiter=rate_limiter)
+
+    def preload(self) -> list[ProviderType]:
+        """Import the modules of every configured provider ahead of first use."""
+        configured = self.get_configured_providers()
+        for provider_type in configured:
+            self._provider_class(provider_type)
+        return configured
 
     def get_default_provider(self) -> AIProvider:
         configured = self.get_configured_providers()
@@ -81,6 +105,31 @@ class ProviderFactory:
             )
         return self.get_provider(configured[0])
 
+    def get_routing_provider(self, preferred: ProviderType | None = None) -> RoutingProvider:
+        """Route across every configured provider, starting with ``preferred``.
+
+        Remaining providers follow in ``PROVIDER_PRIORITY`` order and are used
+        for failover and, when enabled, hedged requests. Health statistics are
+        shared by all routing providers created by this factory.
+        """
+        configured = self.get_configured_providers()
+        if not configured:
+            raise ValueError(
+                "No AI providers are configured. Please set an API key for at least one provider: "
+                f"{[p.value for p in PROVIDER_PRIORITY]}"
+            )
+        if preferred in configured:
+            configured.remove(preferred)
+            configured.insert(0, preferred)
+        return RoutingProvider(
+            [self.get_provider(p) for p in configured],
+            health=self._health,
+            config=self._routing_config,
+        )
+
+    def get_provider_health(self) -> dict[str, dict]:
+        return {provider_type.value: health.to_dict() for provider_type, health in self._health.items()}
+
     async def get_available_providers(self) -> list[ProviderType]:
         available = []
         for provider_type in ProviderType:
@@ -95,3 +144,4 @@ class ProviderFactory:
     def clear_cache(self) -> None:
         self._instances.clear()
         self._rate_limiters.clear()
+        self._health.clear()
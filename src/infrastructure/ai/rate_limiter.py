@@ -1,8 +1,12 @@
 import asyncio
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+import time
+from abc import ABC, abstractmethod
 from collections import deque
-from typing import Deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Deque, Mapping
+
+import asyncpg
 
 
 @dataclass
@@ -13,26 +17,304 @@ class RateLimitConfig:
     concurrent_requests: int = 10
 
 
+REQUESTS_PER_MINUTE = "requests_per_minute"
+REQUESTS_PER_HOUR = "requests_per_hour"
+TOKENS_PER_MINUTE = "tokens_per_minute"
+
+
+@dataclass(frozen=True)
+class BucketLimit:
+    capacity: float
+    period_seconds: float
+
+    @property
+    def refill_rate(self) -> float:
+        return self.capacity / self.period_seconds
+
+
+class TokenBucket:
+    """Continuously refilling token bucket with O(1) refill and consume.
+
+    ``level`` may go negative when actual usage reported after a call
+    exceeds what was reserved; the debt is paid back by refill before
+    the next reservation is granted.
+    """
+
+    def __init__(self, limit: BucketLimit, level: float | None = None, updated_at: float = 0.0):
+        self.limit = limit
+        self.level = limit.capacity if level is None else level
+        self.updated_at = updated_at
+
+    def refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self.updated_at)
+        self.level = min(self.limit.capacity, self.level + elapsed * self.limit.refill_rate)
+        self.updated_at = now
+
+    def set_limit(self, limit: BucketLimit) -> None:
+        self.limit = limit
+        self.level = min(self.level, limit.capacity)
+
+    def delay_for(self, amount: float) -> float:
+        amount = min(amount, self.limit.capacity)
+        deficit = amount - self.level
+        if deficit <= 0:
+            return 0.0
+        return deficit / self.limit.refill_rate
+
+
+def consume_all(
+    buckets: Mapping[str, TokenBucket],
+    demands: Mapping[str, float],
+    now: float,
+) -> float:
+    """Atomically take ``demands`` from ``buckets`` or return the wait time.
+
+    Nothing is consumed unless every bucket can satisfy its demand.
+    """
+    for bucket in buckets.values():
+        bucket.refill(now)
+    delay = max((buckets[name].delay_for(amount) for name, amount in demands.items()), default=0.0)
+    if delay > 0:
+        return delay
+    for name, amount in demands.items():
+        bucket = buckets[name]
+        bucket.level -= min(amount, bucket.limit.capacity)
+    return 0.0
+
+
+class RateLimitStore(ABC):
+    """Holds bucket levels so they can be shared between limiters."""
+
+    @abstractmethod
+    async def try_consume(
+        self,
+        key: str,
+        limits: Mapping[str, BucketLimit],
+        demands: Mapping[str, float],
+    ) -> tuple[float, dict[str, float]]:
+        """Consume ``demands`` if possible.
+
+        Returns the seconds to wait before retrying (0 when granted) and
+        the resulting bucket levels.
+        """
+        pass
+
+    @abstractmethod
+    async def adjust(
+        self,
+        key: str,
+        bucket: str,
+        limit: BucketLimit,
+        delta: float = 0.0,
+        max_level: float | None = None,
+    ) -> float:
+        """Apply a correction to one bucket and return its new level."""
+        pass
+
+
+class InMemoryRateLimitStore(RateLimitStore):
+    def __init__(self):
+        self._buckets: dict[str, dict[str, TokenBucket]] = {}
+
+    def _get_buckets(self, key: str, limits: Mapping[str, BucketLimit], now: float) -> dict[str, TokenBucket]:
+        buckets = self._buckets.setdefault(key, {})
+        for name, limit in limits.items():
+            bucket = buckets.get(name)
+            if bucket is None:
+                buckets[name] = TokenBucket(limit, updated_at=now)
+            elif bucket.limit != limit:
+                bucket.refill(now)
+                bucket.set_limit(limit)
+        return buckets
+
+    async def try_consume(
+        self,
+        key: str,
+        limits: Mapping[str, BucketLimit],
+        demands: Mapping[str, float],
+    ) -> tuple[float, dict[str, float]]:
+        now = time.monotonic()
+        buckets = self._get_buckets(key, limits, now)
+        delay = consume_all(buckets, demands, now)
+        return delay, {name: bucket.level for name, bucket in buckets.items()}
+
+    async def adjust(
+        self,
+        key: str,
+        bucket: str,
+        limit: BucketLimit,
+        delta: float = 0.0,
+        max_level: float | None = None,
+    ) -> float:
+        now = time.monotonic()
+        target = self._get_buckets(key, {bucket: limit}, now)[bucket]
+        target.refill(now)
+        target.level -= delta
+        if max_level is not None:
+            target.level = min(target.level, max_level)
+        return target.level
+
+
+class PostgresRateLimitStore(RateLimitStore):
+    """Bucket state shared by every worker through the database.
+
+    Each operation runs in a short transaction serialised per limiter key
+    with ``pg_advisory_xact_lock``, and refill is computed against the
+    database clock so workers agree on elapsed time.
+    """
+
+    def __init__(self, pool: asyncpg.Pool):
+        self._pool = pool
+
+    async def _load(
+        self,
+        conn: asyncpg.Connection,
+        key: str,
+        limits: Mapping[str, BucketLimit],
+    ) -> tuple[float, dict[str, TokenBucket]]:
+        await conn.execute("SELECT pg_advisory_xact_lock(hashtext($1))", key)
+        now = await conn.fetchval("SELECT EXTRACT(EPOCH FROM clock_timestamp())::float8")
+        rows = await conn.fetch(
+            """
+            SELECT bucket, level, updated_at
+            FROM rate_limit_buckets
+            WHERE limiter_key = $1 AND bucket = ANY($2::text[])
+            """,
+            key,
+            list(limits.keys()),
+        )
+        stored = {row["bucket"]: row for row in rows}
+        buckets = {}
+        for name, limit in limits.items():
+            row = stored.get(name)
+            if row is None:
+                buckets[name] = TokenBucket(limit, updated_at=now)
+            else:
+                bucket = TokenBucket(limit, level=row["level"], updated_at=row["updated_at"])
+                bucket.refill(now)
+                bucket.set_limit(limit)
+                buckets[name] = bucket
+        return now, buckets
+
+    async def _save(self, conn: asyncpg.Connection, key: str, buckets: Mapping[str, TokenBucket]) -> None:
+        await conn.executemany(
+            """
+            INSERT INTO rate_limit_buckets (limiter_key, bucket, level, updated_at)
+            VALUES ($1, $2, $3, $4)
+            ON CONFLICT (limiter_key, bucket)
+            DO UPDATE SET level = EXCLUDED.level, updated_at = EXCLUDED.updated_at
+            """,
+            [(key, name, bucket.level, bucket.updated_at) for name, bucket in buckets.items()],
+        )
+
+    async def try_consume(
+        self,
+        key: str,
+        limits: Mapping[str, BucketLimit],
+        demands: Mapping[str, float],
+    ) -> tuple[float, dict[str, float]]:
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                now, buckets = await self._load(conn, key, limits)
+                delay = consume_all(buckets, demands, now)
+                await self._save(conn, key, buckets)
+        return delay, {name: bucket.level for name, bucket in buckets.items()}
+
+    async def adjust(
+        self,
+        key: str,
+        bucket: str,
+        limit: BucketLimit,
+        delta: float = 0.0,
+        max_level: float | None = None,
+    ) -> float:
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                _, buckets = await self._load(conn, key, {bucket: limit})
+                target = buckets[bucket]
+                target.level -= delta
+                if max_level is not None:
+                    target.level = min(target.level, max_level)
+                await self._save(conn, key, buckets)
+        return target.level
+
+
+def _parse_reset(value: str, now: datetime) -> float | None:
+    """Parse a reset header as seconds from now.
+
+    Accepts plain seconds, OpenAI-style durations (``6m0s``, ``20ms``)
+    and RFC 3339 timestamps as sent by Anthropic.
+    """
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    if "T" in value:
+        try:
+            reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        return max(0.0, (reset_at - now).total_seconds())
+
+    units = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+    total = 0.0
+    number = ""
+    i = 0
+    while i < len(value):
+        ch = value[i]
+        if ch.isdigit() or ch == ".":
+            number += ch
+            i += 1
+            continue
+        unit = "ms" if value.startswith("ms", i) else ch
+        if unit not in units or not number:
+            return None
+        total += float(number) * units[unit]
+        number = ""
+        i += len(unit)
+    return total if not number else None
+
+
 class RateLimiter:
-    def __init__(self, config: RateLimitConfig | None = None):
+    """Provider rate limiter built on continuously refilling token buckets.
+
+    Request and token budgets are tracked as running bucket levels, so
+    every check is O(1). Waiters are admitted in FIFO order and only the
+    head of the queue sleeps for capacity; no lock is held while sleeping.
+    Bucket state lives in a ``RateLimitStore`` and can be shared across
+    worker processes via ``PostgresRateLimitStore``.
+    """
+
+    def __init__(
+        self,
+        config: RateLimitConfig | None = None,
+        store: RateLimitStore | None = None,
+        key: str = "default",
+    ):
         self._config = config or RateLimitConfig()
-        self._minute_requests: Deque[datetime] = deque()
-        self._hour_requests: Deque[datetime] = deque()
-        self._minute_tokens: Deque[tuple[datetime, int]] = deque()
-        self._semaphore = asyncio.Semaphore(self._config.concurrent_requests)
-        self._lock = asyncio.Lock()
+        self._store = store or InMemoryRateLimitStore()
+        self._key = key
+        self._limits: dict[str, BucketLimit] = {
+            REQUESTS_PER_MINUTE: BucketLimit(self._config.requests_per_minute, 60.0),
+            REQUESTS_PER_HOUR: BucketLimit(self._config.requests_per_hour, 3600.0),
+            TOKENS_PER_MINUTE: BucketLimit(self._config.tokens_per_minute, 60.0),
+        }
+        self._levels: dict[str, tuple[float, float]] = {}
+        self._blocked_until = 0.0
+        self._semaphore = asyncio.BoundedSemaphore(self._config.concurrent_requests)
+        self._waiters: Deque[asyncio.Future] = deque()
 
     async def acquire(self, estimated_tokens: int = 0) -> None:
+        """Wait for a concurrency slot and rate-limit capacity.
+
+        Call ``release`` exactly once after a successful acquire. If this
+        raises or is cancelled, the slot has already been given back.
+        """
         await self._semaphore.acquire()
         try:
-            async with self._lock:
-                await self._wait_for_rate_limit(estimated_tokens)
-                now = datetime.utcnow()
-                self._minute_requests.append(now)
-                self._hour_requests.append(now)
-                if estimated_tokens > 0:
-                    self._minute_tokens.append((now, estimated_tokens))
-        except Exception:
+            await self._wait_for_rate_limit(estimated_tokens)
+        except BaseException:
             self._semaphore.release()
             raise
 
@@ -40,75 +322,135 @@ class RateLimiter:
         self._semaphore.release()
 
     async def _wait_for_rate_limit(self, estimated_tokens: int) -> None:
-        now = datetime.utcnow()
-        self._cleanup_old_requests(now)
-
-        while True:
-            minute_count = len(self._minute_requests)
-            hour_count = len(self._hour_requests)
-            minute_token_count = sum(t[1] for t in self._minute_tokens)
-
-            if minute_count >= self._config.requests_per_minute:
-                oldest = self._minute_requests[0]
-                wait_time = (oldest + timedelta(minutes=1) - now).total_seconds()
-                if wait_time > 0:
-                    await asyncio.sleep(wait_time + 0.1)
-                    now = datetime.utcnow()
-                    self._cleanup_old_requests(now)
-                    continue
+        turn = asyncio.get_running_loop().create_future()
+        self._waiters.append(turn)
+        if self._waiters[0] is turn:
+            turn.set_result(None)
 
-            if hour_count >= self._config.requests_per_hour:
-                oldest = self._hour_requests[0]
-                wait_time = (oldest + timedelta(hours=1) - now).total_seconds()
-                if wait_time > 0:
-                    await asyncio.sleep(min(wait_time + 0.1, 60))
-                    now = datetime.utcnow()
-                    self._cleanup_old_requests(now)
+        try:
+            await turn
+            demands = {REQUESTS_PER_MINUTE: 1, REQUESTS_PER_HOUR: 1}
+            if estimated_tokens > 0:
+                demands[TOKENS_PER_MINUTE] = estimated_tokens
+            while True:
+                blocked = self._blocked_until - time.monotonic()
+                if blocked > 0:
+                    await asyncio.sleep(blocked)
                     continue
+                delay, levels = await self._store.try_consume(self._key, self._limits, demands)
+                self._record_levels(levels)
+                if delay <= 0:
+                    return
+                await asyncio.sleep(delay)
+        finally:
+            was_head = bool(self._waiters) and self._waiters[0] is turn
+            try:
+                self._waiters.remove(turn)
+            except ValueError:
+                pass
+            if was_head and self._waiters and not self._waiters[0].done():
+                self._waiters[0].set_result(None)
 
-            if minute_token_count + estimated_tokens > self._config.tokens_per_minute:
-                if self._minute_tokens:
-                    oldest = self._minute_tokens[0][0]
-                    wait_time = (oldest + timedelta(minutes=1) - now).total_seconds()
-                    if wait_time > 0:
-                        await asyncio.sleep(wait_time + 0.1)
-                        now = datetime.utcnow()
-                        self._cleanup_old_requests(now)
-                        continue
+    async def record_usage(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct the token budget once the provider reports real usage."""
+        if actual_tokens <= 0 or actual_tokens == estimated_tokens:
+            return
+        level = await self._store.adjust(
+            self._key,
+            TOKENS_PER_MINUTE,
+            self._limits[TOKENS_PER_MINUTE],
+            delta=actual_tokens - estimated_tokens,
+        )
+        self._record_levels({TOKENS_PER_MINUTE: level})
 
-            break
+    async def update_from_headers(self, headers: Mapping[str, str] | None) -> None:
+        """Adapt limits from provider rate-limit response headers.
 
-    def _cleanup_old_requests(self, now: datetime) -> None:
-        minute_ago = now - timedelta(minutes=1)
-        hour_ago = now - timedelta(hours=1)
+        Understands Anthropic ``anthropic-ratelimit-*``, OpenAI
+        ``x-ratelimit-*`` and ``retry-after`` headers. Header names may
+        carry the ``llm_provider-`` prefix added by LiteLLM.
+        """
+        if not headers:
+            return
+        normalised = {}
+        for name, value in headers.items():
+            name = name.lower()
+            if name.startswith("llm_provider-"):
+                name = name[len("llm_provider-"):]
+            normalised[name] = str(value)
 
-        while self._minute_requests and self._minute_requests[0] < minute_ago:
-            self._minute_requests.popleft()
+        now = datetime.now(timezone.utc)
+        retry_after = normalised.get("retry-after")
+        if retry_after:
+            seconds = _parse_reset(retry_after, now)
+            if seconds:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+        sources = {
+            REQUESTS_PER_MINUTE: [
+                ("anthropic-ratelimit-requests-limit", "anthropic-ratelimit-requests-remaining",
+                 "anthropic-ratelimit-requests-reset"),
+                ("x-ratelimit-limit-requests", "x-ratelimit-remaining-requests",
+                 "x-ratelimit-reset-requests"),
+            ],
+            TOKENS_PER_MINUTE: [
+                ("anthropic-ratelimit-tokens-limit", "anthropic-ratelimit-tokens-remaining",
+                 "anthropic-ratelimit-tokens-reset"),
+                ("anthropic-ratelimit-input-tokens-limit", "anthropic-ratelimit-input-tokens-remaining",
+                 "anthropic-ratelimit-input-tokens-reset"),
+                ("x-ratelimit-limit-tokens", "x-ratelimit-remaining-tokens",
+                 "x-ratelimit-reset-tokens"),
+            ],
+        }
+        for bucket, candidates in sources.items():
+            for limit_header, remaining_header, reset_header in candidates:
+                if remaining_header not in normalised:
+                    continue
+                try:
+                    remaining = float(normalised[remaining_header])
+                    limit_value = float(normalised.get(limit_header, 0))
+                except ValueError:
+                    break
+                if limit_value > 0:
+                    self._limits[bucket] = BucketLimit(limit_value, self._limits[bucket].period_seconds)
+                level = await self._store.adjust(
+                    self._key, bucket, self._limits[bucket], max_level=remaining
+                )
+                self._record_levels({bucket: level})
+                if remaining <= 0 and reset_header in normalised:
+                    seconds = _parse_reset(normalised[reset_header], now)
+                    if seconds:
+                        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+                break
 
-        while self._hour_requests and self._hour_requests[0] < hour_ago:
-            self._hour_requests.popleft()
+    def _record_levels(self, levels: Mapping[str, float]) -> None:
+        now = time.monotonic()
+        for name, level in levels.items():
+            self._levels[name] = (level, now)
 
-        while self._minute_tokens and self._minute_tokens[0][0] < minute_ago:
-            self._minute_tokens.popleft()
+    def _usage(self, bucket: str) -> int:
+        if bucket not in self._levels:
+            return 0
+        limit = self._limits[bucket]
+        level, observed_at = self._levels[bucket]
+        level = min(limit.capacity, level + (time.monotonic() - observed_at) * limit.refill_rate)
+        return max(0, round(limit.capacity - level))
 
     @property
     def current_minute_usage(self) -> int:
-        self._cleanup_old_requests(datetime.utcnow())
-        return len(self._minute_requests)
+        return self._usage(REQUESTS_PER_MINUTE)
 
     @property
     def current_hour_usage(self) -> int:
-        self._cleanup_old_requests(datetime.utcnow())
-        return len(self._hour_requests)
+        return self._usage(REQUESTS_PER_HOUR)
 
     def get_stats(self) -> dict:
-        now = datetime.utcnow()
-        self._cleanup_old_requests(now)
         return {
-            "requests_per_minute": len(self._minute_requests),
-            "requests_per_hour": len(self._hour_requests),
-            "tokens_per_minute": sum(t[1] for t in self._minute_tokens),
+            "requests_per_minute": self._usage(REQUESTS_PER_MINUTE),
+            "requests_per_hour": self._usage(REQUESTS_PER_HOUR),
+            "tokens_per_minute": self._usage(TOKENS_PER_MINUTE),
             "concurrent_limit": self._config.concurrent_requests,
-            "minute_limit": self._config.requests_per_minute,
-            "hour_limit": self._config.requests_per_hour,
+            "minute_limit": int(self._limits[REQUESTS_PER_MINUTE].capacity),
+            "hour_limit": int(self._limits[REQUESTS_PER_HOUR].capacity),
+            "waiting": len(self._waiters),
         }
@@ -0,0 +1,362 @@
+"""Failover and hedged requests across the configured AI providers.
+
+``RoutingProvider`` wraps the configured providers in priority order.
+Every call is timed and its outcome folded into a per-provider
+``ProviderHealth`` (latency and error-rate EWMAs plus a window of recent
+latencies). Providers with a high recent error rate are tried last; a
+failed call fails over to the next provider, unless it had already
+streamed issues to the caller, in which case its failure is returned. When hedging is enabled and
+a provider has enough history, a second request is sent to the next
+provider once the first has run longer than its p95 latency. The first
+attempt to answer wins and the other is cancelled.
+"""
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from functools import partial
+
+from .base import (
+    AIProvider,
+    AnalysisOptions,
+    AnalysisResult,
+    Issue,
+    IssueCallback,
+    PolicyRule,
+    ProviderType,
+    Suggestion,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RoutingConfig:
+    ewma_alpha: float = 0.2
+    latency_window: int = 100
+    unhealthy_error_rate: float = 0.5
+    hedge_enabled: bool = False
+    hedge_min_samples: int = 20
+    hedge_min_delay: float = 1.0
+
+    @classmethod
+    def from_env(cls) -> "RoutingConfig":
+        defaults = cls()
+        return cls(
+            unhealthy_error_rate=float(
+                os.environ.get("AI_PROVIDER_UNHEALTHY_ERROR_RATE", defaults.unhealthy_error_rate)
+            ),
+            hedge_enabled=os.environ.get("AI_PROVIDER_HEDGING", "").lower() in ("1", "true", "yes"),
+            hedge_min_samples=int(os.environ.get("AI_PROVIDER_HEDGE_MIN_SAMPLES", defaults.hedge_min_samples)),
+        )
+
+
+class ProviderHealth:
+
+    def __init__(self, config: RoutingConfig | None = None):
+        self._config = config or RoutingConfig()
+        self._latencies: deque[float] = deque(maxlen=self._config.latency_window)
+        self.latency_ewma: float | None = None
+        self.error_ewma = 0.0
+        self.successes = 0
+        self.failures = 0
+
+    def record_success(self, latency: float) -> None:
+        alpha = self._config.ewma_alpha
+        self._latencies.append(latency)
+        self.latency_ewma = latency if self.latency_ewma is None else (
+            alpha * latency + (1 - alpha) * self.latency_ewma
+        )
+        self.error_ewma = (1 - alpha) * self.error_ewma
+        self.successes += 1
+
+    def record_failure(self) -> None:
+        alpha = self._config.ewma_alpha
+        self.error_ewma = alpha + (1 - alpha) * self.error_ewma
+        self.failures += 1
+
+    @property
+    def is_healthy(self) -> bool:
+        return self.error_ewma < self._config.unhealthy_error_rate
+
+    def p95(self) -> float | None:
+        if len(self._latencies) < self._config.hedge_min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[max(0, int(len(ordered) * 0.95) - 1)]
+
+    def to_dict(self) -> dict:
+        return {
+            "latency_ewma_ms": int(self.latency_ewma * 1000) if self.latency_ewma is not None else None,
+            "p95_ms": int(self.p95() * 1000) if self.p95() is not None else None,
+            "error_rate": round(self.error_ewma, 3),
+            "successes": self.successes,
+            "failures": self.failures,
+            "healthy": self.is_healthy,
+        }
+
+
+class RoutingProvider(AIProvider):
+
+    def __init__(
+        self,
+        providers: list[AIProvider],
+        health: dict[ProviderType, ProviderHealth],
+        config: RoutingConfig | None = None,
+    ):
+        if not providers:
+            raise ValueError("RoutingProvider requires at least one provider")
+        self._providers = providers
+        self._health = health
+        self._config = config or RoutingConfig()
+
+    @property
+    def provider_type(self) -> ProviderType:
+        return self._providers[0].provider_type
+
+    @property
+    def default_model(self) -> str:
+        return self._providers[0].default_model
+
+    @property
+    def available_models(self) -> list[str]:
+        return self._providers[0].available_models
+
+    @property
+    def providers(self) -> list[AIProvider]:
+        return list(self._providers)
+
+    def validate_model(self, model_name: str | None) -> str:
+        return self._providers[0].validate_model(model_name)
+
+    def _health_for(self, provider: AIProvider) -> ProviderHealth:
+        if provider.provider_type not in self._health:
+            self._health[provider.provider_type] = ProviderHealth(self._config)
+        return self._health[provider.provider_type]
+
+    def _candidates(self) -> list[AIProvider]:
+        """Providers in priority order with currently unhealthy ones moved last."""
+        healthy = [p for p in self._providers if self._health_for(p).is_healthy]
+        unhealthy = [p for p in self._providers if not self._health_for(p).is_healthy]
+        return healthy + unhealthy
+
+    @staticmethod
+    def _options_for(provider: AIProvider, options: AnalysisOptions | None, primary: AIProvider) -> AnalysisOptions | None:
+        # A model name chosen for the primary provider means nothing to the others.
+        if options is None or provider is primary or options.model_name is None:
+            return options
+        return replace(options, model_name=None)
+
+    async def analyze_document(
+        self,
+        content: str,
+        policy_rules: list[PolicyRule],
+        options: AnalysisOptions | None = None,
+    ) -> AnalysisResult:
+        return await self.analyze_document_stream(content, policy_rules, options)
+
+    async def analyze_document_stream(
+        self,
+        content: str,
+        policy_rules: list[PolicyRule],
+        options: AnalysisOptions | None = None,
+        on_issue: IssueCallback | None = None,
+    ) -> AnalysisResult:
+        primary = self._providers[0]
+        candidates = self._candidates()
+        errors: list[str] = []
+        result: AnalysisResult | None = None
+        streamed: list[Issue] = []
+        forward: IssueCallback | None = None
+        if on_issue is not None:
+            def forward(issue: Issue) -> None:
+                streamed.append(issue)
+                on_issue(issue)
+
+        def call(provider: AIProvider, callback: IssueCallback | None):
+            return provider.analyze_document_stream(
+                content, policy_rules, self._options_for(provider, options, primary), on_issue=callback
+            )
+
+        index = 0
+        while index < len(candidates):
+            provider = candidates[index]
+            backup = candidates[index + 1] if index + 1 < len(candidates) else None
+            delay = self._hedge_delay(provider) if backup else None
+
+            if delay is None:
+                result = await self._attempt(provider, partial(call, provider), forward)
+                attempted = [provider]
+            else:
+                result, attempted = await self._race(provider, backup, delay, call, forward)
+
+            if result.success:
+                return result
+
+            for p in attempted:
+                errors.append(f"{p.provider_type.value}: {'; '.join(result.errors) or 'failed'}")
+            index += len(attempted)
+            if streamed:
+                # Its issues already reached on_issue; another provider's would be reported on top
+                logger.warning(
+                    f"AI provider {attempted[-1].provider_type.value} failed after streaming "
+                    f"{len(streamed)} issues, not failing over"
+                )
+                break
+            if index < len(candidates):
+                logger.warning(
+                    f"AI provider {attempted[-1].provider_type.value} failed, "
+                    f"failing over to {candidates[index].provider_type.value}"
+                )
+
+        assert result is not None
+        result.errors = errors
+        return result
+
+    def _hedge_delay(self, provider: AIProvider) -> float | None:
+        if not self._config.hedge_enabled:
+            return None
+        p95 = self._health_for(provider).p95()
+        if p95 is None:
+            return None
+        return max(p95, self._config.hedge_min_delay)
+
+    async def _attempt(self, provider: AIProvider, run, on_issue: IssueCallback | None) -> AnalysisResult:
+        start = time.monotonic()
+        try:
+            result = await run(on_issue)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            result = AnalysisResult(
+                success=False,
+                issues=[],
+                suggestions=[],
+                summary="",
+                processing_time_ms=int((time.monotonic() - start) * 1000),
+                model_used=provider.default_model,
+                errors=[str(e)],
+            )
+        health = self._health_for(provider)
+        if result.success:
+            health.record_success(time.monotonic() - start)
+        else:
+            health.record_failure()
+        return result
+
+    async def _race(
+        self,
+        primary: AIProvider,
+        backup: AIProvider,
+        delay: float,
+        call,
+        on_issue: IssueCallback | None,
+    ) -> tuple[AnalysisResult, list[AIProvider]]:
+        """Run ``primary``, hedging with ``backup`` once ``delay`` has passed.
+
+        The first attempt to stream an issue owns the result: the other is
+        cancelled and only the owner's outcome, success or failure, is
+        returned. Without an owner the first successful attempt wins. No
+        backup is started once the primary has streamed, since its issues
+        already reached ``on_issue``.
+        """
+        tasks: dict[asyncio.Task, AIProvider] = {}
+        owner: list[asyncio.Task] = []
+
+        def gated(task_ref: list[asyncio.Task]) -> IssueCallback:
+            def forward(issue: Issue) -> None:
+                task = task_ref[0]
+                if not owner:
+                    owner.append(task)
+                    for other in tasks:
+                        if other is not task:
+                            other.cancel()
+                if owner[0] is task and on_issue:
+                    on_issue(issue)
+            return forward
+
+        def launch(provider: AIProvider) -> asyncio.Task:
+            task_ref: list[asyncio.Task] = []
+            task = asyncio.ensure_future(self._attempt(provider, partial(call, provider), gated(task_ref)))
+            task_ref.append(task)
+            tasks[task] = provider
+            return task
+
+        first = launch(primary)
+        done, _ = await asyncio.wait({first}, timeout=delay)
+        if done or owner:
+            return await first, [primary]
+
+        logger.info(
+            f"Hedging {primary.provider_type.value} request with {backup.provider_type.value} "
+            f"after {delay:.1f}s"
+        )
+        launch(backup)
+        pending = set(tasks)
+        last: AnalysisResult | None = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.cancelled() or (owner and owner[0] is not task):
+                        continue
+                    last = task.result()
+                    if owner:
+                        return last, [tasks[task]] if last.success else list(tasks.values())
+                    if last.success:
+                        return last, [tasks[task]]
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        assert last is not None
+        return last, list(tasks.values())
+
+    async def generate_suggestion(
+        self,
+        issue: Issue,
+        document_context: str,
+        policy_rule: PolicyRule,
+    ) -> Suggestion:
+        last_error: Exception | None = None
+        for provider in self._candidates():
+            health = self._health_for(provider)
+            start = time.monotonic()
+            try:
+                suggestion = await provider.generate_suggestion(issue, document_context, policy_rule)
+            except Exception as e:
+                health.record_failure()
+                last_error = e
+                logger.warning(f"Suggestion generation failed on {provider.provider_type.value}: {e}")
+                continue
+            health.record_success(time.monotonic() - start)
+            return suggestion
+        assert last_error is not None
+        raise last_error
+
+    async def generate_text(self, prompt: str, max_tokens: int = 2048) -> str:
+        last_error: Exception | None = None
+        for provider in self._candidates():
+            health = self._health_for(provider)
+            start = time.monotonic()
+            try:
+                text = await provider.generate_text(prompt, max_tokens)
+            except Exception as e:
+                health.record_failure()
+                last_error = e
+                logger.warning(f"Text generation failed on {provider.provider_type.value}: {e}")
+                continue
+            health.record_success(time.monotonic() - start)
+            return text
+        assert last_error is not None
+        raise last_error
+
+    async def is_available(self) -> bool:
+        for provider in self._providers:
+            if await provider.is_available():
+                return True
+        return False
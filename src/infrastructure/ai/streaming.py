@@ -0,0 +1,137 @@
+"""Incremental parsing of streamed JSON analysis responses.
+
+Models answer the analysis prompt with a single JSON object, optionally
+wrapped in a markdown code fence, whose ``issues`` member is an array of
+objects. ``StreamingJsonParser`` is fed text chunks as they arrive and
+returns each element of that array as soon as its closing brace is seen,
+so issues can be surfaced long before the completion finishes.
+"""
+import json
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingJsonParser:
+
+    def __init__(self, array_key: str = "issues"):
+        self._array_key = array_key
+        self._buffer = ""
+        self._pos = 0
+        self._start = -1
+        self._end = -1
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = -1
+        self._last_key: str | None = None
+        self._current_key: str | None = None
+        self._array_depth = -1
+        self._element_start = -1
+        self._elements: list[dict[str, Any]] = []
+
+    @property
+    def elements(self) -> list[dict[str, Any]]:
+        return list(self._elements)
+
+    @property
+    def is_complete(self) -> bool:
+        return self._end != -1
+
+    @property
+    def text(self) -> str:
+        return self._buffer
+
+    def feed(self, chunk: str) -> list[dict[str, Any]]:
+        """Consume ``chunk`` and return the array elements it completed."""
+        if not chunk:
+            return []
+        self._buffer += chunk
+        completed: list[dict[str, Any]] = []
+        if self._end != -1:
+            return completed
+
+        buffer = self._buffer
+        for i in range(self._pos, len(buffer)):
+            char = buffer[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if len(self._stack) == 1:
+                        self._last_key = buffer[self._string_start + 1:i]
+                continue
+
+            if self._start == -1:
+                if char == "{":
+                    self._start = i
+                    self._stack.append("{")
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = i
+            elif char == ":" and len(self._stack) == 1:
+                self._current_key = self._last_key
+            elif char in "{[":
+                if char == "[" and len(self._stack) == 1 and self._current_key == self._array_key:
+                    self._array_depth = 2
+                elif char == "{" and len(self._stack) == self._array_depth:
+                    self._element_start = i
+                self._stack.append(char)
+            elif char in "}]":
+                if self._stack:
+                    self._stack.pop()
+                depth = len(self._stack)
+                if char == "}" and depth == self._array_depth and self._element_start != -1:
+                    element = self._decode(buffer[self._element_start:i + 1])
+                    self._element_start = -1
+                    if element is not None:
+                        self._elements.append(element)
+                        completed.append(element)
+                elif char == "]" and depth == 1 and self._array_depth == 2:
+                    self._array_depth = -1
+                elif depth == 0:
+                    self._end = i + 1
+                    self._pos = i + 1
+                    return completed
+
+        self._pos = len(buffer)
+        return completed
+
+    def result(self) -> dict[str, Any]:
+        """Return the parsed top-level object.
+
+        When the stream stopped before the object closed (for example on
+        ``max_tokens``), the result holds the array elements that did
+        complete instead of attempting to repair the truncated text.
+        """
+        if self._end != -1:
+            data = self._decode(self._buffer[self._start:self._end])
+            if isinstance(data, dict):
+                return data
+        if self._start != -1:
+            logger.warning(
+                f"Streamed JSON incomplete after {len(self._buffer)} chars; "
+                f"keeping {len(self._elements)} complete '{self._array_key}' entries"
+            )
+        return {self._array_key: list(self._elements)} if self._elements else {}
+
+    @staticmethod
+    def _decode(text: str) -> Any:
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError as e:
+            logger.debug(f"Skipping undecodable JSON fragment: {e}")
+            return None
+
+
+def parse_json_response(text: str, array_key: str = "issues") -> dict[str, Any]:
+    """Parse a complete (non-streamed) model response the same way."""
+    parser = StreamingJsonParser(array_key=array_key)
+    parser.feed(text)
+    return parser.result()
@@ -0,0 +1,330 @@
+"""
+Token counting and section-priority packing for prompt content.
+
+Counts come from tiktoken encodings once they are loaded. OpenAI models
+use their own encoding; Claude and Gemini publish no local tokenizer and
+are approximated with ``o200k_base``. Until an encoding is loaded, or
+when tiktoken is unavailable, counts fall back to ``CHARS_PER_TOKEN``.
+tiktoken may download an encoding on first load, so encodings are only
+loaded by ``preload()`` (run in a worker thread after startup), never on
+the request path.
+
+Counts and packed content are cached by content hash, so a document
+version is tokenized and packed once per encoding and budget.
+"""
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from src.domain.value_objects.semantic_ir import SectionType
+from src.infrastructure.converters.base import extract_sections
+from src.infrastructure.semantic.section_classifier import SectionClassifier
+
+logger = logging.getLogger(__name__)
+
+# Fallback estimate when no tokenizer is loaded
+CHARS_PER_TOKEN = 4
+
+DEFAULT_ENCODING = "o200k_base"
+ESTIMATE = "estimate"
+
+# Model name prefixes that use an older encoding; everything else uses DEFAULT_ENCODING
+LEGACY_ENCODINGS = (("gpt-4-", "cl100k_base"), ("gpt-3.5", "cl100k_base"))
+
+# Document content per analysis or compliance prompt (the former 50,000 characters)
+DOCUMENT_TOKEN_BUDGET = 12_500
+# Surrounding context per suggestion or curation prompt (the former 10,000 characters)
+EXCERPT_TOKEN_BUDGET = 2_500
+
+COUNT_CACHE_SIZE = 256
+PACK_CACHE_SIZE = 64
+
+# A section that does not fit whole is cut to fit when at least this much budget is left
+MIN_PARTIAL_SECTION_TOKENS = 200
+
+TRUNCATION_MARKER = "\n\n... [Content truncated for length] ...\n\n"
+OMITTED_SECTION_NOTE = "[Section omitted to fit the token budget]"
+
+# Lower packs first: definitions and formulas are what an analysis can least afford to lose
+SECTION_PRIORITY = {
+    SectionType.DEFINITION: 0,
+    SectionType.GLOSSARY: 0,
+    SectionType.FORMULA: 1,
+    SectionType.TABLE: 2,
+    SectionType.CODE: 3,
+    SectionType.NARRATIVE: 4,
+    SectionType.UNKNOWN: 4,
+    SectionType.ANNEX: 5,
+}
+
+
+def content_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def encoding_for_model(model: str | None) -> str:
+    for prefix, encoding in LEGACY_ENCODINGS:
+        if model and model.startswith(prefix):
+            return encoding
+    return DEFAULT_ENCODING
+
+
+class TokenCounter:
+    """Counts tokens with one encoding; without an encoder, estimates from length."""
+
+    def __init__(self, encoding_name: str, encoder: Any = None, cache_size: int = COUNT_CACHE_SIZE):
+        self.encoding_name = encoding_name
+        self._encoder = encoder
+        self._cache_size = cache_size
+        self._counts: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def exact(self) -> bool:
+        return self._encoder is not None
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        if self._encoder is None:
+            return len(text) // CHARS_PER_TOKEN
+        key = content_digest(text)
+        with self._lock:
+            count = self._counts.get(key)
+            if count is not None:
+                self._counts.move_to_end(key)
+                return count
+        count = len(self._encode(text))
+        with self._lock:
+            self._counts[key] = count
+            if len(self._counts) > self._cache_size:
+                self._counts.popitem(last=False)
+        return count
+
+    def count_all(self, *texts: str) -> int:
+        return sum(self.count(text) for text in texts)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Keep the head and tail of ``text`` so the result fits ``max_tokens``."""
+        if self.count(text) <= max_tokens:
+            return text
+        half = max(0, max_tokens - self.count(TRUNCATION_MARKER)) // 2
+        if self._encoder is None:
+            chars = half * CHARS_PER_TOKEN
+            head, tail = text[:chars], text[len(text) - chars:]
+        else:
+            tokens = self._encode(text)
+            head = self._encoder.decode(tokens[:half])
+            tail = self._encoder.decode(tokens[len(tokens) - half:])
+        return head + TRUNCATION_MARKER + tail
+
+    def _encode(self, text: str) -> list[int]:
+        # Document text may contain special-token strings; encode them as plain text
+        return self._encoder.encode(text, disallowed_special=())
+
+
+_estimator = TokenCounter(ESTIMATE)
+_counters: dict[str, TokenCounter] = {}
+_counters_lock = threading.Lock()
+
+
+def get_token_counter(model: str | None = None) -> TokenCounter:
+    """The counter for ``model``: exact once its encoding is preloaded, an estimate until then."""
+    return _counters.get(encoding_for_model(model), _estimator)
+
+
+def preload(models: Iterable[str | None] = (None,)) -> list[str]:
+    """
+    Load the tiktoken encodings used by ``models``.
+
+    Set ``AI_TOKENIZER=estimate`` to skip loading and always estimate.
+    Returns the names of the encodings available afterwards.
+    """
+    if os.environ.get("AI_TOKENIZER", "tiktoken").lower() == ESTIMATE:
+        return []
+    try:
+        import tiktoken
+    except ImportError:
+        logger.info("tiktoken not installed; token counts are estimated")
+        return []
+
+    loaded = []
+    for name in sorted({encoding_for_model(model) for model in models}):
+        if name not in _counters:
+            try:
+                encoding = tiktoken.get_encoding(name)
+            except Exception as e:
+                logger.warning(f"Could not load tokenizer {name}; token counts are estimated: {e}")
+                continue
+            with _counters_lock:
+                _counters.setdefault(name, TokenCounter(name, encoding))
+        loaded.append(name)
+    return loaded
+
+
+@dataclass(frozen=True)
+class PackedContent:
+    text: str
+    tokens: int
+    omitted_sections: tuple[str, ...] = ()
+    truncated: bool = False
+
+
+@dataclass
+class _Block:
+    priority: int
+    text: str
+    omitted: str
+    title: str
+
+
+_packed: OrderedDict[tuple[str, str, int], PackedContent] = OrderedDict()
+_packed_lock = threading.Lock()
+
+
+def pack_content(content: str, max_tokens: int, counter: TokenCounter | None = None) -> PackedContent:
+    """
+    Fit ``content`` into ``max_tokens``, keeping the sections that matter most.
+
+    Content that fits is returned unchanged. Otherwise whole sections are
+    kept in priority order (definitions, then formulas, tables, code,
+    narrative and annexes) and emitted in document order. Each omitted
+    section is replaced by its heading and a note, so the model knows
+    what is missing. Content without headings keeps its head and tail.
+    """
+    counter = counter or get_token_counter()
+    key = (counter.encoding_name, content_digest(content), max_tokens)
+    with _packed_lock:
+        packed = _packed.get(key)
+        if packed is not None:
+            _packed.move_to_end(key)
+            return packed
+    packed = _pack(content, max_tokens, counter)
+    with _packed_lock:
+        _packed[key] = packed
+        if len(_packed) > PACK_CACHE_SIZE:
+            _packed.popitem(last=False)
+    return packed
+
+
+def fit_content(content: str, max_tokens: int, model: str | None = None) -> str:
+    return pack_content(content, max_tokens, get_token_counter(model)).text
+
+
+def split_content(content: str, max_tokens: int, model: str | None = None) -> list[str]:
+    """
+    Split ``content`` into shards of at most ``max_tokens`` along section boundaries.
+
+    Consecutive sections share a shard while they fit; a section larger
+    than the budget is split between paragraphs, and a paragraph larger
+    than the budget between lines.
+    """
+    counter = get_token_counter(model)
+    if counter.count(content) <= max_tokens:
+        return [content] if content.strip() else []
+    shards: list[str] = []
+    current: list[str] = []
+    used = 0
+    for piece in _pieces(content, max_tokens, counter):
+        tokens = counter.count(piece) + 1
+        if current and used + tokens > max_tokens:
+            shards.append("\n\n".join(current))
+            current, used = [], 0
+        current.append(piece)
+        used += tokens
+    if current:
+        shards.append("\n\n".join(current))
+    return shards
+
+
+def _pieces(content: str, max_tokens: int, counter: TokenCounter) -> list[str]:
+    """Sections of ``content``, broken into paragraphs or lines where too large."""
+    pieces = [block.text for block in _blocks(content)] or [content.strip()]
+    for separator in ("\n\n", "\n"):
+        split = []
+        for piece in pieces:
+            if counter.count(piece) <= max_tokens:
+                split.append(piece)
+            else:
+                split.extend(part for part in piece.split(separator) if part.strip())
+        pieces = split
+    # A single line over budget is cut into budget-sized slices, at a space where possible
+    limit = max(1, max_tokens * CHARS_PER_TOKEN)
+    result = []
+    for piece in pieces:
+        while counter.count(piece) > max_tokens and len(piece) > limit:
+            cut = piece.rfind(" ", 0, limit + 1)
+            cut = cut if cut > 0 else limit
+            result.append(piece[:cut])
+            piece = piece[cut:].lstrip(" ")
+        if piece:
+            result.append(piece)
+    return result
+
+
+def _pack(content: str, max_tokens: int, counter: TokenCounter) -> PackedContent:
+    total = counter.count(content)
+    if total <= max_tokens:
+        return PackedContent(text=content, tokens=total)
+
+    blocks = _blocks(content)
+    costs = [(counter.count(block.text), counter.count(block.omitted)) for block in blocks]
+    # One token per block covers the separators and rounding between block counts
+    used = sum(omitted for _, omitted in costs) + len(blocks)
+    if not blocks or used > max_tokens:
+        text = counter.truncate(content, max_tokens)
+        return PackedContent(text=text, tokens=counter.count(text), truncated=True)
+
+    chosen = [block.omitted for block in blocks]
+    kept: set[int] = set()
+    for i in sorted(range(len(blocks)), key=lambda i: (blocks[i].priority, i)):
+        full, omitted = costs[i]
+        remaining = max_tokens - used
+        if full - omitted <= remaining:
+            chosen[i] = blocks[i].text
+            kept.add(i)
+            used += full - omitted
+        elif remaining >= MIN_PARTIAL_SECTION_TOKENS:
+            chosen[i] = counter.truncate(blocks[i].text, omitted + remaining)
+            kept.add(i)
+            used = max_tokens
+
+    # Joining can merge tokens across block boundaries; drop the least
+    # important kept blocks until the joined text really fits
+    text = "\n\n".join(chosen)
+    by_importance = sorted(kept, key=lambda i: (blocks[i].priority, i))
+    while counter.count(text) > max_tokens and by_importance:
+        i = by_importance.pop()
+        chosen[i] = blocks[i].omitted
+        text = "\n\n".join(chosen)
+
+    omitted_titles = tuple(block.title for block, part in zip(blocks, chosen) if part == block.omitted)
+    return PackedContent(text=text, tokens=counter.count(text), omitted_sections=omitted_titles, truncated=True)
+
+
+def _blocks(content: str) -> list[_Block]:
+    sections = extract_sections(content)
+    if not sections:
+        return []
+    blocks = []
+    preamble = "\n".join(content.split("\n")[:sections[0].start_line - 1]).strip()
+    if preamble:
+        blocks.append(_Block(
+            priority=SECTION_PRIORITY[SectionType.NARRATIVE],
+            text=preamble,
+            omitted=OMITTED_SECTION_NOTE,
+            title="",
+        ))
+    for section in SectionClassifier().classify_sections(sections):
+        heading = f"{'#' * section.level} {section.title}"
+        blocks.append(_Block(
+            priority=SECTION_PRIORITY.get(section.section_type, SECTION_PRIORITY[SectionType.NARRATIVE]),
+            text=f"{heading}\n{section.content}" if section.content else heading,
+            omitted=f"{heading}\n{OMITTED_SECTION_NOTE}",
+            title=section.title,
+        ))
+    return blocks
@@ -0,0 +1,32 @@
+"""
+Token accounting shared by the AI providers.
+
+Prompt token counts include any tokens the provider served from its
+prompt cache; those are also counted separately as ``cached`` so the
+cache hit rate is ``cached / prompt``.
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Import metrics (unavailable outside the API context)
+try:
+    from src.api.metrics import ai_tokens_used_total
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+    logger.debug("Metrics not available - running outside API context")
+
+
+def record_token_usage(
+    provider: str,
+    prompt_tokens: int,
+    completion_tokens: int,
+    cached_tokens: int = 0,
+) -> None:
+    if not METRICS_AVAILABLE:
+        return
+    ai_tokens_used_total.labels(provider=provider, token_type="prompt").inc(prompt_tokens)
+    ai_tokens_used_total.labels(provider=provider, token_type="completion").inc(completion_tokens)
+    if cached_tokens:
+        ai_tokens_used_total.labels(provider=provider, token_type="cached").inc(cached_tokens)
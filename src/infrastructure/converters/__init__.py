@@ -1,10 +1,8 @@
 # Document converters
+import importlib
+
 from .base import DocumentConverter, ConversionResult
-from .word_converter import WordConverter
-from .pdf_converter import PdfConverter
-from .rst_converter import RstConverter
-from .markdown_converter import MarkdownConverter
-from .converter_factory import ConverterFactory
+from .converter_factory import CONVERTER_REGISTRY, ConverterFactory
 
 # Custom exceptions
 from .exceptions import (
@@ -39,3 +37,14 @@ __all__ = [
     "FileNotReadableError",
     "DependencyError",
 ]
+
+
+# WordConverter, PdfConverter, etc. import their libraries on first access
+_LAZY_CONVERTERS = {class_name: module_name for module_name, class_name, _ in CONVERTER_REGISTRY}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_CONVERTERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
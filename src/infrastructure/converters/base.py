@@ -68,39 +68,44 @@ class DocumentConverter(ABC):
         return file_path.suffix.lower().lstrip('.') in self.supported_extensions
     
     def _extract_sections(self, markdown: str) -> list[DocumentSection]:
-        sections = []
-        current_section = None
-        current_content_lines = []
-        section_id = 0
-        
-        lines = markdown.split('\n')
-        for line_num, line in enumerate(lines, 1):
-            if line.startswith('#'):
-                if current_section:
-                    current_section.content = '\n'.join(current_content_lines).strip()
-                    current_section.end_line = line_num - 1
-                    sections.append(current_section)
-                
-                level = len(line) - len(line.lstrip('#'))
-                title = line.lstrip('#').strip()
-                section_id += 1
-                current_section = DocumentSection(
-                    id=f"section-{section_id}",
-                    title=title,
-                    content="",
-                    level=level,
-                    start_line=line_num
-                )
-                current_content_lines = []
-            elif current_section:
-                current_content_lines.append(line)
-        
-        if current_section:
-            current_section.content = '\n'.join(current_content_lines).strip()
-            current_section.end_line = len(lines)
-            sections.append(current_section)
-        
-        return sections
+        return extract_sections(markdown)
     
     def _count_words(self, text: str) -> int:
         return len(text.split())
+
+
+def extract_sections(markdown: str) -> list[DocumentSection]:
+    """Split markdown at its headings; text before the first heading belongs to no section."""
+    sections = []
+    current_section = None
+    current_content_lines = []
+    section_id = 0
+    
+    lines = markdown.split('\n')
+    for line_num, line in enumerate(lines, 1):
+        if line.startswith('#'):
+            if current_section:
+                current_section.content = '\n'.join(current_content_lines).strip()
+                current_section.end_line = line_num - 1
+                sections.append(current_section)
+            
+            level = len(line) - len(line.lstrip('#'))
+            title = line.lstrip('#').strip()
+            section_id += 1
+            current_section = DocumentSection(
+                id=f"section-{section_id}",
+                title=title,
+                content="",
+                level=level,
+                start_line=line_num
+            )
+            current_content_lines = []
+        elif current_section:
+            current_content_lines.append(line)
+    
+    if current_section:
+        current_section.content = '\n'.join(current_content_lines).strip()
+        current_section.end_line = len(lines)
+        sections.append(current_section)
+    
+    return sections
@@ -10,15 +10,17 @@ Possible exceptions:
 - FileTooLargeError: File exceeds size limits
 - EncodingError: Text encoding issues
 - UnsupportedFileFormatError: File format not supported
+
+Converter modules are imported the first time one of their extensions is
+converted (or on ``preload``), so fitz, pdfplumber, python-docx and docutils
+stay out of process startup.
 """
 from pathlib import Path
+import importlib
 import logging
+import threading
 
 from .base import DocumentConverter, ConversionResult, DocumentMetadata, DocumentFormat
-from .word_converter import WordConverter
-from .pdf_converter import PdfConverter
-from .rst_converter import RstConverter
-from .markdown_converter import MarkdownConverter
 from .exceptions import (
     ConverterError,
     UnsupportedFileFormatError,
@@ -27,28 +29,60 @@ from .exceptions import (
 logger = logging.getLogger(__name__)
 
 
+# (module, class, extensions) for every converter, in selection order
+CONVERTER_REGISTRY: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+    (".word_converter", "WordConverter", ("docx", "doc")),
+    (".pdf_converter", "PdfConverter", ("pdf",)),
+    (".rst_converter", "RstConverter", ("rst", "rest")),
+    (".markdown_converter", "MarkdownConverter", ("md", "markdown", "mdown", "mkd")),
+)
+
+
 class ConverterFactory:
     
     def __init__(self):
-        self._converters: list[DocumentConverter] = [
-            WordConverter(),
-            PdfConverter(),
-            RstConverter(),
-            MarkdownConverter(),
-        ]
+        # Converters loaded so far; the others are imported on first use
+        self._converters: list[DocumentConverter] = []
+        # Pre-warming loads from a worker thread
+        self._lock = threading.Lock()
     
     def get_converter(self, file_path: Path) -> DocumentConverter | None:
         for converter in self._converters:
             if converter.can_convert(file_path):
                 return converter
-        return None
+        return self._load_for_extension(file_path.suffix)
     
     def get_converter_for_extension(self, extension: str) -> DocumentConverter | None:
         ext = extension.lower().lstrip('.')
         for converter in self._converters:
             if ext in converter.supported_extensions:
                 return converter
+        return self._load_for_extension(ext)
+
+    def preload(self) -> list[str]:
+        """Import and create every converter now instead of on first use."""
+        return [
+            type(self._load(module_name, class_name)).__name__
+            for module_name, class_name, _ in CONVERTER_REGISTRY
+        ]
+
+    def _load_for_extension(self, extension: str) -> DocumentConverter | None:
+        ext = extension.lower().lstrip('.')
+        for module_name, class_name, extensions in CONVERTER_REGISTRY:
+            if ext in extensions:
+                return self._load(module_name, class_name)
         return None
+
+    def _load(self, module_name: str, class_name: str) -> DocumentConverter:
+        with self._lock:
+            for converter in self._converters:
+                if type(converter).__name__ == class_name:
+                    return converter
+            module = importlib.import_module(module_name, __package__)
+            converter = getattr(module, class_name)()
+            self._converters.append(converter)
+            logger.debug(f"Loaded {class_name}")
+            return converter
     
     def convert(self, file_path: Path) -> ConversionResult:
         """
@@ -119,8 +153,8 @@ class ConverterFactory:
     @property
     def supported_extensions(self) -> list[str]:
         extensions = []
-        for converter in self._converters:
-            extensions.extend(converter.supported_extensions)
+        for _, _, converter_extensions in CONVERTER_REGISTRY:
+            extensions.extend(converter_extensions)
         return extensions
     
     @property
@@ -0,0 +1,140 @@
+"""
+Content-addressed storage for large event payload fields.
+
+``DocumentConverted`` carries the whole converted markdown and its
+sections. Inline in ``events.payload`` they are read and decoded by every
+aggregate load and projection page. Fields listed in
+``EXTERNALIZED_FIELDS`` whose JSON encoding reaches
+``BLOB_THRESHOLD_BYTES`` are written once to ``event_blobs``, keyed by the
+SHA-256 of the encoding, and the payload keeps ``{"$blob": <digest>}`` in
+their place. Readers resolve the references in one query per page, or skip
+the fields entirely when the caller does not need document content.
+"""
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import MISSING, fields, replace
+from typing import Any, Dict, Iterable, List, Tuple
+
+from src.domain.events import DomainEvent
+
+BLOB_REF = "$blob"
+
+# Fields smaller than this stay inline; a reference costs about 80 bytes
+BLOB_THRESHOLD_BYTES = 8 * 1024
+
+# Payload fields that hold document content, by event type
+EXTERNALIZED_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "DocumentConverted": ("markdown_content", "sections"),
+}
+
+# Decoded blobs kept in memory; content-addressed blobs never change
+BLOB_CACHE_BYTES = 32 * 1024 * 1024
+
+
+def blob_digest(encoded: str) -> str:
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def is_blob_ref(value: Any) -> bool:
+    return isinstance(value, dict) and len(value) == 1 and BLOB_REF in value
+
+
+def externalize(event_type: str, payload: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    Move large content fields of a serialized event out of its payload.
+
+    Returns:
+        The payload with references in place of the moved fields, and the
+        moved fields' JSON encodings keyed by digest
+    """
+    blobs: Dict[str, str] = {}
+    names = EXTERNALIZED_FIELDS.get(event_type, ())
+    if not names:
+        return payload, blobs
+    payload = dict(payload)
+    for name in names:
+        value = payload.get(name)
+        if value is None or is_blob_ref(value):
+            continue
+        encoded = json.dumps(value)
+        if len(encoded.encode("utf-8")) < BLOB_THRESHOLD_BYTES:
+            continue
+        digest = blob_digest(encoded)
+        blobs[digest] = encoded
+        payload[name] = {BLOB_REF: digest}
+    return payload, blobs
+
+
+def referenced_digests(payloads: Iterable[Dict[str, Any]]) -> List[str]:
+    """Digests referenced by ``payloads``, each once, in order of first reference."""
+    digests: Dict[str, None] = {}
+    for payload in payloads:
+        for value in payload.values():
+            if is_blob_ref(value):
+                digests[value[BLOB_REF]] = None
+    return list(digests)
+
+
+def resolve(payload: Dict[str, Any], blobs: Dict[str, str]) -> Dict[str, Any]:
+    """Replace the references in ``payload`` with the decoded blobs."""
+    if not any(is_blob_ref(value) for value in payload.values()):
+        return payload
+    resolved = dict(payload)
+    for name, value in payload.items():
+        if is_blob_ref(value):
+            digest = value[BLOB_REF]
+            if digest not in blobs:
+                raise LookupError(f"Event blob {digest} is missing from event_blobs")
+            resolved[name] = json.loads(blobs[digest])
+    return resolved
+
+
+def strip_content(event_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop the content fields so the event deserializes with their defaults."""
+    names = EXTERNALIZED_FIELDS.get(event_type, ())
+    if not names:
+        return payload
+    return {name: value for name, value in payload.items() if name not in names}
+
+
+def without_content(event: DomainEvent) -> DomainEvent:
+    """``event`` with its content fields reset to their defaults."""
+    names = EXTERNALIZED_FIELDS.get(event.event_type, ())
+    if not names:
+        return event
+    defaults = {}
+    for f in fields(event):
+        if f.name in names:
+            defaults[f.name] = f.default_factory() if f.default_factory is not MISSING else f.default
+    return replace(event, **defaults)
+
+
+class BlobCache:
+    """Least-recently-used cache of blob encodings, bounded by total size."""
+
+    def __init__(self, max_bytes: int = BLOB_CACHE_BYTES):
+        self._max_bytes = max_bytes
+        self._blobs: "OrderedDict[str, str]" = OrderedDict()
+        self._bytes = 0
+
+    def get_many(self, digests: Iterable[str]) -> Dict[str, str]:
+        found = {}
+        for digest in digests:
+            encoded = self._blobs.get(digest)
+            if encoded is not None:
+                self._blobs.move_to_end(digest)
+                found[digest] = encoded
+        return found
+
+    def put(self, digest: str, encoded: str) -> None:
+        if digest in self._blobs or len(encoded) > self._max_bytes:
+            return
+        self._blobs[digest] = encoded
+        self._bytes += len(encoded)
+        while self._bytes > self._max_bytes:
+            _, evicted = self._blobs.popitem(last=False)
+            self._bytes -= len(evicted)
+
+    def __len__(self) -> int:
+        return len(self._blobs)
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import replace
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 import json
 import time
@@ -9,6 +9,8 @@ import logging
 import asyncpg
 
 from src.domain.events import DomainEvent
+from src.infrastructure.persistence import event_blobs
+from src.infrastructure.persistence.event_blobs import BlobCache
 from src.infrastructure.persistence.event_serializer import EventSerializer
 from src.infrastructure.persistence.event_upcaster import UpcasterRegistry, create_upcaster_registry
 
@@ -52,15 +54,24 @@ class EventStore(ABC):
     async def get_events(
         self,
         aggregate_id: UUID,
-        from_version: int = 0
+        from_version: int = 0,
+        include_content: bool = True
     ) -> List[DomainEvent]:
+        """
+        Events of one aggregate after ``from_version``.
+
+        With ``include_content=False`` the document content fields of
+        ``DocumentConverted`` (see ``event_blobs.EXTERNALIZED_FIELDS``) are
+        left at their defaults and never read from storage.
+        """
         pass
 
     @abstractmethod
     async def get_all_events(
         self,
         from_position: int = 0,
-        batch_size: int = 100
+        batch_size: int = 100,
+        include_content: bool = True
     ) -> List[DomainEvent]:
         pass
 
@@ -75,6 +86,7 @@ class PostgresEventStore(EventStore):
         self._pool = pool
         self._serializer = serializer or EventSerializer()
         self._upcaster_registry = upcaster_registry or create_upcaster_registry()
+        self._blob_cache = BlobCache()
 
     async def append(
         self,
@@ -91,6 +103,13 @@ class PostgresEventStore(EventStore):
         try:
             async with self._pool.acquire() as conn:
                 async with conn.transaction():
+                    # Serialize appends per aggregate. Partitioned, the events table cannot
+                    # enforce (aggregate_id, event_version) uniqueness across partitions,
+                    # and FOR UPDATE below locks nothing for a new aggregate.
+                    await conn.execute(
+                        "SELECT pg_advisory_xact_lock(hashtextextended($1::text, 0))",
+                        str(aggregate_id)
+                    )
                     # Lock aggregate rows to prevent concurrent modifications
                     # Using FOR UPDATE in a subquery ensures only one transaction can check/insert at a time
                     # We use a subquery because FOR UPDATE cannot be used directly with aggregate functions
@@ -111,7 +130,18 @@ class PostgresEventStore(EventStore):
 
                     for i, event in enumerate(events):
                         version = expected_version + i + 1
-                        payload = self._serializer.serialize(event)
+                        payload, blobs = event_blobs.externalize(
+                            event.event_type, self._serializer.serialize(event)
+                        )
+                        if blobs:
+                            await conn.executemany(
+                                """
+                                INSERT INTO event_blobs (digest, content, size_bytes)
+                                VALUES ($1, $2, $3)
+                                ON CONFLICT (digest) DO NOTHING
+                                """,
+                                [(digest, encoded, len(encoded)) for digest, encoded in blobs.items()]
+                            )
                         await conn.execute(
                             """
                             INSERT INTO events
@@ -157,7 +187,8 @@ class PostgresEventStore(EventStore):
     async def get_events(
         self,
         aggregate_id: UUID,
-        from_version: int = 0
+        from_version: int = 0,
+        include_content: bool = True
     ) -> List[DomainEvent]:
         start_time = time.time()
 
@@ -173,10 +204,10 @@ class PostgresEventStore(EventStore):
                     aggregate_id,
                     from_version
                 )
+                payloads = await self._load_payloads(conn, rows, include_content)
 
             events = []
-            for row in rows:
-                payload = json.loads(row["payload"]) if isinstance(row["payload"], str) else row["payload"]
+            for row, payload in zip(rows, payloads):
                 # Ensure event_type and version are in payload for upcaster
                 if 'event_type' not in payload:
                     payload['event_type'] = row["event_type"]
@@ -210,7 +241,8 @@ class PostgresEventStore(EventStore):
     async def get_all_events(
         self,
         from_position: int = 0,
-        batch_size: int = 100
+        batch_size: int = 100,
+        include_content: bool = True
     ) -> List[DomainEvent]:
         start_time = time.time()
 
@@ -226,10 +258,10 @@ class PostgresEventStore(EventStore):
                     from_position,
                     batch_size
                 )
+                payloads = await self._load_payloads(conn, rows, include_content)
 
             events = []
-            for row in rows:
-                payload = json.loads(row["payload"]) if isinstance(row["payload"], str) else row["payload"]
+            for row, payload in zip(rows, payloads):
                 # Ensure event_type is in payload for upcaster
                 if 'event_type' not in payload:
                     payload['event_type'] = row["event_type"]
@@ -250,6 +282,38 @@ class PostgresEventStore(EventStore):
                     operation="get_all"
                 ).observe(duration)
 
+    async def _load_payloads(
+        self,
+        conn: asyncpg.Connection,
+        rows: List[asyncpg.Record],
+        include_content: bool
+    ) -> List[Dict[str, Any]]:
+        """Decode row payloads, resolving blob references in one query or dropping content."""
+        payloads = [
+            json.loads(row["payload"]) if isinstance(row["payload"], str) else row["payload"]
+            for row in rows
+        ]
+        if not include_content:
+            return [
+                event_blobs.strip_content(row["event_type"], payload)
+                for row, payload in zip(rows, payloads)
+            ]
+
+        digests = event_blobs.referenced_digests(payloads)
+        if not digests:
+            return payloads
+        blobs = self._blob_cache.get_many(digests)
+        missing = [digest for digest in digests if digest not in blobs]
+        if missing:
+            blob_rows = await conn.fetch(
+                "SELECT digest, content FROM event_blobs WHERE digest = ANY($1::text[])",
+                missing
+            )
+            for blob_row in blob_rows:
+                blobs[blob_row["digest"]] = blob_row["content"]
+                self._blob_cache.put(blob_row["digest"], blob_row["content"])
+        return [event_blobs.resolve(payload, blobs) for payload in payloads]
+
     async def get_events_count(self, aggregate_id: UUID) -> int:
         async with self._pool.acquire() as conn:
             return await conn.fetchval(
@@ -287,17 +351,24 @@ class InMemoryEventStore(EventStore):
     async def get_events(
         self,
         aggregate_id: UUID,
-        from_version: int = 0
+        from_version: int = 0,
+        include_content: bool = True
     ) -> List[DomainEvent]:
-        events = self._events.get(aggregate_id, [])
-        return events[from_version:]
+        events = self._events.get(aggregate_id, [])[from_version:]
+        if not include_content:
+            events = [event_blobs.without_content(event) for event in events]
+        return events
 
     async def get_all_events(
         self,
         from_position: int = 0,
-        batch_size: int = 100
+        batch_size: int = 100,
+        include_content: bool = True
     ) -> List[DomainEvent]:
-        return self._all_events[from_position:from_position + batch_size]
+        events = self._all_events[from_position:from_position + batch_size]
+        if not include_content:
+            events = [event_blobs.without_content(event) for event in events]
+        return events
 
     def clear(self) -> None:
         self._events.clear()
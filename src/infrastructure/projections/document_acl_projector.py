@@ -0,0 +1,90 @@
+import logging
+from typing import List, Optional, Type
+
+import asyncpg
+
+from src.domain.events import DomainEvent, DocumentUploaded
+from src.domain.events.document_events import DocumentSharedWithGroup, DocumentMadePrivate
+from src.infrastructure.projections.base import Projection
+from src.infrastructure.queries.document_acl_queries import DocumentAclCache
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentAclProjection(Projection):
+    """Maintains ``document_acl_views``: owner, visibility and shared groups per document."""
+
+    def __init__(self, pool: asyncpg.Pool, cache: Optional[DocumentAclCache] = None):
+        self._pool = pool
+        self._cache = cache
+
+    def handles(self) -> List[Type[DomainEvent]]:
+        return [
+            DocumentUploaded,
+            DocumentSharedWithGroup,
+            DocumentMadePrivate,
+        ]
+
+    async def handle(self, event: DomainEvent) -> None:
+        if isinstance(event, DocumentUploaded):
+            await self._handle_uploaded(event)
+        elif isinstance(event, DocumentSharedWithGroup):
+            await self._handle_shared(event)
+        elif isinstance(event, DocumentMadePrivate):
+            await self._handle_made_private(event)
+
+        if self._cache is not None:
+            self._cache.invalidate(event.aggregate_id)
+
+    async def _handle_uploaded(self, event: DocumentUploaded) -> None:
+        async with self._pool.acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO document_acl_views
+                (document_id, owner_kerberos_id, visibility, shared_with_groups, updated_at)
+                VALUES ($1, $2, 'private', '{}', $3)
+                ON CONFLICT (document_id) DO UPDATE SET
+                    owner_kerberos_id = $2,
+                    updated_at = $3
+                """,
+                event.aggregate_id,
+                event.owner_kerberos_id,
+                event.occurred_at
+            )
+
+    async def _handle_shared(self, event: DocumentSharedWithGroup) -> None:
+        async with self._pool.acquire() as conn:
+            result = await conn.execute(
+                """
+                UPDATE document_acl_views
+                SET visibility = 'group',
+                    shared_with_groups = CASE
+                        WHEN $2 = ANY(shared_with_groups) THEN shared_with_groups
+                        ELSE array_append(shared_with_groups, $2)
+                    END,
+                    updated_at = $3
+                WHERE document_id = $1
+                """,
+                event.aggregate_id,
+                event.group,
+                event.occurred_at
+            )
+        if result == "UPDATE 0":
+            logger.warning(
+                f"Document {event.aggregate_id} not in document_acl_views, "
+                f"skipping DocumentSharedWithGroup projection"
+            )
+
+    async def _handle_made_private(self, event: DocumentMadePrivate) -> None:
+        async with self._pool.acquire() as conn:
+            await conn.execute(
+                """
+                UPDATE document_acl_views
+                SET visibility = 'private',
+                    shared_with_groups = '{}',
+                    updated_at = $2
+                WHERE document_id = $1
+                """,
+                event.aggregate_id,
+                event.occurred_at
+            )
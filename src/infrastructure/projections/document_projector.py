@@ -1,5 +1,5 @@
 import logging
-from typing import List, Type, Any
+from typing import List, Optional, Type, Any
 import json
 from enum import Enum
 
@@ -21,6 +21,7 @@ from src.domain.events import (
     AnalysisReset,
 )
 from src.infrastructure.projections.base import Projection
+from src.infrastructure.queries.document_queries import DocumentDetailCache
 
 
 def serialize_for_json(obj: Any) -> Any:
@@ -35,8 +36,9 @@ def serialize_for_json(obj: Any) -> Any:
 
 
 class DocumentProjection(Projection):
-    def __init__(self, pool: asyncpg.Pool):
+    def __init__(self, pool: asyncpg.Pool, detail_cache: Optional[DocumentDetailCache] = None):
         self._pool = pool
+        self._detail_cache = detail_cache
 
     def handles(self) -> List[Type[DomainEvent]]:
         return [
@@ -75,6 +77,9 @@ class DocumentProjection(Projection):
             await self._handle_analysis_reset(event)
         elif isinstance(event, DocumentExported):
             await self._handle_exported(event)
+
+        if self._detail_cache is not None:
+            self._detail_cache.invalidate(event.aggregate_id)
         
         logger.info(f"DocumentProjection successfully handled event: {event.event_type}")
 
@@ -118,29 +123,31 @@ class DocumentProjection(Projection):
                 # For now, skip and let event replay handle it
                 return
 
-            await conn.execute(
-                """
-                UPDATE document_views
-                SET status = 'converted', updated_at = NOW()
-                WHERE id = $1
-                """,
-                event.aggregate_id
-            )
-            await conn.execute(
-                """
-                INSERT INTO document_contents
-                (document_id, version, markdown_content, sections, metadata)
-                VALUES ($1, 1, $2, $3, $4)
-                ON CONFLICT (document_id, version) DO UPDATE SET
-                    markdown_content = $2,
-                    sections = $3,
-                    metadata = $4
-                """,
-                event.aggregate_id,
-                event.markdown_content,
-                json.dumps(serialize_for_json(event.sections)),
-                json.dumps(serialize_for_json(event.metadata))
-            )
+            # Status and content become visible together, so a revision never pairs with stale content
+            async with conn.transaction():
+                await conn.execute(
+                    """
+                    UPDATE document_views
+                    SET status = 'converted', updated_at = NOW()
+                    WHERE id = $1
+                    """,
+                    event.aggregate_id
+                )
+                await conn.execute(
+                    """
+                    INSERT INTO document_contents
+                    (document_id, version, markdown_content, sections, metadata)
+                    VALUES ($1, 1, $2, $3, $4)
+                    ON CONFLICT (document_id, version) DO UPDATE SET
+                        markdown_content = $2,
+                        sections = $3,
+                        metadata = $4
+                    """,
+                    event.aggregate_id,
+                    event.markdown_content,
+                    json.dumps(serialize_for_json(event.sections)),
+                    json.dumps(serialize_for_json(event.metadata))
+                )
 
     async def _handle_analysis_started(self, event: AnalysisStarted) -> None:
         async with self._pool.acquire() as conn:
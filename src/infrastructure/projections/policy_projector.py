@@ -1,4 +1,4 @@
-from typing import List, Type
+from typing import List, Optional, Type
 
 import asyncpg
 
@@ -9,11 +9,13 @@ from src.domain.events import (
     DocumentAssignedToPolicy,
 )
 from src.infrastructure.projections.base import Projection
+from src.infrastructure.queries.document_queries import DocumentDetailCache
 
 
 class PolicyProjection(Projection):
-    def __init__(self, pool: asyncpg.Pool):
+    def __init__(self, pool: asyncpg.Pool, detail_cache: Optional[DocumentDetailCache] = None):
         self._pool = pool
+        self._detail_cache = detail_cache
 
     def handles(self) -> List[Type[DomainEvent]]:
         return [
@@ -29,6 +31,8 @@ class PolicyProjection(Projection):
             await self._handle_policy_added(event)
         elif isinstance(event, DocumentAssignedToPolicy):
             await self._handle_document_assigned(event)
+            if self._detail_cache is not None:
+                self._detail_cache.invalidate(event.document_id)
 
     async def _handle_created(self, event: PolicyRepositoryCreated) -> None:
         async with self._pool.acquire() as conn:
@@ -0,0 +1,47 @@
+import logging
+from typing import List, Optional, Type
+
+from src.domain.events import DomainEvent, DocumentConverted, SemanticIRCurated
+from src.infrastructure.projections.base import Projection
+from src.infrastructure.semantic.converted_ir import ConvertedIR
+from src.infrastructure.semantic.ir_store import SemanticIRStore
+from src.infrastructure.semantic.term_index import TermIndex
+
+logger = logging.getLogger(__name__)
+
+
+class TermIndexProjection(Projection):
+    """Keeps the cross-document term index in step with each document's IR.
+
+    On ``DocumentConverted`` the document's IR comes from ``ConvertedIR``,
+    which the curation handler shares, so a first conversion is extracted
+    and saved once. On ``SemanticIRCurated`` the curated IR is re-read from
+    the store. Either way only the one document's entries are replaced.
+    """
+
+    def __init__(
+        self,
+        term_index: TermIndex,
+        ir_store: SemanticIRStore,
+        converted_ir: Optional[ConvertedIR] = None,
+    ):
+        self._term_index = term_index
+        self._ir_store = ir_store
+        self._converted_ir = converted_ir or ConvertedIR(ir_store)
+
+    def handles(self) -> List[Type[DomainEvent]]:
+        return [
+            DocumentConverted,
+            SemanticIRCurated,
+        ]
+
+    async def handle(self, event: DomainEvent) -> None:
+        document_id = str(event.aggregate_id)
+        if isinstance(event, DocumentConverted):
+            ir = await self._converted_ir.load_or_build(event)
+        else:
+            ir = await self._ir_store.load(document_id)
+        if ir is None:
+            logger.warning(f"No semantic IR for document {document_id}, skipping term index update")
+            return
+        await self._term_index.replace_document(ir)
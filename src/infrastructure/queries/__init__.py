@@ -1,12 +1,16 @@
-from .document_queries import DocumentQueries, DocumentView, DocumentDetailView
+from .document_queries import DocumentDetailCache, DocumentQueries, DocumentView, DocumentDetailView
 from .feedback_queries import FeedbackQueries, FeedbackView
 from .policy_queries import PolicyQueries, PolicyRepositoryView, PolicyView
 from .audit_queries import AuditQueries, AuditLogView
+from .document_acl_queries import DocumentAclCache, DocumentAclQueries
+from .pagination import encode_cursor, decode_cursor
+from .content_window import ContentWindow, decode_window_cursor, encode_window_cursor
 
 __all__ = [
     "DocumentQueries",
     "DocumentView",
     "DocumentDetailView",
+    "DocumentDetailCache",
     "FeedbackQueries",
     "FeedbackView",
     "PolicyQueries",
@@ -14,4 +18,11 @@ __all__ = [
     "PolicyView",
     "AuditQueries",
     "AuditLogView",
+    "DocumentAclCache",
+    "DocumentAclQueries",
+    "encode_cursor",
+    "decode_cursor",
+    "ContentWindow",
+    "encode_window_cursor",
+    "decode_window_cursor",
 ]
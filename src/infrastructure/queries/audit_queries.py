@@ -6,6 +6,8 @@ from uuid import UUID
 import asyncpg
 import json
 
+from .pagination import keyset_clause
+
 
 @dataclass
 class AuditLogView:
@@ -44,53 +46,40 @@ class AuditQueries:
         self,
         document_id: UUID,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> List[AuditLogView]:
-        async with self._pool.acquire() as conn:
-            rows = await conn.fetch(
-                """
-                SELECT id, event_type, aggregate_id, aggregate_type, document_id,
-                       user_id, details, timestamp
-                FROM audit_log_views
-                WHERE document_id = $1
-                ORDER BY timestamp DESC
-                LIMIT $2 OFFSET $3
-                """,
-                document_id,
-                limit,
-                offset
-            )
-
-        return [self._row_to_view(row) for row in rows]
+        query = """
+            SELECT id, event_type, aggregate_id, aggregate_type, document_id,
+                   user_id, details, timestamp
+            FROM audit_log_views
+            WHERE document_id = $1
+        """
+        params = [document_id]
+        return await self._fetch_page(query, params, limit, offset, cursor)
 
     async def get_by_user(
         self,
         user_id: str,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> List[AuditLogView]:
-        async with self._pool.acquire() as conn:
-            rows = await conn.fetch(
-                """
-                SELECT id, event_type, aggregate_id, aggregate_type, document_id,
-                       user_id, details, timestamp
-                FROM audit_log_views
-                WHERE user_id = $1
-                ORDER BY timestamp DESC
-                LIMIT $2 OFFSET $3
-                """,
-                user_id,
-                limit,
-                offset
-            )
-
-        return [self._row_to_view(row) for row in rows]
+        query = """
+            SELECT id, event_type, aggregate_id, aggregate_type, document_id,
+                   user_id, details, timestamp
+            FROM audit_log_views
+            WHERE user_id = $1
+        """
+        params = [user_id]
+        return await self._fetch_page(query, params, limit, offset, cursor)
 
     async def get_recent(
         self,
         limit: int = 50,
         offset: int = 0,
-        event_type: Optional[str] = None
+        event_type: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> List[AuditLogView]:
         query = """
             SELECT id, event_type, aggregate_id, aggregate_type, document_id,
@@ -106,13 +95,7 @@ class AuditQueries:
             query += f" AND event_type = ${param_count}"
             params.append(event_type)
 
-        query += f" ORDER BY timestamp DESC LIMIT ${param_count + 1} OFFSET ${param_count + 2}"
-        params.extend([limit, offset])
-
-        async with self._pool.acquire() as conn:
-            rows = await conn.fetch(query, *params)
-
-        return [self._row_to_view(row) for row in rows]
+        return await self._fetch_page(query, params, limit, offset, cursor)
 
     async def count_by_document(self, document_id: UUID) -> int:
         async with self._pool.acquire() as conn:
@@ -121,6 +104,27 @@ class AuditQueries:
                 document_id
             )
 
+    async def _fetch_page(
+        self,
+        query: str,
+        params: list,
+        limit: int,
+        offset: int,
+        cursor: Optional[str]
+    ) -> List[AuditLogView]:
+        # A cursor replaces OFFSET: (timestamp, id) seeks straight to the page
+        query += keyset_clause(cursor, "timestamp", params)
+        params.append(limit)
+        query += f" ORDER BY timestamp DESC, id DESC LIMIT ${len(params)}"
+        if offset and not cursor:
+            params.append(offset)
+            query += f" OFFSET ${len(params)}"
+
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(query, *params)
+
+        return [self._row_to_view(row) for row in rows]
+
     def _row_to_view(self, row: asyncpg.Record) -> AuditLogView:
         details = row["details"]
         if isinstance(details, str):
@@ -0,0 +1,85 @@
+"""Windows over a document's sections or markdown, with opaque cursors.
+
+A window is either a range of sections or a range of characters of the
+markdown. Its cursor encodes the document revision it was cut from, so a
+client paging through a document that changes underneath it is told to
+start over instead of being handed windows from two different versions.
+"""
+import base64
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence, Tuple
+
+SECTIONS = "sections"
+CHARS = "chars"
+WINDOW_UNITS = (SECTIONS, CHARS)
+
+DEFAULT_LIMITS = {SECTIONS: 20, CHARS: 64 * 1024}
+MAX_LIMITS = {SECTIONS: 200, CHARS: 1024 * 1024}
+
+
+@dataclass(frozen=True)
+class ContentWindow:
+    unit: str
+    start: int
+    end: int
+    total: int
+    items: Any
+
+    @property
+    def is_last(self) -> bool:
+        return self.end >= self.total
+
+
+def encode_window_cursor(revision: str, unit: str, position: int) -> str:
+    raw = f"{revision}|{unit}|{position}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_window_cursor(cursor: str) -> Tuple[str, str, int]:
+    """Decode a cursor from ``encode_window_cursor`` into (revision, unit, position).
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        revision, unit, position = base64.urlsafe_b64decode(padded).decode().split("|")
+        if unit not in WINDOW_UNITS or int(position) < 0:
+            raise ValueError(unit)
+        return revision, unit, int(position)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid content cursor: {cursor!r}") from e
+
+
+def section_window(sections: Optional[Sequence[dict]], start: int, limit: int) -> ContentWindow:
+    sections = [s for s in sections or [] if isinstance(s, dict)]
+    start = min(start, len(sections))
+    end = min(start + limit, len(sections))
+    return ContentWindow(SECTIONS, start, end, len(sections), sections[start:end])
+
+
+def char_window(markdown: Optional[str], start: int, limit: int) -> ContentWindow:
+    """Up to ``limit`` characters from ``start``, ending on a line break when one fits."""
+    markdown = markdown or ""
+    start = min(start, len(markdown))
+    end = min(start + limit, len(markdown))
+    if end < len(markdown):
+        line_end = markdown.rfind("\n", start, end)
+        if line_end >= start:
+            end = line_end + 1
+    return ContentWindow(CHARS, start, end, len(markdown), markdown[start:end])
+
+
+def next_window_cursor(window: ContentWindow, revision: str) -> Optional[str]:
+    """Cursor for the window after ``window``, or None when it reached the end."""
+    if window.is_last:
+        return None
+    return encode_window_cursor(revision, window.unit, window.end)
+
+
+def window_limit(unit: str, limit: Optional[int]) -> int:
+    """The window size for ``unit``: ``limit`` or the default, capped at the maximum."""
+    if unit not in WINDOW_UNITS:
+        raise ValueError(f"Unknown content window unit: {unit!r}")
+    return min(limit or DEFAULT_LIMITS[unit], MAX_LIMITS[unit])
+
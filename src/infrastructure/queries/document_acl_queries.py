@@ -0,0 +1,86 @@
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+from uuid import UUID
+
+import asyncpg
+
+from src.domain.value_objects.document_access import DocumentAccess
+
+
+class DocumentAclCache:
+    """In-process LRU of DocumentAccess entries with a freshness bound.
+
+    The projection invalidates entries for events handled in this process;
+    ``ttl_seconds`` bounds staleness for changes projected by other workers.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 30.0):
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[UUID, Tuple[float, DocumentAccess]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, document_id: UUID) -> Optional[DocumentAccess]:
+        entry = self._entries.get(document_id)
+        if entry is None or time.monotonic() - entry[0] > self._ttl_seconds:
+            if entry is not None:
+                del self._entries[document_id]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(document_id)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, access: DocumentAccess) -> None:
+        self._entries[access.document_id] = (time.monotonic(), access)
+        self._entries.move_to_end(access.document_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, document_id: UUID) -> None:
+        self._entries.pop(document_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DocumentAclQueries:
+    def __init__(self, pool: asyncpg.Pool, cache: Optional[DocumentAclCache] = None):
+        self._pool = pool
+        self._cache = cache or DocumentAclCache()
+
+    @property
+    def cache(self) -> DocumentAclCache:
+        return self._cache
+
+    async def get_access(self, document_id: UUID) -> Optional[DocumentAccess]:
+        cached = self._cache.get(document_id)
+        if cached is not None:
+            return cached
+
+        async with self._pool.acquire() as conn:
+            row = await conn.fetchrow(
+                """
+                SELECT document_id, owner_kerberos_id, visibility, shared_with_groups
+                FROM document_acl_views
+                WHERE document_id = $1
+                """,
+                document_id
+            )
+
+        if row is None:
+            return None
+
+        access = DocumentAccess(
+            document_id=row["document_id"],
+            owner_kerberos_id=row["owner_kerberos_id"],
+            visibility=row["visibility"],
+            shared_with_groups=frozenset(row["shared_with_groups"] or []),
+        )
+        self._cache.put(access)
+        return access
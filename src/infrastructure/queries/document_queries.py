@@ -1,10 +1,15 @@
+import json
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 import asyncpg
 
+from .pagination import keyset_clause
+
 
 @dataclass
 class DocumentView:
@@ -21,6 +26,16 @@ class DocumentView:
     updated_at: datetime
 
 
+def document_revision(version: int, updated_at: datetime) -> str:
+    """
+    Token that changes whenever the projected document changes.
+
+    ``version`` only moves on export, so the row's ``updated_at``, which
+    every projection update sets, is part of it.
+    """
+    return f"{version}.{int(updated_at.timestamp() * 1_000_000)}"
+
+
 @dataclass
 class DocumentDetailView:
     id: UUID
@@ -37,12 +52,110 @@ class DocumentDetailView:
     created_at: datetime
     updated_at: datetime
 
+    @property
+    def revision(self) -> str:
+        return document_revision(self.version, self.updated_at)
+
+
+class DocumentDetailCache:
+    """In-process LRU of DocumentDetailView entries, bounded by count and content size.
+
+    An entry is served as-is for ``fresh_seconds`` after it was stored or
+    last revalidated; after that ``DocumentQueries`` checks its revision
+    with a primary-key lookup before reusing it. The projections invalidate
+    entries for events handled in this process, so ``fresh_seconds`` bounds
+    staleness only for changes projected by other workers.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_content_chars: int = 64 * 1024 * 1024,
+        fresh_seconds: float = 2.0,
+    ):
+        self._max_entries = max_entries
+        self._max_content_chars = max_content_chars
+        self._fresh_seconds = fresh_seconds
+        self._entries: "OrderedDict[UUID, Tuple[float, DocumentDetailView]]" = OrderedDict()
+        self._content_chars = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+    def get(self, document_id: UUID) -> Tuple[Optional[DocumentDetailView], bool]:
+        """The cached view, if any, and whether it is still fresh."""
+        entry = self._entries.get(document_id)
+        if entry is None:
+            self.misses += 1
+            return None, False
+        self._entries.move_to_end(document_id)
+        fresh = time.monotonic() - entry[0] < self._fresh_seconds
+        if fresh:
+            self.hits += 1
+        else:
+            self.revalidations += 1
+        return entry[1], fresh
+
+    def put(self, view: DocumentDetailView) -> None:
+        self.invalidate(view.id)
+        size = len(view.markdown_content or "")
+        if size > self._max_content_chars:
+            return
+        self._entries[view.id] = (time.monotonic(), view)
+        self._content_chars += size
+        while len(self._entries) > self._max_entries or self._content_chars > self._max_content_chars:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._content_chars -= len(evicted.markdown_content or "")
+
+    def invalidate(self, document_id: UUID) -> None:
+        entry = self._entries.pop(document_id, None)
+        if entry is not None:
+            self._content_chars -= len(entry[1].markdown_content or "")
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._content_chars = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
 
 class DocumentQueries:
-    def __init__(self, pool: asyncpg.Pool):
+    def __init__(self, pool: asyncpg.Pool, cache: Optional[DocumentDetailCache] = None):
         self._pool = pool
+        self._cache = cache if cache is not None else DocumentDetailCache()
+
+    @property
+    def cache(self) -> DocumentDetailCache:
+        return self._cache
 
     async def get_by_id(self, document_id: UUID) -> Optional[DocumentDetailView]:
+        """Read-through: reuse the cached view while its revision is unchanged."""
+        cached, fresh = self._cache.get(document_id)
+        if cached is not None:
+            if fresh:
+                return cached
+            if await self.get_revision(document_id) == cached.revision:
+                self._cache.put(cached)
+                return cached
+
+        view = await self._load_by_id(document_id)
+        if view is None:
+            self._cache.invalidate(document_id)
+        else:
+            self._cache.put(view)
+        return view
+
+    async def get_revision(self, document_id: UUID) -> Optional[str]:
+        """Revision of the projected document, without reading its content."""
+        async with self._pool.acquire() as conn:
+            row = await conn.fetchrow(
+                "SELECT version, updated_at FROM document_views WHERE id = $1",
+                document_id
+            )
+        return document_revision(row["version"], row["updated_at"]) if row else None
+
+    async def _load_by_id(self, document_id: UUID) -> Optional[DocumentDetailView]:
         async with self._pool.acquire() as conn:
             row = await conn.fetchrow(
                 """
@@ -62,7 +175,6 @@ class DocumentQueries:
         if row is None:
             return None
 
-        import json
         sections = json.loads(row["sections"]) if row["sections"] else None
         metadata = json.loads(row["metadata"]) if row["metadata"] else None
 
@@ -87,7 +199,8 @@ class DocumentQueries:
         status: Optional[str] = None,
         policy_repository_id: Optional[UUID] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> List[DocumentView]:
         query = """
             SELECT id, title, description, status, version, original_format,
@@ -109,8 +222,13 @@ class DocumentQueries:
             query += f" AND policy_repository_id = ${param_count}"
             params.append(policy_repository_id)
 
-        query += f" ORDER BY created_at DESC LIMIT ${param_count + 1} OFFSET ${param_count + 2}"
-        params.extend([limit, offset])
+        # A cursor replaces OFFSET: (created_at, id) seeks straight to the page
+        query += keyset_clause(cursor, "created_at", params)
+        params.append(limit)
+        query += f" ORDER BY created_at DESC, id DESC LIMIT ${len(params)}"
+        if offset and not cursor:
+            params.append(offset)
+            query += f" OFFSET ${len(params)}"
 
         async with self._pool.acquire() as conn:
             rows = await conn.fetch(query, *params)
@@ -135,21 +253,39 @@ class DocumentQueries:
     async def count(
         self,
         status: Optional[str] = None,
-        policy_repository_id: Optional[UUID] = None
+        policy_repository_id: Optional[UUID] = None,
+        estimate: bool = False
     ) -> int:
-        query = "SELECT COUNT(*) FROM document_views WHERE 1=1"
-        params = []
-        param_count = 0
+        """Count documents matching the filters.
+
+        Status-only and unfiltered counts are read from ``document_status_counts``
+        rather than scanning ``document_views``. With ``estimate`` an unfiltered
+        count uses the planner's row estimate from ``pg_class``.
+        """
+        if policy_repository_id is None:
+            async with self._pool.acquire() as conn:
+                if status:
+                    total = await conn.fetchval(
+                        "SELECT count FROM document_status_counts WHERE status = $1",
+                        status
+                    )
+                    return total or 0
+                if estimate:
+                    reltuples = await conn.fetchval(
+                        "SELECT reltuples::BIGINT FROM pg_class WHERE oid = 'document_views'::regclass"
+                    )
+                    # reltuples is -1 until the table has been vacuumed or analyzed
+                    if reltuples is not None and reltuples >= 0:
+                        return reltuples
+                total = await conn.fetchval("SELECT SUM(count)::BIGINT FROM document_status_counts")
+                return total or 0
+
+        query = "SELECT COUNT(*) FROM document_views WHERE policy_repository_id = $1"
+        params = [policy_repository_id]
 
         if status:
-            param_count += 1
-            query += f" AND status = ${param_count}"
+            query += " AND status = $2"
             params.append(status)
 
-        if policy_repository_id:
-            param_count += 1
-            query += f" AND policy_repository_id = ${param_count}"
-            params.append(policy_repository_id)
-
         async with self._pool.acquire() as conn:
             return await conn.fetchval(query, *params)
@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 import asyncpg
 
+from .pagination import keyset_clause
+
 
 @dataclass
 class FeedbackView:
@@ -49,7 +51,9 @@ class FeedbackQueries:
     async def get_by_document(
         self,
         document_id: UUID,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> List[FeedbackView]:
         query = """
             SELECT id, document_id, section_id, status, category, severity,
@@ -64,7 +68,11 @@ class FeedbackQueries:
             query += " AND status = $2"
             params.append(status)
 
-        query += " ORDER BY created_at ASC"
+        query += keyset_clause(cursor, "created_at", params, descending=False)
+        query += " ORDER BY created_at ASC, id ASC"
+        if limit is not None:
+            params.append(limit)
+            query += f" LIMIT ${len(params)}"
 
         async with self._pool.acquire() as conn:
             rows = await conn.fetch(query, *params)
@@ -79,7 +87,7 @@ class FeedbackQueries:
         document_id: UUID,
         status: Optional[str] = None
     ) -> int:
-        query = "SELECT COUNT(*) FROM feedback_views WHERE document_id = $1"
+        query = "SELECT SUM(count)::BIGINT FROM feedback_status_counts WHERE document_id = $1"
         params = [document_id]
 
         if status:
@@ -87,11 +95,25 @@ class FeedbackQueries:
             params.append(status)
 
         async with self._pool.acquire() as conn:
-            return await conn.fetchval(query, *params)
+            return await conn.fetchval(query, *params) or 0
 
     async def count_pending(self, document_id: UUID) -> int:
         return await self.count_by_document(document_id, status="pending")
 
+    async def count_by_status(self, document_id: UUID) -> Dict[str, int]:
+        """Feedback counts per status from the ``feedback_status_counts`` table."""
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT status, count
+                FROM feedback_status_counts
+                WHERE document_id = $1
+                """,
+                document_id
+            )
+
+        return {row["status"]: row["count"] for row in rows}
+
     def _row_to_view(self, row: asyncpg.Record) -> FeedbackView:
         return FeedbackView(
             id=row["id"],
@@ -0,0 +1,57 @@
+"""Opaque keyset cursors for listing queries.
+
+Listings are ordered by a timestamp column with the row id as tie-breaker.
+A cursor encodes the (timestamp, id) of the last row on a page, so the next
+page is ``WHERE (ts, id) < (cursor_ts, cursor_id)`` and can be served from a
+composite index no matter how deep the client has paged.
+"""
+import base64
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+
+
+def encode_cursor(sort_value: datetime, row_id: UUID) -> str:
+    raw = f"{sort_value.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor from ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_text, id_text = base64.urlsafe_b64decode(padded).decode().split("|", 1)
+        return datetime.fromisoformat(sort_text), UUID(id_text)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor!r}") from e
+
+
+def keyset_clause(
+    cursor: Optional[str],
+    sort_column: str,
+    params: List,
+    descending: bool = True,
+) -> str:
+    """Return the ``AND (sort_column, id) < (...)`` predicate for ``cursor``.
+
+    Appends the decoded cursor values to ``params`` and returns an empty
+    string when there is no cursor.
+    """
+    if not cursor:
+        return ""
+    sort_value, row_id = decode_cursor(cursor)
+    params.extend([sort_value, row_id])
+    op = "<" if descending else ">"
+    return f" AND ({sort_column}, id) {op} (${len(params) - 1}, ${len(params)})"
+
+
+def next_cursor(rows: Sequence, limit: Optional[int], sort_attr: str = "created_at") -> Optional[str]:
+    """Cursor for the page after ``rows``, or None when it was the last page."""
+    if not rows or limit is None or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(getattr(last, sort_attr), last.id)
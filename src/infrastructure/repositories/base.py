@@ -3,6 +3,7 @@ from typing import Generic, TypeVar, Optional, Type, List
 from uuid import UUID
 import asyncio
 import logging
+import weakref
 
 from src.domain.aggregates.base import Aggregate
 from src.infrastructure.persistence.event_store import EventStore, ConcurrencyError
@@ -27,6 +28,8 @@ class Repository(ABC, Generic[T]):
         self._snapshot_threshold = snapshot_threshold
         self._max_retries = max_retries
         self._retry_delay_ms = retry_delay_ms
+        # Aggregates loaded without document content must never be snapshotted
+        self._without_content: "weakref.WeakSet[T]" = weakref.WeakSet()
 
     @abstractmethod
     def _aggregate_type(self) -> Type[T]:
@@ -36,7 +39,15 @@ class Repository(ABC, Generic[T]):
     def _aggregate_type_name(self) -> str:
         pass
 
-    async def get(self, aggregate_id: UUID) -> Optional[T]:
+    async def get(self, aggregate_id: UUID, include_content: bool = True) -> Optional[T]:
+        """
+        Load an aggregate from its snapshot and later events.
+
+        Pass ``include_content=False`` when only ownership, sharing or status
+        is needed: large document content is then neither read nor decoded,
+        and the content properties of the aggregate are empty. Such an
+        aggregate can still be changed and saved.
+        """
         from_version = 0
         aggregate = None
 
@@ -46,7 +57,7 @@ class Repository(ABC, Generic[T]):
                 from_version = snapshot.version
                 aggregate = self._restore_from_snapshot(snapshot)
 
-        events = await self._event_store.get_events(aggregate_id, from_version)
+        events = await self._event_store.get_events(aggregate_id, from_version, include_content=include_content)
 
         if not events and aggregate is None:
             return None
@@ -57,6 +68,8 @@ class Repository(ABC, Generic[T]):
             for event in events:
                 aggregate._apply_event(event, is_new=False)
 
+        if not include_content:
+            self._without_content.add(aggregate)
         return aggregate
 
     async def save(self, aggregate: T) -> None:
@@ -84,7 +97,11 @@ class Repository(ABC, Generic[T]):
                 )
 
                 # Success - create snapshot if threshold reached
-                if self._snapshot_store and aggregate.version >= self._snapshot_threshold:
+                if (
+                    self._snapshot_store
+                    and aggregate.version >= self._snapshot_threshold
+                    and aggregate not in self._without_content
+                ):
                     if aggregate.version % self._snapshot_threshold == 0:
                         snapshot = self._create_snapshot(aggregate)
                         await self._snapshot_store.save(snapshot)
@@ -117,7 +134,7 @@ class Repository(ABC, Generic[T]):
             raise last_error
 
     async def exists(self, aggregate_id: UUID) -> bool:
-        events = await self._event_store.get_events(aggregate_id, 0)
+        events = await self._event_store.get_events(aggregate_id, 0, include_content=False)
         return len(events) > 0
 
     def _create_snapshot(self, aggregate: T) -> Snapshot:
@@ -51,8 +51,6 @@ class FeedbackSessionRepository(Repository[FeedbackSession]):
         session._version = state["version"]
         session._pending_events = []
         session._document_id = UUID(state["document_id"]) if state.get("document_id") else None
-        session._feedback_items = [
-            FeedbackItem.from_dict(item)
-            for item in state["feedback_items"]
-        ]
+        items = [FeedbackItem.from_dict(item) for item in state["feedback_items"]]
+        session._feedback_items = {item.feedback_id: item for item in items}
         return session
@@ -6,6 +6,7 @@ from .table_extractor import TableExtractor
 from .reference_extractor import ReferenceExtractor
 from .section_classifier import SectionClassifier
 from .ir_builder import IRBuilder
+from .incremental_ir_builder import IncrementalIRBuilder, IRDiff
 from .ir_validator import IRValidator
 
 __all__ = [
@@ -15,5 +16,7 @@ __all__ = [
     'ReferenceExtractor',
     'SectionClassifier',
     'IRBuilder',
+    'IncrementalIRBuilder',
+    'IRDiff',
     'IRValidator',
 ]
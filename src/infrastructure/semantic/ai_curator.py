@@ -1,9 +1,11 @@
 """AI-powered semantic IR curation and enhancement."""
 
+import asyncio
+import hashlib
 import json
 import logging
-from typing import List, Dict, Any, Optional
-import uuid
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TYPE_CHECKING
 
 from src.domain.value_objects.semantic_ir import (
     DocumentIR,
@@ -13,11 +15,25 @@ from src.domain.value_objects.semantic_ir import (
     Parameter,
     DependencyType,
 )
+from src.infrastructure.ai.base import AIProvider, ProviderType
 from src.infrastructure.ai.provider_factory import ProviderFactory
+from src.infrastructure.ai.token_budget import EXCERPT_TOKEN_BUDGET, split_content
 from .lineage_extractor import LineageExtractor
 
+if TYPE_CHECKING:
+    from src.infrastructure.ai.analysis.analysis_log import AnalysisLog
+
 logger = logging.getLogger(__name__)
 
+# Curation calls in flight per document; the provider's rate limiter still applies
+DEFAULT_CURATION_CONCURRENCY = 4
+
+# Already-found terms listed per shard so the model does not repeat them
+MAX_KNOWN_TERMS_PER_SHARD = 50
+
+DISCOVERY = "discovery"
+VALIDATION = "validation"
+
 
 class SemanticIRCurator:
     """
@@ -28,19 +44,28 @@ class SemanticIRCurator:
     2. Validate extracted definitions for correctness
     3. Suggest corrections for malformed extractions
     4. Identify new definition patterns to improve rules
+
+    The whole document is covered: discovery runs once per section shard
+    and validation once per batch of definitions, all concurrently.
     """
 
-    def __init__(self, provider_factory: Optional[ProviderFactory] = None):
+    def __init__(
+        self,
+        provider_factory: Optional[ProviderFactory] = None,
+        max_concurrency: int = DEFAULT_CURATION_CONCURRENCY,
+    ):
         """Initialize curator with AI provider."""
         self._provider_factory = provider_factory or ProviderFactory()
         self._max_definitions_per_call = 50  # Batch size for API calls
+        self._max_concurrency = max_concurrency
         self._lineage_extractor = LineageExtractor()
 
     async def curate(
         self,
         ir: DocumentIR,
         markdown: str,
-        provider_type: str = "claude"
+        provider_type: str = "claude",
+        analysis_log: Optional["AnalysisLog"] = None,
     ) -> DocumentIR:
         """
         AI-enhance the semantic IR.
@@ -49,22 +74,45 @@ class SemanticIRCurator:
             ir: Initial semantic IR from rule-based extraction
             markdown: Full markdown content
             provider_type: AI provider to use (claude, gemini, openai)
+            analysis_log: Log that receives per-batch timing
 
         Returns:
             Enhanced DocumentIR with AI improvements
         """
         try:
             logger.info(f"Starting AI curation for document {ir.document_id}")
+            provider = self._provider_factory.get_provider(ProviderType(provider_type))
+
+            shards = split_content(markdown, EXCERPT_TOKEN_BUDGET, provider.default_model)
+            size = self._max_definitions_per_call
+            batches = [ir.definitions[i:i + size] for i in range(0, len(ir.definitions), size)]
+            if analysis_log:
+                analysis_log.info(
+                    "semantic_curation",
+                    f"Curating {len(shards)} document shards and {len(batches)} definition batches",
+                    {"shards": len(shards), "definition_batches": len(batches), "concurrency": self._max_concurrency},
+                )
+
+            # Both stages share one concurrency limit; gather keeps results in submission order
+            semaphore = asyncio.Semaphore(self._max_concurrency)
+            discovery = [
+                self._run_batch(
+                    semaphore, analysis_log, DISCOVERY, i, len(shards),
+                    lambda shard=shard: self._find_missed_definitions(shard, ir, provider),
+                )
+                for i, shard in enumerate(shards)
+            ]
+            validation = [
+                self._run_batch(
+                    semaphore, analysis_log, VALIDATION, i, len(batches),
+                    lambda batch=batch: self._validate_definitions(batch, provider),
+                )
+                for i, batch in enumerate(batches)
+            ]
+            results = await asyncio.gather(*discovery, *validation)
 
-            # Run AI tasks
-            missed_definitions = await self._find_missed_definitions(
-                markdown, ir, provider_type
-            )
-            validation_results = await self._validate_definitions(
-                ir.definitions[:self._max_definitions_per_call],  # Limit batch size
-                markdown,
-                provider_type
-            )
+            missed_definitions = self._merge_discoveries(ir, results[:len(shards)])
+            validation_results = [issue for batch in results[len(shards):] for issue in batch]
 
             # Merge enhancements
             enhanced_ir = self._merge_enhancements(
@@ -75,7 +123,7 @@ class SemanticIRCurator:
 
             logger.info(
                 f"AI curation complete: added {len(missed_definitions)} definitions, "
-                f"validated {len(validation_results)} existing definitions"
+                f"validated {len(ir.definitions)} existing definitions"
             )
 
             return enhanced_ir
@@ -85,39 +133,87 @@ class SemanticIRCurator:
             # Return original IR if curation fails
             return ir
 
+    async def _run_batch(
+        self,
+        semaphore: asyncio.Semaphore,
+        analysis_log: Optional["AnalysisLog"],
+        stage: str,
+        index: int,
+        total: int,
+        call: Callable[[], Awaitable[list]],
+    ) -> list:
+        """Run one curation call, logging its timing; a failed batch contributes nothing."""
+        async with semaphore:
+            started = time.monotonic()
+            try:
+                result = await call()
+                error = None
+            except Exception as e:
+                logger.error(f"Curation {stage} batch {index + 1}/{total} failed: {e}", exc_info=True)
+                result, error = [], e
+            duration_ms = round((time.monotonic() - started) * 1000)
+
+        if analysis_log:
+            details = {"stage": stage, "batch": index + 1, "batches": total, "duration_ms": duration_ms}
+            if error is None:
+                analysis_log.info(
+                    "semantic_curation",
+                    f"Curation {stage} batch {index + 1}/{total} finished",
+                    {**details, "results": len(result)},
+                )
+            else:
+                analysis_log.warning(
+                    "semantic_curation",
+                    f"Curation {stage} batch {index + 1}/{total} failed: {error}",
+                    {**details, "error_type": type(error).__name__},
+                )
+        return result
+
+    def _merge_discoveries(
+        self,
+        ir: DocumentIR,
+        shard_results: List[List[TermDefinition]],
+    ) -> List[TermDefinition]:
+        """New definitions in document order, keeping the first definition of each term."""
+        seen = {d.term for d in ir.definitions}
+        merged = []
+        for definitions in shard_results:
+            for definition in definitions:
+                if definition.term not in seen:
+                    seen.add(definition.term)
+                    merged.append(definition)
+        return merged
+
     async def _find_missed_definitions(
         self,
-        markdown: str,
+        shard: str,
         existing_ir: DocumentIR,
-        provider_type: str
+        provider: AIProvider,
     ) -> List[TermDefinition]:
         """
         Use AI to find definitions missed by rule-based extraction.
 
         Args:
-            markdown: Document markdown content
+            shard: One section-aligned shard of the document markdown
             existing_ir: Existing IR with rule-based definitions
-            provider_type: AI provider to use
+            provider: AI provider to use
 
         Returns:
             List of newly discovered term definitions
         """
-        try:
-            provider = self._provider_factory.get_provider(provider_type)
-
-            # Build list of already-found terms
-            existing_terms = [d.term for d in existing_ir.definitions]
+        # Already-found terms that occur in this shard
+        shard_lower = shard.lower()
+        existing_terms = [
+            d.term for d in existing_ir.definitions if d.term.lower() in shard_lower
+        ][:MAX_KNOWN_TERMS_PER_SHARD]
 
-            # Create focused markdown sample (first 10k chars to stay within limits)
-            sample_markdown = markdown[:10000] if len(markdown) > 10000 else markdown
-
-            prompt = f"""Analyze this document excerpt and identify defined terms that may have been missed.
+        prompt = f"""Analyze this document excerpt and identify defined terms that may have been missed.
 
 ALREADY FOUND TERMS (do not repeat these):
-{json.dumps(existing_terms[:20], indent=2)}
+{json.dumps(existing_terms, indent=2)}
 
 DOCUMENT EXCERPT:
-{sample_markdown}
+{shard}
 
 Look for definitions using varied patterns:
 - "X is defined to mean Y"
@@ -140,71 +236,64 @@ Focus on:
 Return empty array [] if no additional terms found.
 """
 
-            response = await provider.generate_text(prompt, max_tokens=2000)
-
-            # Parse JSON response
-            definitions = self._parse_definition_json(response)
-
-            # Convert to TermDefinition objects with lineage
-            term_definitions = []
-            all_known_terms = {d.term for d in existing_ir.definitions}
-
-            for d in definitions:
-                if d.get("confidence") in ["high", "medium"]:  # Skip low confidence
-                    # Extract lineage for this definition
-                    lineage = self._lineage_extractor.extract_lineage(
-                        d["definition"],
-                        all_known_terms
-                    )
-
-                    term_def = TermDefinition(
-                        id=f"ai-def-{str(uuid.uuid4())[:8]}",
-                        term=d["term"],
-                        definition=d["definition"],
-                        section_id="ai-discovered",
-                        aliases=[],
-                        first_occurrence_line=0,
-                        lineage=lineage,
-                    )
-                    term_definitions.append(term_def)
-
-            logger.info(f"AI found {len(term_definitions)} additional definitions")
-            return term_definitions
-
-        except Exception as e:
-            logger.error(f"Error finding missed definitions: {e}", exc_info=True)
-            return []
+        response = await provider.generate_text(prompt, max_tokens=2000)
+
+        # Parse JSON response
+        definitions = self._parse_definition_json(response)
+
+        # Convert to TermDefinition objects with lineage
+        term_definitions = []
+        all_known_terms = {d.term for d in existing_ir.definitions}
+
+        for d in definitions:
+            if d.get("confidence") in ["high", "medium"]:  # Skip low confidence
+                # Extract lineage for this definition
+                lineage = self._lineage_extractor.extract_lineage(
+                    d["definition"],
+                    all_known_terms
+                )
+
+                # Ids derive from the term so repeated curation is stable
+                term_id = hashlib.sha1(d["term"].encode("utf-8")).hexdigest()[:8]
+                term_def = TermDefinition(
+                    id=f"ai-def-{term_id}",
+                    term=d["term"],
+                    definition=d["definition"],
+                    section_id="ai-discovered",
+                    aliases=[],
+                    first_occurrence_line=0,
+                    lineage=lineage,
+                )
+                term_definitions.append(term_def)
+
+        logger.info(f"AI found {len(term_definitions)} additional definitions")
+        return term_definitions
 
     async def _validate_definitions(
         self,
         definitions: List[TermDefinition],
-        markdown: str,
-        provider_type: str
+        provider: AIProvider,
     ) -> List[Dict[str, Any]]:
         """
         Use AI to validate extracted definitions.
 
         Args:
-            definitions: List of definitions to validate
-            markdown: Document markdown content
-            provider_type: AI provider to use
+            definitions: One batch of definitions to validate
+            provider: AI provider to use
 
         Returns:
             List of validation results with suggested fixes
         """
-        try:
-            if not definitions:
-                return []
-
-            provider = self._provider_factory.get_provider(provider_type)
+        if not definitions:
+            return []
 
-            # Prepare definitions for review
-            defs_for_review = [
-                {"term": d.term, "definition": d.definition[:200]}  # Truncate long defs
-                for d in definitions[:20]  # Limit batch
-            ]
+        # Prepare definitions for review
+        defs_for_review = [
+            {"term": d.term, "definition": d.definition[:200]}  # Truncate long defs
+            for d in definitions
+        ]
 
-            prompt = f"""Review these extracted term definitions for quality issues.
+        prompt = f"""Review these extracted term definitions for quality issues.
 
 DEFINITIONS TO REVIEW:
 {json.dumps(defs_for_review, indent=2)}
@@ -229,17 +318,13 @@ Return ONLY a JSON array of issues found:
 Return empty array [] if all definitions look good.
 """
 
-            response = await provider.generate_text(prompt, max_tokens=1500)
+        response = await provider.generate_text(prompt, max_tokens=1500)
 
-            # Parse validation results
-            issues = self._parse_validation_json(response)
+        # Parse validation results
+        issues = self._parse_validation_json(response)
 
-            logger.info(f"AI validation found {len(issues)} issues")
-            return issues
-
-        except Exception as e:
-            logger.error(f"Error validating definitions: {e}", exc_info=True)
-            return []
+        logger.info(f"AI validation found {len(issues)} issues")
+        return issues
 
     def _merge_enhancements(
         self,
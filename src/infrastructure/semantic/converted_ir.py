@@ -0,0 +1,91 @@
+"""Rule-based semantic IR for documents as they are converted.
+
+``DocumentConverted`` is handled both by the term index projection and by
+the AI curation handler, and each needs the document's IR. ``ConvertedIR``
+loads the stored IR or, on the first conversion, builds it from the
+event's markdown and sections off the event loop and saves it. Concurrent
+requests for the same document share one build.
+"""
+import asyncio
+import logging
+from typing import Dict, Optional
+
+from src.domain.events import DocumentConverted
+from src.domain.value_objects.semantic_ir import DocumentIR
+from src.infrastructure.converters.base import (
+    ConversionResult,
+    DocumentFormat,
+    DocumentMetadata,
+    DocumentSection,
+)
+from src.infrastructure.semantic.ir_builder import IRBuilder
+from src.infrastructure.semantic.ir_store import SemanticIRStore
+
+logger = logging.getLogger(__name__)
+
+
+def conversion_result_from_event(event: DocumentConverted) -> ConversionResult:
+    """Rebuild the converter output carried by a ``DocumentConverted`` event."""
+    sections = [
+        DocumentSection(
+            id=s.get("id", ""),
+            title=s.get("title", ""),
+            content=s.get("content", ""),
+            level=s.get("level", 1),
+            start_line=s.get("start_line"),
+            end_line=s.get("end_line"),
+        )
+        for s in event.sections
+        if isinstance(s, dict)
+    ]
+    metadata = event.metadata or {}
+    fmt = metadata.get("original_format")
+    try:
+        original_format = DocumentFormat(getattr(fmt, "value", fmt))
+    except ValueError:
+        original_format = DocumentFormat.UNKNOWN
+    return ConversionResult(
+        success=True,
+        markdown_content=event.markdown_content,
+        sections=sections,
+        metadata=DocumentMetadata(title=metadata.get("title"), original_format=original_format),
+    )
+
+
+class ConvertedIR:
+    """Stored IR for converted documents, built and saved on first request."""
+
+    def __init__(self, ir_store: SemanticIRStore, ir_builder: Optional[IRBuilder] = None):
+        self._ir_store = ir_store
+        self._ir_builder = ir_builder or IRBuilder()
+        self._pending: Dict[str, "asyncio.Future[DocumentIR]"] = {}
+
+    async def load_or_build(self, event: DocumentConverted) -> DocumentIR:
+        """
+        Return the stored IR for the event's document, building it if absent.
+
+        Args:
+            event: Conversion whose markdown backs section bodies and, when
+                nothing is stored yet, the rule-based extraction
+
+        Returns:
+            The stored or newly saved DocumentIR
+        """
+        document_id = str(event.aggregate_id)
+        pending = self._pending.get(document_id)
+        if pending is None:
+            pending = asyncio.ensure_future(self._load_or_build(document_id, event))
+            self._pending[document_id] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(document_id, None))
+        # One caller being cancelled must not cancel the build the others wait on
+        return await asyncio.shield(pending)
+
+    async def _load_or_build(self, document_id: str, event: DocumentConverted) -> DocumentIR:
+        markdown = event.markdown_content
+        ir = await self._ir_store.load(document_id, markdown_loader=lambda: markdown)
+        if ir is not None:
+            return ir
+        logger.info(f"Building rule-based semantic IR for converted document {document_id}")
+        ir = await asyncio.to_thread(self._ir_builder.build, conversion_result_from_event(event), document_id)
+        await self._ir_store.save(ir)
+        return ir
@@ -0,0 +1,482 @@
+"""Incremental semantic IR rebuild for new versions of a document."""
+
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass, field, replace
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple, Union
+
+from src.infrastructure.converters.base import ConversionResult
+from src.domain.value_objects.semantic_ir import (
+    CrossReference,
+    DocumentIR,
+    FormulaReference,
+    IRSection,
+    TableData,
+    TermDefinition,
+)
+
+from .ir_builder import (
+    IRBuilder,
+    PREAMBLE,
+    SECTION_INDEX_KEY,
+    TABLE_TITLE_LOOKBACK,
+    fingerprint_sections,
+    section_regions,
+)
+
+UNKNOWN_SECTION = "section-unknown"
+
+
+@dataclass
+class IRDiff:
+    """What changed between two versions of a document's IR."""
+
+    sections_reused: int = 0
+    sections_changed: List[str] = field(default_factory=list)
+    sections_added: List[str] = field(default_factory=list)
+    sections_removed: List[str] = field(default_factory=list)
+    definitions_added: List[str] = field(default_factory=list)
+    definitions_removed: List[str] = field(default_factory=list)
+    definitions_changed: List[str] = field(default_factory=list)
+    formulae_added: int = 0
+    formulae_removed: int = 0
+    tables_added: int = 0
+    tables_removed: int = 0
+    cross_references_added: int = 0
+    cross_references_removed: int = 0
+    full_rebuild: bool = False
+
+    def summary(self) -> str:
+        """One-line description for logs."""
+        return (
+            f"sections reused={self.sections_reused} changed={len(self.sections_changed)} "
+            f"added={len(self.sections_added)} removed={len(self.sections_removed)}; "
+            f"definitions +{len(self.definitions_added)} -{len(self.definitions_removed)} "
+            f"~{len(self.definitions_changed)}; formulae +{self.formulae_added} -{self.formulae_removed}; "
+            f"tables +{self.tables_added} -{self.tables_removed}; "
+            f"references +{self.cross_references_added} -{self.cross_references_removed}"
+            + ("; full rebuild" if self.full_rebuild else "")
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "sections": {
+                "reused": self.sections_reused,
+                "changed": self.sections_changed,
+                "added": self.sections_added,
+                "removed": self.sections_removed,
+            },
+            "definitions": {
+                "added": self.definitions_added,
+                "removed": self.definitions_removed,
+                "changed": self.definitions_changed,
+            },
+            "formulae": {"added": self.formulae_added, "removed": self.formulae_removed},
+            "tables": {"added": self.tables_added, "removed": self.tables_removed},
+            "cross_references": {
+                "added": self.cross_references_added,
+                "removed": self.cross_references_removed,
+            },
+            "full_rebuild": self.full_rebuild,
+        }
+
+
+class _FullRebuild(Exception):
+    """Raised when reuse cannot reproduce a full build exactly."""
+
+
+class IncrementalIRBuilder(IRBuilder):
+    """
+    Builds DocumentIR for a new version of a document from the previous IR.
+
+    Each section is fingerprinted (see ``fingerprint_sections``) and matched
+    against the section index recorded in the previous IR's metadata.
+    Definitions, formulae and tables of matched sections are reused; only
+    changed sections are re-extracted. Cross-references are rescanned in
+    changed sections, and in unchanged ones only for reference types whose
+    set of targets changed. The result equals ``build()`` on the new version
+    except that definitions keep the IDs they had in the previous IR.
+
+    Falls back to a full build when there is no usable previous IR or when a
+    formula or table straddles a section boundary.
+    """
+
+    def rebuild(
+        self,
+        conversion_result: ConversionResult,
+        document_id: str,
+        previous: Optional[DocumentIR],
+    ) -> Tuple[DocumentIR, IRDiff]:
+        """
+        Build DocumentIR for ``conversion_result``, reusing ``previous`` where unchanged.
+
+        Args:
+            conversion_result: Conversion of the new version
+            document_id: ID of the document
+            previous: IR of the previous version, if any
+
+        Returns:
+            The new IR and a diff against ``previous``
+        """
+        index = previous.metadata.get(SECTION_INDEX_KEY) if previous is not None else None
+        if index:
+            try:
+                return self._rebuild(conversion_result, document_id, previous, index)
+            except _FullRebuild:
+                pass
+
+        ir = self.build(conversion_result, document_id)
+        diff = _diff(previous, ir, reused=0)
+        diff.full_rebuild = True
+        return ir, diff
+
+    def _rebuild(
+        self,
+        conversion_result: ConversionResult,
+        document_id: str,
+        previous: DocumentIR,
+        index: Dict[str, Any],
+    ) -> Tuple[DocumentIR, IRDiff]:
+        markdown = conversion_result.markdown_content
+        lines = markdown.split("\n")
+        sections = conversion_result.sections
+        regions = section_regions(sections, len(lines))
+        _check_regions_independent(lines, regions)
+
+        preamble, fingerprints = fingerprint_sections(lines, sections, regions)
+        matches = _match_sections(index["sections"], fingerprints)
+        reused_old_ids = {entry["id"]: sections[i].id for i, entry in enumerate(matches) if entry}
+
+        # 1. Classify sections (cheap, and parent links depend on neighbours)
+        ir_sections = self.section_classifier.classify_sections(sections)
+
+        # 2. Definitions: reuse unchanged sections, then merge as build() does
+        definitions, section_terms = self._definitions(ir_sections, matches, previous, reused_old_ids)
+
+        # 3. Formulae and tables, region by region
+        formulae, tables = self._formulae_and_tables(
+            lines, regions, ir_sections, matches, previous,
+            reuse_preamble=index.get("preamble") == preamble,
+        )
+        formulae = self.formula_extractor.resolve_dependencies(formulae, definitions)
+
+        # 4. Cross-references
+        cross_refs = self._cross_references(
+            lines, regions, ir_sections, matches, previous, definitions, formulae, tables
+        )
+
+        ir = DocumentIR(
+            document_id=document_id,
+            title=conversion_result.metadata.title or "Untitled",
+            original_format=conversion_result.metadata.original_format.value,
+            sections=ir_sections,
+            definitions=definitions,
+            formulae=formulae,
+            tables=tables,
+            cross_references=cross_refs,
+            metadata=self._extract_metadata_dict(conversion_result),
+            raw_markdown=markdown,
+        )
+        ir.metadata[SECTION_INDEX_KEY] = {
+            "preamble": preamble,
+            "sections": [
+                {"id": section.id, "fingerprint": fingerprint, "terms": terms}
+                for section, fingerprint, terms in zip(sections, fingerprints, section_terms)
+            ],
+        }
+        ir.validation_issues = self.validator.validate(ir)
+
+        diff = _diff(previous, ir, reused=len(reused_old_ids))
+        return ir, diff
+
+    def _definitions(
+        self,
+        ir_sections: Sequence[IRSection],
+        matches: Sequence[Optional[Dict[str, Any]]],
+        previous: DocumentIR,
+        reused_old_ids: Dict[str, str],
+    ) -> Tuple[List[TermDefinition], List[List[str]]]:
+        """
+        Per-section definitions, merged in document order.
+
+        The previous IR only holds merge winners. An unchanged section's
+        terms that lost the merge are kept as bare names: they still lose,
+        provided the winner's section is unchanged too. Otherwise the
+        section is re-extracted to recover the full definition.
+        """
+        previous_by_term = {d.term.lower(): d for d in previous.definitions}
+        raw: List[List[Union[TermDefinition, str]]] = []
+        section_terms: List[List[str]] = []
+
+        for section, entry in zip(ir_sections, matches):
+            if entry is not None and all(
+                previous_by_term.get(term.lower()) is not None
+                and previous_by_term[term.lower()].section_id in reused_old_ids
+                for term in entry["terms"]
+            ):
+                items: List[Union[TermDefinition, str]] = []
+                for term in entry["terms"]:
+                    winner = previous_by_term[term.lower()]
+                    if winner.section_id == entry["id"]:
+                        items.append(replace(winner, section_id=section.id))
+                    else:
+                        items.append(term)
+                raw.append(items)
+                section_terms.append(list(entry["terms"]))
+                continue
+
+            extracted = self.definition_extractor.extract(section.content, section.id)
+            raw.append([
+                replace(d, id=previous_by_term[d.term.lower()].id)
+                if d.term.lower() in previous_by_term else d
+                for d in extracted
+            ])
+            section_terms.append([d.term for d in extracted])
+
+        # Same outcome as DefinitionExtractor.merge_definitions: first
+        # occurrence fixes the position, the longest definition wins
+        merged: Dict[str, Optional[TermDefinition]] = {}
+        for items in raw:
+            for item in items:
+                if isinstance(item, str):
+                    merged.setdefault(item.lower(), None)
+                    continue
+                key = item.term.lower()
+                existing = merged.get(key)
+                if existing is None or len(item.definition) > len(existing.definition):
+                    merged[key] = item
+
+        if any(d is None for d in merged.values()):
+            raise _FullRebuild()
+        return list(merged.values()), section_terms
+
+    def _formulae_and_tables(
+        self,
+        lines: Sequence[str],
+        regions: Sequence[Tuple[int, int, int]],
+        ir_sections: Sequence[IRSection],
+        matches: Sequence[Optional[Dict[str, Any]]],
+        previous: DocumentIR,
+        reuse_preamble: bool,
+    ) -> Tuple[List[FormulaReference], List[TableData]]:
+        previous_formulae = _group_by_section(previous.formulae)
+        previous_tables = _group_by_section(previous.tables)
+        previous_starts = {s.id: s.start_line for s in previous.sections}
+
+        formulae: List[FormulaReference] = []
+        tables: List[TableData] = []
+        for index, start, end in regions:
+            if index == PREAMBLE:
+                section_id = UNKNOWN_SECTION
+                old_id = UNKNOWN_SECTION if reuse_preamble else None
+                old_start = 1
+            else:
+                section_id = ir_sections[index].id
+                entry = matches[index]
+                old_id = entry["id"] if entry else None
+                old_start = previous_starts.get(old_id)
+
+            if old_id is not None and old_start is not None:
+                shift = start - old_start
+                formulae.extend(
+                    replace(f, section_id=section_id, line_number=f.line_number + shift)
+                    for f in previous_formulae.get(old_id, [])
+                )
+                tables.extend(replace(t, section_id=section_id) for t in previous_tables.get(old_id, []))
+                continue
+
+            section_map = {} if index == PREAMBLE else {1: section_id}
+            region_formulae = self.formula_extractor.extract_from_markdown(
+                "\n".join(lines[start - 1:end]), section_map
+            )
+            formulae.extend(replace(f, line_number=f.line_number + start - 1) for f in region_formulae)
+
+            # Include the lines above the region that table titles are read from
+            context = start if index == PREAMBLE else max(1, start - TABLE_TITLE_LOOKBACK)
+            region_tables = self.table_extractor.extract(
+                "\n".join(lines[context - 1:end]),
+                {} if index == PREAMBLE else {start - context + 1: section_id},
+            )
+            tables.extend(
+                t for t in region_tables if index == PREAMBLE or t.section_id != UNKNOWN_SECTION
+            )
+
+        formulae = [replace(f, id=f"formula-{n}") for n, f in enumerate(formulae, 1)]
+        tables = [replace(t, id=f"table-{n}") for n, t in enumerate(tables, 1)]
+        return formulae, tables
+
+    def _cross_references(
+        self,
+        lines: Sequence[str],
+        regions: Sequence[Tuple[int, int, int]],
+        ir_sections: Sequence[IRSection],
+        matches: Sequence[Optional[Dict[str, Any]]],
+        previous: DocumentIR,
+        definitions: Sequence[TermDefinition],
+        formulae: Sequence[FormulaReference],
+        tables: Sequence[TableData],
+    ) -> List[CrossReference]:
+        """
+        References in document order per pattern, as ReferenceExtractor.extract returns them.
+
+        A reference pattern is rescanned in an unchanged section only when
+        the set of targets of its type changed, since that is the only way a
+        previously unresolved reference can start resolving. Otherwise the
+        section's previous references are re-resolved against the new
+        targets, whose IDs may have shifted.
+        """
+        extractor = self.reference_extractor
+        entity_map = extractor.build_entity_map(ir_sections, definitions, formulae, tables)
+        previous_map = extractor.build_entity_map(
+            previous.sections, previous.definitions, previous.formulae, previous.tables
+        )
+        retargeted = {
+            ref_type for ref_type in entity_map
+            if entity_map[ref_type].keys() != previous_map[ref_type].keys()
+        }
+        all_patterns = range(len(extractor.PATTERNS))
+        rescan_patterns = [
+            n for n, (_, ref_type) in enumerate(extractor.PATTERNS) if ref_type in retargeted
+        ]
+        previous_refs = _group_by_source(previous.cross_references)
+
+        # (pattern index, region order, position in region, source, text, target)
+        found: List[Tuple[int, int, int, str, str, str]] = []
+        for order, (index, start, end) in enumerate(regions):
+            entry = matches[index] if index != PREAMBLE else None
+            patterns = rescan_patterns if entry is not None else all_patterns
+
+            if entry is not None:
+                for position, ref in enumerate(previous_refs.get(entry["id"], [])):
+                    matched = extractor.match_pattern(ref)
+                    if matched is None or matched[0] in rescan_patterns:
+                        continue
+                    target_id = extractor.resolve_target(matched[1], ref.target_type, entity_map)
+                    if target_id:
+                        found.append((matched[0], order, position, ir_sections[index].id,
+                                      ref.reference_text, target_id))
+
+            region_section = ir_sections[index] if index != PREAMBLE else None
+            for pattern, line_number, text, target_id in extractor.scan(
+                "\n".join(lines[start - 1:end]), start, patterns, entity_map
+            ):
+                if region_section is not None and region_section.contains_line(line_number):
+                    source = region_section
+                else:
+                    source = extractor.find_section_by_line(line_number, ir_sections)
+                if source is not None:
+                    found.append((pattern, order, line_number, source.id, text, target_id))
+
+        found.sort(key=lambda item: item[:3])
+        return [
+            CrossReference(
+                id=f"ref-{n}",
+                source_id=source_id,
+                source_type="section",
+                target_id=target_id,
+                target_type=extractor.PATTERNS[pattern][1],
+                reference_text=text,
+                resolved=True,
+            )
+            for n, (pattern, _, _, source_id, text, target_id) in enumerate(found, 1)
+        ]
+
+
+def _check_regions_independent(lines: Sequence[str], regions: Sequence[Tuple[int, int, int]]) -> None:
+    """Require every display formula and table to lie within one region."""
+    for _, start, end in regions:
+        if "\n".join(lines[start - 1:end]).count("$$") % 2:
+            raise _FullRebuild()
+        if start > 1 and "|" in lines[start - 1] and "|" in lines[start - 2]:
+            raise _FullRebuild()
+
+
+def _match_sections(
+    previous_entries: Sequence[Dict[str, Any]], fingerprints: Sequence[str]
+) -> List[Optional[Dict[str, Any]]]:
+    """Pair each new section with an unused previous section of equal fingerprint."""
+    by_fingerprint: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+    for entry in previous_entries:
+        by_fingerprint[entry["fingerprint"]].append(entry)
+    return [
+        by_fingerprint[fp].popleft() if by_fingerprint.get(fp) else None
+        for fp in fingerprints
+    ]
+
+
+def _group_by_section(items) -> Dict[str, list]:
+    groups: Dict[str, list] = defaultdict(list)
+    for item in items:
+        groups[item.section_id].append(item)
+    return groups
+
+
+def _group_by_source(references: Sequence[CrossReference]) -> Dict[str, List[CrossReference]]:
+    groups: Dict[str, List[CrossReference]] = defaultdict(list)
+    for ref in references:
+        groups[ref.source_id].append(ref)
+    return groups
+
+
+def _diff(previous: Optional[DocumentIR], current: DocumentIR, reused: int) -> IRDiff:
+    if previous is None:
+        return IRDiff(
+            sections_added=[s.id for s in current.sections],
+            definitions_added=[d.term for d in current.definitions],
+            formulae_added=len(current.formulae),
+            tables_added=len(current.tables),
+            cross_references_added=len(current.cross_references),
+        )
+
+    # Sections: unchanged ones are matched by fingerprint, the rest by title
+    old_index = previous.metadata.get(SECTION_INDEX_KEY) or {}
+    new_index = current.metadata.get(SECTION_INDEX_KEY) or {}
+    matches = _match_sections(
+        old_index.get("sections", []),
+        [entry["fingerprint"] for entry in new_index.get("sections", [])],
+    ) if old_index else [None] * len(current.sections)
+    matched_old = {entry["id"] for entry in matches if entry}
+    unmatched_old: Dict[str, Deque[str]] = defaultdict(deque)
+    for section in previous.sections:
+        if section.id not in matched_old:
+            unmatched_old[section.title].append(section.id)
+
+    diff = IRDiff(sections_reused=reused)
+    for section, entry in zip(current.sections, matches):
+        if entry is not None:
+            continue
+        if unmatched_old.get(section.title):
+            unmatched_old[section.title].popleft()
+            diff.sections_changed.append(section.id)
+        else:
+            diff.sections_added.append(section.id)
+    diff.sections_removed = [sid for ids in unmatched_old.values() for sid in ids]
+
+    old_defs = {d.term.lower(): d for d in previous.definitions}
+    new_defs = {d.term.lower(): d for d in current.definitions}
+    diff.definitions_added = [d.term for k, d in new_defs.items() if k not in old_defs]
+    diff.definitions_removed = [d.term for k, d in old_defs.items() if k not in new_defs]
+    diff.definitions_changed = [
+        d.term for k, d in new_defs.items()
+        if k in old_defs and (d.definition, d.aliases) != (old_defs[k].definition, old_defs[k].aliases)
+    ]
+
+    diff.formulae_added, diff.formulae_removed = _count_changes(
+        [f.latex for f in previous.formulae], [f.latex for f in current.formulae]
+    )
+    diff.tables_added, diff.tables_removed = _count_changes(
+        [_table_key(t) for t in previous.tables], [_table_key(t) for t in current.tables]
+    )
+    diff.cross_references_added, diff.cross_references_removed = _count_changes(
+        [(r.reference_text, r.target_type) for r in previous.cross_references],
+        [(r.reference_text, r.target_type) for r in current.cross_references],
+    )
+    return diff
+
+
+def _table_key(table: TableData) -> tuple:
+    return table.title, tuple(table.headers), tuple(tuple(row) for row in table.rows)
+
+
+def _count_changes(before: list, after: list) -> Tuple[int, int]:
+    old, new = Counter(before), Counter(after)
+    return sum((new - old).values()), sum((old - new).values())
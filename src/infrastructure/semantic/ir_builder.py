@@ -1,8 +1,9 @@
 """IR Builder to orchestrate semantic extraction."""
 
-from typing import Dict, List
+import hashlib
+from typing import Dict, List, Sequence, Tuple
 
-from src.infrastructure.converters.base import ConversionResult
+from src.infrastructure.converters.base import ConversionResult, DocumentSection
 from src.domain.value_objects.semantic_ir import DocumentIR
 
 from .definition_extractor import DefinitionExtractor
@@ -12,6 +13,77 @@ from .reference_extractor import ReferenceExtractor
 from .section_classifier import SectionClassifier
 from .ir_validator import IRValidator
 
+# Metadata key recording each section's fingerprint and extracted terms,
+# which lets IncrementalIRBuilder reuse a previous build
+SECTION_INDEX_KEY = "section_index"
+
+# Lines TableExtractor looks back from a table for its title
+TABLE_TITLE_LOOKBACK = 3
+
+PREAMBLE = -1
+
+
+def section_regions(
+    sections: Sequence[DocumentSection], line_count: int
+) -> List[Tuple[int, int, int]]:
+    """
+    Split the document into the line ranges extraction attributes to one section.
+
+    A line belongs to the section with the latest ``start_line`` at or before
+    it, matching how formulae and tables are assigned to sections. Lines
+    before the first section form the preamble.
+
+    Args:
+        sections: Converted sections
+        line_count: Number of lines in the markdown
+
+    Returns:
+        (section index or PREAMBLE, first line, last line) in document order
+    """
+    starts: Dict[int, int] = {}
+    for index, section in enumerate(sections):
+        if section.start_line is not None:
+            starts[section.start_line] = index
+
+    ordered = sorted(starts.items())
+    first_start = ordered[0][0] if ordered else line_count + 1
+    regions = []
+    if first_start > 1:
+        regions.append((PREAMBLE, 1, min(first_start - 1, line_count)))
+    for n, (start, index) in enumerate(ordered):
+        end = ordered[n + 1][0] - 1 if n + 1 < len(ordered) else line_count
+        regions.append((index, start, max(start, end)))
+    return regions
+
+
+def fingerprint_sections(
+    lines: Sequence[str],
+    sections: Sequence[DocumentSection],
+    regions: Sequence[Tuple[int, int, int]],
+) -> Tuple[str, List[str]]:
+    """
+    Hash everything extraction reads for each section.
+
+    Covers the title, level, content and the section's region of the
+    markdown, including the lines above it that table titles are read from.
+
+    Returns:
+        (preamble fingerprint, fingerprint per section in ``sections`` order)
+    """
+    def digest(*parts: str) -> str:
+        return hashlib.sha256("\x00".join(parts).encode()).hexdigest()
+
+    region_text: Dict[int, str] = {}
+    for index, start, end in regions:
+        context = start if index == PREAMBLE else max(1, start - TABLE_TITLE_LOOKBACK)
+        region_text[index] = "\n".join(lines[context - 1:end])
+
+    preamble = digest(region_text.get(PREAMBLE, ""))
+    return preamble, [
+        digest(section.title, str(section.level), section.content, region_text.get(index, ""))
+        for index, section in enumerate(sections)
+    ]
+
 
 class IRBuilder:
     """Orchestrates semantic extraction into DocumentIR."""
@@ -44,9 +116,11 @@ class IRBuilder:
 
         # 3. Extract definitions from each section
         definitions = []
+        section_terms = []
         for section in ir_sections:
             section_defs = self.definition_extractor.extract(section.content, section.id)
             definitions.extend(section_defs)
+            section_terms.append([d.term for d in section_defs])
 
         # Merge duplicate definitions
         definitions = self.definition_extractor.merge_definitions(definitions)
@@ -82,12 +156,39 @@ class IRBuilder:
             metadata=self._extract_metadata_dict(conversion_result),
             raw_markdown=conversion_result.markdown_content,
         )
+        ir.metadata[SECTION_INDEX_KEY] = self._section_index(conversion_result, section_terms)
 
         # 9. Run validation
         ir.validation_issues = self.validator.validate(ir)
 
         return ir
 
+    def _section_index(
+        self, conversion_result: ConversionResult, section_terms: List[List[str]]
+    ) -> Dict:
+        """
+        Record what an incremental rebuild needs to reuse this build.
+
+        Args:
+            conversion_result: Conversion result the IR was built from
+            section_terms: Terms extracted from each section, before merging
+
+        Returns:
+            Preamble fingerprint and, per section, its ID, fingerprint and terms
+        """
+        lines = conversion_result.markdown_content.split("\n")
+        sections = conversion_result.sections
+        preamble, fingerprints = fingerprint_sections(
+            lines, sections, section_regions(sections, len(lines))
+        )
+        return {
+            "preamble": preamble,
+            "sections": [
+                {"id": section.id, "fingerprint": fingerprint, "terms": terms}
+                for section, fingerprint, terms in zip(sections, fingerprints, section_terms)
+            ],
+        }
+
     def _build_section_map(self, sections: List) -> Dict[int, str]:
         """
         Build a map from line numbers to section IDs.
@@ -0,0 +1,461 @@
+"""Persistence for semantic IR as one row per definition, formula, table and reference.
+
+Storing the IR normalised lets the API return just the fields a client
+asks for (``?include=definitions&term=...``), page through long lists in
+SQL and search definitions across every document through indexes on the
+lowercased term and formula name. Section bodies and the markdown are not
+stored; they are sliced from the document content on demand (see
+``DocumentIR.from_dict``).
+"""
+import itertools
+import json
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+import asyncpg
+
+from src.domain.value_objects.semantic_ir import DocumentIR, TermDefinition
+from src.domain.value_objects.semantic_ir.lazy_content import ContentLoader
+
+logger = logging.getLogger(__name__)
+
+# IR list fields that can be selected and paged
+IR_LIST_FIELDS = ("sections", "definitions", "formulae", "tables", "cross_references", "validation_issues")
+
+# (kerberos_id, groups) of the user a search runs for; None searches every document
+Viewer = Optional[Tuple[str, Set[str]]]
+
+
+@dataclass(frozen=True)
+class DefinitionSearchHit:
+    document_id: str
+    document_title: str
+    definition: TermDefinition
+
+
+def validate_include(include: Sequence[str]) -> List[str]:
+    """
+    Check requested field names.
+
+    Raises:
+        ValueError: If a field is not a selectable IR list field
+    """
+    unknown = [name for name in include if name not in IR_LIST_FIELDS]
+    if unknown:
+        raise ValueError(
+            f"Unknown semantic IR field(s): {', '.join(unknown)}. "
+            f"Choose from: {', '.join(IR_LIST_FIELDS)}"
+        )
+    return list(dict.fromkeys(include))
+
+
+def _to_json(value: Any) -> str:
+    # SectionType and friends serialise through __str__
+    return json.dumps(value, default=str)
+
+
+def _matches_prefix(term: str, prefix: str) -> bool:
+    return term.lower().startswith(prefix)
+
+
+class SemanticIRStore(ABC):
+    """Stores DocumentIR and serves partial reads of it."""
+
+    @abstractmethod
+    async def save(self, ir: DocumentIR) -> None:
+        """Replace the stored IR for ``ir.document_id``."""
+        pass
+
+    @abstractmethod
+    async def load(
+        self, document_id: str, markdown_loader: Optional[ContentLoader] = None
+    ) -> Optional[DocumentIR]:
+        """Load the full IR; section bodies and markdown come from ``markdown_loader``."""
+        pass
+
+    @abstractmethod
+    async def version(self, document_id: str) -> Optional[str]:
+        """Marker that changes whenever the IR is saved; None if no IR is stored."""
+        pass
+
+    @abstractmethod
+    async def fetch(
+        self,
+        document_id: str,
+        include: Sequence[str],
+        term: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return selected IR fields for one document.
+
+        ``term`` narrows definitions to those whose term starts with it or
+        has it as an alias, and formulae to those whose name starts with it.
+        Each list is paged by ``limit``/``offset``; ``totals`` holds the
+        unpaged counts.
+
+        Returns:
+            Dictionary with document_id, title, original_format, the
+            requested fields and totals; None if no IR is stored
+        """
+        pass
+
+    @abstractmethod
+    async def search_definitions(
+        self,
+        term: str,
+        viewer: Viewer = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[DefinitionSearchHit]:
+        """Find definitions in any document the viewer may see, exact matches first."""
+        pass
+
+
+class InMemorySemanticIRStore(SemanticIRStore):
+    """Single-process store for tests and running without a database.
+
+    Has no document ACL to consult, so ``viewer`` is ignored by searches.
+    """
+
+    def __init__(self):
+        self._irs: Dict[str, DocumentIR] = {}
+        self._versions: Dict[str, str] = {}
+        self._saves = itertools.count(1)
+
+    async def save(self, ir: DocumentIR) -> None:
+        self._irs[ir.document_id] = DocumentIR.from_dict(ir.to_dict())
+        self._versions[ir.document_id] = str(next(self._saves))
+
+    async def version(self, document_id: str) -> Optional[str]:
+        return self._versions.get(document_id)
+
+    async def load(
+        self, document_id: str, markdown_loader: Optional[ContentLoader] = None
+    ) -> Optional[DocumentIR]:
+        ir = self._irs.get(document_id)
+        if ir is None:
+            return None
+        return DocumentIR.from_dict(ir.to_dict(include_content=False), markdown_loader=markdown_loader)
+
+    async def fetch(
+        self,
+        document_id: str,
+        include: Sequence[str],
+        term: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Optional[Dict[str, Any]]:
+        include = validate_include(include)
+        ir = self._irs.get(document_id)
+        if ir is None:
+            return None
+
+        prefix = term.lower().strip() if term else None
+        items: Dict[str, List[Dict[str, Any]]] = {
+            "sections": [s.to_dict(include_content=False) for s in ir.sections],
+            "definitions": [
+                d.to_dict() for d in ir.definitions
+                if prefix is None or _matches_prefix(d.term, prefix)
+                or prefix in (a.lower() for a in d.aliases)
+            ],
+            "formulae": [
+                asdict(f) for f in ir.formulae
+                if prefix is None or (f.name and _matches_prefix(f.name, prefix))
+            ],
+            "tables": [asdict(t) for t in ir.tables],
+            "cross_references": [asdict(c) for c in ir.cross_references],
+            "validation_issues": [asdict(v) for v in ir.validation_issues],
+        }
+
+        result: Dict[str, Any] = {
+            "document_id": ir.document_id,
+            "title": ir.title,
+            "original_format": ir.original_format,
+            "totals": {},
+            "limit": limit,
+            "offset": offset,
+        }
+        for name in include:
+            result[name] = items[name][offset:offset + limit]
+            result["totals"][name] = len(items[name])
+        return result
+
+    async def search_definitions(
+        self,
+        term: str,
+        viewer: Viewer = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[DefinitionSearchHit]:
+        prefix = term.lower().strip()
+        hits = [
+            DefinitionSearchHit(document_id=ir.document_id, document_title=ir.title, definition=d)
+            for ir in self._irs.values()
+            for d in ir.definitions
+            if _matches_prefix(d.term, prefix) or prefix in (a.lower() for a in d.aliases)
+        ]
+        hits.sort(key=lambda h: (
+            h.definition.term.lower() != prefix, len(h.definition.term), h.definition.term, h.document_id
+        ))
+        return hits[offset:offset + limit]
+
+
+class PostgresSemanticIRStore(SemanticIRStore):
+    """Normalised IR tables from migration 021."""
+
+    # IR field -> table holding one row per element, full element in ``data``
+    _CHILD_TABLES = {
+        "definitions": "semantic_ir_definitions",
+        "formulae": "semantic_ir_formulae",
+        "tables": "semantic_ir_tables",
+        "cross_references": "semantic_ir_cross_references",
+    }
+
+    def __init__(self, pool: asyncpg.Pool):
+        self._pool = pool
+
+    async def save(self, ir: DocumentIR) -> None:
+        document_id = UUID(ir.document_id)
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    """
+                    INSERT INTO semantic_ir_documents
+                    (document_id, title, original_format, sections, metadata, validation_issues, updated_at)
+                    VALUES ($1, $2, $3, $4, $5, $6, NOW())
+                    ON CONFLICT (document_id) DO UPDATE SET
+                        title = EXCLUDED.title,
+                        original_format = EXCLUDED.original_format,
+                        sections = EXCLUDED.sections,
+                        metadata = EXCLUDED.metadata,
+                        validation_issues = EXCLUDED.validation_issues,
+                        updated_at = NOW()
+                    """,
+                    document_id,
+                    ir.title,
+                    ir.original_format,
+                    _to_json([s.to_dict(include_content=False) for s in ir.sections]),
+                    _to_json(ir.metadata),
+                    _to_json([asdict(v) for v in ir.validation_issues]),
+                )
+                for table in self._CHILD_TABLES.values():
+                    await conn.execute(f"DELETE FROM {table} WHERE document_id = $1", document_id)
+
+                await conn.executemany(
+                    """
+                    INSERT INTO semantic_ir_definitions
+                    (document_id, position, id, term, aliases_lower, section_id, data)
+                    VALUES ($1, $2, $3, $4, $5, $6, $7)
+                    """,
+                    [
+                        (document_id, n, d.id, d.term, [a.lower() for a in d.aliases],
+                         d.section_id, _to_json(d.to_dict()))
+                        for n, d in enumerate(ir.definitions)
+                    ],
+                )
+                await conn.executemany(
+                    """
+                    INSERT INTO semantic_ir_formulae
+                    (document_id, position, id, name, section_id, data)
+                    VALUES ($1, $2, $3, $4, $5, $6)
+                    """,
+                    [
+                        (document_id, n, f.id, f.name, f.section_id, _to_json(asdict(f)))
+                        for n, f in enumerate(ir.formulae)
+                    ],
+                )
+                await conn.executemany(
+                    """
+                    INSERT INTO semantic_ir_tables
+                    (document_id, position, id, title, section_id, data)
+                    VALUES ($1, $2, $3, $4, $5, $6)
+                    """,
+                    [
+                        (document_id, n, t.id, t.title, t.section_id, _to_json(asdict(t)))
+                        for n, t in enumerate(ir.tables)
+                    ],
+                )
+                await conn.executemany(
+                    """
+                    INSERT INTO semantic_ir_cross_references
+                    (document_id, position, id, source_id, target_id, resolved, data)
+                    VALUES ($1, $2, $3, $4, $5, $6, $7)
+                    """,
+                    [
+                        (document_id, n, c.id, c.source_id, c.target_id, c.resolved, _to_json(asdict(c)))
+                        for n, c in enumerate(ir.cross_references)
+                    ],
+                )
+
+    async def _fetch_header(self, conn, document_id: UUID) -> Optional[asyncpg.Record]:
+        return await conn.fetchrow(
+            """
+            SELECT document_id, title, original_format, sections, metadata, validation_issues
+            FROM semantic_ir_documents
+            WHERE document_id = $1
+            """,
+            document_id,
+        )
+
+    async def version(self, document_id: str) -> Optional[str]:
+        async with self._pool.acquire() as conn:
+            updated_at = await conn.fetchval(
+                "SELECT updated_at FROM semantic_ir_documents WHERE document_id = $1",
+                UUID(document_id),
+            )
+        return updated_at.isoformat() if updated_at else None
+
+    async def load(
+        self, document_id: str, markdown_loader: Optional[ContentLoader] = None
+    ) -> Optional[DocumentIR]:
+        doc_uuid = UUID(document_id)
+        async with self._pool.acquire() as conn:
+            header = await self._fetch_header(conn, doc_uuid)
+            if header is None:
+                return None
+            children = {}
+            for field_name, table in self._CHILD_TABLES.items():
+                rows = await conn.fetch(
+                    f"SELECT data FROM {table} WHERE document_id = $1 ORDER BY position",
+                    doc_uuid,
+                )
+                children[field_name] = [json.loads(row["data"]) for row in rows]
+
+        return DocumentIR.from_dict(
+            {
+                "document_id": document_id,
+                "title": header["title"],
+                "original_format": header["original_format"],
+                "sections": json.loads(header["sections"]),
+                "metadata": json.loads(header["metadata"]),
+                "validation_issues": json.loads(header["validation_issues"]),
+                **children,
+            },
+            markdown_loader=markdown_loader or (lambda: ""),
+        )
+
+    async def fetch(
+        self,
+        document_id: str,
+        include: Sequence[str],
+        term: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Optional[Dict[str, Any]]:
+        include = validate_include(include)
+        doc_uuid = UUID(document_id)
+        prefix = term.lower().strip() if term else None
+
+        async with self._pool.acquire() as conn:
+            header = await self._fetch_header(conn, doc_uuid)
+            if header is None:
+                return None
+
+            result: Dict[str, Any] = {
+                "document_id": document_id,
+                "title": header["title"],
+                "original_format": header["original_format"],
+                "totals": {},
+                "limit": limit,
+                "offset": offset,
+            }
+            for name in include:
+                if name in self._CHILD_TABLES:
+                    items, total = await self._fetch_children(conn, name, doc_uuid, prefix, limit, offset)
+                else:
+                    all_items = json.loads(header[name])
+                    items, total = all_items[offset:offset + limit], len(all_items)
+                result[name] = items
+                result["totals"][name] = total
+
+        return result
+
+    async def _fetch_children(
+        self,
+        conn,
+        name: str,
+        document_id: UUID,
+        prefix: Optional[str],
+        limit: int,
+        offset: int,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        where = "document_id = $1"
+        params: List[Any] = [document_id]
+        if prefix is not None and name == "definitions":
+            params.extend([like_prefix(prefix), prefix])
+            where += " AND (lower(term) LIKE $2 OR aliases_lower @> ARRAY[$3]::TEXT[])"
+        elif prefix is not None and name == "formulae":
+            params.append(like_prefix(prefix))
+            where += " AND lower(name) LIKE $2"
+
+        table = self._CHILD_TABLES[name]
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM {table} WHERE {where}", *params)
+        rows = await conn.fetch(
+            f"""
+            SELECT data FROM {table}
+            WHERE {where}
+            ORDER BY position
+            LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
+            """,
+            *params, limit, offset,
+        )
+        return [json.loads(row["data"]) for row in rows], total
+
+    async def search_definitions(
+        self,
+        term: str,
+        viewer: Viewer = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[DefinitionSearchHit]:
+        prefix = term.lower().strip()
+        params: List[Any] = [like_prefix(prefix), prefix]
+        acl = ""
+        if viewer is not None:
+            kerberos_id, groups = viewer
+            params.extend([kerberos_id, list(groups)])
+            # Mirrors DocumentAccess.can_view
+            acl = """
+                AND EXISTS (
+                    SELECT 1 FROM document_acl_views a
+                    WHERE a.document_id = d.document_id
+                      AND (a.owner_kerberos_id = $3
+                           OR a.visibility IN ('organization', 'public')
+                           OR (a.visibility = 'group' AND a.shared_with_groups && $4::TEXT[]))
+                )
+            """
+        params.extend([limit, offset])
+
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT d.document_id, s.title, d.data
+                FROM semantic_ir_definitions d
+                JOIN semantic_ir_documents s ON s.document_id = d.document_id
+                WHERE (lower(d.term) LIKE $1 OR d.aliases_lower @> ARRAY[$2]::TEXT[])
+                {acl}
+                ORDER BY lower(d.term) = $2 DESC, length(d.term), d.term, d.document_id
+                LIMIT ${len(params) - 1} OFFSET ${len(params)}
+                """,
+                *params,
+            )
+
+        return [
+            DefinitionSearchHit(
+                document_id=str(row["document_id"]),
+                document_title=row["title"],
+                definition=TermDefinition.from_dict(json.loads(row["data"])),
+            )
+            for row in rows
+        ]
+
+
+def like_prefix(prefix: str) -> str:
+    """LIKE pattern matching strings that start with ``prefix``, wildcards escaped."""
+    escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return escaped + "%"
@@ -1,9 +1,10 @@
 """Validation service for semantic IR."""
 
 import uuid
-from typing import List, Set, Dict
+from typing import List
 from collections import defaultdict
 
+from src.domain.services.lineage_graph import FORMULA
 from src.domain.value_objects.semantic_ir import (
     DocumentIR,
     ValidationIssue,
@@ -74,8 +75,10 @@ class IRValidator:
                 defined_terms.add(formula.name.lower())
 
         # Check each formula for undefined variables
+        # defined_terms is already lowercase; get_undefined_variables would
+        # re-lower the whole set for every formula
         for formula in ir.formulae:
-            undefined = formula.get_undefined_variables(defined_terms)
+            undefined = [v for v in formula.variables if v.lower() not in defined_terms]
 
             if undefined:
                 issue = ValidationIssue(
@@ -92,15 +95,12 @@ class IRValidator:
         return issues
 
     def _check_circular_dependencies(self, ir: DocumentIR) -> List[ValidationIssue]:
-        """Check for circular dependencies in formulas."""
+        """Check for formulas that are in, or depend on, a cycle of formulas."""
         issues = []
+        graph = ir.lineage_graph()
 
-        # Build dependency graph
-        graph = {f.id: f.dependencies for f in ir.formulae}
-
-        # Check each formula for circular dependencies using DFS
         for formula in ir.formulae:
-            if self._has_circular_dependency(formula.id, graph, set()):
+            if graph.reaches_cycle(formula.id, kind=FORMULA):
                 issue = ValidationIssue(
                     id=f"val-{str(uuid.uuid4())[:8]}",
                     issue_type=ValidationType.CIRCULAR_DEPENDENCY,
@@ -114,43 +114,6 @@ class IRValidator:
 
         return issues
 
-    def _has_circular_dependency(
-        self, node: str, graph: Dict[str, List[str]], visited: Set[str], path: Set[str] = None
-    ) -> bool:
-        """
-        Check if a node has circular dependencies using DFS.
-
-        Args:
-            node: Current node to check
-            graph: Dependency graph
-            visited: Set of visited nodes
-            path: Current path being explored
-
-        Returns:
-            True if circular dependency found
-        """
-        if path is None:
-            path = set()
-
-        if node in path:
-            return True  # Circular dependency detected
-
-        if node in visited:
-            return False  # Already checked this node
-
-        visited.add(node)
-        path.add(node)
-
-        # Check dependencies
-        if node in graph:
-            for dep in graph[node]:
-                if dep in graph:  # Only check formula dependencies
-                    if self._has_circular_dependency(dep, graph, visited, path):
-                        return True
-
-        path.remove(node)
-        return False
-
     def _check_unresolved_references(self, ir: DocumentIR) -> List[ValidationIssue]:
         """Check for unresolved cross-references."""
         issues = []
@@ -0,0 +1,59 @@
+"""In-process cache of lineage graphs keyed by the stored IR version."""
+
+from collections import OrderedDict
+from typing import Awaitable, Callable, Tuple
+
+from src.domain.services.lineage_graph import LineageGraph
+from src.domain.value_objects.semantic_ir import DocumentIR
+from src.infrastructure.semantic.ir_store import SemanticIRStore
+
+
+class LineageGraphCache:
+    """LRU of LineageGraph per document, checked against ``SemanticIRStore.version``.
+
+    A hit costs one version lookup; the IR is only loaded and the graph only
+    rebuilt after the stored IR changes.
+    """
+
+    def __init__(self, ir_store: SemanticIRStore, max_entries: int = 256):
+        self._ir_store = ir_store
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, LineageGraph]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    async def get(
+        self, document_id: str, load_ir: Callable[[], Awaitable[DocumentIR]]
+    ) -> LineageGraph:
+        """
+        Return the graph for a document's current IR.
+
+        Args:
+            document_id: Document ID
+            load_ir: Loads the IR (storing it first if needed) on a miss
+
+        Returns:
+            LineageGraph for the stored IR
+        """
+        version = await self._ir_store.version(document_id)
+        entry = self._entries.get(document_id)
+        if entry is not None and version is not None and entry[0] == version:
+            self._entries.move_to_end(document_id)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        graph = (await load_ir()).lineage_graph()
+        version = await self._ir_store.version(document_id)
+        if version is not None:
+            self._entries[document_id] = (version, graph)
+            self._entries.move_to_end(document_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return graph
+
+    def invalidate(self, document_id: str) -> None:
+        self._entries.pop(document_id, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
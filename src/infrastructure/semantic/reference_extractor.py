@@ -1,8 +1,7 @@
 """Cross-reference extraction from document content."""
 
 import re
-import uuid
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 from src.domain.value_objects.semantic_ir import (
     CrossReference,
@@ -16,6 +15,16 @@ from src.domain.value_objects.semantic_ir import (
 class ReferenceExtractor:
     """Extract cross-references from document content."""
 
+    # (pattern, target type); references are numbered pattern by pattern
+    # Pattern: "see Section X", "as defined in Y", "Table Z shows", etc.
+    PATTERNS = [
+        (r'(?:see|refer to|as in)\s+(Section\s+\d+(?:\.\d+)*)', 'section'),
+        (r'(?:Table|table)\s+(\d+(?:\.\d+)*)', 'table'),
+        (r'(?:Formula|formula|equation)\s+(\d+)', 'formula'),
+        (r'as\s+defined\s+in\s+"([^"]+)"', 'definition'),
+        (r'(?:Annex|Appendix)\s+([A-Z])', 'section'),
+    ]
+
     def extract(
         self,
         markdown: str,
@@ -41,32 +50,23 @@ class ReferenceExtractor:
         ref_counter = 1
 
         # Build entity maps
-        entity_map = self._build_entity_map(sections, definitions, formulae, tables)
+        entity_map = self.build_entity_map(sections, definitions, formulae, tables)
 
         # Find references in text
-        # Pattern: "see Section X", "as defined in Y", "Table Z shows", etc.
-        patterns = [
-            (r'(?:see|refer to|as in)\s+(Section\s+\d+(?:\.\d+)*)', 'section'),
-            (r'(?:Table|table)\s+(\d+(?:\.\d+)*)', 'table'),
-            (r'(?:Formula|formula|equation)\s+(\d+)', 'formula'),
-            (r'as\s+defined\s+in\s+"([^"]+)"', 'definition'),
-            (r'(?:Annex|Appendix)\s+([A-Z])', 'section'),
-        ]
-
-        for pattern, ref_type in patterns:
+        for pattern, ref_type in self.PATTERNS:
             for match in re.finditer(pattern, markdown, re.IGNORECASE):
                 reference_text = match.group(0)
                 target_identifier = match.group(1)
 
                 # Try to resolve the target
-                target_id = self._resolve_target(
+                target_id = self.resolve_target(
                     target_identifier, ref_type, entity_map
                 )
 
                 if target_id:
                     # Find source context (which section contains this reference)
                     line_number = markdown[: match.start()].count('\n') + 1
-                    source_section = self._find_section_by_line(line_number, sections)
+                    source_section = self.find_section_by_line(line_number, sections)
 
                     if source_section:
                         ref_id = f"ref-{ref_counter}"
@@ -85,7 +85,46 @@ class ReferenceExtractor:
 
         return references
 
-    def _build_entity_map(
+    def scan(
+        self,
+        text: str,
+        first_line: int,
+        pattern_indexes: Iterable[int],
+        entity_map: Dict[str, Dict[str, Any]],
+    ) -> Iterator[Tuple[int, int, str, str]]:
+        """
+        Find resolvable references in an excerpt of the document.
+
+        Args:
+            text: Excerpt of the markdown
+            first_line: Document line number of the excerpt's first line
+            pattern_indexes: Indexes into ``PATTERNS`` to search for
+            entity_map: Targets from ``build_entity_map``
+
+        Yields:
+            (pattern index, line number, reference text, target ID) per match
+        """
+        for index in pattern_indexes:
+            pattern, ref_type = self.PATTERNS[index]
+            line_number, scanned_to = first_line, 0
+            for match in re.finditer(pattern, text, re.IGNORECASE):
+                target_id = self.resolve_target(match.group(1), ref_type, entity_map)
+                if target_id:
+                    line_number += text.count('\n', scanned_to, match.start())
+                    scanned_to = match.start()
+                    yield index, line_number, match.group(0), target_id
+
+    def match_pattern(self, reference: CrossReference) -> Tuple[int, str] | None:
+        """(pattern index, target identifier) of an extracted reference, or None."""
+        for index, (pattern, ref_type) in enumerate(self.PATTERNS):
+            if ref_type != reference.target_type:
+                continue
+            match = re.fullmatch(pattern, reference.reference_text, re.IGNORECASE)
+            if match:
+                return index, match.group(1)
+        return None
+
+    def build_entity_map(
         self,
         sections: List[IRSection],
         definitions: List[TermDefinition],
@@ -123,7 +162,7 @@ class ReferenceExtractor:
 
         return entity_map
 
-    def _resolve_target(
+    def resolve_target(
         self, identifier: str, ref_type: str, entity_map: Dict[str, Dict[str, Any]]
     ) -> str | None:
         """Resolve a reference identifier to an entity ID."""
@@ -143,7 +182,7 @@ class ReferenceExtractor:
 
         return None
 
-    def _find_section_by_line(
+    def find_section_by_line(
         self, line_number: int, sections: List[IRSection]
     ) -> IRSection | None:
         """Find which section contains a given line number."""
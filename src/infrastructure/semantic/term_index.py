@@ -0,0 +1,261 @@
+"""Cross-document inverted index of defined terms, aliases and formula variables.
+
+Answers "which documents define or use this term" without loading any IR:
+one row per (document, term, kind, source) kept current by
+``TermIndexProjection``. Search ranks exact matches above prefix matches
+above fuzzy (trigram) matches, then by trigram similarity, and within a tie
+definitions above aliases above formula variables.
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+import asyncpg
+
+from src.domain.value_objects.semantic_ir import DocumentIR
+from src.infrastructure.semantic.ir_store import Viewer, like_prefix
+
+DEFINITION = "definition"
+ALIAS = "alias"
+VARIABLE = "variable"
+
+# Tie-break order within a match tier
+KIND_RANK = {DEFINITION: 0, ALIAS: 1, VARIABLE: 2}
+
+# Matches pg_trgm's default similarity_threshold
+FUZZY_THRESHOLD = 0.3
+
+# Match tiers, best first
+EXACT, PREFIX, FUZZY = 0, 1, 2
+
+
+@dataclass(frozen=True)
+class TermIndexEntry:
+    term: str
+    kind: str
+    source_id: str
+    section_id: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class TermIndexHit:
+    document_id: str
+    document_title: str
+    term: str
+    kind: str
+    source_id: str
+    section_id: Optional[str]
+    score: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "document_id": self.document_id,
+            "document_title": self.document_title,
+            "term": self.term,
+            "kind": self.kind,
+            "source_id": self.source_id,
+            "section_id": self.section_id,
+            "score": round(self.score, 4),
+        }
+
+
+def term_entries(ir: DocumentIR) -> List[TermIndexEntry]:
+    """Index entries for an IR: definition terms, their aliases and formula variables."""
+    entries: Dict[Tuple[str, str, str], TermIndexEntry] = {}
+
+    def add(term: str, kind: str, source_id: str, section_id: Optional[str]) -> None:
+        term = term.strip()
+        if term:
+            entries.setdefault((term.lower(), kind, source_id), TermIndexEntry(term, kind, source_id, section_id))
+
+    for definition in ir.definitions:
+        add(definition.term, DEFINITION, definition.id, definition.section_id)
+        for alias in definition.aliases:
+            add(alias, ALIAS, definition.id, definition.section_id)
+    for formula in ir.formulae:
+        for variable in formula.variables:
+            add(variable, VARIABLE, formula.id, formula.section_id)
+    return list(entries.values())
+
+
+def trigrams(text: str) -> Set[str]:
+    """Trigrams of each word padded as pg_trgm does ("  w", " wo", ..., "rd ")."""
+    grams: Set[str] = set()
+    for word in "".join(c if c.isalnum() else " " for c in text.lower()).split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def similarity(a: str, b: str) -> float:
+    """Share of trigrams in common, as ``pg_trgm.similarity``."""
+    left, right = trigrams(a), trigrams(b)
+    if not left or not right:
+        return 0.0
+    return len(left & right) / len(left | right)
+
+
+class TermIndex(ABC):
+    """Inverted index from terms to the documents that define or use them."""
+
+    @abstractmethod
+    async def replace_document(self, ir: DocumentIR) -> None:
+        """Replace every entry of ``ir.document_id`` with the entries of ``ir``."""
+        pass
+
+    @abstractmethod
+    async def remove_document(self, document_id: str) -> None:
+        pass
+
+    @abstractmethod
+    async def search(
+        self,
+        query: str,
+        viewer: Viewer = None,
+        fuzzy: bool = True,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[TermIndexHit]:
+        """
+        Find entries matching ``query`` in documents the viewer may see.
+
+        Exact matches come first, then prefix matches, then (with ``fuzzy``)
+        terms whose trigram similarity to the query is at least
+        ``FUZZY_THRESHOLD``.
+        """
+        pass
+
+
+class InMemoryTermIndex(TermIndex):
+    """Single-process index for tests and running without a database.
+
+    Has no document ACL to consult, so ``viewer`` is ignored by searches.
+    """
+
+    def __init__(self):
+        self._documents: Dict[str, Tuple[str, List[TermIndexEntry]]] = {}
+
+    async def replace_document(self, ir: DocumentIR) -> None:
+        self._documents[ir.document_id] = (ir.title, term_entries(ir))
+
+    async def remove_document(self, document_id: str) -> None:
+        self._documents.pop(document_id, None)
+
+    async def search(
+        self,
+        query: str,
+        viewer: Viewer = None,
+        fuzzy: bool = True,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[TermIndexHit]:
+        needle = query.lower().strip()
+        ranked = []
+        for document_id, (title, entries) in self._documents.items():
+            for entry in entries:
+                term = entry.term.lower()
+                score = similarity(term, needle)
+                if term == needle:
+                    tier = EXACT
+                elif term.startswith(needle):
+                    tier = PREFIX
+                elif fuzzy and score >= FUZZY_THRESHOLD:
+                    tier = FUZZY
+                else:
+                    continue
+                hit = TermIndexHit(document_id, title, entry.term, entry.kind, entry.source_id, entry.section_id, score)
+                ranked.append(((tier, -score, KIND_RANK[entry.kind], document_id, entry.source_id, term), hit))
+        ranked.sort(key=lambda pair: pair[0])
+        return [hit for _, hit in ranked[offset:offset + limit]]
+
+
+class PostgresTermIndex(TermIndex):
+    """``term_index_entries`` from migration 022, searched through its trigram index."""
+
+    def __init__(self, pool: asyncpg.Pool):
+        self._pool = pool
+
+    async def replace_document(self, ir: DocumentIR) -> None:
+        document_id = UUID(ir.document_id)
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute("DELETE FROM term_index_entries WHERE document_id = $1", document_id)
+                await conn.executemany(
+                    """
+                    INSERT INTO term_index_entries
+                    (document_id, term, term_lower, kind, source_id, section_id)
+                    VALUES ($1, $2, $3, $4, $5, $6)
+                    """,
+                    [
+                        (document_id, e.term, e.term.lower(), e.kind, e.source_id, e.section_id)
+                        for e in term_entries(ir)
+                    ],
+                )
+
+    async def remove_document(self, document_id: str) -> None:
+        async with self._pool.acquire() as conn:
+            await conn.execute("DELETE FROM term_index_entries WHERE document_id = $1", UUID(document_id))
+
+    async def search(
+        self,
+        query: str,
+        viewer: Viewer = None,
+        fuzzy: bool = True,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[TermIndexHit]:
+        needle = query.lower().strip()
+        params: List[Any] = [needle, like_prefix(needle)]
+        match = "t.term_lower LIKE $2"
+        if fuzzy:
+            # % is pg_trgm's similarity operator (threshold 0.3 by default)
+            match = "(t.term_lower LIKE $2 OR t.term_lower % $1)"
+        acl = ""
+        if viewer is not None:
+            kerberos_id, groups = viewer
+            params.extend([kerberos_id, list(groups)])
+            # Mirrors DocumentAccess.can_view
+            acl = """
+                AND EXISTS (
+                    SELECT 1 FROM document_acl_views a
+                    WHERE a.document_id = t.document_id
+                      AND (a.owner_kerberos_id = $3
+                           OR a.visibility IN ('organization', 'public')
+                           OR (a.visibility = 'group' AND a.shared_with_groups && $4::TEXT[]))
+                )
+            """
+        params.extend([limit, offset])
+
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT t.document_id, d.title AS document_title, t.term, t.kind, t.source_id,
+                       t.section_id, similarity(t.term_lower, $1) AS score
+                FROM term_index_entries t
+                JOIN document_views d ON d.id = t.document_id
+                WHERE {match}
+                {acl}
+                ORDER BY CASE WHEN t.term_lower = $1 THEN {EXACT}
+                              WHEN t.term_lower LIKE $2 THEN {PREFIX}
+                              ELSE {FUZZY} END,
+                         score DESC,
+                         CASE t.kind WHEN '{DEFINITION}' THEN 0 WHEN '{ALIAS}' THEN 1 ELSE 2 END,
+                         t.document_id, t.source_id, t.term_lower
+                LIMIT ${len(params) - 1} OFFSET ${len(params)}
+                """,
+                *params,
+            )
+
+        return [
+            TermIndexHit(
+                document_id=str(row["document_id"]),
+                document_title=row["document_title"],
+                term=row["term"],
+                kind=row["kind"],
+                source_id=row["source_id"],
+                section_id=row["section_id"],
+                score=float(row["score"]),
+            )
+            for row in rows
+        ]
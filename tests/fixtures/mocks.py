@@ -30,7 +30,8 @@ class MockEventStore:
     async def get_events(
         self,
         aggregate_id: UUID,
-        from_version: int = 0
+        from_version: int = 0,
+        include_content: bool = True
     ) -> List[DomainEvent]:
         events = self._events.get(aggregate_id, [])
         return events[from_version:]
@@ -38,7 +39,8 @@ class MockEventStore:
     async def get_all_events(
         self,
         from_position: int = 0,
-        batch_size: int = 100
+        batch_size: int = 100,
+        include_content: bool = True
     ) -> List[DomainEvent]:
         return self._all_events[from_position:from_position + batch_size]
 
@@ -66,7 +68,7 @@ class MockDocumentRepository:
         self._documents: Dict[UUID, Document] = {}
         self._save_calls: List[Document] = []
 
-    async def get(self, aggregate_id: UUID) -> Optional[Document]:
+    async def get(self, aggregate_id: UUID, include_content: bool = True) -> Optional[Document]:
         return self._documents.get(aggregate_id)
 
     async def save(self, aggregate: Document) -> None:
@@ -0,0 +1,135 @@
+import gzip
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.api.middleware import compression
+from src.api.middleware.compression import (
+    CompressedVariantCache,
+    CompressionMiddleware,
+    is_compressible,
+    negotiate_encoding,
+)
+
+LARGE = {"content": "The index level is published daily. " * 200}
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+
+    @app.get("/large")
+    def large():
+        return LARGE
+
+    @app.get("/small")
+    def small():
+        return {"status": "ok"}
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([b"a" * 2048, b"b" * 2048]), media_type="text/plain")
+
+    @app.get("/encoded")
+    def encoded():
+        return PlainTextResponse("x" * 2048, headers={"Content-Encoding": "identity"})
+
+    # TestClient decodes gzip itself; raw bytes show what was actually sent
+    return TestClient(app)
+
+
+def raw_get(client, path, accept_encoding="gzip"):
+    with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+class TestNegotiateEncoding:
+    def test_prefers_highest_weight(self):
+        assert negotiate_encoding("gzip") == "gzip"
+        assert negotiate_encoding("deflate, gzip;q=0.5") == "gzip"
+        assert negotiate_encoding("*") == compression.SUPPORTED_ENCODINGS[0]
+
+    def test_identity_when_nothing_supported_is_accepted(self):
+        assert negotiate_encoding(None) is None
+        assert negotiate_encoding("deflate") is None
+        assert negotiate_encoding("gzip;q=0, *;q=0") is None
+
+    def test_brotli_preferred_when_installed(self, monkeypatch):
+        monkeypatch.setattr(compression, "SUPPORTED_ENCODINGS", ("br", "gzip"))
+
+        assert negotiate_encoding("gzip, deflate, br") == "br"
+        assert negotiate_encoding("gzip, br;q=0.8") == "gzip"
+
+    def test_compressible_types(self):
+        assert is_compressible("application/json")
+        assert is_compressible("text/markdown; charset=utf-8")
+        assert not is_compressible("text/event-stream")
+        assert not is_compressible("application/pdf")
+
+
+class TestCompressionMiddleware:
+    def test_compresses_large_json(self, client):
+        response, body = raw_get(client, "/large")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) == len(body)
+        assert json.loads(gzip.decompress(body)) == LARGE
+
+    def test_leaves_small_and_unaccepted_responses(self, client):
+        small, _ = raw_get(client, "/small")
+        identity, body = raw_get(client, "/large", accept_encoding="identity")
+
+        assert "content-encoding" not in small.headers
+        assert "content-encoding" not in identity.headers
+        assert json.loads(body) == LARGE
+
+    def test_streams_and_encoded_responses_pass_through(self, client):
+        stream, body = raw_get(client, "/stream")
+        encoded, _ = raw_get(client, "/encoded")
+
+        assert "content-encoding" not in stream.headers
+        assert body == b"a" * 2048 + b"b" * 2048
+        assert encoded.headers["content-encoding"] == "identity"
+
+
+class TestCompressedVariantCache:
+    @pytest.mark.asyncio
+    async def test_renders_and_compresses_once_per_key(self):
+        cache = CompressedVariantCache()
+        renders = []
+
+        def render():
+            renders.append(1)
+            return json.dumps(LARGE).encode()
+
+        first, encoding = await cache.get_or_encode(("doc", "1.0"), "gzip", render)
+        second, _ = await cache.get_or_encode(("doc", "1.0"), "gzip", render)
+        identity, none = await cache.get_or_encode(("doc", "1.0"), None, render)
+
+        assert encoding == "gzip" and none is None
+        assert first is second and gzip.decompress(first) == identity
+        assert len(renders) == 1
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_small_bodies_are_not_encoded(self):
+        cache = CompressedVariantCache()
+
+        body, encoding = await cache.get_or_encode("small", "gzip", lambda: b"{}")
+
+        assert (body, encoding) == (b"{}", None)
+
+    @pytest.mark.asyncio
+    async def test_bounded_by_size(self):
+        cache = CompressedVariantCache(max_bytes=10, min_size=100)
+
+        await cache.get_or_encode("a", None, lambda: b"12345")
+        await cache.get_or_encode("b", None, lambda: b"12345")
+        await cache.get_or_encode("c", None, lambda: b"12345")
+
+        assert len(cache) == 2
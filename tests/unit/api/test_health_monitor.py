@@ -0,0 +1,186 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.dependencies import Container
+from src.api.health_monitor import (
+    DEGRADED,
+    HEALTHY,
+    STALE_AFTER_INTERVALS,
+    UNHEALTHY,
+    CheckResult,
+    HealthMonitor,
+)
+from src.api.routes import health
+
+
+def make_pool(conn, size=10, idle=8, max_size=20):
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+    pool.get_size.return_value = size
+    pool.get_idle_size.return_value = idle
+    pool.get_max_size.return_value = max_size
+    return pool
+
+
+def make_conn(estimated_events=1200, last_sequence=1234):
+    conn = AsyncMock()
+    conn.fetchval.return_value = 1
+    conn.fetchrow.return_value = {"estimated_events": estimated_events, "last_sequence": last_sequence}
+    return conn
+
+
+class TestHealthMonitor:
+    @pytest.mark.asyncio
+    async def test_refresh_caches_results(self):
+        conn = make_conn()
+        monitor = HealthMonitor(lambda: make_pool(conn))
+
+        await monitor.refresh()
+        results = monitor.snapshot()
+
+        assert monitor.overall_status(results) == HEALTHY
+        assert results["event_store"].details == {"estimated_events": 1200, "last_sequence": 1234}
+        assert results["database"].details["connected"] is True
+        assert results["database"].details["active_connections"] == 2
+        # The event store is never counted
+        assert "COUNT" not in conn.fetchrow.call_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_does_no_io(self):
+        conn = make_conn()
+        monitor = HealthMonitor(lambda: make_pool(conn))
+        await monitor.refresh()
+        conn.reset_mock()
+
+        monitor.snapshot()
+        monitor.snapshot()
+
+        conn.fetchval.assert_not_called()
+        conn.fetchrow.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unanalysed_table_has_no_estimate(self):
+        monitor = HealthMonitor(lambda: make_pool(make_conn(estimated_events=-1, last_sequence=None)))
+
+        await monitor.refresh()
+
+        assert monitor.snapshot()["event_store"].details == {"estimated_events": None, "last_sequence": 0}
+
+    @pytest.mark.asyncio
+    async def test_slow_check_times_out(self):
+        conn = make_conn()
+
+        async def hang(*args):
+            await asyncio.sleep(10)
+
+        conn.fetchrow.side_effect = hang
+        monitor = HealthMonitor(lambda: make_pool(conn), check_timeout=0.01)
+
+        await monitor.refresh()
+        results = monitor.snapshot()
+
+        assert results["event_store"].status == UNHEALTHY
+        assert "timed out" in results["event_store"].message
+        assert results["database"].status == HEALTHY
+
+    @pytest.mark.asyncio
+    async def test_failed_check(self):
+        conn = make_conn()
+        conn.fetchval.side_effect = OSError("connection refused")
+        monitor = HealthMonitor(lambda: make_pool(conn))
+
+        await monitor.refresh()
+
+        assert monitor.snapshot()["database"].status == UNHEALTHY
+
+    @pytest.mark.asyncio
+    async def test_stale_results_are_unhealthy(self):
+        monitor = HealthMonitor(lambda: make_pool(make_conn()), refresh_interval=1.0)
+        await monitor.refresh()
+        monitor._refreshed_at -= STALE_AFTER_INTERVALS + 1
+
+        results = monitor.snapshot()
+
+        assert {r.status for r in results.values()} == {UNHEALTHY}
+        assert results["event_store"].message.startswith("Last check is stale")
+
+    @pytest.mark.asyncio
+    async def test_busy_pool_degrades_database(self):
+        monitor = HealthMonitor(lambda: make_pool(make_conn(), size=20, idle=1))
+        await monitor.refresh()
+
+        results = monitor.snapshot()
+
+        assert results["database"].status == DEGRADED
+        assert monitor.overall_status(results) == DEGRADED
+
+    def test_not_checked_yet(self):
+        monitor = HealthMonitor(lambda: None)
+
+        assert monitor.overall_status(monitor.snapshot()) == UNHEALTHY
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self):
+        conn = make_conn()
+        monitor = HealthMonitor(lambda: make_pool(conn), refresh_interval=0.01)
+
+        await monitor.start()
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+        assert conn.fetchval.await_count > 1
+        assert monitor._task is None
+
+    def test_overall_status(self):
+        ok = CheckResult(status=HEALTHY, message="")
+        assert HealthMonitor.overall_status({"a": ok}) == HEALTHY
+        assert HealthMonitor.overall_status({"a": ok, "b": CheckResult(status=DEGRADED, message="")}) == DEGRADED
+        assert HealthMonitor.overall_status({
+            "a": CheckResult(status=DEGRADED, message=""),
+            "b": CheckResult(status=UNHEALTHY, message=""),
+        }) == UNHEALTHY
+
+
+class TestHealthProbes:
+    @pytest.fixture
+    def container(self):
+        container = MagicMock()
+        container.health_monitor = HealthMonitor(lambda: make_pool(make_conn()))
+        return container
+
+    @pytest.fixture
+    def client(self, container):
+        app = FastAPI()
+        app.include_router(health.router, prefix="/api/v1")
+        app.dependency_overrides[Container.get_instance] = lambda: container
+        return TestClient(app)
+
+    def test_liveness_needs_no_dependencies(self):
+        app = FastAPI()
+        app.include_router(health.router, prefix="/api/v1")
+
+        response = TestClient(app).get("/api/v1/health/live")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "alive"}
+
+    def test_readiness_before_first_check(self, client):
+        response = client.get("/api/v1/health/ready")
+
+        assert response.status_code == 503
+        assert response.json()["status"] == UNHEALTHY
+
+    def test_readiness_and_health_serve_cached_results(self, client, container):
+        asyncio.run(container.health_monitor.refresh())
+
+        ready = client.get("/api/v1/health/ready")
+        full = client.get("/api/v1/health")
+
+        assert ready.status_code == 200
+        assert full.json()["status"] == HEALTHY
+        assert full.json()["dependencies"]["event_store"]["details"]["last_sequence"] == 1234
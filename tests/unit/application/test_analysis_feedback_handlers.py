@@ -8,6 +8,8 @@ from src.application.commands.analysis_handlers import (
 from src.application.commands.feedback_handlers import (
     AcceptChangeHandler,
     RejectChangeHandler,
+    AcceptChangesHandler,
+    RejectChangesHandler,
     ModifyChangeHandler,
 )
 from src.domain.commands import (
@@ -15,6 +17,8 @@ from src.domain.commands import (
     CancelAnalysis,
     AcceptChange,
     RejectChange,
+    AcceptChanges,
+    RejectChanges,
     ModifyChange,
 )
 from src.domain.aggregates.document import Document
@@ -330,3 +334,70 @@ class TestModifyChangeHandler:
         result = await handler.handle(command)
 
         assert result is True
+
+
+class TestBulkFeedbackHandlers:
+    @pytest.fixture
+    def mock_feedback_repo(self):
+        return MockFeedbackRepository()
+
+    @pytest.fixture
+    def mock_publisher(self):
+        return MockEventPublisher()
+
+    @pytest.fixture
+    def session_with_items(self):
+        session = FeedbackSession.create_for_document(session_id=uuid4(), document_id=uuid4())
+        feedback_ids = [uuid4() for _ in range(3)]
+        for feedback_id in feedback_ids:
+            session.add_feedback(
+                feedback_id=feedback_id,
+                issue_description="Test issue",
+                suggested_change="Test change",
+                confidence_score=0.9,
+                policy_reference="POL-001",
+                section_reference="Section 1"
+            )
+        session.clear_pending_events()
+        return session, feedback_ids
+
+    @pytest.mark.asyncio
+    async def test_accept_changes_saves_and_publishes_once(
+        self, mock_feedback_repo, mock_publisher, session_with_items
+    ):
+        session, feedback_ids = session_with_items
+        mock_feedback_repo.add(session)
+        handler = AcceptChangesHandler(feedback_repository=mock_feedback_repo, event_publisher=mock_publisher)
+
+        result = await handler.handle(AcceptChanges(
+            document_id=session.id,
+            feedback_ids=tuple(feedback_ids),
+            accepted_by="user@example.com"
+        ))
+
+        assert result == feedback_ids
+        assert len(mock_feedback_repo._save_calls) == 1
+        assert len(mock_publisher._published_events) == 3
+
+    @pytest.mark.asyncio
+    async def test_reject_changes(self, mock_feedback_repo, mock_publisher, session_with_items):
+        session, feedback_ids = session_with_items
+        mock_feedback_repo.add(session)
+        handler = RejectChangesHandler(feedback_repository=mock_feedback_repo, event_publisher=mock_publisher)
+
+        result = await handler.handle(RejectChanges(
+            document_id=session.id,
+            feedback_ids=tuple(feedback_ids[:2]),
+            rejected_by="user@example.com",
+            reason="Not applicable"
+        ))
+
+        assert result == feedback_ids[:2]
+        assert session.get_feedback(feedback_ids[2]).status.value == "PENDING"
+
+    @pytest.mark.asyncio
+    async def test_bulk_session_not_found(self, mock_feedback_repo, mock_publisher):
+        handler = AcceptChangesHandler(feedback_repository=mock_feedback_repo, event_publisher=mock_publisher)
+
+        with pytest.raises(FeedbackSessionNotFound):
+            await handler.handle(AcceptChanges(document_id=uuid4(), feedback_ids=(uuid4(),)))
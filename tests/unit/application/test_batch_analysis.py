@@ -0,0 +1,289 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from src.application.commands.analysis_handlers import (
+    StartBatchAnalysisHandler,
+    policy_rules_from_repository,
+)
+from src.application.services.batch_analysis import (
+    COMPLETED,
+    FAILED,
+    PENDING,
+    RESPONSE_TOKEN_ALLOWANCE,
+    SKIPPED,
+    BatchAnalysisRegistry,
+    BatchAnalysisReport,
+    CompiledPolicy,
+)
+from src.domain.aggregates.document import Document
+from src.domain.aggregates.document_group import DocumentGroup
+from src.domain.aggregates.policy_repository import PolicyRepository
+from src.domain.commands import StartBatchAnalysis
+from src.domain.exceptions.document_group_exceptions import InvalidGroupOperation
+from src.domain.exceptions.policy_exceptions import PolicyRepositoryNotFound
+from src.infrastructure.ai.prompts.base import format_rules
+from tests.fixtures.mocks import MockDocumentRepository, MockPolicyRepository
+
+
+def make_document(content: str = "# Methodology") -> Document:
+    document = Document.upload(
+        document_id=uuid4(),
+        filename="test.pdf",
+        content=b"content",
+        original_format="pdf",
+        uploaded_by="user@example.com",
+    )
+    document.convert(markdown_content=content, sections=[], metadata={})
+    document.clear_pending_events()
+    return document
+
+
+def make_policy_repository(*document_ids) -> PolicyRepository:
+    repo = PolicyRepository.create(
+        repository_id=uuid4(), name="Policies", description="", created_by="user@example.com"
+    )
+    repo.add_policy(uuid4(), "Define all parameters", "Every parameter has a value", "MUST", "user@example.com")
+    for document_id in document_ids:
+        repo.assign_document(document_id, "user@example.com")
+    repo.clear_pending_events()
+    return repo
+
+
+class FakeAnalysis:
+    """Stands in for StartAnalysisHandler.run, recording concurrency."""
+
+    def __init__(self, delay: float = 0.01, failing=()):
+        self.delay = delay
+        self.failing = set(failing)
+        self.active = 0
+        self.peak = 0
+        self.calls = []
+
+    async def run(self, document, policy_repository_id, policy_rules, ai_model, initiated_by):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.calls.append((document.id, policy_repository_id, policy_rules))
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        failed = document.id in self.failing
+        return SimpleNamespace(success=not failed, errors=["provider error"] if failed else [])
+
+
+@pytest.fixture
+def documents():
+    return MockDocumentRepository()
+
+
+@pytest.fixture
+def policies():
+    return MockPolicyRepository()
+
+
+def make_handler(documents, policies, analysis, group_repository=None):
+    return StartBatchAnalysisHandler(
+        document_repository=documents,
+        policy_repository=policies,
+        analysis_handler=analysis,
+        group_repository=group_repository,
+        registry=BatchAnalysisRegistry(),
+    )
+
+
+class TestStartBatchAnalysisHandler:
+    @pytest.mark.asyncio
+    async def test_analyses_documents_within_concurrency(self, documents, policies):
+        docs = [make_document() for _ in range(6)]
+        for doc in docs:
+            documents.add(doc)
+        repo = make_policy_repository()
+        policies.add(repo)
+        analysis = FakeAnalysis()
+        handler = make_handler(documents, policies, analysis)
+
+        report = await handler.handle(StartBatchAnalysis(
+            document_ids=tuple(d.id for d in docs),
+            policy_repository_id=repo.id,
+            max_concurrency=2,
+        ))
+        await report.wait()
+
+        assert report.count(COMPLETED) == 6
+        assert analysis.peak == 2
+        assert report.is_finished
+        assert report.eta_seconds() == 0.0
+
+    @pytest.mark.asyncio
+    async def test_policy_is_compiled_once_per_batch(self, documents, policies):
+        docs = [make_document() for _ in range(4)]
+        for doc in docs:
+            documents.add(doc)
+        repo = make_policy_repository(*(d.id for d in docs))
+        policies.add(repo)
+        policies.get = AsyncMock(wraps=policies.get)
+        analysis = FakeAnalysis()
+        handler = make_handler(documents, policies, analysis)
+
+        report = await handler.handle(StartBatchAnalysis(policy_repository_id=repo.id, max_concurrency=4))
+        await report.wait()
+
+        # Once to resolve the assigned documents, once to compile the rules
+        assert policies.get.await_count == 2
+        assert sorted(report.document_ids, key=str) == sorted((d.id for d in docs), key=str)
+        rules = {id(call[2]) for call in analysis.calls}
+        assert len(rules) == 1
+        assert analysis.calls[0][2][0].name == "Define all parameters"
+
+    @pytest.mark.asyncio
+    async def test_token_budget_skips_documents_that_do_not_fit(self, documents, policies):
+        docs = [make_document("x" * 4000) for _ in range(3)]
+        for doc in docs:
+            documents.add(doc)
+        repo = make_policy_repository()
+        policies.add(repo)
+        per_document = 1000 + CompiledPolicy.compile(repo.id, policy_rules_from_repository(repo)).prompt_tokens \
+            + RESPONSE_TOKEN_ALLOWANCE
+        handler = make_handler(documents, policies, FakeAnalysis())
+
+        report = await handler.handle(StartBatchAnalysis(
+            document_ids=tuple(d.id for d in docs),
+            policy_repository_id=repo.id,
+            max_concurrency=1,
+            token_budget=per_document * 2,
+        ))
+        await report.wait()
+
+        assert [report.statuses[d.id] for d in docs] == [COMPLETED, COMPLETED, SKIPPED]
+        assert report.reasons[docs[2].id] == "token budget exhausted"
+        assert report.tokens_reserved == per_document * 2
+
+    @pytest.mark.asyncio
+    async def test_records_failures_and_skips(self, documents, policies):
+        failing, ok = make_document(), make_document()
+        for doc in (failing, ok):
+            documents.add(doc)
+        repo = make_policy_repository()
+        policies.add(repo)
+        missing = uuid4()
+        handler = make_handler(documents, policies, FakeAnalysis(failing=[failing.id]))
+
+        report = await handler.handle(StartBatchAnalysis(
+            document_ids=(failing.id, missing, ok.id, ok.id),
+            policy_repository_id=repo.id,
+        ))
+        await report.wait()
+
+        assert report.total == 3
+        assert report.statuses[failing.id] == FAILED
+        assert report.reasons[failing.id] == "provider error"
+        assert report.statuses[missing] == SKIPPED
+        assert report.reasons[missing] == "document not found"
+        assert report.statuses[ok.id] == COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_document_without_policy_repository_is_skipped(self, documents, policies):
+        doc = make_document()
+        documents.add(doc)
+        handler = make_handler(documents, policies, FakeAnalysis())
+
+        report = await handler.handle(StartBatchAnalysis(document_ids=(doc.id,)))
+        await report.wait()
+
+        assert report.reasons[doc.id] == "no policy repository"
+
+    @pytest.mark.asyncio
+    async def test_group_members(self, documents, policies):
+        docs = [make_document() for _ in range(2)]
+        for doc in docs:
+            documents.add(doc)
+        repo = make_policy_repository()
+        policies.add(repo)
+        group = DocumentGroup.create(
+            group_id=uuid4(), name="Index family", description="", owner_kerberos_id="abc123"
+        )
+        for doc in docs:
+            group.add_document(doc.id)
+        groups = MagicMock()
+        groups.get = AsyncMock(return_value=group)
+        handler = make_handler(documents, policies, FakeAnalysis(), group_repository=groups)
+
+        report = await handler.handle(StartBatchAnalysis(group_id=group.id, policy_repository_id=repo.id))
+        await report.wait()
+
+        assert report.document_ids == [d.id for d in docs]
+        assert report.count(COMPLETED) == 2
+
+    @pytest.mark.asyncio
+    async def test_group_without_repository(self, documents, policies):
+        handler = make_handler(documents, policies, FakeAnalysis())
+
+        with pytest.raises(InvalidGroupOperation):
+            await handler.handle(StartBatchAnalysis(group_id=uuid4()))
+
+    @pytest.mark.asyncio
+    async def test_unknown_policy_repository(self, documents, policies):
+        handler = make_handler(documents, policies, FakeAnalysis())
+
+        with pytest.raises(PolicyRepositoryNotFound):
+            await handler.handle(StartBatchAnalysis(policy_repository_id=uuid4()))
+
+    @pytest.mark.asyncio
+    async def test_requires_targets(self, documents, policies):
+        handler = make_handler(documents, policies, FakeAnalysis())
+
+        with pytest.raises(ValueError):
+            await handler.handle(StartBatchAnalysis())
+
+
+class TestBatchAnalysisReport:
+    def test_throughput_and_eta(self):
+        ids = [uuid4() for _ in range(4)]
+        report = BatchAnalysisReport(batch_id=uuid4(), document_ids=ids, max_concurrency=2)
+        report._started -= 60
+        report.mark(ids[0], COMPLETED)
+        report.mark(ids[1], FAILED, "boom")
+
+        assert report.throughput_per_minute() == pytest.approx(2, rel=0.01)
+        assert report.eta_seconds() == pytest.approx(60, rel=0.01)
+        data = report.to_dict()
+        assert (data["completed"], data["failed"], data["pending"]) == (1, 1, 2)
+        assert data["documents"][1] == {"document_id": str(ids[1]), "status": FAILED, "reason": "boom"}
+
+    def test_eta_unknown_before_first_document(self):
+        report = BatchAnalysisReport(batch_id=uuid4(), document_ids=[uuid4()], max_concurrency=1)
+        assert report.statuses == {report.document_ids[0]: PENDING}
+        assert report.eta_seconds() is None
+
+    def test_registry_keeps_running_batches(self):
+        registry = BatchAnalysisRegistry(max_reports=1)
+        running = BatchAnalysisReport(batch_id=uuid4(), document_ids=[], max_concurrency=1)
+        finished = BatchAnalysisReport(batch_id=uuid4(), document_ids=[], max_concurrency=1)
+        finished.finish()
+        registry.add(finished)
+        registry.add(running)
+        registry.add(BatchAnalysisReport(batch_id=uuid4(), document_ids=[], max_concurrency=1))
+
+        assert registry.get(finished.batch_id) is None
+        assert registry.get(running.batch_id) is running
+
+
+class TestPolicyCompilation:
+    def test_rules_from_repository(self):
+        rules = policy_rules_from_repository(make_policy_repository())
+
+        assert len(rules) == 1
+        assert rules[0].name == "Define all parameters"
+        assert rules[0].description == "Every parameter has a value"
+        assert rules[0].requirement_type == "MUST"
+
+    def test_compiled_rules_text_is_shared(self):
+        repo = make_policy_repository()
+        rules = policy_rules_from_repository(repo)
+        CompiledPolicy.compile(repo.id, rules)
+        hits = format_rules.cache_info().hits
+
+        CompiledPolicy.compile(repo.id, rules)
+
+        assert format_rules.cache_info().hits == hits + 1
@@ -22,6 +22,8 @@ from src.application.queries import (
     GetFeedbackByDocumentHandler,
     GetPendingFeedbackHandler,
     CountFeedbackByDocumentHandler,
+    GetFeedbackStatusCounts,
+    GetFeedbackStatusCountsHandler,
     GetPolicyRepositoryById,
     ListPolicyRepositories,
     GetPoliciesByRepository,
@@ -74,7 +76,8 @@ class MockDocumentQueries:
         status: Optional[str] = None,
         policy_repository_id: Optional[UUID] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> List[DocumentView]:
         result = self._document_list
         if status:
@@ -86,7 +89,8 @@ class MockDocumentQueries:
     async def count(
         self,
         status: Optional[str] = None,
-        policy_repository_id: Optional[UUID] = None
+        policy_repository_id: Optional[UUID] = None,
+        estimate: bool = False
     ) -> int:
         result = self._document_list
         if status:
@@ -113,12 +117,14 @@ class MockFeedbackQueries:
     async def get_by_document(
         self,
         document_id: UUID,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> List[FeedbackView]:
         result = self._by_document.get(document_id, [])
         if status:
             result = [f for f in result if f.status == status]
-        return result
+        return result[:limit] if limit is not None else result
 
     async def get_pending_by_document(self, document_id: UUID) -> List[FeedbackView]:
         return await self.get_by_document(document_id, status="pending")
@@ -130,6 +136,12 @@ class MockFeedbackQueries:
     ) -> int:
         return len(await self.get_by_document(document_id, status))
 
+    async def count_by_status(self, document_id: UUID) -> dict:
+        counts: dict = {}
+        for feedback in self._by_document.get(document_id, []):
+            counts[feedback.status] = counts.get(feedback.status, 0) + 1
+        return counts
+
 
 class MockPolicyQueries:
     def __init__(self):
@@ -186,7 +198,8 @@ class MockAuditQueries:
         self,
         document_id: UUID,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> List[AuditLogView]:
         logs = self._by_document.get(document_id, [])
         return logs[offset:offset + limit]
@@ -195,7 +208,8 @@ class MockAuditQueries:
         self,
         limit: int = 50,
         offset: int = 0,
-        event_type: Optional[str] = None
+        event_type: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> List[AuditLogView]:
         result = list(self._logs.values())
         if event_type:
@@ -363,6 +377,30 @@ class TestFeedbackQueryHandlers:
 
         assert result == 1
 
+    @pytest.mark.asyncio
+    async def test_get_feedback_by_document_paginated(self, mock_queries, sample_feedback):
+        mock_queries.add_feedback(sample_feedback)
+        mock_queries.add_feedback(FeedbackView(**{**sample_feedback.__dict__, "id": uuid4()}))
+        handler = GetFeedbackByDocumentHandler(mock_queries)
+
+        query = GetFeedbackByDocument(
+            document_id=sample_feedback.document_id,
+            pagination=PaginationParams(limit=1),
+        )
+        result = await handler.handle(query)
+
+        assert len(result) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_feedback_status_counts(self, mock_queries, sample_feedback):
+        mock_queries.add_feedback(sample_feedback)
+        handler = GetFeedbackStatusCountsHandler(mock_queries)
+
+        query = GetFeedbackStatusCounts(document_id=sample_feedback.document_id)
+        result = await handler.handle(query)
+
+        assert result == {"pending": 1}
+
 
 class TestPolicyQueryHandlers:
     @pytest.fixture
@@ -0,0 +1,94 @@
+"""Unit tests for FeedbackSession id-keyed state and bulk decisions."""
+
+import pytest
+from uuid import uuid4
+
+from src.domain.aggregates.feedback_session import FeedbackSession
+from src.domain.events.feedback_events import ChangeAccepted, ChangeRejected
+from src.domain.exceptions.feedback_exceptions import ChangeAlreadyProcessed, FeedbackNotFound
+from src.domain.value_objects import FeedbackStatus
+
+
+def make_session(count: int):
+    session = FeedbackSession.create_for_document(session_id=uuid4(), document_id=uuid4())
+    feedback_ids = [uuid4() for _ in range(count)]
+    for i, feedback_id in enumerate(feedback_ids):
+        session.add_feedback(
+            feedback_id=feedback_id,
+            issue_description=f"Issue {i}",
+            suggested_change=f"Change {i}",
+            confidence_score=0.9,
+            policy_reference="POL-1",
+            section_reference="SEC-1",
+        )
+    session.clear_pending_events()
+    return session, feedback_ids
+
+
+class TestFeedbackSessionState:
+    """Tests for id-keyed feedback state."""
+
+    def test_items_keep_generation_order(self):
+        session, feedback_ids = make_session(3)
+        session.accept_change(feedback_ids[1], "user", "Applied")
+
+        items = session.feedback_items
+        assert [item.feedback_id for item in items] == feedback_ids
+        assert items[1].status == FeedbackStatus.ACCEPTED
+
+    def test_get_feedback(self):
+        session, feedback_ids = make_session(2)
+
+        assert session.get_feedback(feedback_ids[0]).issue_description == "Issue 0"
+        assert session.get_feedback(uuid4()) is None
+
+    def test_replay_rebuilds_state(self):
+        session = FeedbackSession.create_for_document(session_id=uuid4(), document_id=uuid4())
+        feedback_ids = [uuid4() for _ in range(3)]
+        for feedback_id in feedback_ids:
+            session.add_feedback(feedback_id, "Issue", "Change", 0.9, "POL-1", "SEC-1")
+        session.accept_changes(feedback_ids[:2], "user")
+        session.reject_change(feedback_ids[2], "user", "No")
+
+        rebuilt = FeedbackSession.reconstitute(session.pending_events)
+
+        assert rebuilt.feedback_items == session.feedback_items
+        assert [item.status for item in rebuilt.feedback_items] == [
+            FeedbackStatus.ACCEPTED, FeedbackStatus.ACCEPTED, FeedbackStatus.REJECTED,
+        ]
+
+
+class TestBulkDecisions:
+    """Tests for accepting and rejecting many changes at once."""
+
+    def test_accept_changes(self):
+        session, feedback_ids = make_session(3)
+
+        accepted = session.accept_changes(feedback_ids[:2] + [feedback_ids[0]], "user")
+
+        assert accepted == feedback_ids[:2]
+        assert [type(e) for e in session.pending_events] == [ChangeAccepted, ChangeAccepted]
+        assert [item.status for item in session.feedback_items] == [
+            FeedbackStatus.ACCEPTED, FeedbackStatus.ACCEPTED, FeedbackStatus.PENDING,
+        ]
+
+    def test_reject_changes(self):
+        session, feedback_ids = make_session(2)
+
+        session.reject_changes(feedback_ids, "user", "Out of scope")
+
+        assert all(isinstance(e, ChangeRejected) for e in session.pending_events)
+        assert {item.rejection_reason for item in session.feedback_items} == {"Out of scope"}
+
+    def test_bulk_decision_is_all_or_nothing(self):
+        session, feedback_ids = make_session(3)
+        session.accept_change(feedback_ids[2], "user", "")
+        session.clear_pending_events()
+
+        with pytest.raises(ChangeAlreadyProcessed):
+            session.reject_changes(feedback_ids, "user", "No")
+        with pytest.raises(FeedbackNotFound):
+            session.accept_changes([feedback_ids[0], uuid4()], "user")
+
+        assert session.pending_events == []
+        assert session.get_feedback(feedback_ids[0]).status == FeedbackStatus.PENDING
@@ -4,6 +4,7 @@ import pytest
 from uuid import uuid4
 
 from src.domain.aggregates.document import Document
+from src.domain.value_objects.document_access import DocumentAccess
 from src.domain.aggregates.user import User
 from src.domain.services.authorization_service import AuthorizationService, ROLE_PERMISSIONS
 from src.domain.value_objects.permission import Permission
@@ -294,6 +295,27 @@ class TestAuthorizationService:
         
         assert auth_service.can_delete_document(user, private_document) is False
 
+    def test_can_view_document_access_group_member_shared(
+        self, auth_service, viewer_user, shared_document
+    ):
+        """Test group membership is honoured for a DocumentAccess snapshot."""
+        access = DocumentAccess.from_document(shared_document)
+        assert auth_service.can_view_document(viewer_user, access) is True
+    
+    def test_can_view_document_access_non_member_private(
+        self, auth_service, viewer_user, private_document
+    ):
+        """Test a private DocumentAccess snapshot is hidden from non-owners."""
+        access = DocumentAccess.from_document(private_document)
+        assert auth_service.can_view_document(viewer_user, access) is False
+    
+    def test_can_edit_document_access_owner_can_edit(
+        self, auth_service, document_owner, private_document
+    ):
+        """Test ownership checks work against a DocumentAccess snapshot."""
+        access = DocumentAccess.from_document(private_document)
+        assert auth_service.can_edit_document(document_owner, access) is True
+
 
 class TestPermissionValueObject:
     """Tests for Permission enum."""
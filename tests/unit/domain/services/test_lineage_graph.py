@@ -0,0 +1,122 @@
+"""Tests for the term and formula lineage graph."""
+
+import pytest
+
+from src.domain.services.lineage_graph import DEFINITION, FORMULA, LineageGraph, LineageNode
+from src.domain.value_objects.semantic_ir import (
+    DocumentIR,
+    FormulaReference,
+    TermDefinition,
+)
+from src.domain.value_objects.semantic_ir.term_lineage import (
+    DependencyType,
+    TermDependency,
+    TermLineage,
+)
+
+
+def definition(id: str, term: str, *inputs: str, aliases=None) -> TermDefinition:
+    lineage = TermLineage(
+        input_terms=[TermDependency(name=name, dependency_type=DependencyType.DIRECT_REFERENCE) for name in inputs]
+    )
+    return TermDefinition(
+        id=id, term=term, definition=f"{term} text", section_id="sec-1",
+        aliases=aliases or [], lineage=lineage,
+    )
+
+
+def make_ir(definitions, formulae=()) -> DocumentIR:
+    return DocumentIR(
+        document_id="doc-1",
+        title="Spec",
+        original_format="markdown",
+        sections=[],
+        definitions=list(definitions),
+        formulae=list(formulae),
+        tables=[],
+        cross_references=[],
+        metadata={},
+        raw_markdown="",
+    )
+
+
+def chain(length: int) -> LineageGraph:
+    nodes = [LineageNode(f"n{i}", f"N{i}", DEFINITION) for i in range(length)]
+    edges = [(f"n{i}", f"n{i + 1}") for i in range(length - 1)]
+    return LineageGraph(nodes, edges)
+
+
+@pytest.fixture
+def ir():
+    return make_ir(
+        [
+            definition("d-nav", "Net Asset Value"),
+            definition("d-vol", "Volatility", aliases=["Vol"]),
+            definition("d-rar", "Risk-Adjusted Return", "volatility", "Net Asset Value"),
+            definition("d-sharpe", "Sharpe Ratio", "Risk-Adjusted Return", "Unknown Term"),
+        ],
+        [FormulaReference(id="f-1", latex="S = R / V", section_id="sec-1", name="Score",
+                          dependencies=["d-sharpe", "missing"])],
+    )
+
+
+class TestLineageGraph:
+    def test_resolves_lineage_inputs_by_term_and_alias(self, ir):
+        graph = LineageGraph.from_ir(ir)
+
+        assert set(graph.dependencies("d-rar")) == {"d-nav", "d-vol"}
+        assert set(graph.upstream("d-sharpe")) == {"d-rar", "d-vol", "d-nav"}
+        assert set(graph.downstream("d-vol")) == {"d-rar", "d-sharpe", "f-1"}
+        assert graph.dependents("d-sharpe") == ["f-1"]
+        assert graph.resolve("VOL") == "d-vol"
+        assert graph.resolve("score") == "f-1"
+        assert graph.resolve("f-1") == "f-1"
+        assert graph.resolve("unknown term") is None
+        assert graph.node("f-1").kind == FORMULA
+
+    def test_topological_order_puts_dependencies_first(self, ir):
+        order = LineageGraph.from_ir(ir).topological_order()
+
+        position = {node_id: i for i, node_id in enumerate(order)}
+        assert position["d-vol"] < position["d-rar"] < position["d-sharpe"] < position["f-1"]
+        assert position["d-nav"] < position["d-rar"]
+        assert LineageGraph.from_ir(ir).upstream("f-1")[-1] == "d-sharpe"
+
+    def test_condenses_cycles(self):
+        nodes = [LineageNode(n, n.upper(), DEFINITION) for n in ("a", "b", "c", "d", "e")]
+        edges = [("a", "b"), ("b", "c"), ("c", "a"), ("d", "a"), ("e", "e")]
+
+        graph = LineageGraph(nodes, edges)
+
+        assert sorted(map(sorted, graph.cycles())) == [["a", "b", "c"], ["e"]]
+        assert graph.in_cycle("b") and graph.in_cycle("e") and not graph.in_cycle("d")
+        assert set(graph.upstream("a")) == {"b", "c"}
+        assert set(graph.downstream("a")) == {"b", "c", "d"}
+        assert graph.upstream("e") == []
+        assert graph.reaches_cycle("d") and not graph.reaches_cycle("d", kind=FORMULA)
+
+    def test_deep_chain_does_not_recurse(self):
+        graph = chain(20000)
+
+        assert len(graph.upstream("n0")) == 19999
+        assert graph.downstream("n19999")[-1] == "n0"
+        assert graph.topological_order()[0] == "n19999"
+        assert graph.cycles() == []
+
+    def test_unknown_node_raises(self):
+        with pytest.raises(KeyError, match="nope"):
+            chain(2).upstream("nope")
+
+    def test_document_ir_caches_graph_until_lists_change(self, ir):
+        graph = ir.lineage_graph()
+
+        assert ir.lineage_graph() is graph
+
+        ir.formulae.append(FormulaReference(id="f-2", latex="y = 1", section_id="sec-1", dependencies=["f-1"]))
+        rebuilt = ir.lineage_graph()
+
+        assert rebuilt is not graph
+        assert "f-2" in rebuilt.downstream("d-nav")
+
+        ir.definitions = ir.definitions[:1]
+        assert "d-vol" not in ir.lineage_graph()
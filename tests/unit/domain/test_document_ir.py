@@ -0,0 +1,155 @@
+import pickle
+
+import pytest
+
+from src.domain.value_objects.semantic_ir import (
+    DocumentIR,
+    FormulaReference,
+    IRSection,
+    SectionType,
+    TableData,
+    TermDefinition,
+)
+
+
+def make_definition(def_id: str, term: str, aliases=()) -> TermDefinition:
+    return TermDefinition(
+        id=def_id,
+        term=term,
+        definition=f"Definition of {term}",
+        section_id="sec-1",
+        aliases=list(aliases),
+    )
+
+
+@pytest.fixture
+def document_ir():
+    return DocumentIR(
+        document_id="doc-1",
+        title="Algorithm",
+        original_format="markdown",
+        sections=[
+            IRSection(
+                id="sec-1",
+                title="Definitions",
+                content="Alpha means a.\nBeta means b.",
+                level=1,
+                section_type=SectionType.DEFINITION,
+                start_line=2,
+                end_line=3,
+            )
+        ],
+        definitions=[
+            make_definition("def-1", "Alpha", aliases=["A"]),
+            make_definition("def-2", "Beta"),
+        ],
+        formulae=[
+            FormulaReference(id="f-1", latex="x = y", section_id="sec-1", name="Score"),
+        ],
+        tables=[
+            TableData(id="t-1", headers=["a"], rows=[["1"]], section_id="sec-1"),
+        ],
+        cross_references=[],
+        metadata={},
+        raw_markdown="# Definitions\nAlpha means a.\nBeta means b.",
+    )
+
+
+class TestDocumentIRLookups:
+    def test_find_by_term_alias_and_id(self, document_ir):
+        assert document_ir.find_definition("alpha").id == "def-1"
+        assert document_ir.find_definition(" a ").id == "def-1"
+        assert document_ir.find_definition("gamma") is None
+        assert document_ir.find_formula("f-1").name == "Score"
+        assert document_ir.find_formula_by_name("SCORE").id == "f-1"
+        assert document_ir.find_table("t-1").id == "t-1"
+        assert document_ir.find_section("sec-1").title == "Definitions"
+
+    def test_first_definition_wins_for_duplicate_terms(self, document_ir):
+        document_ir.definitions.append(make_definition("def-3", "alpha"))
+
+        assert document_ir.find_definition("Alpha").id == "def-1"
+
+    def test_index_rebuilt_after_in_place_mutation(self, document_ir):
+        assert document_ir.find_definition("gamma") is None
+
+        document_ir.definitions.append(make_definition("def-3", "Gamma"))
+        assert document_ir.find_definition("gamma").id == "def-3"
+
+        document_ir.definitions[0] = make_definition("def-4", "Delta")
+        assert document_ir.find_definition("alpha") is None
+        assert document_ir.find_definition("delta").id == "def-4"
+
+    def test_index_rebuilt_after_reassignment(self, document_ir):
+        assert document_ir.find_definition("alpha") is not None
+
+        document_ir.definitions = [make_definition("def-9", "Omega")]
+
+        assert document_ir.find_definition("alpha") is None
+        assert document_ir.get_all_defined_terms_set() == {"omega"}
+
+    def test_defined_terms_set_is_a_copy(self, document_ir):
+        terms = document_ir.get_all_defined_terms_set()
+        terms.add("extra")
+
+        assert "extra" not in document_ir.get_all_defined_terms_set()
+
+    def test_pickle_round_trip_keeps_indexes_consistent(self, document_ir):
+        document_ir.find_definition("alpha")
+        restored = pickle.loads(pickle.dumps(document_ir))
+
+        restored.definitions.append(make_definition("def-3", "Gamma"))
+
+        assert restored == pickle.loads(pickle.dumps(restored))
+        assert restored.find_definition("gamma").id == "def-3"
+        assert document_ir.find_definition("gamma") is None
+
+
+class TestDocumentIRLazyContent:
+    def test_to_dict_without_content(self, document_ir):
+        data = document_ir.to_dict(include_content=False)
+
+        assert "raw_markdown" not in data
+        assert "content" not in data["sections"][0]
+
+    def test_markdown_loaded_once_on_demand(self, document_ir):
+        calls = []
+
+        def load():
+            calls.append(1)
+            return document_ir.raw_markdown
+
+        ir = DocumentIR.from_dict(document_ir.to_dict(include_content=False), markdown_loader=load)
+
+        assert not ir.is_content_loaded
+        assert not ir.sections[0].is_content_loaded
+        assert ir.sections[0].content == "Alpha means a.\nBeta means b."
+        assert ir.raw_markdown == document_ir.raw_markdown
+        assert len(calls) == 1
+
+    def test_to_dict_without_content_does_not_load(self, document_ir):
+        calls = []
+
+        def load():
+            calls.append(1)
+            return document_ir.raw_markdown
+
+        ir = DocumentIR.from_dict(document_ir.to_dict(include_content=False), markdown_loader=load)
+        data = ir.to_dict(include_content=False)
+
+        assert calls == []
+        assert not ir.is_content_loaded
+        assert not ir.sections[0].is_content_loaded
+        assert "content" not in data["sections"][0]
+
+    def test_section_loader(self, document_ir):
+        ir = DocumentIR.from_dict(
+            document_ir.to_dict(include_content=False),
+            markdown_loader=lambda: "",
+            section_loader=lambda section_id: f"body of {section_id}",
+        )
+
+        assert ir.sections[0].content == "body of sec-1"
+
+    def test_full_round_trip_unchanged(self, document_ir):
+        assert DocumentIR.from_dict(document_ir.to_dict()) == document_ir
@@ -1,8 +1,10 @@
 import pytest
+import random
 from uuid import uuid4
 
 from src.domain.services.document_conversion_service import DocumentConversionService
 from src.domain.services.compliance_checker import ComplianceChecker
+from src.domain.services.keyword_index import KeywordIndex
 from src.domain.services.version_calculator import VersionCalculator
 from src.domain.value_objects import VersionNumber, RequirementType
 
@@ -88,6 +90,68 @@ class TestComplianceChecker:
         )
         assert isinstance(issues, list)
 
+    def test_identify_issues_matches_per_rule_check(self):
+        checker = ComplianceChecker()
+        doc_content = "Risk Disclosure: this algorithm reports performance metrics daily."
+        rules = [
+            {"rule": "Must have risk disclosure", "type": RequirementType.MUST},
+            {"rule": "Should have performance metrics", "type": RequirementType.SHOULD},
+            {"rule": "Must include backtesting results", "type": RequirementType.MUST},
+        ]
+
+        issues = checker.identify_issues(doc_content, rules)
+
+        expected = [
+            rule["rule"] for rule in rules
+            if not checker.check_requirement(doc_content, rule["rule"], rule["type"]).is_compliant
+        ]
+        assert [issue["rule"] for issue in issues] == expected
+
+    def test_index_is_cached_per_rule_set(self):
+        checker = ComplianceChecker()
+        rules = [{"rule": "Must have risk disclosure", "type": RequirementType.MUST}]
+
+        first = checker.get_index(rules)
+        second = checker.get_index([dict(r) for r in rules])
+
+        assert first is second
+        assert checker.get_index(rules + [{"rule": "Should log trades"}]) is not first
+
+
+class TestKeywordIndex:
+    def test_finds_overlapping_keywords(self):
+        index = KeywordIndex(["he", "she", "his", "hers"])
+        assert index.find_all("ushers") == {"he", "she", "hers"}
+
+    def test_matching_is_case_insensitive_substring(self):
+        index = KeywordIndex(["risk", "disclosure", "missing"])
+        assert index.find_all("RISKY Disclosures") == {"risk", "disclosure"}
+
+    def test_empty_index_matches_nothing(self):
+        assert KeywordIndex([]).find_all("anything") == set()
+
+    @pytest.mark.parametrize("rule_count", [10, 100, 1000])
+    def test_single_scan_matches_naive(self, rule_count):
+        rng = random.Random(rule_count)
+        vocabulary = [f"term{i}x" for i in range(rule_count * 2)]
+        rules = [
+            {
+                "rule": "Must include " + " ".join(rng.sample(vocabulary, 4)),
+                "type": RequirementType.MUST,
+            }
+            for _ in range(rule_count)
+        ]
+        document = " ".join(rng.choice(vocabulary) for _ in range(5000))
+        checker = ComplianceChecker()
+
+        indexed = checker.identify_issues(document, rules)
+
+        naive = [
+            rule["rule"] for rule in rules
+            if not checker.check_requirement(document, rule["rule"], rule["type"]).is_compliant
+        ]
+        assert [issue["rule"] for issue in indexed] == naive
+
 
 class TestVersionCalculator:
     def test_calculate_patch_increment_for_minor_changes(self):
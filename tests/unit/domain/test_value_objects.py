@@ -10,6 +10,7 @@ from src.domain.value_objects.compliance_status import ComplianceStatus
 from src.domain.value_objects.document_status import DocumentStatus
 from src.domain.value_objects.feedback_status import FeedbackStatus
 from src.domain.value_objects.section import Section
+from src.domain.value_objects.document_access import DocumentAccess
 
 
 class TestDocumentId:
@@ -258,3 +259,43 @@ class TestSection:
             Section(heading="Test", content="Content", level=0)
         with pytest.raises(ValueError):
             Section(heading="Test", content="Content", level=7)
+
+
+class TestDocumentAccess:
+    def test_owner_can_view_private(self):
+        access = DocumentAccess(document_id=uuid4(), owner_kerberos_id="owner1")
+        assert access.can_view("owner1", set()) is True
+        assert access.can_view("other", {"equity-trading"}) is False
+
+    def test_group_visibility_requires_shared_group(self):
+        access = DocumentAccess(
+            document_id=uuid4(),
+            owner_kerberos_id="owner1",
+            visibility="group",
+            shared_with_groups=frozenset({"equity-trading"}),
+        )
+        assert access.can_view("other", {"equity-trading"}) is True
+        assert access.can_view("other", {"risk-mgmt"}) is False
+
+    def test_organization_visibility_allows_everyone(self):
+        access = DocumentAccess(document_id=uuid4(), owner_kerberos_id="owner1", visibility="organization")
+        assert access.can_view("other", set()) is True
+
+    def test_from_document_matches_aggregate(self):
+        from src.domain.aggregates.document import Document
+
+        document = Document.upload(
+            document_id=uuid4(),
+            filename="algo.pdf",
+            content=b"content",
+            original_format="application/pdf",
+            uploaded_by="owner1",
+        )
+        document.share_with_group("equity-trading", "owner1")
+
+        access = DocumentAccess.from_document(document)
+
+        assert access.document_id == document.id
+        assert access.owner_kerberos_id == "owner1"
+        assert access.visibility == "group"
+        assert access.shared_with_groups == frozenset({"equity-trading"})
@@ -368,8 +368,8 @@ class TestFeedbackSessionWithImmutableValueObjects:
         assert item.feedback_id == feedback_id
         assert item.status == FeedbackStatus.PENDING
 
-    def test_accepting_feedback_creates_new_list(self):
-        """Test that accepting feedback creates new list (immutable update)."""
+    def test_accepting_feedback_replaces_item(self):
+        """Test that accepting feedback replaces the item instead of mutating it."""
         session = FeedbackSession.create_for_document(
             session_id=uuid4(),
             document_id=uuid4()
@@ -385,21 +385,18 @@ class TestFeedbackSessionWithImmutableValueObjects:
             section_reference="SEC-1"
         )
 
-        # Get reference to original list
-        original_items = session._feedback_items
-        original_item = original_items[0]
+        # Get reference to original item
+        original_item = session.get_feedback(feedback_id)
 
         # Accept the feedback
         session.accept_change(feedback_id, "user", "Applied")
 
-        # List reference should be different (new list created)
-        assert session._feedback_items is not original_items
-
         # Original item should be unchanged (immutable)
         assert original_item.status == FeedbackStatus.PENDING
 
-        # New list has updated item
-        new_item = session._feedback_items[0]
+        # Session holds the updated item under the same id
+        new_item = session.get_feedback(feedback_id)
+        assert new_item is not original_item
         assert new_item.status == FeedbackStatus.ACCEPTED
         assert new_item.applied_change == "Applied"
 
@@ -0,0 +1,314 @@
+import asyncio
+import json
+import time
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from src.infrastructure.ai.analysis.analysis_log import (
+    AnalysisLog,
+    AnalysisLogStore,
+    LogLevel,
+)
+from src.infrastructure.ai.analysis.analysis_log_writer import PostgresAnalysisLogWriter
+
+
+def make_log(**kwargs) -> AnalysisLog:
+    return AnalysisLog(document_id=uuid4(), started_at=datetime.utcnow(), **kwargs)
+
+
+def make_pool(conn):
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+    transaction = MagicMock()
+    transaction.__aenter__ = AsyncMock(return_value=None)
+    transaction.__aexit__ = AsyncMock(return_value=None)
+    conn.transaction = MagicMock(return_value=transaction)
+    return pool
+
+
+class TestAnalysisLog:
+    def test_entries_are_numbered(self):
+        log = make_log()
+        log.info("parse", "one")
+        log.warning("parse", "two")
+
+        assert [e.sequence for e in log.entries] == [1, 2]
+        assert log.last_sequence == 2
+        assert log.to_dict()["entries"][1]["level"] == "warning"
+
+    def test_ring_drops_oldest_past_entry_limit(self):
+        log = make_log(max_entries=3)
+        for i in range(5):
+            log.info("stage", f"message {i}")
+
+        assert [e.sequence for e in log.entries] == [3, 4, 5]
+        assert log.dropped_entries == 2
+        assert log.last_sequence == 5
+
+    def test_ring_drops_oldest_past_char_limit(self):
+        log = make_log(max_chars=25)
+        for _ in range(4):
+            log.info("stage", "x" * 10)
+
+        assert len(log.entries) == 2
+        assert log.dropped_entries == 2
+
+    def test_entries_after(self):
+        log = make_log(max_entries=3)
+        for i in range(5):
+            log.info("stage", str(i))
+
+        assert [e.sequence for e in log.entries_after(0)] == [3, 4, 5]
+        assert [e.sequence for e in log.entries_after(1)] == [3, 4, 5]
+        assert [e.sequence for e in log.entries_after(4)] == [5]
+        assert log.entries_after(5) == []
+        assert [e["sequence"] for e in log.to_dict(after=3)["entries"]] == [4, 5]
+
+    @pytest.mark.asyncio
+    async def test_wait_for_entries_wakes_on_new_entry(self):
+        log = make_log()
+        log.info("stage", "first")
+
+        async def add_later():
+            await asyncio.sleep(0.01)
+            log.info("stage", "second")
+
+        task = asyncio.create_task(add_later())
+        entries = await log.wait_for_entries(1, timeout=5)
+        await task
+
+        assert [e.message for e in entries] == ["second"]
+
+    @pytest.mark.asyncio
+    async def test_wait_for_entries_times_out_empty(self):
+        log = make_log()
+        assert await log.wait_for_entries(0, timeout=0.01) == []
+
+    @pytest.mark.asyncio
+    async def test_wait_for_entries_returns_on_complete(self):
+        log = make_log()
+
+        async def complete_later():
+            await asyncio.sleep(0.01)
+            log.complete("failed")
+
+        task = asyncio.create_task(complete_later())
+        started = time.monotonic()
+        entries = await log.wait_for_entries(0, timeout=5)
+        await task
+
+        assert entries == []
+        assert log.status == "failed"
+        assert time.monotonic() - started < 1
+
+    def test_sink_receives_changes(self):
+        sink = MagicMock()
+        log = make_log(sink=sink)
+        log.info("stage", "hello")
+        log.complete()
+
+        sink.entry_added.assert_called_once_with(log, log.entries[0])
+        sink.log_changed.assert_called_once_with(log)
+
+
+class TestAnalysisLogStore:
+    def test_create_replaces_previous_run(self):
+        store = AnalysisLogStore()
+        document_id = uuid4()
+        first = store.create_log(document_id)
+        second = store.create_log(document_id)
+
+        assert first.replaced
+        assert not second.replaced
+        assert store.get_log(document_id) is second
+
+    def test_evicts_least_recently_used(self):
+        store = AnalysisLogStore(max_logs=2)
+        a, b, c = uuid4(), uuid4(), uuid4()
+        store.create_log(a)
+        store.create_log(b)
+        store.get_log(a)
+        store.create_log(c)
+
+        assert len(store) == 2
+        assert store.get_log(b) is None
+        assert store.get_log(a) is not None
+
+    def test_evicts_expired_logs_on_create(self):
+        store = AnalysisLogStore(max_age_seconds=60)
+        old = store.create_log(uuid4())
+        old.touched_at -= 120
+        store.create_log(uuid4())
+
+        assert store.get_log(old.document_id) is None
+        assert len(store) == 1
+
+    def test_applies_per_log_bounds(self):
+        store = AnalysisLogStore(max_entries_per_log=2)
+        log = store.create_log(uuid4())
+        for i in range(3):
+            log.info("stage", str(i))
+
+        assert len(log.entries) == 2
+
+    def test_attach_sets_sink_on_existing_logs(self):
+        store = AnalysisLogStore()
+        log = store.create_log(uuid4())
+        sink = MagicMock()
+        store.attach(sink=sink)
+        log.info("stage", "hello")
+
+        sink.entry_added.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_load_log_falls_back_to_reader(self):
+        persisted = make_log()
+        reader = MagicMock()
+        reader.load = AsyncMock(return_value=persisted)
+        store = AnalysisLogStore()
+        store.attach(reader=reader)
+
+        assert await store.load_log(persisted.document_id, after=3) is persisted
+        reader.load.assert_awaited_once_with(persisted.document_id, after=3)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_entries_on_local_log(self):
+        store = AnalysisLogStore()
+        log = store.create_log(uuid4())
+        log.info("stage", "one")
+        log.info("stage", "two")
+
+        found, entries = await store.wait_for_entries(log.document_id, 1, timeout=1)
+
+        assert found is log
+        assert [e.message for e in entries] == ["two"]
+
+    @pytest.mark.asyncio
+    async def test_wait_for_entries_unknown_log(self):
+        store = AnalysisLogStore()
+        assert await store.wait_for_entries(uuid4(), 0, timeout=0) == (None, [])
+
+
+class TestPostgresAnalysisLogWriter:
+    @pytest.mark.asyncio
+    async def test_flush_writes_headers_and_entries(self):
+        conn = AsyncMock()
+        writer = PostgresAnalysisLogWriter(make_pool(conn))
+        log = make_log(sink=writer)
+        writer.log_changed(log)
+        log.info("parse", "hello", {"pages": 3})
+        log.info("parse", "world")
+
+        written = await writer.flush()
+
+        assert written == 2
+        assert writer.pending == 0
+        headers, deletes, entries = [c.args for c in conn.executemany.call_args_list]
+        assert headers[1] == [
+            (log.document_id, log.run_id, log.started_at, None, "in_progress", 2, 0)
+        ]
+        assert deletes[1] == [(log.document_id, log.run_id)]
+        assert [row[1] for row in entries[1]] == [1, 2]
+        assert json.loads(entries[1][0][8]) == {"pages": 3}
+        assert entries[1][1][8] is None
+
+    @pytest.mark.asyncio
+    async def test_flush_skips_replaced_runs(self):
+        conn = AsyncMock()
+        writer = PostgresAnalysisLogWriter(make_pool(conn))
+        store = AnalysisLogStore()
+        store.attach(sink=writer)
+        document_id = uuid4()
+        first = store.create_log(document_id)
+        first.info("stage", "stale")
+        second = store.create_log(document_id)
+        second.info("stage", "fresh")
+
+        assert await writer.flush() == 1
+        headers, _, entries = [c.args[1] for c in conn.executemany.call_args_list]
+        assert [row[1] for row in headers] == [second.run_id]
+        assert [row[0] for row in entries] == [second.run_id]
+
+    @pytest.mark.asyncio
+    async def test_flush_requeues_batch_on_failure(self):
+        conn = AsyncMock()
+        conn.executemany.side_effect = RuntimeError("connection lost")
+        writer = PostgresAnalysisLogWriter(make_pool(conn))
+        log = make_log(sink=writer)
+        log.info("stage", "one")
+        log.info("stage", "two")
+
+        with pytest.raises(RuntimeError):
+            await writer.flush()
+
+        assert writer.pending == 3
+        conn.executemany.side_effect = None
+        assert await writer.flush() == 2
+
+    def test_queue_is_bounded(self):
+        writer = PostgresAnalysisLogWriter(MagicMock(), max_pending=2)
+        log = make_log(sink=writer)
+        for i in range(3):
+            log.info("stage", str(i))
+
+        assert writer.dropped == 1
+        assert [e.sequence for _, e in writer._entries] == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_pending(self):
+        conn = AsyncMock()
+        writer = PostgresAnalysisLogWriter(make_pool(conn), flush_interval=60)
+        await writer.start()
+        log = make_log(sink=writer)
+        log.info("stage", "hello")
+
+        await writer.stop()
+
+        assert writer.pending == 0
+        assert conn.executemany.await_count >= 3
+
+    @pytest.mark.asyncio
+    async def test_load(self):
+        document_id, run_id = uuid4(), uuid4()
+        started = datetime.utcnow()
+        conn = AsyncMock()
+        conn.fetchrow.return_value = {
+            "run_id": run_id,
+            "started_at": started,
+            "completed_at": None,
+            "status": "in_progress",
+            "last_sequence": 7,
+            "dropped_entries": 0,
+        }
+        conn.fetch.return_value = [
+            {
+                "id": uuid4(),
+                "sequence": 7,
+                "timestamp": started,
+                "level": "error",
+                "stage": "ai",
+                "message": "boom",
+                "details": '{"code": 1}',
+            }
+        ]
+        writer = PostgresAnalysisLogWriter(make_pool(conn))
+
+        log = await writer.load(document_id, after=6)
+
+        assert log.run_id == run_id
+        assert log.last_sequence == 7
+        assert log.entries_after(6)[0].level == LogLevel.ERROR
+        assert log.entries_after(6)[0].details == {"code": 1}
+        assert conn.fetch.call_args.args[1:] == (run_id, 6, 1000)
+
+    @pytest.mark.asyncio
+    async def test_load_missing(self):
+        conn = AsyncMock()
+        conn.fetchrow.return_value = None
+        writer = PostgresAnalysisLogWriter(make_pool(conn))
+
+        assert await writer.load(uuid4()) is None
+        conn.fetch.assert_not_called()
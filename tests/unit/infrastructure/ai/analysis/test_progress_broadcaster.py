@@ -0,0 +1,254 @@
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from src.infrastructure.ai.analysis.progress_broadcaster import (
+    ProgressBroadcaster,
+    ProgressSubscription,
+)
+from src.infrastructure.ai.analysis.progress_relay import (
+    MAX_PAYLOAD_BYTES,
+    PostgresProgressRelay,
+)
+from src.infrastructure.ai.analysis.progress_tracker import (
+    AnalysisProgress,
+    AnalysisStage,
+    ProgressTracker,
+)
+
+
+def make_progress(document_id=None, stage=AnalysisStage.ANALYZING, step="Analyzing") -> AnalysisProgress:
+    tracker = ProgressTracker(document_id=document_id or uuid4())
+    if stage == AnalysisStage.COMPLETED:
+        tracker.complete()
+    else:
+        tracker.start_stage(stage, step)
+    return tracker.get_progress()
+
+
+def make_pool(conn):
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+    return pool
+
+
+class TestAnalysisProgressSerialization:
+    def test_round_trip(self):
+        tracker = ProgressTracker(document_id=uuid4())
+        tracker.start_stage(AnalysisStage.ANALYZING, "Analyzing")
+        tracker.complete_step()
+        tracker.report_issue({"title": "Missing owner"})
+        tracker.add_warning("slow provider")
+        progress = tracker.get_progress()
+
+        restored = AnalysisProgress.from_dict(json.loads(json.dumps(progress.to_dict())))
+
+        assert restored == progress
+
+    def test_is_finished(self):
+        assert not make_progress().is_finished
+        assert make_progress(stage=AnalysisStage.COMPLETED).is_finished
+
+
+class TestProgressSubscription:
+    @pytest.mark.asyncio
+    async def test_coalesces_to_latest(self):
+        subscription = ProgressSubscription(uuid4())
+        first, second = make_progress(step="first"), make_progress(step="second")
+        subscription.offer(first)
+        subscription.offer(second)
+
+        assert await subscription.next(timeout=1) is second
+        assert subscription.coalesced == 1
+        assert await subscription.next(timeout=0.01) is None
+
+    @pytest.mark.asyncio
+    async def test_next_waits_for_offer(self):
+        subscription = ProgressSubscription(uuid4())
+        progress = make_progress()
+
+        async def offer_later():
+            await asyncio.sleep(0.01)
+            subscription.offer(progress)
+
+        task = asyncio.create_task(offer_later())
+        assert await subscription.next(timeout=5) is progress
+        await task
+
+
+class TestProgressBroadcaster:
+    def test_publish_reaches_document_subscribers(self):
+        broadcaster = ProgressBroadcaster()
+        document_id = uuid4()
+        subscription = broadcaster.subscribe(document_id)
+        other = broadcaster.subscribe(uuid4())
+        progress = make_progress(document_id)
+
+        broadcaster.publish(progress)
+
+        assert subscription._latest is progress
+        assert other._latest is None
+        assert broadcaster.latest(document_id) is progress
+
+    def test_publish_forwards_to_relay(self):
+        broadcaster = ProgressBroadcaster()
+        relay = MagicMock()
+        broadcaster.attach(relay)
+        progress = make_progress()
+
+        broadcaster.publish(progress)
+        broadcaster.deliver(make_progress())
+
+        relay.send.assert_called_once_with(progress)
+
+    def test_subscribe_starts_with_running_progress(self):
+        broadcaster = ProgressBroadcaster()
+        running = make_progress()
+        finished = make_progress(stage=AnalysisStage.COMPLETED)
+        broadcaster.deliver(running)
+        broadcaster.deliver(finished)
+
+        assert broadcaster.subscribe(running.document_id)._latest is running
+        assert broadcaster.subscribe(finished.document_id)._latest is None
+
+    def test_unsubscribe(self):
+        broadcaster = ProgressBroadcaster()
+        document_id = uuid4()
+        subscription = broadcaster.subscribe(document_id)
+        broadcaster.unsubscribe(subscription)
+        broadcaster.unsubscribe(subscription)
+
+        assert broadcaster.subscriber_count(document_id) == 0
+
+    def test_latest_is_bounded(self):
+        broadcaster = ProgressBroadcaster(max_documents=2)
+        progresses = [make_progress() for _ in range(3)]
+        for progress in progresses:
+            broadcaster.deliver(progress)
+
+        assert broadcaster.latest(progresses[0].document_id) is None
+        assert broadcaster.latest(progresses[2].document_id) is progresses[2]
+
+    def test_tracker_callback(self):
+        broadcaster = ProgressBroadcaster()
+        document_id = uuid4()
+        tracker = ProgressTracker(document_id=document_id)
+        tracker.add_callback(broadcaster.publish)
+        tracker.start_stage(AnalysisStage.PREPROCESSING, "Preparing")
+
+        assert broadcaster.latest(document_id).stage == AnalysisStage.PREPROCESSING
+
+
+class TestPostgresProgressRelay:
+    @pytest.mark.asyncio
+    async def test_flush_sends_latest_per_document(self):
+        conn = AsyncMock()
+        relay = PostgresProgressRelay(make_pool(conn), ProgressBroadcaster())
+        document_id = uuid4()
+        relay.send(make_progress(document_id, step="first"))
+        relay.send(make_progress(document_id, step="second"))
+        relay.send(make_progress())
+
+        assert await relay.flush() == 2
+
+        rows = conn.executemany.call_args.args[1]
+        assert [row[0] for row in rows] == ["analysis_progress", "analysis_progress"]
+        assert json.loads(rows[0][1])["progress"]["current_step"] == "second"
+        assert relay.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_flush_failure_keeps_newer_progress(self):
+        conn = AsyncMock()
+        relay = PostgresProgressRelay(make_pool(conn), ProgressBroadcaster())
+        document_id = uuid4()
+        newer = make_progress(document_id, step="newer")
+
+        async def fail(*args):
+            relay.send(newer)
+            raise RuntimeError("connection lost")
+
+        conn.executemany.side_effect = fail
+        relay.send(make_progress(document_id, step="older"))
+
+        with pytest.raises(RuntimeError):
+            await relay.flush()
+
+        assert relay._pending == {document_id: newer}
+
+    def test_encode_trims_large_payloads(self):
+        relay = PostgresProgressRelay(MagicMock(), ProgressBroadcaster())
+        progress = make_progress()
+        progress.latest_issue = {"description": "x" * 10000}
+        progress.errors = ["e" * 1000] * 10
+
+        payload = relay._encode(progress)
+
+        assert len(payload.encode()) <= MAX_PAYLOAD_BYTES
+        data = json.loads(payload)["progress"]
+        assert data["latest_issue"] is None
+        assert len(data["errors"]) == 3
+
+    def test_notification_from_other_worker_is_delivered(self):
+        broadcaster = ProgressBroadcaster()
+        relay = PostgresProgressRelay(MagicMock(), broadcaster)
+        progress = make_progress()
+        payload = json.dumps({"origin": "other", "progress": progress.to_dict()})
+
+        relay._on_notification(None, 1, "analysis_progress", payload)
+
+        assert broadcaster.latest(progress.document_id) == progress
+
+    def test_own_and_malformed_notifications_are_ignored(self):
+        broadcaster = ProgressBroadcaster()
+        relay = PostgresProgressRelay(MagicMock(), broadcaster)
+        progress = make_progress()
+
+        relay._on_notification(None, 1, "analysis_progress", relay._encode(progress))
+        relay._on_notification(None, 1, "analysis_progress", "not json")
+        relay._on_notification(None, 1, "analysis_progress", '{"origin": "other"}')
+
+        assert broadcaster.latest(progress.document_id) is None
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop_manage_listener(self):
+        listener = MagicMock()
+        listener.add_listener = AsyncMock()
+        listener.remove_listener = AsyncMock()
+        listener.is_closed.return_value = False
+        conn = AsyncMock()
+        pool = MagicMock()
+        pool.acquire = MagicMock(side_effect=lambda: _Acquire(listener, conn))
+        pool.release = AsyncMock()
+        relay = PostgresProgressRelay(pool, ProgressBroadcaster(), flush_interval=0)
+
+        await relay.start()
+        relay.send(make_progress())
+        await relay.stop()
+
+        listener.add_listener.assert_awaited_once()
+        listener.remove_listener.assert_awaited_once()
+        pool.release.assert_awaited_once_with(listener)
+        assert relay.pending == 0
+        conn.executemany.assert_awaited()
+
+
+class _Acquire:
+    """Mimics asyncpg's PoolAcquireContext: awaitable or usable as a context manager."""
+
+    def __init__(self, listener, conn):
+        self._listener = listener
+        self._conn = conn
+
+    def __await__(self):
+        async def acquire():
+            return self._listener
+        return acquire().__await__()
+
+    async def __aenter__(self):
+        return self._conn
+
+    async def __aexit__(self, *exc):
+        return None
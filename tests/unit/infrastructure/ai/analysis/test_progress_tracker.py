@@ -109,6 +109,23 @@ class TestProgressTracker:
         assert notifications[0].stage == AnalysisStage.ANALYZING
         assert notifications[1].completed_steps == 1
 
+    def test_report_issue_notifies_callbacks(self, tracker):
+        notifications = []
+        tracker.add_callback(notifications.append)
+        
+        tracker.report_issue({"title": "First"})
+        tracker.report_issue({"title": "Second"})
+        
+        assert [n.issues_found for n in notifications] == [1, 2]
+        assert notifications[-1].latest_issue == {"title": "Second"}
+        assert notifications[-1].to_dict()["issues_found"] == 2
+
+    def test_report_issue_after_cancel(self, tracker):
+        tracker.cancel()
+        
+        with pytest.raises(AnalysisCancelledException):
+            tracker.report_issue({"title": "Late"})
+
     def test_remove_callback(self, tracker):
         notifications = []
         
@@ -0,0 +1,107 @@
+import pytest
+
+from src.infrastructure.ai.prompts.base import PrefixMemo, PromptContext, PromptParts, prefix_memo
+from src.infrastructure.ai.prompts.document_analysis import DocumentAnalysisPrompt
+from src.infrastructure.ai.prompts.policy_compliance import PolicyCompliancePrompt
+from src.infrastructure.ai.prompts.suggestion_generation import SuggestionGenerationPrompt
+
+RULES = [{"id": "1", "name": "Rule 1", "description": "Define all parameters"}]
+
+
+@pytest.fixture(autouse=True)
+def clear_memo():
+    prefix_memo.clear()
+    yield
+    prefix_memo.clear()
+
+
+class TestPrefixMemo:
+    def test_renders_once_per_key(self):
+        memo = PrefixMemo()
+        calls = []
+
+        def render():
+            calls.append(1)
+            return "prefix"
+
+        assert memo.get_or_render("a", render) == "prefix"
+        assert memo.get_or_render("a", render) == "prefix"
+        assert len(calls) == 1
+        assert (memo.hits, memo.misses) == (1, 1)
+
+    def test_evicts_least_recently_used(self):
+        memo = PrefixMemo(max_size=2)
+        memo.get_or_render("a", lambda: "a")
+        memo.get_or_render("b", lambda: "b")
+        memo.get_or_render("a", lambda: "a")
+        memo.get_or_render("c", lambda: "c")
+
+        assert len(memo) == 2
+        assert memo.get_or_render("b", lambda: "rerendered") == "rerendered"
+
+
+class TestDocumentAnalysisParts:
+    def test_prefix_is_shared_across_options(self):
+        prompt = DocumentAnalysisPrompt()
+        first = prompt.render_parts(PromptContext(document_content="Doc", policy_rules=RULES, max_issues=10))
+        second = prompt.render_parts(PromptContext(
+            document_content="Doc",
+            policy_rules=RULES,
+            max_issues=25,
+            include_suggestions=False,
+            section_focus=["Rebalancing"],
+            extra_context="Second pass",
+        ))
+
+        assert first.prefix == second.prefix
+        assert first.cache_key == second.cache_key
+        assert first.suffix != second.suffix
+        assert "Rebalancing" in second.suffix and "Rebalancing" not in second.prefix
+        assert prefix_memo.hits == 1
+
+    def test_document_and_rules_are_in_prefix(self):
+        parts = DocumentAnalysisPrompt().render_parts(
+            PromptContext(document_content="Unique document body", policy_rules=RULES)
+        )
+
+        assert "Unique document body" in parts.prefix
+        assert "Define all parameters" in parts.prefix
+        assert parts.system == DocumentAnalysisPrompt().get_system_prompt()
+        assert parts.user == parts.prefix + parts.suffix
+
+    def test_different_document_changes_key(self):
+        prompt = DocumentAnalysisPrompt()
+        first = prompt.render_parts(PromptContext(document_content="Doc A", policy_rules=RULES))
+        second = prompt.render_parts(PromptContext(document_content="Doc B", policy_rules=RULES))
+
+        assert first.cache_key != second.cache_key
+        assert prefix_memo.misses == 2
+
+    def test_render_matches_parts(self):
+        prompt = DocumentAnalysisPrompt()
+        context = PromptContext(document_content="Doc", policy_rules=RULES)
+
+        assert prompt.render(context) == prompt.render_parts(context).user
+
+
+class TestSuggestionParts:
+    def test_issue_details_follow_shared_prefix(self):
+        prompt = SuggestionGenerationPrompt()
+        first = prompt.render_parts(PromptContext(document_content="Context", issue_data={"title": "Issue A"}))
+        second = prompt.render_parts(PromptContext(document_content="Context", issue_data={"title": "Issue B"}))
+
+        assert first.prefix == second.prefix
+        assert "Issue A" in first.suffix and "Issue A" not in first.prefix
+
+    def test_requires_issue_data(self):
+        with pytest.raises(ValueError):
+            SuggestionGenerationPrompt().render_parts(PromptContext())
+
+
+def test_templates_without_prefix_send_everything_as_suffix():
+    prompt = PolicyCompliancePrompt()
+    context = PromptContext(document_content="Doc", policy_rules=RULES)
+
+    parts = prompt.render_parts(context)
+
+    assert parts == PromptParts(system=prompt.get_system_prompt(), prefix="", suffix=prompt.render(context))
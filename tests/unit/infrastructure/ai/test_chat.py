@@ -0,0 +1,224 @@
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.infrastructure.ai.chat import (
+    BM25Index,
+    ChatContextCache,
+    DocumentChatService,
+    ProviderContextCache,
+    build_chunks,
+    build_context,
+    tokenize,
+)
+from src.infrastructure.ai.chat import context as chat_context
+from src.infrastructure.ai.chat.retrieval import DEFINITION, SECTION
+from src.infrastructure.queries.document_queries import DocumentDetailView
+from src.infrastructure.semantic.ir_store import InMemorySemanticIRStore
+
+UPDATED_AT = datetime(2026, 1, 5, 12, 0, tzinfo=timezone.utc)
+
+SECTIONS = [
+    {"title": "Overview", "content": "The strategy trades equity index futures intraday.", "level": 1},
+    {"title": "Signal Generation", "content": "A momentum signal compares the 20 day lookback return to zero.", "level": 2},
+    {"title": "Risk Management", "content": "Positions are capped by a value at risk limit and a stop loss.", "level": 2},
+    {"title": "Execution", "content": "Orders are sliced with a volume weighted schedule.", "level": 2},
+]
+DEFINITIONS = [
+    {"id": "d1", "term": "Lookback Window", "definition": "Number of days used for the momentum return.", "aliases": ["lookback"]},
+]
+# Large enough for each section to be its own excerpt but the document too large to send whole
+FILLER = " ".join(f"filler{i}" for i in range(3000))
+
+
+def make_document(sections=SECTIONS, updated_at=UPDATED_AT) -> DocumentDetailView:
+    return DocumentDetailView(
+        id=uuid4(),
+        title="Momentum Strategy",
+        description=None,
+        status="converted",
+        version=1,
+        original_format="pdf",
+        markdown_content="\n\n".join(s["content"] for s in sections),
+        sections=sections,
+        metadata={},
+        policy_repository_id=None,
+        compliance_status=None,
+        created_at=UPDATED_AT,
+        updated_at=updated_at,
+    )
+
+
+def make_client(text="Answer"):
+    client = MagicMock()
+    client.aio.models.generate_content = AsyncMock(
+        return_value=SimpleNamespace(text=text, usage_metadata=None)
+    )
+    client.aio.caches.create = AsyncMock(return_value=SimpleNamespace(name="cachedContents/abc"))
+    return client
+
+
+def sent_text(client) -> str:
+    contents = client.aio.models.generate_content.call_args.kwargs["contents"]
+    return "\n".join(part.text for content in contents for part in content.parts)
+
+
+class TestRetrieval:
+    def test_tokenize_drops_stopwords(self):
+        assert tokenize("What is the 20 day Lookback?") == ["20", "day", "lookback"]
+
+    def test_chunks_cover_sections_and_definitions(self):
+        chunks = build_chunks(SECTIONS, None, DEFINITIONS)
+
+        assert [c.kind for c in chunks] == [SECTION] * 4 + [DEFINITION]
+        assert chunks[-1].title == "Lookback Window (lookback)"
+        assert build_chunks(None, "Only markdown")[0].text == "Only markdown"
+
+    def test_large_sections_are_split(self):
+        chunks = build_chunks([{"title": "Appendix", "content": "\n\n".join([FILLER] * 3)}], None)
+
+        assert len(chunks) > 3
+        assert all(c.title == "Appendix" for c in chunks)
+
+    def test_ranks_relevant_chunks_first(self):
+        index = BM25Index(build_chunks(SECTIONS, None, DEFINITIONS))
+
+        hits = index.search("How is risk limited?", k=2)
+
+        assert hits[0][0].title == "Risk Management"
+        assert index.search("zebra") == []
+
+    def test_follow_up_uses_earlier_turns(self):
+        index = BM25Index(build_chunks(SECTIONS, None, DEFINITIONS))
+
+        hits = index.search("how long is it?", k=3, context=["Tell me about the momentum signal"])
+
+        assert {chunk.title for chunk, _ in hits} >= {"Signal Generation"}
+
+
+class TestChatContext:
+    def test_system_instruction_has_outline_not_content(self):
+        context = build_context(make_document(), DEFINITIONS)
+
+        assert "  - Signal Generation" in context.system_instruction
+        assert "Defined Terms: Lookback Window" in context.system_instruction
+        assert "volume weighted" not in context.system_instruction
+
+    @pytest.mark.asyncio
+    async def test_context_is_rebuilt_only_for_new_versions(self):
+        cache = ChatContextCache()
+        builds = []
+
+        async def build():
+            builds.append(1)
+            return build_context(make_document(), [])
+
+        first = await cache.get("doc", ("1.0", None), build)
+        assert await cache.get("doc", ("1.0", None), build) is first
+        await cache.get("doc", ("1.1", None), build)
+
+        assert len(builds) == 2 and (cache.hits, cache.misses) == (1, 2)
+
+
+class TestProviderContextCache:
+    @pytest.fixture
+    def large_context(self):
+        sections = [{"title": f"Section {i} {FILLER[:400]}", "content": "x", "level": 1} for i in range(40)]
+        return build_context(make_document(sections), [])
+
+    @pytest.mark.asyncio
+    async def test_small_contexts_are_not_cached(self):
+        client = make_client()
+
+        assert await ProviderContextCache().get_or_create(client, "gemini-2.5-flash", build_context(make_document(), [])) is None
+        client.aio.caches.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_turns_share_one_cached_content(self, large_context):
+        client = make_client()
+        cache = ProviderContextCache()
+
+        names = await asyncio.gather(*[
+            cache.get_or_create(client, "gemini-2.5-flash", large_context) for _ in range(5)
+        ])
+
+        assert names == ["cachedContents/abc"] * 5
+        assert client.aio.caches.create.await_count == 1
+        config = client.aio.caches.create.call_args.kwargs["config"]
+        assert config.system_instruction == large_context.system_instruction
+
+    @pytest.mark.asyncio
+    async def test_failed_create_falls_back_inline_for_a_while(self, large_context):
+        client = make_client()
+        client.aio.caches.create.side_effect = RuntimeError("caches API not available")
+        cache = ProviderContextCache()
+
+        assert await cache.get_or_create(client, "gemini-2.5-flash", large_context) is None
+        assert await cache.get_or_create(client, "gemini-2.5-flash", large_context) is None
+        assert client.aio.caches.create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_entries_are_recreated_before_expiry(self, large_context, monkeypatch):
+        client = make_client()
+        cache = ProviderContextCache(ttl_seconds=3600)
+        monkeypatch.setattr(chat_context.time, "monotonic", lambda: 1000.0)
+        await cache.get_or_create(client, "gemini-2.5-flash", large_context)
+
+        monkeypatch.setattr(chat_context.time, "monotonic", lambda: 1000.0 + 3600 - 30)
+        await cache.get_or_create(client, "gemini-2.5-flash", large_context)
+
+        assert client.aio.caches.create.await_count == 2
+
+
+class TestDocumentChatService:
+    @pytest.mark.asyncio
+    async def test_turn_sends_top_chunks_and_recent_history_only(self):
+        client = make_client()
+        service = DocumentChatService(top_k=1)
+        history = [("user", FILLER), ("assistant", FILLER), ("user", "What about risk?"), ("assistant", "It is capped.")]
+
+        reply = await service.reply(client, make_document(), "Which stop loss applies?", history)
+
+        text = sent_text(client)
+        assert reply.text == "Answer" and reply.sources == ("Risk Management",)
+        assert "value at risk limit" in text and "volume weighted" not in text
+        # The long opening exchange no longer fits the history budget
+        assert FILLER not in text and "What about risk?" in text
+        config = client.aio.models.generate_content.call_args.kwargs["config"]
+        assert "Document Outline" in config.system_instruction
+
+    @pytest.mark.asyncio
+    async def test_definitions_from_semantic_ir_are_retrievable(self):
+        store = InMemorySemanticIRStore()
+        store.fetch = AsyncMock(return_value={"definitions": DEFINITIONS})
+        store.version = AsyncMock(return_value="v1")
+        client = make_client()
+
+        reply = await DocumentChatService(store, top_k=1).reply(client, make_document(), "Define lookback")
+
+        assert reply.sources == ("Lookback Window (lookback)",)
+        store.fetch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cached_content_is_used_and_dropped_when_rejected(self):
+        client = make_client()
+        provider_cache = MagicMock(spec=ProviderContextCache)
+        provider_cache.get_or_create = AsyncMock(return_value="cachedContents/abc")
+        client.aio.models.generate_content.side_effect = [
+            RuntimeError("cached content not found"),
+            SimpleNamespace(text="Answer", usage_metadata=None),
+        ]
+        service = DocumentChatService(provider_cache=provider_cache)
+
+        reply = await service.reply(client, make_document(), "Which stop loss applies?")
+
+        first, second = client.aio.models.generate_content.call_args_list
+        assert first.kwargs["config"].cached_content == "cachedContents/abc"
+        assert first.kwargs["config"].system_instruction is None
+        assert second.kwargs["config"].cached_content is None
+        provider_cache.forget.assert_called_once()
+        assert reply.cached_context is False
@@ -0,0 +1,99 @@
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.infrastructure.ai import http_pool
+from src.infrastructure.ai.http_pool import (
+    HttpPoolConfig,
+    _default_client_factory,
+    close_http_clients,
+    get_http_client,
+)
+
+
+class TestHttpPoolConfig:
+    def test_defaults(self):
+        config = HttpPoolConfig()
+
+        assert config.max_connections == 100
+        assert config.max_keepalive_connections == 20
+
+    def test_from_env(self):
+        with patch.dict('os.environ', {
+            'AI_HTTP_MAX_CONNECTIONS': '7',
+            'AI_HTTP_MAX_KEEPALIVE_CONNECTIONS': '3',
+            'AI_HTTP_KEEPALIVE_EXPIRY': '5.5',
+        }):
+            config = HttpPoolConfig.from_env()
+
+        assert config.max_connections == 7
+        assert config.max_keepalive_connections == 3
+        assert config.keepalive_expiry == 5.5
+
+
+class TestGetHttpClient:
+    @pytest_asyncio.fixture(autouse=True)
+    async def pool(self, monkeypatch):
+        # A pool of this test's own; clients left by other tests may belong to a closed loop
+        monkeypatch.setattr(http_pool, "_clients", {})
+        yield
+        await close_http_clients()
+
+    @pytest.mark.asyncio
+    async def test_reuses_client_per_name(self):
+        first = get_http_client("claude", 30)
+        second = get_http_client("claude", 30)
+
+        assert first is second
+        assert get_http_client("openai", 30) is not first
+
+    @pytest.mark.asyncio
+    async def test_applies_timeout(self):
+        client = get_http_client("gemini", 45, HttpPoolConfig(connect_timeout=2.0))
+
+        assert client.timeout.read == 45
+        assert client.timeout.connect == 2.0
+
+    @pytest.mark.asyncio
+    async def test_recreated_after_close(self):
+        first = get_http_client("claude", 30)
+        await close_http_clients()
+
+        assert first.is_closed
+        assert get_http_client("claude", 30) is not first
+
+    @pytest.mark.asyncio
+    async def test_custom_client_factory(self):
+        calls = []
+
+        def factory(config, read_timeout):
+            calls.append((config.max_connections, read_timeout))
+            return _default_client_factory(config, read_timeout)
+
+        get_http_client("custom", 12, HttpPoolConfig(max_connections=4), client_factory=factory)
+        get_http_client("custom", 12, client_factory=factory)
+
+        assert calls == [(4, 12)]
+
+    @pytest.mark.asyncio
+    async def test_close_continues_after_a_failing_client(self, monkeypatch):
+        broken = MagicMock(is_closed=False, aclose=AsyncMock(side_effect=RuntimeError("Event loop is closed")))
+        healthy = MagicMock(is_closed=False, aclose=AsyncMock())
+        monkeypatch.setattr(http_pool, "_clients", {"broken": broken, "healthy": healthy})
+
+        await close_http_clients()
+
+        healthy.aclose.assert_awaited_once()
+        assert http_pool._clients == {}
+
+    @pytest.mark.asyncio
+    async def test_gemini_client_follows_recreated_pool_client(self, monkeypatch):
+        from src.infrastructure.ai import gemini_provider
+
+        monkeypatch.setattr(gemini_provider, "_gemini_clients", {})
+        first = gemini_provider.get_gemini_client("key", None)
+        assert gemini_provider.get_gemini_client("key", None) is first
+
+        await close_http_clients()
+
+        assert gemini_provider.get_gemini_client("key", None) is not first
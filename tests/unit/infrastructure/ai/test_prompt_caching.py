@@ -0,0 +1,52 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.infrastructure.ai.claude_provider import EPHEMERAL_CACHE, ClaudeProvider
+from src.infrastructure.ai.openai_provider import OpenAIProvider
+from src.infrastructure.ai.prompts.base import PromptParts
+
+PROMPT = PromptParts(system="System", prefix="Prefix", suffix="Suffix", cache_key="abc123")
+
+
+class TestClaudePromptCaching:
+    def test_system_and_prefix_are_cache_breakpoints(self):
+        request = ClaudeProvider._cached_request(PROMPT)
+
+        assert request["system"] == [{"type": "text", "text": "System", "cache_control": EPHEMERAL_CACHE}]
+        assert request["messages"][0]["content"] == [
+            {"type": "text", "text": "Prefix", "cache_control": EPHEMERAL_CACHE},
+            {"type": "text", "text": "Suffix"},
+        ]
+
+    def test_usage_counts_cache_reads(self):
+        provider = ClaudeProvider.__new__(ClaudeProvider)
+        message = SimpleNamespace(usage=SimpleNamespace(
+            input_tokens=100, cache_read_input_tokens=900, cache_creation_input_tokens=0, output_tokens=50,
+        ))
+
+        with patch("src.infrastructure.ai.claude_provider.record_token_usage") as record:
+            assert provider._record_usage(message) == (1050, 900)
+
+        record.assert_called_once_with("claude", 1000, 50, 900)
+
+
+class TestOpenAIPromptCaching:
+    def test_cache_key_is_sent(self):
+        request = OpenAIProvider._cached_request(PROMPT)
+
+        assert request["prompt_cache_key"] == "abc123"
+        assert request["messages"][1] == {"role": "user", "content": "PrefixSuffix"}
+
+    def test_usage_counts_cached_tokens(self):
+        provider = OpenAIProvider.__new__(OpenAIProvider)
+        usage = SimpleNamespace(
+            prompt_tokens=2000,
+            completion_tokens=100,
+            total_tokens=2100,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=1536),
+        )
+
+        with patch("src.infrastructure.ai.openai_provider.record_token_usage") as record:
+            assert provider._record_usage(usage) == (2100, 1536)
+
+        record.assert_called_once_with("openai", 2000, 100, 1536)
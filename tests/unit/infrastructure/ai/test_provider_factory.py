@@ -89,3 +89,24 @@ class TestProviderFactory:
         stats = limiter.get_stats()
         
         assert stats["minute_limit"] == 30
+
+
+class TestProviderRegistry:
+    def test_preload_imports_configured_providers_only(self):
+        factory = ProviderFactory()
+        with patch.dict('os.environ', {
+            'ANTHROPIC_API_KEY': 'test-key',
+            'AI_INTEGRATIONS_ANTHROPIC_API_KEY': '',
+            'GEMINI_API_KEY': '',
+            'AI_INTEGRATIONS_GEMINI_API_KEY': '',
+            'OPENAI_API_KEY': '',
+            'AI_INTEGRATIONS_OPENAI_API_KEY': '',
+        }, clear=False):
+            assert factory.preload() == [ProviderType.CLAUDE]
+        # Preloading imports modules without creating providers
+        assert factory._instances == {}
+
+    def test_provider_class_from_registry(self):
+        from src.infrastructure.ai.openai_provider import OpenAIProvider
+
+        assert ProviderFactory._provider_class(ProviderType.OPENAI) is OpenAIProvider
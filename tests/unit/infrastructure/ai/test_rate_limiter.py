@@ -1,8 +1,16 @@
 import pytest
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
-from src.infrastructure.ai.rate_limiter import RateLimiter, RateLimitConfig
+from src.infrastructure.ai.rate_limiter import (
+    BucketLimit,
+    InMemoryRateLimitStore,
+    RateLimiter,
+    RateLimitConfig,
+    TokenBucket,
+    _parse_reset,
+    consume_all,
+)
 
 
 class TestRateLimitConfig:
@@ -91,3 +99,180 @@ class TestRateLimiter:
         assert stats["tokens_per_minute"] == 1000
         
         limiter.release()
+
+
+class TestTokenBucket:
+    def test_refill_is_capped_at_capacity(self):
+        bucket = TokenBucket(BucketLimit(60, 60.0), level=0, updated_at=0.0)
+
+        bucket.refill(10.0)
+        assert bucket.level == pytest.approx(10)
+
+        bucket.refill(1000.0)
+        assert bucket.level == 60
+
+    def test_delay_for_deficit(self):
+        bucket = TokenBucket(BucketLimit(60, 60.0), level=0, updated_at=0.0)
+
+        assert bucket.delay_for(5) == pytest.approx(5.0)
+        assert bucket.delay_for(0) == 0.0
+
+    def test_consume_all_is_all_or_nothing(self):
+        buckets = {
+            "a": TokenBucket(BucketLimit(10, 60.0), level=10, updated_at=0.0),
+            "b": TokenBucket(BucketLimit(10, 60.0), level=1, updated_at=0.0),
+        }
+
+        delay = consume_all(buckets, {"a": 5, "b": 5}, now=0.0)
+
+        assert delay > 0
+        assert buckets["a"].level == 10
+        assert buckets["b"].level == 1
+
+
+class TestParseReset:
+    def test_plain_seconds(self):
+        assert _parse_reset("2.5", datetime.now(timezone.utc)) == 2.5
+
+    def test_openai_duration(self):
+        now = datetime.now(timezone.utc)
+        assert _parse_reset("6m0s", now) == 360.0
+        assert _parse_reset("20ms", now) == pytest.approx(0.02)
+        assert _parse_reset("1h2m3s", now) == 3723.0
+
+    def test_rfc3339_timestamp(self):
+        now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        assert _parse_reset("2025-01-01T00:00:30Z", now) == 30.0
+
+    def test_garbage_returns_none(self):
+        assert _parse_reset("soon", datetime.now(timezone.utc)) is None
+
+
+class TestTokenBucketRateLimiter:
+    @pytest.mark.asyncio
+    async def test_waiters_are_served_in_fifo_order(self):
+        limiter = RateLimiter(RateLimitConfig(requests_per_minute=600, concurrent_requests=10))
+        # Drain the minute bucket so every waiter must queue for refill (10 req/s).
+        for _ in range(600):
+            await limiter.acquire()
+            limiter.release()
+
+        order = []
+
+        async def worker(i):
+            await limiter.acquire()
+            order.append(i)
+            limiter.release()
+
+        tasks = [asyncio.create_task(worker(i)) for i in range(3)]
+        await asyncio.sleep(0)
+        assert limiter.get_stats()["waiting"] == 3
+        await asyncio.gather(*tasks)
+
+        assert order == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_block_queue(self):
+        limiter = RateLimiter(RateLimitConfig(requests_per_minute=600))
+        for _ in range(600):
+            await limiter.acquire()
+            limiter.release()
+
+        first = asyncio.create_task(limiter.acquire())
+        second = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        first.cancel()
+
+        await asyncio.wait_for(second, timeout=1)
+        limiter.release()
+        assert limiter.get_stats()["waiting"] == 0
+
+    @pytest.mark.asyncio
+    async def test_record_usage_corrects_token_estimate(self):
+        limiter = RateLimiter()
+        await limiter.acquire(estimated_tokens=1000)
+        limiter.release()
+
+        await limiter.record_usage(estimated_tokens=1000, actual_tokens=4000)
+
+        assert limiter.get_stats()["tokens_per_minute"] == 4000
+
+    @pytest.mark.asyncio
+    async def test_anthropic_headers_adapt_limits(self):
+        limiter = RateLimiter(RateLimitConfig(requests_per_minute=60))
+
+        await limiter.update_from_headers({
+            "llm_provider-anthropic-ratelimit-requests-limit": "50",
+            "llm_provider-anthropic-ratelimit-requests-remaining": "10",
+            "anthropic-ratelimit-tokens-limit": "80000",
+            "anthropic-ratelimit-tokens-remaining": "20000",
+        })
+
+        stats = limiter.get_stats()
+        assert stats["minute_limit"] == 50
+        assert stats["requests_per_minute"] == 40
+        assert stats["tokens_per_minute"] == 60000
+
+    @pytest.mark.asyncio
+    async def test_exhausted_openai_headers_block_until_reset(self):
+        limiter = RateLimiter()
+
+        await limiter.update_from_headers({
+            "x-ratelimit-limit-requests": "100",
+            "x-ratelimit-remaining-requests": "0",
+            "x-ratelimit-reset-requests": "200ms",
+        })
+
+        start = asyncio.get_running_loop().time()
+        await limiter.acquire()
+        limiter.release()
+        assert asyncio.get_running_loop().time() - start >= 0.15
+
+    @pytest.mark.asyncio
+    async def test_limiters_sharing_a_store_share_budget(self):
+        store = InMemoryRateLimitStore()
+        config = RateLimitConfig(requests_per_minute=10)
+        worker_a = RateLimiter(config, store=store, key="claude")
+        worker_b = RateLimiter(config, store=store, key="claude")
+
+        for _ in range(3):
+            await worker_a.acquire()
+            worker_a.release()
+        await worker_b.acquire()
+        worker_b.release()
+
+        assert worker_b.current_minute_usage == 4
+
+
+class TestConcurrencySlots:
+    @pytest.mark.asyncio
+    async def test_over_release_fails_loudly(self):
+        limiter = RateLimiter(RateLimitConfig(concurrent_requests=1))
+        await limiter.acquire()
+        limiter.release()
+
+        with pytest.raises(ValueError):
+            limiter.release()
+
+    @pytest.mark.asyncio
+    async def test_provider_cancelled_while_queued_does_not_release(self, monkeypatch):
+        from src.infrastructure.ai import http_pool
+        from src.infrastructure.ai.claude_provider import ClaudeProvider
+
+        monkeypatch.setattr(http_pool, "_clients", {})
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+        limiter = RateLimiter(RateLimitConfig(concurrent_requests=1))
+        provider = ClaudeProvider(rate_limiter=limiter)
+        await limiter.acquire()
+
+        task = asyncio.create_task(provider.analyze_document_stream("doc", []))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # Only the slot taken above is outstanding
+        limiter.release()
+        with pytest.raises(ValueError):
+            limiter.release()
+        await http_pool.close_http_clients()
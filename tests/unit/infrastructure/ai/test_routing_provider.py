@@ -0,0 +1,321 @@
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from src.infrastructure.ai.base import (
+    AIProvider,
+    AnalysisOptions,
+    AnalysisResult,
+    Issue,
+    IssueSeverity,
+    PolicyRule,
+    ProviderType,
+    Suggestion,
+)
+from src.infrastructure.ai.provider_factory import ProviderFactory
+from src.infrastructure.ai.routing_provider import ProviderHealth, RoutingConfig, RoutingProvider
+
+
+def make_issue(title: str) -> Issue:
+    return Issue.create("R1", IssueSeverity.MEDIUM, title, "", "", "", 0.8)
+
+
+class FakeProvider(AIProvider):
+    def __init__(self, provider_type, delay=0.0, success=True, issues=None, issue_delay=None):
+        self._type = provider_type
+        self.delay = delay
+        self.success = success
+        self.issues = issues or []
+        self.issue_delay = issue_delay
+        self.calls = 0
+        self.cancelled = False
+        self.options_seen = []
+
+    @property
+    def provider_type(self):
+        return self._type
+
+    @property
+    def default_model(self):
+        return f"{self._type.value}-model"
+
+    @property
+    def available_models(self):
+        return [self.default_model]
+
+    async def analyze_document(self, content, policy_rules, options=None):
+        return await self.analyze_document_stream(content, policy_rules, options)
+
+    async def analyze_document_stream(self, content, policy_rules, options=None, on_issue=None):
+        self.calls += 1
+        self.options_seen.append(options)
+        try:
+            if self.issue_delay is not None:
+                await asyncio.sleep(self.issue_delay)
+                for issue in self.issues:
+                    if on_issue:
+                        on_issue(issue)
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return AnalysisResult(
+            success=self.success,
+            issues=self.issues if self.success else [],
+            suggestions=[],
+            summary=self._type.value,
+            processing_time_ms=int(self.delay * 1000),
+            model_used=self.default_model,
+            errors=[] if self.success else [f"{self._type.value} down"],
+        )
+
+    async def generate_suggestion(self, issue, document_context, policy_rule):
+        self.calls += 1
+        if not self.success:
+            raise RuntimeError(f"{self._type.value} down")
+        return Suggestion.create(issue.id, self._type.value, "", 0.9)
+
+    async def generate_text(self, prompt, max_tokens=2048):
+        self.calls += 1
+        if not self.success:
+            raise RuntimeError(f"{self._type.value} down")
+        return self._type.value
+
+    async def is_available(self):
+        return self.success
+
+
+def routing(*providers, **config):
+    return RoutingProvider(list(providers), health={}, config=RoutingConfig(**config))
+
+
+class TestProviderHealth:
+    def test_latency_ewma(self):
+        health = ProviderHealth(RoutingConfig(ewma_alpha=0.5))
+        health.record_success(1.0)
+        health.record_success(3.0)
+        
+        assert health.latency_ewma == 2.0
+
+    def test_errors_make_provider_unhealthy(self):
+        health = ProviderHealth(RoutingConfig(ewma_alpha=0.5, unhealthy_error_rate=0.5))
+        health.record_failure()
+        
+        assert not health.is_healthy
+        
+        health.record_success(1.0)
+        
+        assert health.is_healthy
+
+    def test_p95_requires_min_samples(self):
+        health = ProviderHealth(RoutingConfig(hedge_min_samples=20))
+        for i in range(19):
+            health.record_success(float(i))
+        
+        assert health.p95() is None
+        
+        for i in range(19, 100):
+            health.record_success(float(i))
+        
+        assert health.p95() == 94.0
+
+
+class TestRoutingProvider:
+    @pytest.mark.asyncio
+    async def test_uses_primary_when_healthy(self):
+        claude = FakeProvider(ProviderType.CLAUDE)
+        gemini = FakeProvider(ProviderType.GEMINI)
+        
+        result = await routing(claude, gemini).analyze_document("doc", [])
+        
+        assert result.success
+        assert result.summary == "claude"
+        assert gemini.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_fails_over_in_order(self):
+        claude = FakeProvider(ProviderType.CLAUDE, success=False)
+        gemini = FakeProvider(ProviderType.GEMINI, success=False)
+        openai = FakeProvider(ProviderType.OPENAI)
+        
+        result = await routing(claude, gemini, openai).analyze_document("doc", [])
+        
+        assert result.success
+        assert result.summary == "openai"
+        assert (claude.calls, gemini.calls, openai.calls) == (1, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_all_fail_collects_errors(self):
+        claude = FakeProvider(ProviderType.CLAUDE, success=False)
+        gemini = FakeProvider(ProviderType.GEMINI, success=False)
+        
+        result = await routing(claude, gemini).analyze_document("doc", [])
+        
+        assert not result.success
+        assert result.errors == ["claude: claude down", "gemini: gemini down"]
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_provider_tried_last(self):
+        claude = FakeProvider(ProviderType.CLAUDE, success=False)
+        gemini = FakeProvider(ProviderType.GEMINI)
+        router = routing(claude, gemini, ewma_alpha=0.6)
+        
+        await router.analyze_document("doc", [])
+        claude.success = True
+        result = await router.analyze_document("doc", [])
+        
+        assert result.summary == "gemini"
+        assert claude.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_model_name_only_sent_to_primary(self):
+        claude = FakeProvider(ProviderType.CLAUDE, success=False)
+        gemini = FakeProvider(ProviderType.GEMINI)
+        
+        await routing(claude, gemini).analyze_document("doc", [], AnalysisOptions(model_name="claude-model"))
+        
+        assert claude.options_seen[0].model_name == "claude-model"
+        assert gemini.options_seen[0].model_name is None
+
+    @pytest.mark.asyncio
+    async def test_hedge_backup_wins_and_primary_cancelled(self):
+        claude = FakeProvider(ProviderType.CLAUDE, delay=5.0)
+        gemini = FakeProvider(ProviderType.GEMINI, delay=0.01)
+        router = routing(claude, gemini, hedge_enabled=True, hedge_min_samples=1, hedge_min_delay=0.05)
+        router._health_for(claude).record_success(0.05)
+        
+        result = await asyncio.wait_for(router.analyze_document("doc", []), timeout=2)
+        
+        assert result.summary == "gemini"
+        assert claude.cancelled
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_without_latency_history(self):
+        claude = FakeProvider(ProviderType.CLAUDE, delay=0.1)
+        gemini = FakeProvider(ProviderType.GEMINI)
+        router = routing(claude, gemini, hedge_enabled=True, hedge_min_samples=5, hedge_min_delay=0.01)
+        
+        result = await router.analyze_document("doc", [])
+        
+        assert result.summary == "claude"
+        assert gemini.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_hedge_first_streamed_issue_wins(self):
+        claude = FakeProvider(ProviderType.CLAUDE, delay=0.2, issues=[make_issue("claude")], issue_delay=0.1)
+        gemini = FakeProvider(ProviderType.GEMINI, delay=0.0, issues=[make_issue("gemini")], issue_delay=0.5)
+        router = routing(claude, gemini, hedge_enabled=True, hedge_min_samples=1, hedge_min_delay=0.05)
+        router._health_for(claude).record_success(0.05)
+        seen = []
+        
+        result = await router.analyze_document_stream("doc", [], on_issue=seen.append)
+        
+        assert result.summary == "claude"
+        assert [i.title for i in seen] == ["claude"]
+        assert gemini.cancelled
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_once_primary_has_streamed(self):
+        claude = FakeProvider(ProviderType.CLAUDE, delay=0.2, issues=[make_issue("claude")], issue_delay=0.01)
+        gemini = FakeProvider(ProviderType.GEMINI, issues=[make_issue("gemini")])
+        router = routing(claude, gemini, hedge_enabled=True, hedge_min_samples=1, hedge_min_delay=0.05)
+        router._health_for(claude).record_success(0.05)
+        seen = []
+
+        result = await router.analyze_document_stream("doc", [], on_issue=seen.append)
+
+        assert gemini.calls == 0
+        assert [i.title for i in seen] == [i.title for i in result.issues] == ["claude"]
+
+    @pytest.mark.asyncio
+    async def test_streaming_primary_owns_result_over_faster_backup(self):
+        # The backup starts at 0.05s and would finish at 0.15s; the primary streams at 0.1s and finishes at 0.4s
+        claude = FakeProvider(ProviderType.CLAUDE, delay=0.3, issues=[make_issue("claude")], issue_delay=0.1)
+        gemini = FakeProvider(ProviderType.GEMINI, delay=0.1, issues=[make_issue("gemini")])
+        router = routing(claude, gemini, hedge_enabled=True, hedge_min_samples=1, hedge_min_delay=0.05)
+        router._health_for(claude).record_success(0.05)
+        seen = []
+
+        result = await router.analyze_document_stream("doc", [], on_issue=seen.append)
+
+        assert result.summary == "claude"
+        assert [i.title for i in seen] == [i.title for i in result.issues] == ["claude"]
+        assert gemini.cancelled
+
+    @pytest.mark.asyncio
+    async def test_failed_owner_is_not_replaced_by_backup(self):
+        claude = FakeProvider(
+            ProviderType.CLAUDE, delay=0.05, success=False, issues=[make_issue("claude")], issue_delay=0.1
+        )
+        gemini = FakeProvider(ProviderType.GEMINI, delay=0.1, issues=[make_issue("gemini")])
+        router = routing(claude, gemini, hedge_enabled=True, hedge_min_samples=1, hedge_min_delay=0.05)
+        router._health_for(claude).record_success(0.05)
+        seen = []
+
+        result = await router.analyze_document_stream("doc", [], on_issue=seen.append)
+
+        assert not result.success
+        assert [i.title for i in seen] == ["claude"]
+        assert gemini.cancelled
+
+    @pytest.mark.asyncio
+    async def test_no_failover_after_streamed_issues(self):
+        claude = FakeProvider(ProviderType.CLAUDE, success=False, issues=[make_issue("claude")], issue_delay=0.0)
+        gemini = FakeProvider(ProviderType.GEMINI, issues=[make_issue("gemini")], issue_delay=0.0)
+        seen = []
+
+        result = await routing(claude, gemini).analyze_document_stream("doc", [], on_issue=seen.append)
+
+        assert not result.success
+        assert gemini.calls == 0
+        assert [i.title for i in seen] == ["claude"]
+        assert result.errors == ["claude: claude down"]
+
+    @pytest.mark.asyncio
+    async def test_failed_hedge_owner_does_not_fail_over(self):
+        claude = FakeProvider(
+            ProviderType.CLAUDE, delay=0.05, success=False, issues=[make_issue("claude")], issue_delay=0.1
+        )
+        gemini = FakeProvider(ProviderType.GEMINI, delay=0.1)
+        openai = FakeProvider(ProviderType.OPENAI, issues=[make_issue("openai")], issue_delay=0.0)
+        router = routing(claude, gemini, openai, hedge_enabled=True, hedge_min_samples=1, hedge_min_delay=0.05)
+        router._health_for(claude).record_success(0.05)
+        seen = []
+
+        result = await router.analyze_document_stream("doc", [], on_issue=seen.append)
+
+        assert not result.success
+        assert openai.calls == 0
+        assert [i.title for i in seen] == ["claude"]
+
+    @pytest.mark.asyncio
+    async def test_suggestion_failover(self):
+        claude = FakeProvider(ProviderType.CLAUDE, success=False)
+        gemini = FakeProvider(ProviderType.GEMINI)
+        rule = PolicyRule("R1", "Rule", "", "MUST", "general", "")
+        
+        suggestion = await routing(claude, gemini).generate_suggestion(make_issue("x"), "doc", rule)
+        
+        assert suggestion.suggested_text == "gemini"
+
+
+class TestFactoryRouting:
+    def test_preferred_provider_first(self):
+        factory = ProviderFactory()
+        with patch.dict('os.environ', {
+            'ANTHROPIC_API_KEY': 'a',
+            'AI_INTEGRATIONS_GEMINI_API_KEY': 'g',
+            'AI_INTEGRATIONS_OPENAI_API_KEY': 'o',
+        }), patch.object(factory, '_create_provider', side_effect=lambda t: FakeProvider(t)):
+            router = factory.get_routing_provider(ProviderType.OPENAI)
+        
+        assert [p.provider_type for p in router.providers] == [
+            ProviderType.OPENAI, ProviderType.CLAUDE, ProviderType.GEMINI,
+        ]
+
+    def test_no_providers_configured(self):
+        factory = ProviderFactory()
+        with patch.object(factory, 'get_configured_providers', return_value=[]):
+            with pytest.raises(ValueError):
+                factory.get_routing_provider()
@@ -0,0 +1,116 @@
+import json
+
+import pytest
+
+from src.infrastructure.ai.base import (
+    AIProvider,
+    AnalysisResult,
+    Issue,
+    IssueSeverity,
+    ProviderType,
+)
+from src.infrastructure.ai.streaming import StreamingJsonParser, parse_json_response
+
+
+RESPONSE = {
+    "issues": [
+        {"title": "Brace } inside \"string\"", "nested": [1, {"k": "]"}]},
+        {"title": "Second"},
+    ],
+    "summary": "Summary with {braces}",
+    "suggestions": [{"issue_index": 0}],
+}
+
+
+def fenced(data: dict) -> str:
+    return "Here is the analysis:\n```json\n" + json.dumps(data, indent=2) + "\n```\nDone {"
+
+
+class TestStreamingJsonParser:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 16, 10_000])
+    def test_emits_issues_as_objects_close(self, chunk_size):
+        text = fenced(RESPONSE)
+        parser = StreamingJsonParser()
+        emitted = []
+        
+        for i in range(0, len(text), chunk_size):
+            emitted.extend(parser.feed(text[i:i + chunk_size]))
+        
+        assert emitted == RESPONSE["issues"]
+        assert parser.is_complete
+        assert parser.result() == RESPONSE
+
+    def test_issue_emitted_before_stream_ends(self):
+        text = fenced(RESPONSE)
+        cut = text.index('"Second"')
+        parser = StreamingJsonParser()
+        
+        emitted = parser.feed(text[:cut])
+        
+        assert emitted == [RESPONSE["issues"][0]]
+        assert not parser.is_complete
+
+    def test_truncated_stream_keeps_complete_issues(self):
+        text = fenced(RESPONSE)
+        parser = StreamingJsonParser()
+        parser.feed(text[:text.index('"summary"')])
+        
+        assert parser.result() == {"issues": RESPONSE["issues"]}
+
+    def test_ignores_other_arrays(self):
+        parser = StreamingJsonParser()
+        
+        emitted = parser.feed(json.dumps({"suggestions": [{"a": 1}], "issues": []}))
+        
+        assert emitted == []
+        assert parser.result() == {"suggestions": [{"a": 1}], "issues": []}
+
+    def test_no_json(self):
+        assert parse_json_response("I could not analyze this document.") == {}
+
+    def test_parse_json_response(self):
+        assert parse_json_response(fenced({"suggested_text": "x"})) == {"suggested_text": "x"}
+
+
+class FixedProvider(AIProvider):
+    provider_type = ProviderType.GEMINI
+    default_model = "model"
+    available_models = ["model"]
+
+    def __init__(self, issues):
+        self._issues = issues
+
+    async def analyze_document(self, content, policy_rules, options=None):
+        return AnalysisResult(
+            success=True,
+            issues=self._issues,
+            suggestions=[],
+            summary="",
+            processing_time_ms=0,
+            model_used="model",
+        )
+
+    async def generate_suggestion(self, issue, document_context, policy_rule):
+        raise NotImplementedError
+
+    async def generate_text(self, prompt, max_tokens=2048):
+        raise NotImplementedError
+
+    async def is_available(self):
+        return True
+
+
+class TestDefaultAnalyzeDocumentStream:
+    @pytest.mark.asyncio
+    async def test_reports_issues_after_completion(self):
+        issues = [
+            Issue.create("R1", IssueSeverity.HIGH, "One", "", "", "", 0.9),
+            Issue.create("R2", IssueSeverity.LOW, "Two", "", "", "", 0.5),
+        ]
+        provider = FixedProvider(issues)
+        seen = []
+        
+        result = await provider.analyze_document_stream("doc", [], on_issue=seen.append)
+        
+        assert seen == issues
+        assert result.issues == issues
@@ -0,0 +1,197 @@
+import re
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from src.infrastructure.ai import token_budget
+from src.infrastructure.ai.token_budget import (
+    OMITTED_SECTION_NOTE,
+    TRUNCATION_MARKER,
+    TokenCounter,
+    encoding_for_model,
+    get_token_counter,
+    pack_content,
+    split_content,
+)
+
+
+class FakeEncoding:
+    """Word-level stand-in for a tiktoken encoding."""
+
+    def __init__(self):
+        self.encoded = 0
+        self._ids: dict[str, int] = {}
+        self._pieces: list[str] = []
+
+    def encode(self, text, disallowed_special=None):
+        self.encoded += 1
+        ids = []
+        for piece in re.findall(r"\S+|\s+", text):
+            if piece not in self._ids:
+                self._ids[piece] = len(self._pieces)
+                self._pieces.append(piece)
+            ids.append(self._ids[piece])
+        return ids
+
+    def decode(self, ids):
+        return "".join(self._pieces[i] for i in ids)
+
+
+@pytest.fixture
+def no_tokenizers(monkeypatch):
+    monkeypatch.setattr(token_budget, "_counters", {})
+    monkeypatch.setattr(token_budget, "_packed", token_budget.OrderedDict())
+
+
+def make_document(history_words: int = 2000) -> str:
+    return "\n".join([
+        "# Index Methodology",
+        "Preamble text.",
+        "## Overview",
+        "overview " * history_words,
+        "## Definitions",
+        '"Index Level" means the published level of the index.',
+        "## Calculation Formula",
+        "$$L_t = L_{t-1} (1 + r_t)$$ and $$r_t = w_t R_t$$",
+        "## Annex A",
+        "annex " * history_words,
+    ])
+
+
+class TestTokenCounter:
+    def test_estimate_without_encoder(self):
+        counter = TokenCounter("estimate")
+
+        assert not counter.exact
+        assert counter.count("x" * 400) == 100
+        assert counter.count("") == 0
+
+    def test_exact_counts_are_cached_by_content(self):
+        encoding = FakeEncoding()
+        counter = TokenCounter("fake", encoding)
+        text = "alpha beta gamma " * 10
+
+        assert counter.count(text) == 60
+        assert counter.count("".join(text)) == 60
+        assert encoding.encoded == 1
+
+    @pytest.mark.parametrize("encoder", [None, FakeEncoding()])
+    def test_truncate_keeps_head_and_tail(self, encoder):
+        counter = TokenCounter("test", encoder)
+        text = " ".join(f"w{i}" for i in range(2000))
+
+        truncated = counter.truncate(text, 200)
+
+        assert TRUNCATION_MARKER in truncated
+        assert truncated.startswith("w0")
+        assert truncated.endswith("w1999")
+        assert counter.count(truncated) <= 200
+
+    def test_encoding_for_model(self):
+        assert encoding_for_model("gpt-5") == "o200k_base"
+        assert encoding_for_model("claude-sonnet-4-5") == "o200k_base"
+        assert encoding_for_model("gpt-4-turbo") == "cl100k_base"
+        assert encoding_for_model(None) == "o200k_base"
+
+
+class TestPreload:
+    def test_estimates_until_preloaded(self, no_tokenizers, monkeypatch):
+        monkeypatch.setitem(sys.modules, "tiktoken", SimpleNamespace(get_encoding=lambda name: FakeEncoding()))
+        assert not get_token_counter("gpt-5").exact
+
+        assert token_budget.preload() == ["o200k_base"]
+
+        assert get_token_counter("gpt-5").exact
+        assert get_token_counter("claude-haiku-4-5") is get_token_counter("gpt-5")
+
+    def test_load_failure_keeps_estimating(self, no_tokenizers, monkeypatch):
+        def unavailable(name):
+            raise ConnectionError("offline")
+
+        monkeypatch.setitem(sys.modules, "tiktoken", SimpleNamespace(get_encoding=unavailable))
+
+        assert token_budget.preload() == []
+        assert not get_token_counter().exact
+
+    def test_estimate_setting_skips_loading(self, no_tokenizers, monkeypatch):
+        monkeypatch.setenv("AI_TOKENIZER", "estimate")
+        monkeypatch.setitem(sys.modules, "tiktoken", None)
+
+        assert token_budget.preload() == []
+
+
+class TestPackContent:
+    @pytest.fixture(autouse=True)
+    def isolated(self, no_tokenizers):
+        pass
+
+    def test_content_within_budget_is_unchanged(self):
+        document = make_document(history_words=10)
+
+        packed = pack_content(document, 10_000)
+
+        assert packed.text == document
+        assert not packed.truncated
+
+    def test_definitions_and_formulas_are_kept_first(self):
+        counter = TokenCounter("fake", FakeEncoding())
+        document = make_document()
+
+        packed = pack_content(document, 150, counter)
+
+        assert packed.truncated
+        assert packed.tokens <= 150
+        assert '"Index Level" means' in packed.text
+        assert "$$L_t = L_{t-1} (1 + r_t)$$" in packed.text
+        assert "## Annex A\n" + OMITTED_SECTION_NOTE in packed.text
+        assert "Annex A" in packed.omitted_sections
+        # Kept sections stay in document order
+        assert packed.text.index("## Overview") < packed.text.index("## Definitions") \
+            < packed.text.index("## Calculation Formula") < packed.text.index("## Annex A")
+
+    def test_section_larger_than_remaining_budget_is_cut(self):
+        counter = TokenCounter("fake", FakeEncoding())
+
+        packed = pack_content(make_document(), 1_500, counter)
+
+        assert packed.tokens <= 1_500
+        assert TRUNCATION_MARKER in packed.text
+        assert "Overview" not in packed.omitted_sections
+
+    def test_content_without_headings_keeps_head_and_tail(self):
+        packed = pack_content("x" * 60_000, 12_500)
+
+        assert TRUNCATION_MARKER in packed.text
+        assert packed.tokens <= 12_500
+
+    def test_packing_is_cached(self):
+        document = make_document()
+
+        assert pack_content(document, 300) is pack_content(document, 300)
+
+
+class TestSplitContent:
+    @pytest.fixture(autouse=True)
+    def isolated(self, no_tokenizers):
+        pass
+
+    def test_small_content_is_one_shard(self):
+        document = make_document(history_words=10)
+
+        assert split_content(document, 10_000) == [document]
+        assert split_content("  ", 10_000) == []
+
+    def test_shards_cover_every_section_within_budget(self):
+        document = make_document()
+        counter = get_token_counter()
+
+        shards = split_content(document, 1_000)
+
+        assert len(shards) > 1
+        assert all(counter.count(shard) <= 1_000 for shard in shards)
+        joined = "\n\n".join(shards)
+        for heading in ("# Index Methodology", "## Overview", "## Definitions", "## Annex A"):
+            assert joined.count(heading) == 1
+        assert joined.count("overview") == 2000
+        assert joined.index("## Definitions") < joined.index("## Annex A")
@@ -0,0 +1,151 @@
+"""Tests for parallel AI curation of the semantic IR."""
+
+import asyncio
+import json
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.domain.value_objects.semantic_ir import DocumentIR, TermDefinition
+from src.infrastructure.ai import token_budget
+from src.infrastructure.ai.analysis.analysis_log import AnalysisLog, LogLevel
+from src.infrastructure.ai.base import ProviderType
+from src.infrastructure.semantic.ai_curator import SemanticIRCurator
+
+
+class FakeProvider:
+    """Answers curation prompts from canned data, recording concurrency."""
+
+    default_model = None
+
+    def __init__(self, discovered=None, issues=None, failing=(), delay=0.01):
+        self.discovered = discovered or {}
+        self.issues = issues or {}
+        self.failing = failing
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.prompts = []
+
+    async def generate_text(self, prompt, max_tokens=2048):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.prompts.append(prompt)
+        try:
+            # Later shards answer first, so results arrive out of order
+            await asyncio.sleep(self.delay / (len(self.prompts) + 1))
+            if any(marker in prompt for marker in self.failing):
+                raise RuntimeError("provider unavailable")
+            if prompt.startswith("Review"):
+                return json.dumps([issue for term, issue in self.issues.items() if f'"{term}"' in prompt])
+            return json.dumps([
+                {"term": term, "definition": definition, "confidence": "high"}
+                for marker, (term, definition) in self.discovered.items()
+                if marker in prompt
+            ])
+        finally:
+            self.active -= 1
+
+
+def make_definition(i: int) -> TermDefinition:
+    return TermDefinition(id=f"def-{i}", term=f"Term {i}", definition=f"Definition {i}", section_id="s1")
+
+
+def make_ir(definition_count: int) -> DocumentIR:
+    return DocumentIR(
+        document_id="doc-1",
+        title="Methodology",
+        original_format="markdown",
+        sections=[],
+        definitions=[make_definition(i) for i in range(definition_count)],
+        formulae=[],
+        tables=[],
+        cross_references=[],
+        metadata={},
+        raw_markdown="",
+    )
+
+
+def make_markdown(sections: int) -> str:
+    return "\n".join(f"## Section {i}\n" + f"marker{i} " + "text " * 3000 for i in range(sections))
+
+
+def make_curator(provider, **kwargs) -> SemanticIRCurator:
+    factory = MagicMock()
+    factory.get_provider.return_value = provider
+    curator = SemanticIRCurator(provider_factory=factory, **kwargs)
+    curator._max_definitions_per_call = 10
+    return curator
+
+
+@pytest.fixture(autouse=True)
+def no_tokenizers(monkeypatch):
+    monkeypatch.setattr(token_budget, "_counters", {})
+
+
+class TestSemanticIRCurator:
+    @pytest.mark.asyncio
+    async def test_covers_whole_document_and_every_definition(self):
+        provider = FakeProvider()
+        curator = make_curator(provider)
+
+        await curator.curate(make_ir(25), make_markdown(6))
+
+        reviews = [p for p in provider.prompts if p.startswith("Review")]
+        excerpts = [p for p in provider.prompts if not p.startswith("Review")]
+        assert len(reviews) == 3
+        assert all(f'"Term {i}"' in "".join(reviews) for i in range(25))
+        assert all(any(f"marker{i} " in p for p in excerpts) for i in range(6))
+        curator._provider_factory.get_provider.assert_called_once_with(ProviderType.CLAUDE)
+
+    @pytest.mark.asyncio
+    async def test_calls_run_concurrently_within_limit(self):
+        provider = FakeProvider()
+        curator = make_curator(provider, max_concurrency=3)
+
+        await curator.curate(make_ir(40), make_markdown(6))
+
+        assert provider.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_merge_is_deterministic(self):
+        discovered = {"marker1 ": ("Notional", "The face amount."), "marker4 ": ("Notional", "A later duplicate.")}
+        discovered["marker0 "] = ("Strike", "The exercise price.")
+        issues = {"Term 3": {"term": "Term 3", "issue_type": "invalid_term", "severity": "high"}}
+
+        results = []
+        for _ in range(2):
+            curator = make_curator(FakeProvider(discovered=discovered, issues=issues))
+            results.append(await curator.curate(make_ir(25), make_markdown(6)))
+
+        first, second = results
+        terms = [d.term for d in first.definitions]
+        assert "Term 3" not in terms
+        assert terms[-2:] == ["Strike", "Notional"]
+        assert first.definitions[-1].definition == "The face amount."
+        assert [(d.id, d.term) for d in first.definitions] == [(d.id, d.term) for d in second.definitions]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_logged_and_skipped(self):
+        provider = FakeProvider(discovered={"marker2 ": ("Strike", "The exercise price.")}, failing=("marker0 ",))
+        curator = make_curator(provider)
+        log = AnalysisLog(document_id=uuid4(), started_at=datetime.utcnow())
+
+        enhanced = await curator.curate(make_ir(12), make_markdown(6), analysis_log=log)
+
+        assert enhanced.definitions[-1].term == "Strike"
+        batches = [e for e in log.entries if e.details and "duration_ms" in e.details]
+        assert len(batches) == len(provider.prompts)
+        assert {e.details["stage"] for e in batches} == {"discovery", "validation"}
+        failed = [e for e in batches if e.level == LogLevel.WARNING]
+        assert len(failed) == 1
+        assert failed[0].details["error_type"] == "RuntimeError"
+
+    @pytest.mark.asyncio
+    async def test_unknown_provider_returns_original_ir(self):
+        ir = make_ir(2)
+        curator = make_curator(FakeProvider())
+
+        assert await curator.curate(ir, "text", provider_type="unknown") is ir
@@ -0,0 +1,90 @@
+"""Tests for building the rule-based IR of converted documents."""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.event_handlers.semantic_curation_handler import SemanticCurationEventHandler
+from src.domain.events import DocumentConverted
+from src.infrastructure.semantic.converted_ir import ConvertedIR
+from src.infrastructure.semantic.ir_builder import IRBuilder
+from src.infrastructure.semantic.ir_store import InMemorySemanticIRStore
+
+
+@pytest.fixture
+def converted():
+    return DocumentConverted(
+        event_id=uuid4(),
+        aggregate_id=uuid4(),
+        occurred_at=datetime.now(timezone.utc),
+        version=2,
+        markdown_content='# Terms\n\n"Notional Amount" means the face value of the swap.\n',
+        sections=[{"id": "section-1", "title": "Terms", "content": '"Notional Amount" means the face value of the swap.',
+                   "level": 1, "start_line": 1, "end_line": 3}],
+        metadata={"title": "Swap Spec", "original_format": "markdown"},
+    )
+
+
+class CountingBuilder(IRBuilder):
+    def __init__(self):
+        super().__init__()
+        self.builds = 0
+
+    def build(self, conversion_result, document_id):
+        self.builds += 1
+        return super().build(conversion_result, document_id)
+
+
+class TestConvertedIR:
+    @pytest.mark.asyncio
+    async def test_builds_and_saves_once(self, converted):
+        store = InMemorySemanticIRStore()
+        builder = CountingBuilder()
+        converted_ir = ConvertedIR(store, builder)
+
+        first, second = await asyncio.gather(
+            converted_ir.load_or_build(converted), converted_ir.load_or_build(converted)
+        )
+        third = await converted_ir.load_or_build(converted)
+
+        assert builder.builds == 1
+        assert first is second
+        assert [d.term for d in third.definitions] == ["Notional Amount"]
+        assert await store.version(str(converted.aggregate_id)) == "1"
+
+    @pytest.mark.asyncio
+    async def test_stored_ir_is_not_rebuilt(self, converted):
+        store = InMemorySemanticIRStore()
+        await ConvertedIR(store).load_or_build(converted)
+        builder = CountingBuilder()
+
+        ir = await ConvertedIR(store, builder).load_or_build(converted)
+
+        assert builder.builds == 0
+        assert ir.sections[0].content.startswith("# Terms")
+
+
+class TestSemanticCurationHandler:
+    @pytest.mark.asyncio
+    async def test_curates_ir_built_on_first_conversion(self, converted):
+        store = InMemorySemanticIRStore()
+        curator = MagicMock()
+        curator.curate = AsyncMock(side_effect=lambda ir, **kwargs: ir)
+        documents = MagicMock()
+        documents.get = AsyncMock(return_value=None)
+        handler = SemanticCurationEventHandler(
+            document_repository=documents,
+            event_publisher=MagicMock(),
+            db_connection=MagicMock(),
+            ai_curator=curator,
+            ir_store=store,
+        )
+
+        await handler.handle(converted)
+
+        curated = curator.curate.call_args.kwargs["ir"]
+        assert [d.term for d in curated.definitions] == ["Notional Amount"]
+        assert await store.version(str(converted.aggregate_id)) == "2"
@@ -0,0 +1,120 @@
+"""Tests for incremental IR rebuilds."""
+
+import pytest
+
+from src.infrastructure.converters.markdown_converter import MarkdownConverter
+from src.infrastructure.semantic import IRBuilder, IncrementalIRBuilder
+
+
+def section(n: int, extra: str = "") -> str:
+    text = (
+        f"## {n}.1 Group {n}\n\n"
+        f'"Term {n}" means the value for group {n}{extra} measured daily.\n\n'
+        f"See Section {max(1, n - 1)}.1, Table 1 and formula 1.\n\n"
+        f"$$\nScore{n} = Term{n} + x\n$$\n"
+    )
+    if n % 3 == 0:
+        text += f"\nTable {n}: Limits\n| a | b |\n|---|---|\n| {n} | 2 |\n"
+    return text
+
+
+def convert(parts):
+    markdown = '# Spec\n\nIntro as defined in "Term 2".\n\n' + "\n".join(parts)
+    return MarkdownConverter().convert_from_bytes(markdown.encode(), "spec.md")
+
+
+def comparable(ir) -> dict:
+    """IR as a dict with definition IDs (random per build) replaced by terms."""
+    data = ir.to_dict()
+    terms = {d["id"]: d["term"] for d in data["definitions"]}
+    data["definitions"] = [{**d, "id": None} for d in data["definitions"]]
+    data["cross_references"] = [
+        {**r, "target_id": terms.get(r["target_id"], r["target_id"])} for r in data["cross_references"]
+    ]
+    data["formulae"] = [
+        {**f, "dependencies": [terms.get(i, i) for i in f["dependencies"]]} for f in data["formulae"]
+    ]
+    data["validation_issues"] = sorted((v["message"], v["location"]) for v in data["validation_issues"])
+    return data
+
+
+BASE = [section(n) for n in range(1, 10)]
+
+
+@pytest.fixture
+def previous():
+    return IRBuilder().build(convert(BASE), "doc-1")
+
+
+class TestIncrementalIRBuilder:
+    @pytest.mark.parametrize(
+        "parts",
+        [
+            BASE,
+            BASE[:4] + [section(5, " and more")] + BASE[5:],
+            BASE[:4] + [section(42)] + BASE[4:],
+            BASE[:3] + BASE[5:],
+            BASE[6:] + BASE[:6],
+            # Term 2 defined twice: the longer, later definition wins the merge
+            BASE + [section(2, " over the whole session")],
+        ],
+        ids=["unchanged", "edited", "inserted", "removed", "reordered", "duplicate-term"],
+    )
+    def test_matches_full_build(self, previous, parts):
+        result = convert(parts)
+
+        incremental, diff = IncrementalIRBuilder().rebuild(result, "doc-1", previous)
+
+        assert comparable(incremental) == comparable(IRBuilder().build(result, "doc-1"))
+        assert not diff.full_rebuild
+
+    def test_recovers_definition_that_lost_merge_when_winner_section_changes(self):
+        builder = IncrementalIRBuilder()
+        first = builder.build(convert(BASE + [section(2, " over the whole session")]), "doc-1")
+        result = convert(BASE)
+
+        incremental, _ = builder.rebuild(result, "doc-1", first)
+
+        assert incremental.find_definition("term 2").definition == (
+            "the value for group 2 measured daily"
+        )
+        assert comparable(incremental) == comparable(IRBuilder().build(result, "doc-1"))
+
+    def test_reuses_unchanged_sections_and_keeps_definition_ids(self, previous):
+        result = convert(BASE[:4] + [section(5, " and more")] + BASE[5:])
+
+        incremental, diff = IncrementalIRBuilder().rebuild(result, "doc-1", previous)
+
+        assert diff.sections_reused == len(previous.sections) - 1
+        assert diff.sections_changed == ["section-6"]
+        assert diff.definitions_changed == ["Term 5"]
+        assert diff.definitions_added == diff.definitions_removed == []
+        assert [d.id for d in incremental.definitions] == [d.id for d in previous.definitions]
+
+    def test_diff_reports_added_and_removed_content(self, previous):
+        result = convert(BASE[:2] + BASE[3:] + [section(12)])
+
+        _, diff = IncrementalIRBuilder().rebuild(result, "doc-1", previous)
+
+        assert diff.sections_added == ["section-10"]
+        assert diff.sections_removed == ["section-4"]
+        assert diff.definitions_added == ["Term 12"]
+        assert diff.definitions_removed == ["Term 3"]
+        assert (diff.formulae_added, diff.formulae_removed) == (1, 1)
+        assert (diff.tables_added, diff.tables_removed) == (1, 1)
+        assert diff.to_dict()["sections"]["removed"] == ["section-4"]
+
+    def test_falls_back_to_full_build(self, previous):
+        straddling = convert(BASE[:2] + ["## Broken\n\n$$\nx = 1\n"] + BASE[2:])
+        del previous.metadata["section_index"]
+
+        _, without_index = IncrementalIRBuilder().rebuild(convert(BASE), "doc-1", previous)
+        _, without_previous = IncrementalIRBuilder().rebuild(convert(BASE), "doc-1", None)
+        ir, straddled = IncrementalIRBuilder().rebuild(
+            straddling, "doc-1", IRBuilder().build(convert(BASE), "doc-1")
+        )
+
+        assert without_index.full_rebuild and without_previous.full_rebuild
+        assert len(without_previous.sections_added) == len(previous.sections)
+        assert straddled.full_rebuild
+        assert comparable(ir) == comparable(IRBuilder().build(straddling, "doc-1"))
@@ -0,0 +1,169 @@
+import json
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.domain.value_objects.semantic_ir import (
+    DocumentIR,
+    FormulaReference,
+    IRSection,
+    SectionType,
+    TermDefinition,
+)
+from src.infrastructure.semantic.ir_store import (
+    InMemorySemanticIRStore,
+    PostgresSemanticIRStore,
+    validate_include,
+)
+
+MARKDOWN = "# Definitions\nAlpha means a.\nAlphabet means b."
+
+
+def make_ir(document_id: str, title: str = "Algorithm") -> DocumentIR:
+    return DocumentIR(
+        document_id=document_id,
+        title=title,
+        original_format="markdown",
+        sections=[
+            IRSection(
+                id="sec-1",
+                title="Definitions",
+                content="Alpha means a.\nAlphabet means b.",
+                level=1,
+                section_type=SectionType.DEFINITION,
+                start_line=2,
+                end_line=3,
+            )
+        ],
+        definitions=[
+            TermDefinition(id="def-1", term="Alphabet", definition="b", section_id="sec-1"),
+            TermDefinition(id="def-2", term="Alpha", definition="a", section_id="sec-1", aliases=["A1"]),
+            TermDefinition(id="def-3", term="Beta", definition="c", section_id="sec-1"),
+        ],
+        formulae=[FormulaReference(id="f-1", latex="x = y", section_id="sec-1", name="Alpha Score")],
+        tables=[],
+        cross_references=[],
+        metadata={},
+        raw_markdown=MARKDOWN,
+    )
+
+
+def test_validate_include_rejects_unknown_fields():
+    assert validate_include(["definitions", "definitions", "tables"]) == ["definitions", "tables"]
+    with pytest.raises(ValueError, match="raw_markdown"):
+        validate_include(["raw_markdown"])
+
+
+class TestInMemorySemanticIRStore:
+    @pytest.mark.asyncio
+    async def test_load_round_trips_without_storing_markdown(self):
+        store = InMemorySemanticIRStore()
+        await store.save(make_ir("doc-1"))
+
+        ir = await store.load("doc-1", markdown_loader=lambda: MARKDOWN)
+
+        assert [d.term for d in ir.definitions] == ["Alphabet", "Alpha", "Beta"]
+        assert not ir.is_content_loaded
+        assert ir.sections[0].content == "Alpha means a.\nAlphabet means b."
+        assert await store.load("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_fetch_returns_selected_fields_paged(self):
+        store = InMemorySemanticIRStore()
+        await store.save(make_ir("doc-1"))
+
+        result = await store.fetch("doc-1", ["definitions"], limit=2, offset=1)
+
+        assert [d["term"] for d in result["definitions"]] == ["Alpha", "Beta"]
+        assert result["totals"] == {"definitions": 3}
+        assert "formulae" not in result
+        assert "raw_markdown" not in result
+
+    @pytest.mark.asyncio
+    async def test_fetch_filters_by_term_prefix_and_alias(self):
+        store = InMemorySemanticIRStore()
+        await store.save(make_ir("doc-1"))
+
+        by_prefix = await store.fetch("doc-1", ["definitions", "formulae"], term="alpha")
+        by_alias = await store.fetch("doc-1", ["definitions"], term="a1")
+
+        assert [d["id"] for d in by_prefix["definitions"]] == ["def-1", "def-2"]
+        assert [f["id"] for f in by_prefix["formulae"]] == ["f-1"]
+        assert [d["id"] for d in by_alias["definitions"]] == ["def-2"]
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_exact_matches_first_across_documents(self):
+        store = InMemorySemanticIRStore()
+        await store.save(make_ir("doc-1", title="First"))
+        await store.save(make_ir("doc-2", title="Second"))
+
+        hits = await store.search_definitions("alpha", limit=3)
+
+        assert [h.definition.term for h in hits] == ["Alpha", "Alpha", "Alphabet"]
+        assert [h.document_title for h in hits[:2]] == ["First", "Second"]
+
+
+class TestPostgresSemanticIRStore:
+    @pytest.fixture
+    def conn(self):
+        conn = AsyncMock()
+        conn.transaction = MagicMock()
+        conn.transaction.return_value.__aenter__ = AsyncMock(return_value=None)
+        conn.transaction.return_value.__aexit__ = AsyncMock(return_value=None)
+        return conn
+
+    @pytest.fixture
+    def store(self, conn):
+        pool = MagicMock()
+        pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+        pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+        return PostgresSemanticIRStore(pool)
+
+    @pytest.mark.asyncio
+    async def test_save_writes_one_row_per_definition(self, store, conn):
+        document_id = str(uuid4())
+
+        await store.save(make_ir(document_id))
+
+        definition_insert = next(
+            call for call in conn.executemany.call_args_list
+            if "semantic_ir_definitions" in call.args[0]
+        )
+        rows = definition_insert.args[1]
+        assert [row[3] for row in rows] == ["Alphabet", "Alpha", "Beta"]
+        assert rows[1][4] == ["a1"]
+        header_sections = json.loads(conn.execute.call_args_list[0].args[4])
+        assert "content" not in header_sections[0]
+
+    @pytest.mark.asyncio
+    async def test_fetch_filters_definitions_in_sql(self, store, conn):
+        document_id = str(uuid4())
+        conn.fetchrow.return_value = {
+            "document_id": document_id, "title": "Algorithm", "original_format": "markdown",
+            "sections": "[]", "metadata": "{}", "validation_issues": "[]",
+        }
+        conn.fetchval.return_value = 7
+        conn.fetch.return_value = [{"data": json.dumps({"id": "def-2", "term": "Alpha"})}]
+
+        result = await store.fetch(document_id, ["definitions"], term="Al_", limit=1, offset=3)
+
+        sql, *params = conn.fetch.call_args.args
+        assert "lower(term) LIKE $2" in sql
+        assert params[1:] == ["al\\_%", "al_", 1, 3]
+        assert result["definitions"] == [{"id": "def-2", "term": "Alpha"}]
+        assert result["totals"] == {"definitions": 7}
+
+    @pytest.mark.asyncio
+    async def test_search_filters_by_viewer_acl(self, store, conn):
+        conn.fetch.return_value = []
+
+        await store.search_definitions("alpha", viewer=("abc123", {"risk"}))
+        sql, *params = conn.fetch.call_args.args
+        assert "document_acl_views" in sql
+        assert params == ["alpha%", "alpha", "abc123", ["risk"], 20, 0]
+
+        await store.search_definitions("alpha")
+        sql, *params = conn.fetch.call_args.args
+        assert "document_acl_views" not in sql
+        assert params == ["alpha%", "alpha", 20, 0]
@@ -0,0 +1,48 @@
+"""Tests for the version-checked lineage graph cache."""
+
+import pytest
+
+from src.infrastructure.semantic.ir_store import InMemorySemanticIRStore
+from src.infrastructure.semantic.lineage_graph_cache import LineageGraphCache
+from tests.unit.infrastructure.semantic.test_ir_store import make_ir
+
+
+class TestLineageGraphCache:
+    @pytest.mark.asyncio
+    async def test_reuses_graph_until_ir_is_saved_again(self):
+        store = InMemorySemanticIRStore()
+        cache = LineageGraphCache(store)
+        loads = []
+
+        async def load_ir():
+            loads.append(1)
+            ir = await store.load("doc-1")
+            if ir is None:
+                ir = make_ir("doc-1")
+                await store.save(ir)
+            return ir
+
+        first = await cache.get("doc-1", load_ir)
+        second = await cache.get("doc-1", load_ir)
+        await store.save(make_ir("doc-1", title="Edited"))
+        third = await cache.get("doc-1", load_ir)
+
+        assert first is second
+        assert third is not first
+        assert len(loads) == 2
+        assert (cache.hits, cache.misses) == (1, 2)
+        assert first.resolve("a1") == "def-2"
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        store = InMemorySemanticIRStore()
+        cache = LineageGraphCache(store, max_entries=1)
+        for document_id in ("doc-1", "doc-2"):
+            await store.save(make_ir(document_id))
+
+        for document_id in ("doc-1", "doc-2"):
+            await cache.get(document_id, lambda d=document_id: store.load(d))
+
+        assert len(cache) == 1
+        await cache.get("doc-2", lambda: store.load("doc-2"))
+        assert cache.hits == 1
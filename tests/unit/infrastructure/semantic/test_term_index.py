@@ -0,0 +1,159 @@
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.domain.value_objects.semantic_ir import DocumentIR, FormulaReference, TermDefinition
+from src.infrastructure.semantic.term_index import (
+    ALIAS,
+    DEFINITION,
+    VARIABLE,
+    InMemoryTermIndex,
+    PostgresTermIndex,
+    similarity,
+    term_entries,
+)
+
+
+def make_ir(document_id: str, title: str, definitions=(), formulae=()) -> DocumentIR:
+    return DocumentIR(
+        document_id=document_id,
+        title=title,
+        original_format="markdown",
+        sections=[],
+        definitions=list(definitions),
+        formulae=list(formulae),
+        tables=[],
+        cross_references=[],
+        metadata={},
+        raw_markdown="",
+    )
+
+
+def notional_ir(document_id: str = "doc-1", title: str = "Swaps") -> DocumentIR:
+    return make_ir(
+        document_id,
+        title,
+        definitions=[
+            TermDefinition(id="def-1", term="Notional Amount", definition="face value",
+                           section_id="sec-1", aliases=["Notional"]),
+            TermDefinition(id="def-2", term="Notice Period", definition="ten days", section_id="sec-2"),
+        ],
+        formulae=[FormulaReference(id="f-1", latex="P = N r", section_id="sec-3",
+                                   variables=["Notional", "Rate", "Notional"])],
+    )
+
+
+def test_term_entries_cover_definitions_aliases_and_variables():
+    entries = term_entries(notional_ir())
+
+    assert [(e.term, e.kind, e.source_id) for e in entries] == [
+        ("Notional Amount", DEFINITION, "def-1"),
+        ("Notional", ALIAS, "def-1"),
+        ("Notice Period", DEFINITION, "def-2"),
+        ("Notional", VARIABLE, "f-1"),
+        ("Rate", VARIABLE, "f-1"),
+    ]
+
+
+def test_similarity_matches_pg_trgm():
+    assert similarity("notional", "notional") == 1.0
+    assert similarity("word", "two words") == pytest.approx(4 / 11)
+    assert similarity("notional", "xyz") == 0.0
+
+
+class TestInMemoryTermIndex:
+    @pytest.mark.asyncio
+    async def test_ranks_exact_then_prefix_then_fuzzy(self):
+        index = InMemoryTermIndex()
+        await index.replace_document(notional_ir("doc-1", "Swaps"))
+        await index.replace_document(
+            make_ir("doc-2", "Bonds", [TermDefinition(id="d", term="Notionall", definition="typo", section_id="s")])
+        )
+
+        hits = await index.search("Notional")
+
+        assert [(h.document_id, h.term, h.kind) for h in hits] == [
+            ("doc-1", "Notional", ALIAS),
+            ("doc-1", "Notional", VARIABLE),
+            ("doc-2", "Notionall", DEFINITION),
+            ("doc-1", "Notional Amount", DEFINITION),
+        ]
+        assert hits[0].document_title == "Swaps"
+
+    @pytest.mark.asyncio
+    async def test_fuzzy_matching_can_be_disabled_and_pages(self):
+        index = InMemoryTermIndex()
+        await index.replace_document(notional_ir())
+
+        fuzzy = await index.search("notionl")
+        exact = await index.search("notionl", fuzzy=False)
+        everything = await index.search("noti", fuzzy=False)
+        page = await index.search("noti", limit=2, offset=1)
+
+        assert {h.term for h in fuzzy} >= {"Notional", "Notional Amount"}
+        assert exact == []
+        assert len(everything) == 4
+        assert page == everything[1:3]
+
+    @pytest.mark.asyncio
+    async def test_replace_and_remove_document(self):
+        index = InMemoryTermIndex()
+        await index.replace_document(notional_ir())
+        await index.replace_document(make_ir("doc-1", "Swaps"))
+
+        assert await index.search("notional") == []
+
+        await index.replace_document(notional_ir())
+        await index.remove_document("doc-1")
+        assert await index.search("notional") == []
+
+
+class TestPostgresTermIndex:
+    @pytest.fixture
+    def conn(self):
+        conn = AsyncMock()
+        conn.transaction = MagicMock()
+        conn.transaction.return_value.__aenter__ = AsyncMock(return_value=None)
+        conn.transaction.return_value.__aexit__ = AsyncMock(return_value=None)
+        return conn
+
+    @pytest.fixture
+    def index(self, conn):
+        pool = MagicMock()
+        pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+        pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+        return PostgresTermIndex(pool)
+
+    @pytest.mark.asyncio
+    async def test_replace_document_rewrites_rows(self, index, conn):
+        document_id = str(uuid4())
+
+        await index.replace_document(notional_ir(document_id))
+
+        assert "DELETE FROM term_index_entries" in conn.execute.call_args.args[0]
+        rows = conn.executemany.call_args.args[1]
+        assert [(row[2], row[3]) for row in rows][:2] == [
+            ("notional amount", DEFINITION), ("notional", ALIAS),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_search_uses_trigram_match_and_acl(self, index, conn):
+        conn.fetch.return_value = [{
+            "document_id": uuid4(), "document_title": "Swaps", "term": "Notional",
+            "kind": ALIAS, "source_id": "def-1", "section_id": "sec-1", "score": 1.0,
+        }]
+
+        hits = await index.search("Notional_", viewer=("abc123", {"risk"}), limit=5, offset=10)
+
+        sql, *params = conn.fetch.call_args.args
+        assert "t.term_lower % $1" in sql
+        assert "document_acl_views" in sql
+        assert params == ["notional_", "notional\\_%", "abc123", ["risk"], 5, 10]
+        assert hits[0].to_dict()["kind"] == ALIAS
+
+        await index.search("notional", fuzzy=False)
+        sql, *params = conn.fetch.call_args.args
+        assert "%" not in sql.replace("LIKE $2", "")
+        assert "document_acl_views" not in sql
+        assert params == ["notional", "notional%", 20, 0]
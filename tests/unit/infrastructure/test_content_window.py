@@ -0,0 +1,162 @@
+import gzip
+import json
+from dataclasses import replace
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.dependencies import (
+    get_authorization_service,
+    get_content_variant_cache,
+    get_current_user,
+    get_document_acl_queries,
+    get_document_by_id_handler,
+    get_document_repository,
+)
+from src.api.middleware.compression import CompressedVariantCache
+from src.api.middleware.error_handler import add_exception_handlers
+from src.api.routes import documents
+from src.infrastructure.queries.content_window import (
+    CHARS,
+    MAX_LIMITS,
+    SECTIONS,
+    char_window,
+    decode_window_cursor,
+    encode_window_cursor,
+    next_window_cursor,
+    section_window,
+    window_limit,
+)
+from src.infrastructure.queries.document_queries import DocumentDetailView
+
+UPDATED_AT = datetime(2026, 1, 5, 12, 0, tzinfo=timezone.utc)
+SECTION_LIST = [{"title": f"Section {i}", "content": f"Body {i}", "level": 2} for i in range(5)]
+MARKDOWN = "".join(f"line {i}\n" for i in range(300))
+
+
+def make_view() -> DocumentDetailView:
+    return DocumentDetailView(
+        id=uuid4(),
+        title="Methodology",
+        description=None,
+        status="converted",
+        version=1,
+        original_format="pdf",
+        markdown_content=MARKDOWN,
+        sections=SECTION_LIST,
+        metadata={},
+        policy_repository_id=None,
+        compliance_status=None,
+        created_at=UPDATED_AT,
+        updated_at=UPDATED_AT,
+    )
+
+
+class TestWindows:
+    def test_section_window(self):
+        window = section_window(SECTION_LIST, 3, 10)
+
+        assert (window.start, window.end, window.total) == (3, 5, 5)
+        assert [s["title"] for s in window.items] == ["Section 3", "Section 4"]
+        assert window.is_last
+        assert section_window(None, 2, 10).items == []
+
+    def test_char_window_ends_on_a_line_break(self):
+        window = char_window("alpha\nbeta\ngamma\n", 0, 13)
+
+        assert window.items == "alpha\nbeta\n"
+        assert char_window("alpha\nbeta\ngamma\n", window.end, 13).items == "gamma\n"
+
+    def test_char_window_splits_lines_longer_than_the_window(self):
+        window = char_window("x" * 10, 0, 4)
+
+        assert (window.items, window.end) == ("xxxx", 4)
+
+    def test_cursor_round_trip(self):
+        window = section_window(SECTION_LIST, 0, 2)
+        cursor = next_window_cursor(window, "1.123")
+
+        assert decode_window_cursor(cursor) == ("1.123", SECTIONS, 2)
+        assert next_window_cursor(section_window(SECTION_LIST, 4, 2), "1.123") is None
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", encode_window_cursor("1.0", "pages", 1)])
+    def test_invalid_cursor(self, cursor):
+        with pytest.raises(ValueError):
+            decode_window_cursor(cursor)
+
+    def test_window_limit(self):
+        assert window_limit(SECTIONS, None) == 20
+        assert window_limit(CHARS, 10 ** 9) == MAX_LIMITS[CHARS]
+
+
+class TestContentWindowRoute:
+    @pytest.fixture
+    def handler(self):
+        handler = MagicMock()
+        handler.handle = AsyncMock(return_value=make_view())
+        return handler
+
+    @pytest.fixture
+    def client(self, handler):
+        auth = MagicMock()
+        auth.can_view_document.return_value = True
+        acl = MagicMock()
+        acl.get_access = AsyncMock(return_value=MagicMock())
+        variant_cache = CompressedVariantCache()
+
+        app = FastAPI()
+        add_exception_handlers(app)
+        app.include_router(documents.router, prefix="/api/v1")
+        app.dependency_overrides[get_current_user] = lambda: MagicMock()
+        app.dependency_overrides[get_document_by_id_handler] = lambda: handler
+        app.dependency_overrides[get_authorization_service] = lambda: auth
+        app.dependency_overrides[get_document_repository] = lambda: MagicMock()
+        app.dependency_overrides[get_document_acl_queries] = lambda: acl
+        app.dependency_overrides[get_content_variant_cache] = lambda: variant_cache
+        return TestClient(app)
+
+    def url(self, handler):
+        return f"/api/v1/documents/{handler.handle.return_value.id}/content/window"
+
+    def test_pages_through_sections_with_cursors(self, client, handler):
+        first = client.get(self.url(handler), params={"limit": 2}).json()
+        rest = client.get(self.url(handler), params={"limit": 3, "cursor": first["next_cursor"]}).json()
+
+        assert [s["title"] for s in first["sections"]] == ["Section 0", "Section 1"]
+        assert (rest["start"], rest["end"], rest["total"]) == (2, 5, 5)
+        assert rest["next_cursor"] is None
+
+    def test_character_window(self, client, handler):
+        body = client.get(self.url(handler), params={"unit": CHARS, "start": 7, "limit": 20}).json()
+
+        assert body["content"] == "line 1\nline 2\n"
+        assert body["sections"] is None
+        assert decode_window_cursor(body["next_cursor"])[1:] == (CHARS, 21)
+
+    def test_stale_cursor_conflicts(self, client, handler):
+        cursor = client.get(self.url(handler), params={"limit": 2}).json()["next_cursor"]
+        view = handler.handle.return_value
+        handler.handle.return_value = replace(view, updated_at=UPDATED_AT.replace(minute=1))
+
+        response = client.get(self.url(handler), params={"cursor": cursor})
+
+        assert response.status_code == 409
+
+    def test_malformed_cursor_is_rejected(self, client, handler):
+        response = client.get(self.url(handler), params={"cursor": "not-a-cursor"})
+
+        assert response.status_code == 400
+
+    def test_window_is_precompressed(self, client, handler):
+        with client.stream(
+            "GET", self.url(handler), params={"unit": CHARS}, headers={"Accept-Encoding": "gzip"}
+        ) as response:
+            body = b"".join(response.iter_raw())
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"] == f'W/"{handler.handle.return_value.revision}"'
+        assert json.loads(gzip.decompress(body))["content"] == MARKDOWN[:64 * 1024]
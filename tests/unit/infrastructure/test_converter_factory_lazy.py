@@ -0,0 +1,84 @@
+"""
+Tests for lazy converter loading and startup imports.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from src.infrastructure.converters import PdfConverter
+from src.infrastructure.converters.converter_factory import CONVERTER_REGISTRY, ConverterFactory
+from src.infrastructure.converters.markdown_converter import MarkdownConverter
+
+ROOT = Path(__file__).resolve().parents[3]
+
+# Libraries that must only load on first use
+HEAVY_MODULES = ("fitz", "pdfplumber", "docx", "docutils", "google.genai", "anthropic", "openai", "tiktoken")
+
+
+class TestLazyConverterLoading:
+    """Tests for loading converters on first use."""
+
+    def test_nothing_loaded_until_used(self):
+        factory = ConverterFactory()
+
+        assert factory._converters == []
+        assert "pdf" in factory.supported_extensions
+        assert factory._converters == []
+
+    def test_loads_only_the_needed_converter(self):
+        factory = ConverterFactory()
+
+        converter = factory.get_converter(Path("notes.md"))
+
+        assert isinstance(converter, MarkdownConverter)
+        assert factory._converters == [converter]
+        assert factory.get_converter_for_extension(".MD") is converter
+
+    def test_unknown_extension(self):
+        factory = ConverterFactory()
+
+        assert factory.get_converter(Path("file.xyz")) is None
+        assert factory._converters == []
+
+    def test_preload_creates_each_converter_once(self):
+        factory = ConverterFactory()
+        markdown = factory.get_converter(Path("notes.md"))
+
+        loaded = factory.preload()
+
+        assert loaded == [class_name for _, class_name, _ in CONVERTER_REGISTRY]
+        assert len(factory._converters) == len(CONVERTER_REGISTRY)
+        assert factory.get_converter(Path("notes.md")) is markdown
+        assert isinstance(factory.get_converter(Path("report.pdf")), PdfConverter)
+
+    def test_registry_matches_converter_extensions(self):
+        factory = ConverterFactory()
+        factory.preload()
+
+        for converter in factory._converters:
+            registered = next(exts for _, name, exts in CONVERTER_REGISTRY if name == type(converter).__name__)
+            assert list(registered) == converter.supported_extensions
+
+
+class TestStartupImports:
+    """Importing the app must not load converter or AI SDK libraries."""
+
+    def test_app_import_defers_heavy_modules(self):
+        code = (
+            "import sys, src.api.main; "
+            f"print('loaded:', [m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+        )
+        # Settings are validated at import; nothing connects
+        env = {
+            **os.environ,
+            "DATABASE_URL": os.environ.get("DATABASE_URL", "postgresql://u:p@localhost/db"),
+            "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY") or "test-key",
+        }
+
+        completed = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, timeout=120
+        )
+
+        assert completed.returncode == 0, completed.stderr[-2000:]
+        assert completed.stdout.strip().splitlines()[-1] == "loaded: []"
@@ -0,0 +1,82 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from src.domain.value_objects.document_access import DocumentAccess
+from src.infrastructure.queries.document_acl_queries import DocumentAclCache, DocumentAclQueries
+
+
+class TestDocumentAclCache:
+    def test_get_returns_put_entry(self):
+        cache = DocumentAclCache()
+        access = DocumentAccess(document_id=uuid4(), owner_kerberos_id="owner1")
+
+        cache.put(access)
+
+        assert cache.get(access.document_id) == access
+        assert cache.hits == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = DocumentAclCache(max_entries=2)
+        first, second, third = (
+            DocumentAccess(document_id=uuid4(), owner_kerberos_id="owner1") for _ in range(3)
+        )
+
+        cache.put(first)
+        cache.put(second)
+        cache.get(first.document_id)
+        cache.put(third)
+
+        assert len(cache) == 2
+        assert cache.get(second.document_id) is None
+        assert cache.get(first.document_id) == first
+
+    def test_expired_entries_are_dropped(self):
+        cache = DocumentAclCache(ttl_seconds=30.0)
+        access = DocumentAccess(document_id=uuid4(), owner_kerberos_id="owner1")
+
+        with patch("src.infrastructure.queries.document_acl_queries.time.monotonic", return_value=100.0):
+            cache.put(access)
+        with patch("src.infrastructure.queries.document_acl_queries.time.monotonic", return_value=131.0):
+            assert cache.get(access.document_id) is None
+
+        assert len(cache) == 0
+        assert cache.misses == 1
+
+
+class TestDocumentAclQueries:
+    @pytest.fixture
+    def mock_pool(self):
+        pool = MagicMock()
+        conn = AsyncMock()
+        pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+        pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+        return pool, conn
+
+    @pytest.mark.asyncio
+    async def test_get_access_reads_through_cache(self, mock_pool):
+        pool, conn = mock_pool
+        document_id = uuid4()
+        conn.fetchrow.return_value = {
+            "document_id": document_id,
+            "owner_kerberos_id": "owner1",
+            "visibility": "group",
+            "shared_with_groups": ["equity-trading"],
+        }
+        queries = DocumentAclQueries(pool)
+
+        first = await queries.get_access(document_id)
+        second = await queries.get_access(document_id)
+
+        assert first == second
+        assert first.shared_with_groups == frozenset({"equity-trading"})
+        assert conn.fetchrow.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_access_missing_document(self, mock_pool):
+        pool, conn = mock_pool
+        conn.fetchrow.return_value = None
+        queries = DocumentAclQueries(pool)
+
+        assert await queries.get_access(uuid4()) is None
+        assert len(queries.cache) == 0
@@ -0,0 +1,194 @@
+import json
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.dependencies import (
+    get_authorization_service,
+    get_content_variant_cache,
+    get_current_user,
+    get_document_acl_queries,
+    get_document_by_id_handler,
+    get_document_repository,
+)
+from src.api.middleware.compression import CompressedVariantCache
+from src.api.routes import documents
+from src.application.queries.document_queries import GetDocumentByIdHandler
+from src.domain.events import DocumentConverted
+from src.infrastructure.projections.document_projector import DocumentProjection
+from src.infrastructure.queries.document_queries import (
+    DocumentDetailCache,
+    DocumentDetailView,
+    DocumentQueries,
+)
+
+UPDATED_AT = datetime(2026, 1, 5, 12, 0, tzinfo=timezone.utc)
+
+
+def make_view(document_id=None, markdown="# Methodology", updated_at=UPDATED_AT) -> DocumentDetailView:
+    return DocumentDetailView(
+        id=document_id or uuid4(),
+        title="Methodology",
+        description=None,
+        status="converted",
+        version=1,
+        original_format="pdf",
+        markdown_content=markdown,
+        sections=[{"title": "Methodology", "content": "", "level": 1}],
+        metadata={},
+        policy_repository_id=None,
+        compliance_status=None,
+        created_at=UPDATED_AT,
+        updated_at=updated_at,
+    )
+
+
+def detail_row(document_id, updated_at=UPDATED_AT):
+    return {
+        "id": document_id, "title": "Methodology", "description": None, "status": "converted",
+        "version": 1, "original_format": "pdf", "policy_repository_id": None,
+        "compliance_status": None, "created_at": UPDATED_AT, "updated_at": updated_at,
+        "markdown_content": "# Methodology", "sections": json.dumps([]), "metadata": json.dumps({}),
+    }
+
+
+@pytest.fixture
+def mock_pool():
+    pool = MagicMock()
+    conn = AsyncMock()
+    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+    return pool, conn
+
+
+def revision_row(updated_at=UPDATED_AT):
+    return {"version": 1, "updated_at": updated_at}
+
+
+class TestDocumentDetailCache:
+    def test_revision_follows_updated_at(self):
+        view = make_view()
+
+        assert view.revision == make_view(view.id).revision
+        assert view.revision != make_view(view.id, updated_at=UPDATED_AT + timedelta(microseconds=1)).revision
+
+    def test_entries_go_stale_after_fresh_window(self):
+        cache = DocumentDetailCache(fresh_seconds=2.0)
+        view = make_view()
+
+        with patch("src.infrastructure.queries.document_queries.time.monotonic", return_value=100.0):
+            cache.put(view)
+        with patch("src.infrastructure.queries.document_queries.time.monotonic", return_value=101.0):
+            assert cache.get(view.id) == (view, True)
+        with patch("src.infrastructure.queries.document_queries.time.monotonic", return_value=103.0):
+            assert cache.get(view.id) == (view, False)
+
+        assert (cache.hits, cache.revalidations) == (1, 1)
+
+    def test_bounded_by_content_size(self):
+        cache = DocumentDetailCache(max_content_chars=10)
+        first, second = make_view(markdown="x" * 6), make_view(markdown="y" * 6)
+
+        cache.put(first)
+        cache.put(second)
+        cache.put(make_view(markdown="z" * 11))
+
+        assert len(cache) == 1
+        assert cache.get(first.id) == (None, False)
+
+
+class TestDocumentQueriesReadThrough:
+    @pytest.mark.asyncio
+    async def test_fresh_hits_skip_the_database(self, mock_pool):
+        pool, conn = mock_pool
+        document_id = uuid4()
+        conn.fetchrow.return_value = detail_row(document_id)
+        queries = DocumentQueries(pool)
+
+        first = await queries.get_by_id(document_id)
+        second = await queries.get_by_id(document_id)
+
+        assert first is second
+        assert conn.fetchrow.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_hit_is_revalidated_by_revision(self, mock_pool):
+        pool, conn = mock_pool
+        document_id = uuid4()
+        queries = DocumentQueries(pool, cache=DocumentDetailCache(fresh_seconds=0.0))
+        conn.fetchrow.return_value = detail_row(document_id)
+        cached = await queries.get_by_id(document_id)
+
+        conn.fetchrow.reset_mock()
+        conn.fetchrow.return_value = revision_row()
+        assert await queries.get_by_id(document_id) is cached
+        assert "markdown_content" not in conn.fetchrow.call_args[0][0]
+
+        changed = UPDATED_AT + timedelta(seconds=1)
+        conn.fetchrow.side_effect = [revision_row(changed), detail_row(document_id, changed)]
+        reloaded = await queries.get_by_id(document_id)
+        assert reloaded is not cached and reloaded.updated_at == changed
+
+    @pytest.mark.asyncio
+    async def test_projection_invalidates_entry(self, mock_pool):
+        pool, conn = mock_pool
+        cache = DocumentDetailCache()
+        view = make_view()
+        cache.put(view)
+        conn.fetchval.return_value = True
+        conn.transaction = MagicMock()
+        conn.transaction.return_value.__aenter__ = AsyncMock(return_value=None)
+        conn.transaction.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        await DocumentProjection(pool, detail_cache=cache).handle(DocumentConverted(
+            aggregate_id=view.id, markdown_content="# New", sections=[], metadata={},
+        ))
+
+        assert cache.get(view.id) == (None, False)
+
+
+class TestConditionalGet:
+    @pytest.fixture
+    def view(self):
+        return make_view()
+
+    @pytest.fixture
+    def client(self, view):
+        handler = MagicMock(spec=GetDocumentByIdHandler)
+        handler.handle = AsyncMock(return_value=view)
+        auth = MagicMock()
+        auth.can_view_document.return_value = True
+        acl = MagicMock()
+        acl.get_access = AsyncMock(return_value=MagicMock())
+
+        app = FastAPI()
+        app.include_router(documents.router, prefix="/api/v1")
+        app.dependency_overrides[get_current_user] = lambda: MagicMock()
+        app.dependency_overrides[get_document_by_id_handler] = lambda: handler
+        app.dependency_overrides[get_authorization_service] = lambda: auth
+        app.dependency_overrides[get_document_repository] = lambda: MagicMock()
+        app.dependency_overrides[get_document_acl_queries] = lambda: acl
+        variant_cache = CompressedVariantCache()
+        app.dependency_overrides[get_content_variant_cache] = lambda: variant_cache
+        return TestClient(app)
+
+    @pytest.mark.parametrize("path", ["/api/v1/documents/{id}", "/api/v1/documents/{id}/content"])
+    def test_unchanged_document_is_not_modified(self, client, view, path):
+        url = path.format(id=view.id)
+
+        first = client.get(url)
+        etag = first.headers["etag"]
+        second = client.get(url, headers={"If-None-Match": etag})
+        strong = client.get(url, headers={"If-None-Match": etag.removeprefix("W/")})
+        other = client.get(url, headers={"If-None-Match": '"0.0"'})
+
+        assert first.status_code == 200 and etag == f'W/"{view.revision}"'
+        assert first.headers["cache-control"] == "private, no-cache"
+        assert second.status_code == 304 and second.content == b""
+        assert second.headers["etag"] == etag
+        assert strong.status_code == 304
+        assert other.status_code == 200
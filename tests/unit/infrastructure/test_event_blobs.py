@@ -0,0 +1,218 @@
+"""Tests for externalized event content in event_blobs."""
+
+import json
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
+import pytest
+
+from src.domain.aggregates.document import Document
+from src.infrastructure.persistence import event_blobs
+from src.infrastructure.persistence.event_blobs import (
+    BLOB_REF,
+    BLOB_THRESHOLD_BYTES,
+    BlobCache,
+    externalize,
+    referenced_digests,
+    resolve,
+    strip_content,
+)
+from src.infrastructure.persistence.event_store import InMemoryEventStore, PostgresEventStore
+from src.infrastructure.persistence.snapshot_store import InMemorySnapshotStore
+from src.infrastructure.repositories.document_repository import DocumentRepository
+
+LARGE_MARKDOWN = "# Methodology\n" + "The index level is published daily. " * 500
+
+
+class FakeConnection:
+    """Just enough of the events and event_blobs tables for PostgresEventStore."""
+
+    def __init__(self):
+        self.events = []
+        self.blobs = {}
+        self.blob_queries = 0
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def execute(self, query, *args):
+        if "INSERT INTO events" in query:
+            self.events.append({
+                "aggregate_id": args[1],
+                "event_type": args[3],
+                "event_version": args[4],
+                "payload": args[5],
+                "sequence": len(self.events) + 1,
+            })
+
+    async def executemany(self, query, rows):
+        assert "INSERT INTO event_blobs" in query
+        for digest, content, size in rows:
+            self.blobs.setdefault(digest, content)
+
+    async def fetchval(self, query, aggregate_id):
+        return max((e["event_version"] for e in self.events if e["aggregate_id"] == aggregate_id), default=0)
+
+    async def fetch(self, query, *args):
+        if "FROM event_blobs" in query:
+            self.blob_queries += 1
+            return [{"digest": d, "content": self.blobs[d]} for d in args[0] if d in self.blobs]
+        if "WHERE aggregate_id" in query:
+            return [e for e in self.events if e["aggregate_id"] == args[0] and e["event_version"] > args[1]]
+        return self.events[args[0]:args[0] + args[1]]
+
+
+class FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.conn
+
+
+def converted_document(markdown: str = LARGE_MARKDOWN) -> Document:
+    document = Document.upload(
+        document_id=uuid4(),
+        filename="methodology.pdf",
+        content=b"content",
+        original_format="pdf",
+        uploaded_by="user@example.com",
+    )
+    document.convert(markdown_content=markdown, sections=[{"title": "Methodology"}], metadata={"pages": 3})
+    return document
+
+
+class TestExternalize:
+    def test_large_fields_become_references(self):
+        payload = {"markdown_content": LARGE_MARKDOWN, "sections": [], "metadata": {"pages": 3}}
+
+        stored, blobs = externalize("DocumentConverted", payload)
+
+        digest = stored["markdown_content"][BLOB_REF]
+        assert json.loads(blobs[digest]) == LARGE_MARKDOWN
+        # Small fields stay inline
+        assert stored["sections"] == [] and stored["metadata"] == {"pages": 3}
+        assert referenced_digests([stored, stored]) == [digest]
+        assert resolve(stored, blobs) == payload
+
+    def test_small_and_other_events_stay_inline(self):
+        small = {"markdown_content": "x" * (BLOB_THRESHOLD_BYTES // 2)}
+        other = {"filename": "x" * BLOB_THRESHOLD_BYTES}
+
+        assert externalize("DocumentConverted", small) == (small, {})
+        assert externalize("DocumentUploaded", other) == (other, {})
+
+    def test_identical_content_shares_a_digest(self):
+        first, _ = externalize("DocumentConverted", {"markdown_content": LARGE_MARKDOWN})
+        second, _ = externalize("DocumentConverted", {"markdown_content": LARGE_MARKDOWN})
+
+        assert first == second
+
+    def test_missing_blob_raises(self):
+        stored, _ = externalize("DocumentConverted", {"markdown_content": LARGE_MARKDOWN})
+
+        with pytest.raises(LookupError):
+            resolve(stored, {})
+
+    def test_strip_content(self):
+        stored, _ = externalize("DocumentConverted", {"markdown_content": LARGE_MARKDOWN, "metadata": {}})
+
+        assert strip_content("DocumentConverted", stored) == {"metadata": {}}
+
+    def test_blob_cache_is_bounded_by_size(self):
+        cache = BlobCache(max_bytes=10)
+        cache.put("a", "12345")
+        cache.put("b", "12345")
+        cache.get_many(["a"])
+        cache.put("c", "12345")
+
+        assert cache.get_many(["a", "b", "c"]) == {"a": "12345", "c": "12345"}
+        cache.put("d", "x" * 11)
+        assert len(cache) == 2
+
+
+class TestPostgresEventStoreBlobs:
+    @pytest.fixture
+    def conn(self):
+        return FakeConnection()
+
+    @pytest.fixture
+    def store(self, conn):
+        return PostgresEventStore(FakePool(conn))
+
+    @pytest.mark.asyncio
+    async def test_append_writes_content_once_to_event_blobs(self, store, conn):
+        document = converted_document()
+
+        await store.append(document.id, document.pending_events, 0)
+        other = converted_document()
+        await store.append(other.id, other.pending_events, 0)
+
+        assert len(conn.blobs) == 1
+        converted = json.loads(conn.events[1]["payload"])
+        assert converted["markdown_content"] == {BLOB_REF: next(iter(conn.blobs))}
+        assert converted["metadata"] == {"pages": 3}
+
+    @pytest.mark.asyncio
+    async def test_reads_resolve_references_in_one_query(self, store, conn):
+        for document in (converted_document(), converted_document()):
+            await store.append(document.id, document.pending_events, 0)
+
+        events = await store.get_all_events()
+
+        assert conn.blob_queries == 1
+        assert [e.markdown_content for e in events if e.event_type == "DocumentConverted"] == [LARGE_MARKDOWN] * 2
+        # Blobs never change, so later reads are served from memory
+        await store.get_all_events()
+        assert conn.blob_queries == 1
+
+    @pytest.mark.asyncio
+    async def test_reads_without_content_skip_blobs(self, store, conn):
+        document = converted_document()
+        await store.append(document.id, document.pending_events, 0)
+
+        events = await store.get_events(document.id, include_content=False)
+
+        assert conn.blob_queries == 0
+        assert events[1].markdown_content == "" and events[1].sections == []
+        assert events[1].metadata == {"pages": 3}
+
+
+class TestRepositoryWithoutContent:
+    @pytest.mark.asyncio
+    async def test_aggregate_without_content(self):
+        repository = DocumentRepository(InMemoryEventStore(), InMemorySnapshotStore())
+        document = converted_document()
+        await repository.save(document)
+
+        loaded = await repository.get(document.id, include_content=False)
+
+        assert loaded.markdown_content == "" and loaded.sections == []
+        assert loaded.status == document.status
+        assert loaded.owner_kerberos_id == document.owner_kerberos_id
+        assert (await repository.get(document.id)).markdown_content == LARGE_MARKDOWN
+
+    @pytest.mark.asyncio
+    async def test_aggregate_without_content_is_never_snapshotted(self):
+        snapshots = InMemorySnapshotStore()
+        repository = DocumentRepository(InMemoryEventStore(), snapshots, snapshot_threshold=3)
+        document = converted_document()
+        await repository.save(document)
+
+        loaded = await repository.get(document.id, include_content=False)
+        loaded.share_with_group("risk", shared_by=loaded.owner_kerberos_id)
+        await repository.save(loaded)
+
+        assert loaded.version == 3
+        assert await snapshots.get(document.id) is None
+        assert (await repository.get(document.id)).markdown_content == LARGE_MARKDOWN
+
+
+def test_without_content_keeps_other_events():
+    document = converted_document()
+    uploaded, converted = document.pending_events
+
+    assert event_blobs.without_content(uploaded) is uploaded
+    assert event_blobs.without_content(converted).sections == []
@@ -0,0 +1,110 @@
+import pytest
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+from src.infrastructure.queries.audit_queries import AuditQueries
+from src.infrastructure.queries.document_queries import DocumentQueries
+from src.infrastructure.queries.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_clause,
+    next_cursor,
+)
+
+
+@dataclass
+class Row:
+    id: UUID
+    created_at: datetime
+
+
+class TestCursorEncoding:
+    def test_round_trip(self):
+        created_at = datetime(2025, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+        row_id = uuid4()
+
+        assert decode_cursor(encode_cursor(created_at, row_id)) == (created_at, row_id)
+
+    def test_invalid_cursor_raises_value_error(self):
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            decode_cursor("not-a-cursor")
+
+    def test_keyset_clause_appends_params(self):
+        created_at = datetime.now(timezone.utc)
+        row_id = uuid4()
+        params = ["pending"]
+
+        clause = keyset_clause(encode_cursor(created_at, row_id), "created_at", params)
+
+        assert clause == " AND (created_at, id) < ($2, $3)"
+        assert params == ["pending", created_at, row_id]
+
+    def test_keyset_clause_ascending(self):
+        params = []
+        clause = keyset_clause(encode_cursor(datetime.now(timezone.utc), uuid4()), "created_at", params, descending=False)
+        assert "> ($1, $2)" in clause
+
+    def test_keyset_clause_without_cursor(self):
+        params = []
+        assert keyset_clause(None, "created_at", params) == ""
+        assert params == []
+
+    def test_next_cursor_only_for_full_pages(self):
+        rows = [Row(id=uuid4(), created_at=datetime.now(timezone.utc)) for _ in range(3)]
+
+        assert next_cursor(rows, 4) is None
+        assert next_cursor([], 3) is None
+        assert decode_cursor(next_cursor(rows, 3)) == (rows[-1].created_at, rows[-1].id)
+
+
+class TestKeysetQueries:
+    @pytest.fixture
+    def mock_pool(self):
+        pool = MagicMock()
+        conn = AsyncMock()
+        conn.fetch.return_value = []
+        pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+        pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+        return pool, conn
+
+    @pytest.mark.asyncio
+    async def test_document_list_with_cursor_skips_offset(self, mock_pool):
+        pool, conn = mock_pool
+        cursor = encode_cursor(datetime.now(timezone.utc), uuid4())
+
+        await DocumentQueries(pool).list_all(status="pending", limit=20, offset=40, cursor=cursor)
+
+        sql, *params = conn.fetch.call_args[0]
+        assert "(created_at, id) < ($2, $3)" in sql
+        assert "ORDER BY created_at DESC, id DESC LIMIT $4" in sql
+        assert "OFFSET" not in sql
+        assert params[0] == "pending" and params[-1] == 20
+
+    @pytest.mark.asyncio
+    async def test_audit_recent_with_cursor(self, mock_pool):
+        pool, conn = mock_pool
+        cursor = encode_cursor(datetime.now(timezone.utc), uuid4())
+
+        await AuditQueries(pool).get_recent(limit=10, cursor=cursor)
+
+        sql = conn.fetch.call_args[0][0]
+        assert "(timestamp, id) < ($1, $2)" in sql
+        assert "OFFSET" not in sql
+
+    @pytest.mark.asyncio
+    async def test_status_count_reads_counter_table(self, mock_pool):
+        pool, conn = mock_pool
+        conn.fetchval.return_value = 7
+
+        assert await DocumentQueries(pool).count(status="completed") == 7
+        assert "document_status_counts" in conn.fetchval.call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_estimated_total_uses_pg_class(self, mock_pool):
+        pool, conn = mock_pool
+        conn.fetchval.return_value = 120000
+
+        assert await DocumentQueries(pool).count(estimate=True) == 120000
+        assert "pg_class" in conn.fetchval.call_args[0][0]
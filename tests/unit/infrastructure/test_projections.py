@@ -17,6 +17,13 @@ from src.infrastructure.projections.base import Projection
 from src.infrastructure.projections.document_projector import DocumentProjection
 from src.infrastructure.projections.feedback_projector import FeedbackProjection
 from src.infrastructure.projections.policy_projector import PolicyProjection
+from src.infrastructure.projections.document_acl_projector import DocumentAclProjection
+from src.infrastructure.projections.term_index_projector import TermIndexProjection
+from src.infrastructure.semantic.ir_store import InMemorySemanticIRStore
+from src.infrastructure.semantic.term_index import InMemoryTermIndex
+from src.infrastructure.queries.document_acl_queries import DocumentAclCache
+from src.domain.events.document_events import DocumentSharedWithGroup, DocumentMadePrivate, SemanticIRCurated
+from src.domain.value_objects.document_access import DocumentAccess
 
 
 class MockProjection(Projection):
@@ -198,3 +205,132 @@ class TestPolicyProjection:
         await projection.handle(event)
         
         conn.execute.assert_called()
+
+
+class TestDocumentAclProjection:
+    @pytest.fixture
+    def mock_pool(self):
+        pool = MagicMock()
+        conn = AsyncMock()
+        pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+        pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+        return pool, conn
+
+    def test_handles_returns_sharing_events(self):
+        projection = DocumentAclProjection(MagicMock())
+
+        handled = projection.handles()
+
+        assert DocumentUploaded in handled
+        assert DocumentSharedWithGroup in handled
+        assert DocumentMadePrivate in handled
+        assert DocumentConverted not in handled
+
+    @pytest.mark.asyncio
+    async def test_handle_document_uploaded_records_owner(self, mock_pool):
+        pool, conn = mock_pool
+        projection = DocumentAclProjection(pool)
+        document_id = uuid4()
+
+        event = DocumentUploaded(
+            event_id=uuid4(),
+            aggregate_id=document_id,
+            occurred_at=datetime.now(timezone.utc),
+            version=1,
+            filename="test.pdf",
+            original_format="pdf",
+            file_size_bytes=1024,
+            uploaded_by="owner1",
+            owner_kerberos_id="owner1",
+        )
+
+        await projection.handle(event)
+
+        args = conn.execute.call_args[0]
+        assert "INSERT INTO document_acl_views" in args[0]
+        assert args[1] == document_id
+        assert args[2] == "owner1"
+
+    @pytest.mark.asyncio
+    async def test_handle_invalidates_cached_access(self, mock_pool):
+        pool, conn = mock_pool
+        conn.execute.return_value = "UPDATE 1"
+        cache = DocumentAclCache()
+        projection = DocumentAclProjection(pool, cache=cache)
+        document_id = uuid4()
+        cache.put(DocumentAccess(document_id=document_id, owner_kerberos_id="owner1"))
+
+        event = DocumentSharedWithGroup(
+            event_id=uuid4(),
+            aggregate_id=document_id,
+            occurred_at=datetime.now(timezone.utc),
+            version=2,
+            group="equity-trading",
+            shared_by="owner1",
+        )
+
+        await projection.handle(event)
+
+        conn.execute.assert_called()
+        assert cache.get(document_id) is None
+
+
+class TestTermIndexProjection:
+    @pytest.fixture
+    def converted(self):
+        return DocumentConverted(
+            event_id=uuid4(),
+            aggregate_id=uuid4(),
+            occurred_at=datetime.now(timezone.utc),
+            version=2,
+            markdown_content='# Terms\n\n"Notional Amount" means the face value of the swap.\n',
+            sections=[{"id": "section-1", "title": "Terms", "content": '"Notional Amount" means the face value of the swap.',
+                       "level": 1, "start_line": 1, "end_line": 3}],
+            metadata={"title": "Swap Spec", "original_format": "markdown"},
+        )
+
+    def test_handles_conversion_and_curation(self):
+        handled = TermIndexProjection(InMemoryTermIndex(), InMemorySemanticIRStore()).handles()
+
+        assert handled == [DocumentConverted, SemanticIRCurated]
+
+    @pytest.mark.asyncio
+    async def test_indexes_ir_built_from_converted_event(self, converted):
+        term_index = InMemoryTermIndex()
+        projection = TermIndexProjection(term_index, InMemorySemanticIRStore())
+
+        await projection.handle(converted)
+
+        hits = await term_index.search("notional amount")
+        assert [(h.document_id, h.document_title) for h in hits] == [(str(converted.aggregate_id), "Swap Spec")]
+
+    @pytest.mark.asyncio
+    async def test_conversion_ir_is_saved_for_other_consumers(self, converted):
+        ir_store = InMemorySemanticIRStore()
+        projection = TermIndexProjection(InMemoryTermIndex(), ir_store)
+
+        await projection.handle(converted)
+
+        stored = await ir_store.load(str(converted.aggregate_id))
+        assert [d.term for d in stored.definitions] == ["Notional Amount"]
+
+    @pytest.mark.asyncio
+    async def test_reindexes_stored_ir_after_curation(self, converted):
+        term_index = InMemoryTermIndex()
+        ir_store = InMemorySemanticIRStore()
+        projection = TermIndexProjection(term_index, ir_store)
+        await projection.handle(converted)
+        curated = await ir_store.load(str(converted.aggregate_id))
+        curated.definitions[0].aliases.append("Notional")
+        await ir_store.save(curated)
+
+        await projection.handle(
+            SemanticIRCurated(
+                event_id=uuid4(),
+                aggregate_id=converted.aggregate_id,
+                occurred_at=datetime.now(timezone.utc),
+                version=4,
+            )
+        )
+
+        assert [h.kind for h in await term_index.search("notional", fuzzy=False)] == ["alias", "definition"]